@@ -2,16 +2,25 @@
 # -*- coding: utf-8 -*-
 """
 Gemini가 수집한 투자 뉴스 데이터를 Supabase에 업로드
+
+scripts/investment-news-scraper/ingest_news_articles.py의 스트리밍 적재기 사용
+(JSON/NDJSON 스트리밍 읽기, 배치 INSERT + ignore-duplicates, 동시 전송)
+
+실행: python upload_to_supabase.py [파일 (기본 investment_news_data.json)] [--batch-size 500] [--concurrency 4]
 """
 
-import json
-import requests
+import argparse
 import os
-from datetime import datetime
+import sys
 from dotenv import load_dotenv
 
+SCRAPER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts', 'investment-news-scraper')
+sys.path.insert(0, SCRAPER_DIR)
+
+from ingest_news_articles import ArticleIngester, ingest_file
+
 # 환경 변수 로드 (상위 폴더의 .env 파일)
-env_path = os.path.join(os.path.dirname(__file__), '..', 'scripts', 'investment-news-scraper', '.env')
+env_path = os.path.join(SCRAPER_DIR, '.env')
 load_dotenv(env_path)
 
 SUPABASE_URL = os.getenv('SUPABASE_URL')
@@ -22,54 +31,29 @@ if not SUPABASE_URL or not SUPABASE_KEY:
     print(f"Looking for .env at: {env_path}")
     exit(1)
 
-def upload_articles():
-    """JSON 파일의 기사들을 Supabase에 업로드"""
-
-    # JSON 파일 읽기
-    with open('investment_news_data.json', 'r', encoding='utf-8') as f:
-        articles = json.load(f)
 
-    print(f"[INFO] Total {len(articles)} articles to upload...")
+def upload_articles():
+    """JSON/NDJSON 파일의 기사들을 Supabase에 배치 업로드"""
+    arg_parser = argparse.ArgumentParser(description="투자 뉴스 데이터 Supabase 업로드")
+    arg_parser.add_argument('path', nargs='?', default='investment_news_data.json')
+    arg_parser.add_argument('--batch-size', type=int, default=500)
+    arg_parser.add_argument('--concurrency', type=int, default=4)
+    args = arg_parser.parse_args()
+
+    print(f"[INFO] Uploading {args.path} (batch {args.batch_size}, concurrency {args.concurrency})...")
     print("-" * 60)
 
-    success_count = 0
-    duplicate_count = 0
-    error_count = 0
-
-    for idx, article in enumerate(articles, 1):
-        try:
-            # Supabase REST API로 저장
-            response = requests.post(
-                f"{SUPABASE_URL}/rest/v1/investment_news_articles",
-                headers={
-                    'apikey': SUPABASE_KEY,
-                    'Authorization': f'Bearer {SUPABASE_KEY}',
-                    'Content-Type': 'application/json',
-                    'Prefer': 'return=minimal'
-                },
-                json=article
-            )
-
-            if response.status_code == 201:
-                success_count += 1
-                print(f"[OK] [{idx}/{len(articles)}] {article['site_name']}: {article.get('article_title', 'NO TITLE')[:50]}...")
-            elif response.status_code == 409:
-                duplicate_count += 1
-                print(f"[DUP] [{idx}/{len(articles)}] Duplicate: {article.get('article_title', 'NO TITLE')[:50]}...")
-            else:
-                error_count += 1
-                print(f"[ERR] [{idx}/{len(articles)}] Failed ({response.status_code}): {article.get('article_title', 'NO TITLE')[:50]}...")
-
-        except Exception as e:
-            error_count += 1
-            print(f"[ERR] [{idx}/{len(articles)}] Error: {str(e)[:50]}...")
+    ingester = ArticleIngester(
+        f"{SUPABASE_URL.rstrip('/')}/rest/v1",
+        api_key=SUPABASE_KEY,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+    )
+    stats = ingest_file(args.path, ingester)
 
     print("-" * 60)
-    print(f"\n[RESULT] Upload Summary:")
-    print(f"  Success: {success_count}")
-    print(f"  Duplicate: {duplicate_count}")
-    print(f"  Failed: {error_count}")
-    print(f"  Total: {len(articles)}")
+    print(stats.summary())
+
 
 if __name__ == '__main__':
     upload_articles()
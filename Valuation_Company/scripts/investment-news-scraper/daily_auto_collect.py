@@ -21,6 +21,7 @@
 import os
 import sys
 import argparse
+import asyncio
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
 from supabase import create_client
@@ -32,6 +33,7 @@ from google.genai import types
 import time
 import json
 import re
+from pathlib import Path
 from urllib.parse import urlparse, quote
 
 if sys.platform == 'win32':
@@ -40,34 +42,13 @@ if sys.platform == 'win32':
 load_dotenv()
 
 
-# 업종 대분류 카테고리 매핑
-INDUSTRY_CATEGORIES = {
-    'AI': ['AI', '인공지능', 'AI 기반', 'AI 에이전트', 'AI·양자', '머신러닝', '딥러닝', 'LLM', '생성형'],
-    '헬스케어': ['헬스케어', '바이오', '의료', '제약', '건강', '체성분', '클리닉', '메디', '진단', '신약', '헬스'],
-    '핀테크': ['핀테크', '금융', '공급망 금융', '자산', '보험', '페이', '결제', '증권', '인슈어'],
-    '이커머스': ['이커머스', '커머스', 'M&A 플랫폼', '쇼핑', '리테일', '유통'],
-    '모빌리티': ['모빌리티', '자동차', '리스', '렌트', '자율주행', '물류', '배송'],
-    '뷰티/패션': ['뷰티', '스킨케어', '화장품', '패션', '의류'],
-    '콘텐츠/엔터': ['콘텐츠', '웹툰', 'IP 제작', '엔터', '게임', '미디어', '영상'],
-    '우주항공': ['위성', '우주', '항공', '에어로스페이스', '드론'],
-    'IT/하드웨어': ['IT 기기', '하드웨어', '반도체', '센서', '로봇', '제조'],
-    'SaaS/B2B': ['SaaS', '솔루션', '클라우드', 'B2B', 'HR', 'ERP'],
-    '농업/푸드': ['스마트팜', '농업', '푸드', '식품', '푸드테크', '에어로포닉'],
-    '에듀테크': ['에듀', '교육', '학습', '러닝'],
-    '부동산/건설': ['부동산', '프롭', '건설', '건축', '인테리어'],
-    '에너지/환경': ['에너지', '태양광', '배터리', '탄소', '환경', '그린', '수소', '친환경'],
-}
-
+# 업종 대분류 분류기 (backend 공용 모듈 - 컴파일된 키워드 표)
+BACKEND_DIR = Path(__file__).resolve().parents[2] / 'valuation-platform' / 'backend'
+sys.path.insert(0, str(BACKEND_DIR))
 
-def categorize_industry(raw_industry):
-    """세부 업종을 대분류 카테고리로 매핑"""
-    if not raw_industry:
-        return None
-    for category, keywords in INDUSTRY_CATEGORIES.items():
-        for kw in keywords:
-            if kw in raw_industry:
-                return category
-    return '기타'
+from app.services.industry_classifier import categorize_industry
+from app.services.deal_amounts import parse_amount_eok
+from app.services.investment_automation.enricher import DataEnricher
 
 
 # 투자단계 정규화 매핑
@@ -651,11 +632,13 @@ def step3_register_to_deals(target_date):
 
                     # 기존 deal 업데이트
                     new_industry = info.get('industry') or existing_info['deal'].get('industry')
+                    new_amount = info.get('amount') or existing_info['deal'].get('amount')
                     supabase.table('deals').update({
                         'industry': new_industry,
                         'industry_category': categorize_industry(new_industry),
                         'investors': info.get('investors') or existing_info['deal'].get('investors'),
-                        'amount': info.get('amount') or existing_info['deal'].get('amount'),
+                        'amount': new_amount,
+                        'amount_eok': parse_amount_eok(new_amount),
                         'location': info.get('location') or existing_info['deal'].get('location'),
                         'news_title': article['article_title'],
                         'news_url': article['article_url'],
@@ -683,6 +666,7 @@ def step3_register_to_deals(target_date):
                 'stage': normalize_stage(info.get('stage')),
                 'investors': info.get('investors'),
                 'amount': info.get('amount'),
+                'amount_eok': parse_amount_eok(info.get('amount')),
                 'location': info.get('location'),
                 'news_title': article['article_title'],
                 'news_url': article['article_url'],
@@ -844,11 +828,10 @@ def step5_5_naver_api_enrichment():
     """네이버 뉴스 API로 데이터 정제 및 추가 정보 수집"""
     log(f"Step 5.5: 네이버 API 데이터 정제")
 
-    # 네이버 API 키 확인
-    naver_client_id = os.getenv("NAVER_CLIENT_ID")
-    naver_client_secret = os.getenv("NAVER_CLIENT_SECRET")
+    enricher = DataEnricher()
 
-    if not naver_client_id or not naver_client_secret:
+    # 네이버 API 키 확인
+    if not enricher.enabled:
         log(f"  ⚠️ 네이버 API 키 미설정 (NAVER_CLIENT_ID, NAVER_CLIENT_SECRET)")
         log(f"  ⚠️ https://developers.naver.com 에서 API 키 발급 필요")
         return
@@ -864,38 +847,35 @@ def step5_5_naver_api_enrichment():
 
     log(f"  📊 {len(deals_to_enrich.data)}개 Deal 정제 중...")
 
+    # 네이버 뉴스 일괄 검색 (공유 연결 풀, 호출 한도 내 동시 조회, 기업별 캐시)
+    async def search_all():
+        async with enricher:
+            return await enricher.search_investment_news_batch(
+                deal['company_name'] for deal in deals_to_enrich.data
+            )
+
+    search_results = asyncio.run(search_all())
+    log(f"  🔍 네이버 검색: 캐시 {enricher.cache.hits}건 / API {enricher.calls_made}건")
+
     enriched = 0
 
     for deal in deals_to_enrich.data:
         company = deal['company_name']
         log(f"    🔍 {company}...")
 
-        # 네이버 뉴스 검색
-        search_query = f"{company} 투자"
-        url = f"https://openapi.naver.com/v1/search/news.json?query={quote(search_query)}&display=5&sort=date"
-
-        headers = {
-            "X-Naver-Client-Id": naver_client_id,
-            "X-Naver-Client-Secret": naver_client_secret
-        }
-
         try:
-            response = requests.get(url, headers=headers, timeout=10)
+            items = search_results.get(company, [])
 
-            if response.status_code == 200:
-                data = response.json()
-                items = data.get('items', [])
+            if items:
+                # 가장 관련성 높은 기사에서 정보 추출
+                best_item = items[0]
+                title = best_item.get('title', '').replace('<b>', '').replace('</b>', '')
+                description = best_item.get('description', '').replace('<b>', '').replace('</b>', '')
 
-                if items:
-                    # 가장 관련성 높은 기사에서 정보 추출
-                    best_item = items[0]
-                    title = best_item.get('title', '').replace('<b>', '').replace('</b>', '')
-                    description = best_item.get('description', '').replace('<b>', '').replace('</b>', '')
+                # Gemini로 정보 추출
+                combined_text = f"제목: {title}\n내용: {description}"
 
-                    # Gemini로 정보 추출
-                    combined_text = f"제목: {title}\n내용: {description}"
-
-                    extract_prompt = f"""
+                extract_prompt = f"""
 다음 뉴스에서 투자 정보를 추출하세요:
 {combined_text}
 
@@ -906,52 +886,48 @@ JSON 형식으로만 답변:
     "amount": "투자금액 (억원 숫자만, 없으면 null)"
 }}
 """
-                    extract_response = gemini_client.models.generate_content(
-                        model='gemini-2.5-flash',
-                        contents=extract_prompt,
-                        config=types.GenerateContentConfig(
-                            temperature=0,
-                            max_output_tokens=256,
-                            response_mime_type='application/json'
-                        )
+                extract_response = gemini_client.models.generate_content(
+                    model='gemini-2.5-flash',
+                    contents=extract_prompt,
+                    config=types.GenerateContentConfig(
+                        temperature=0,
+                        max_output_tokens=256,
+                        response_mime_type='application/json'
                     )
+                )
 
-                    if extract_response and hasattr(extract_response, 'text'):
-                        info = json.loads(extract_response.text.strip())
-                        if isinstance(info, list):
-                            info = info[0] if info else {}
-
-                        # 업데이트할 필드 결정
-                        update_data = {}
+                if extract_response and hasattr(extract_response, 'text'):
+                    info = json.loads(extract_response.text.strip())
+                    if isinstance(info, list):
+                        info = info[0] if info else {}
 
-                        if info.get('investors') and not deal.get('investors'):
-                            update_data['investors'] = info['investors']
+                    # 업데이트할 필드 결정
+                    update_data = {}
 
-                        if info.get('industry') and (not deal.get('industry') or deal.get('industry') == '-'):
-                            update_data['industry'] = info['industry']
-                            update_data['industry_category'] = categorize_industry(info['industry'])
+                    if info.get('investors') and not deal.get('investors'):
+                        update_data['investors'] = info['investors']
 
-                        if info.get('amount') and not deal.get('amount'):
-                            update_data['amount'] = info['amount']
+                    if info.get('industry') and (not deal.get('industry') or deal.get('industry') == '-'):
+                        update_data['industry'] = info['industry']
+                        update_data['industry_category'] = categorize_industry(info['industry'])
 
-                        if update_data:
-                            supabase.table('deals').update(update_data).eq('id', deal['id']).execute()
-                            log(f"      ✅ 업데이트: {list(update_data.keys())}")
-                            enriched += 1
-                        else:
-                            log(f"      ⚠️ 추가 정보 없음")
+                    if info.get('amount') and not deal.get('amount'):
+                        update_data['amount'] = info['amount']
+                        update_data['amount_eok'] = parse_amount_eok(info['amount'])
 
-                else:
-                    log(f"      ⚠️ 검색 결과 없음")
+                    if update_data:
+                        supabase.table('deals').update(update_data).eq('id', deal['id']).execute()
+                        log(f"      ✅ 업데이트: {list(update_data.keys())}")
+                        enriched += 1
+                    else:
+                        log(f"      ⚠️ 추가 정보 없음")
 
             else:
-                log(f"      ❌ API 오류: {response.status_code}", "ERROR")
+                log(f"      ⚠️ 검색 결과 없음")
 
         except Exception as e:
             log(f"      ❌ 오류: {str(e)[:40]}", "ERROR")
 
-        time.sleep(0.5)  # API 제한 고려
-
     log(f"  ✅ {enriched}개 정제 완료")
 
 
@@ -0,0 +1,452 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+투자 뉴스 기사 대량 적재 (JSON / NDJSON → investment_news_articles)
+
+- 파일을 한 번에 읽지 않고 스트리밍: NDJSON은 줄 단위, JSON 배열은 청크 단위로 원소를 하나씩 디코딩 (.gz 지원)
+- 행 검증·정규화 (필수 필드, site_number 범위, URL, 날짜 형식) 후 모든 행을 같은 컬럼 집합으로 맞춤
+- batch_size 행씩 PostgREST 일괄 INSERT
+  Prefer: resolution=ignore-duplicates → article_url UNIQUE 충돌 행은 건너뜀 (ON CONFLICT DO NOTHING)
+  return=representation + select=id → 실제로 들어간 행 수로 서버 측 중복 수 계산
+- 동시에 전송하는 배치 수를 concurrency로 제한 (메모리: 최대 concurrency × batch_size 행)
+- 429 / 5xx / 연결 오류는 지수 백오프로 재시도
+- 처리량(행/초)과 중복률 보고
+
+--rest-url로 로컬 PostgREST(예: http://localhost:3000)를 가리키면 Supabase 없이 시험할 수 있다.
+
+실행:
+    python ingest_news_articles.py investment_news_data.json
+    python ingest_news_articles.py articles.ndjson.gz --batch-size 1000 --concurrency 8
+    python ingest_news_articles.py articles.ndjson --rest-url http://localhost:3000 --dry-run
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import os
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+TABLE = 'investment_news_articles'
+
+# 업로드 컬럼 (모든 행을 같은 키로 맞춰야 PostgREST 일괄 INSERT 가능) → 값이 없을 때 넣을 값 (= DB 기본값)
+COLUMN_DEFAULTS = {
+    'site_number': None,
+    'site_name': None,
+    'site_url': None,
+    'article_title': None,
+    'article_url': None,
+    'published_date': None,
+    'collected_at': None,
+    'content': None,
+    'company_name': None,
+    'score': 0,
+    'has_amount': False,
+    'has_investors': False,
+    'has_stage': False,
+    'has_industry': False,
+    'has_location': False,
+    'has_employees': False,
+    'processed': False,
+}
+BOOLEAN_COLUMNS = tuple(name for name, default in COLUMN_DEFAULTS.items() if default is False)
+DATE_FORMATS = ('%Y-%m-%d', '%Y.%m.%d', '%Y/%m/%d', '%Y%m%d')
+MAX_URL_LENGTH = 500
+
+
+class InvalidArticle(ValueError):
+    """검증 실패 (메시지 = 사유, 통계 집계 키)"""
+
+
+# ============================================================
+# 스트리밍 읽기
+# ============================================================
+def open_text(path: str) -> TextIO:
+    if path == '-':
+        return sys.stdin
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, 'r', encoding='utf-8')
+
+
+def _iter_json_array(fp: TextIO, buffer: str, chunk_size: int) -> Iterator[Tuple[int, Any]]:
+    """'[' 다음부터 배열 원소를 하나씩 디코딩 (전체를 메모리에 올리지 않음)"""
+    decoder = json.JSONDecoder()
+    pos = 0
+    index = 0
+    eof = False
+    while True:
+        # 공백 / 구분자 건너뛰기
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+        if pos >= len(buffer) - 1 and not eof:
+            chunk = fp.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        if pos >= len(buffer):
+            raise ValueError("JSON 배열이 ']' 없이 끝났습니다.")
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = fp.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            continue
+        index += 1
+        yield index, value
+        pos = end
+        if pos > chunk_size:  # 처리한 앞부분 버리기
+            buffer = buffer[pos:]
+            pos = 0
+
+
+def iter_records(fp: TextIO, chunk_size: int = 1 << 16) -> Iterator[Tuple[int, Any]]:
+    """
+    JSON 배열 / NDJSON 파일의 레코드를 (순번, 값)으로 하나씩 반환
+
+    첫 글자가 '['이면 JSON 배열, 아니면 NDJSON.
+    NDJSON의 깨진 줄은 값 대신 InvalidArticle을 돌려주고 계속 진행한다.
+    """
+    head = ''
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            return
+        head += chunk
+        stripped = head.lstrip('\ufeff \t\r\n')
+        if stripped:
+            break
+
+    if stripped[0] == '[':
+        yield from _iter_json_array(fp, stripped[1:], chunk_size)
+        return
+
+    def lines() -> Iterator[str]:
+        pending = stripped
+        while True:
+            *complete, pending = pending.split('\n')
+            yield from complete
+            chunk = fp.read(chunk_size)
+            if not chunk:
+                break
+            pending += chunk
+        if pending:
+            yield pending
+
+    for line_no, line in enumerate(lines(), 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError:
+            yield line_no, InvalidArticle('JSON 형식 오류')
+
+
+# ============================================================
+# 검증 / 정규화
+# ============================================================
+def _normalize_date(value: Any) -> Optional[str]:
+    if value in (None, ''):
+        return None
+    text = str(value).strip()
+    if len(text) > 10 and text[10] in 'T ':  # ISO 일시 → 날짜
+        text = text[:10]
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date().isoformat()
+        except ValueError:
+            continue
+    raise InvalidArticle('published_date 형식 오류')
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in ('true', '1', 'y', 'yes')
+    return bool(value)
+
+
+def normalize_article(raw: Any, collected_at: str) -> Dict[str, Any]:
+    """
+    원본 기사 dict → 업로드 행 (COLUMN_DEFAULTS의 키만, 모든 행 같은 키)
+
+    Raises:
+        InvalidArticle: 필수 필드 누락 / 형식 오류 (메시지가 사유)
+    """
+    if not isinstance(raw, dict):
+        raise InvalidArticle('객체가 아님')
+
+    # 수집기(daily_auto_collect)가 쓰는 키 이름도 허용
+    url = str(raw.get('article_url') or raw.get('url') or '').strip()
+    title = ' '.join(str(raw.get('article_title') or raw.get('title') or '').split())
+    site_number = raw.get('site_number', raw.get('site_id'))
+
+    if not url:
+        raise InvalidArticle('article_url 누락')
+    parsed = urlparse(url)
+    if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+        raise InvalidArticle('article_url 형식 오류')
+    if len(url) > MAX_URL_LENGTH:
+        raise InvalidArticle('article_url 길이 초과')
+    if not title:
+        raise InvalidArticle('article_title 누락')
+    try:
+        site_number = int(site_number)
+    except (TypeError, ValueError):
+        raise InvalidArticle('site_number 누락/형식 오류')
+    if not 1 <= site_number <= 100:
+        raise InvalidArticle('site_number 범위 밖 (1-100)')
+
+    row = dict(COLUMN_DEFAULTS)
+    for name in COLUMN_DEFAULTS:
+        value = raw.get(name)
+        if value is not None and value != '':
+            row[name] = value
+    row.update({
+        'site_number': site_number,
+        'site_url': row['site_url'] or parsed.netloc,
+        'article_title': title,
+        'article_url': url,
+        'published_date': _normalize_date(raw.get('published_date')),
+        'collected_at': row['collected_at'] or collected_at,
+    })
+    try:
+        row['score'] = int(row['score'])
+    except (TypeError, ValueError):
+        raise InvalidArticle('score 형식 오류')
+    for name in BOOLEAN_COLUMNS:
+        row[name] = _to_bool(row[name])
+    return row
+
+
+# ============================================================
+# 업로드
+# ============================================================
+@dataclass
+class IngestStats:
+    """적재 결과"""
+    read: int = 0
+    invalid: Counter = field(default_factory=Counter)
+    local_duplicates: int = 0     # 파일 안에서 같은 article_url 반복
+    sent: int = 0
+    inserted: int = 0
+    failed: int = 0
+    batches: int = 0
+    retries: int = 0
+    errors: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def server_duplicates(self) -> int:
+        """이미 테이블에 있어 건너뛴 행"""
+        return self.sent - self.inserted - self.failed
+
+    @property
+    def duplicate_rate(self) -> float:
+        valid = self.sent + self.local_duplicates
+        return (self.local_duplicates + self.server_duplicates) / valid if valid else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.read / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        invalid = sum(self.invalid.values())
+        lines = [
+            "[RESULT] Ingest Summary:",
+            f"  Read: {self.read:,} rows ({self.elapsed:.2f}s, {self.rows_per_second:,.0f} rows/s)",
+            f"  Invalid: {invalid:,}" + (f" ({', '.join(f'{k} {v}' for k, v in self.invalid.most_common())})" if invalid else ""),
+            f"  Sent: {self.sent:,} in {self.batches:,} batches (retries {self.retries})",
+            f"  Inserted: {self.inserted:,}",
+            f"  Duplicate: {self.local_duplicates + self.server_duplicates:,} "
+            f"(in file {self.local_duplicates:,}, already stored {self.server_duplicates:,}) - {self.duplicate_rate:.1%}",
+            f"  Failed: {self.failed:,}",
+        ]
+        lines.extend(f"  [ERR] {error}" for error in self.errors[:5])
+        return "\n".join(lines)
+
+
+class ArticleIngester:
+    """
+    investment_news_articles 일괄 적재기
+
+    Args:
+        rest_url: PostgREST 루트 (Supabase: {SUPABASE_URL}/rest/v1, 로컬 PostgREST: http://localhost:3000)
+        api_key: Supabase 키 (apikey / Authorization 헤더), 로컬 PostgREST는 None 가능
+        transport: httpx 전송 계층 (로컬 스탠드인 / 시험용)
+    """
+
+    RETRY_STATUS = (408, 429, 500, 502, 503, 504)
+
+    def __init__(
+        self,
+        rest_url: str,
+        api_key: Optional[str] = None,
+        table: str = TABLE,
+        batch_size: int = 500,
+        concurrency: int = 4,
+        max_retries: int = 3,
+        timeout: float = 30.0,
+        dry_run: bool = False,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self.rest_url = rest_url.rstrip('/')
+        self.table = table
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.dry_run = dry_run
+        self.transport = transport
+        self.headers = {
+            'Content-Type': 'application/json',
+            'Prefer': 'resolution=ignore-duplicates,return=representation',
+        }
+        if api_key:
+            self.headers.update({'apikey': api_key, 'Authorization': f'Bearer {api_key}'})
+        self.params = {'on_conflict': 'article_url', 'columns': ','.join(COLUMN_DEFAULTS), 'select': 'id'}
+
+    async def ingest(self, records: Iterable[Tuple[int, Any]]) -> IngestStats:
+        """(순번, 원본) 레코드 스트림을 검증·배치 업로드"""
+        stats = IngestStats()
+        collected_at = datetime.now().isoformat()
+        seen_urls = set()
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = set()
+        start = time.perf_counter()
+
+        async with httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=self.transport,
+            limits=httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        ) as client:
+
+            async def flush(batch: List[Dict[str, Any]]) -> None:
+                await semaphore.acquire()  # 진행 중 배치가 concurrency개면 여기서 대기 (읽기도 멈춤)
+                stats.batches += 1
+                stats.sent += len(batch)
+
+                async def run() -> None:
+                    try:
+                        await self._send(client, batch, stats)
+                    finally:
+                        semaphore.release()
+
+                task = asyncio.create_task(run())
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            batch = []
+            for _, raw in records:
+                stats.read += 1
+                try:
+                    if isinstance(raw, InvalidArticle):
+                        raise raw
+                    row = normalize_article(raw, collected_at)
+                except InvalidArticle as e:
+                    stats.invalid[str(e)] += 1
+                    continue
+                if row['article_url'] in seen_urls:
+                    stats.local_duplicates += 1
+                    continue
+                seen_urls.add(row['article_url'])
+                batch.append(row)
+                if len(batch) >= self.batch_size:
+                    await flush(batch)
+                    batch = []
+            if batch:
+                await flush(batch)
+            if tasks:
+                await asyncio.gather(*tasks)
+
+        stats.elapsed = time.perf_counter() - start
+        return stats
+
+    async def _send(self, client: httpx.AsyncClient, batch: List[Dict[str, Any]], stats: IngestStats) -> None:
+        if self.dry_run:
+            stats.inserted += len(batch)
+            return
+
+        body = json.dumps(batch, ensure_ascii=False, default=str).encode('utf-8')
+        for attempt in range(self.max_retries + 1):
+            error = None
+            try:
+                response = await client.post(
+                    f"{self.rest_url}/{self.table}", params=self.params, headers=self.headers, content=body
+                )
+                if response.status_code in (200, 201):
+                    stats.inserted += len(response.json())
+                    return
+                error = f"HTTP {response.status_code}: {response.text[:200]}"
+                if response.status_code not in self.RETRY_STATUS:
+                    break
+            except httpx.TransportError as e:
+                error = f"{type(e).__name__}: {e}"
+            if attempt < self.max_retries:
+                stats.retries += 1
+                await asyncio.sleep(0.5 * 2 ** attempt)
+
+        stats.failed += len(batch)
+        stats.errors.append(f"batch of {len(batch)} ({batch[0]['article_url']}...): {error}")
+
+
+def ingest_file(path: str, ingester: ArticleIngester) -> IngestStats:
+    with open_text(path) as fp:
+        return asyncio.run(ingester.ingest(iter_records(fp)))
+
+
+def default_rest_url() -> Optional[str]:
+    supabase_url = os.getenv('SUPABASE_URL')
+    return f"{supabase_url.rstrip('/')}/rest/v1" if supabase_url else None
+
+
+def main() -> None:
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    arg_parser = argparse.ArgumentParser(description="투자 뉴스 기사 JSON/NDJSON 대량 적재")
+    arg_parser.add_argument('path', help="JSON 배열 또는 NDJSON 파일 (.gz 가능, '-'는 stdin)")
+    arg_parser.add_argument('--rest-url', default=default_rest_url(), help="PostgREST 루트 (기본: $SUPABASE_URL/rest/v1)")
+    arg_parser.add_argument('--table', default=TABLE)
+    arg_parser.add_argument('--batch-size', type=int, default=500)
+    arg_parser.add_argument('--concurrency', type=int, default=4, help="동시에 전송할 배치 수")
+    arg_parser.add_argument('--max-retries', type=int, default=3)
+    arg_parser.add_argument('--dry-run', action='store_true', help="검증/정규화만 하고 전송하지 않음")
+    args = arg_parser.parse_args()
+
+    if not args.rest_url and not args.dry_run:
+        print("[ERROR] SUPABASE_URL 또는 --rest-url이 필요합니다.")
+        sys.exit(1)
+
+    ingester = ArticleIngester(
+        args.rest_url or 'http://localhost',
+        api_key=os.getenv('SUPABASE_SERVICE_KEY') or os.getenv('SUPABASE_KEY'),
+        table=args.table,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        max_retries=args.max_retries,
+        dry_run=args.dry_run,
+    )
+    stats = ingest_file(args.path, ingester)
+    print(stats.summary())
+    if stats.failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,17 +7,23 @@
 """
 
 import os
-import re
+import sys
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dotenv import load_dotenv
 from supabase import create_client
 from datetime import datetime, timedelta
-from collections import Counter
+from pathlib import Path
 
 load_dotenv()
 
+# Deal 통계 공용 모듈 (backend)
+BACKEND_DIR = Path(__file__).resolve().parents[2] / 'valuation-platform' / 'backend'
+sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import deal_analytics
+
 supabase = create_client(
     os.getenv('SUPABASE_URL'),
     os.getenv('SUPABASE_SERVICE_KEY')
@@ -50,127 +56,50 @@ def get_last_week_deals():
     return result.data
 
 
-def parse_amount(amount_str):
+def get_previous_week_deals():
     """
-    투자금액 문자열을 억원 단위 숫자로 변환
-
-    Args:
-        amount_str: "100억원", "50억", "1000만 달러" 등
+    그 전 주(14일 전 ~ 8일 전) Deal 조회 - 전주 대비 증감 계산용이라 통계 컬럼만
 
     Returns:
-        float (억원 단위), 파싱 불가 시 0
+        Deal 리스트
     """
-    if not amount_str and amount_str != 0:
-        return 0
-
-    # 숫자 타입이면 그대로 반환 (DB에서 숫자로 저장된 경우, 억원 단위)
-    if isinstance(amount_str, (int, float)):
-        return float(amount_str)
-
-    amount_str = str(amount_str).strip()
-
-    # "약", "총", "최대", "규모" 등 제거
-    cleaned = re.sub(r'(약|총|최대|규모|원|이상|이내)', '', amount_str).strip()
+    today = datetime.now().date()
+    prev_monday = today - timedelta(days=14)
+    prev_sunday = today - timedelta(days=8)
 
-    # 억 단위 매칭: "100억", "2.5억"
-    match = re.search(r'([\d,.]+)\s*억', cleaned)
-    if match:
-        num_str = match.group(1).replace(',', '')
-        try:
-            return float(num_str)
-        except ValueError:
-            return 0
-
-    # 만 달러 → 억원 환산 (대략 1300만원/만달러 기준)
-    match = re.search(r'([\d,.]+)\s*만\s*달러', cleaned)
-    if match:
-        num_str = match.group(1).replace(',', '')
-        try:
-            return float(num_str) * 0.13  # 대략적 환산
-        except ValueError:
-            return 0
-
-    # $NM (million) → 억원
-    match = re.search(r'\$\s*([\d,.]+)\s*[Mm]', cleaned)
-    if match:
-        num_str = match.group(1).replace(',', '')
-        try:
-            return float(num_str) * 0.13
-        except ValueError:
-            return 0
+    result = supabase.table('deals').select('amount,amount_eok,news_date').gte(
+        'news_date', prev_monday.isoformat()
+    ).lte(
+        'news_date', f"{prev_sunday.isoformat()} 23:59:59"
+    ).execute()
 
-    return 0
+    return result.data
 
 
-def analyze_deals(deals):
+def analyze_deals(deals, previous_deals=None):
     """
-    Deal 데이터 분석
+    Deal 데이터 분석 (backend app/services/deal_analytics.py 공용 모듈)
 
     Args:
         deals: Deal 리스트
+        previous_deals: 그 전 주 Deal 리스트 (전주 대비 증감 계산용)
 
     Returns:
         분석 결과 딕셔너리
     """
-    if not deals:
-        return None
-
-    # 투자금액 파싱
-    for deal in deals:
-        deal['_parsed_amount'] = parse_amount(deal.get('amount', ''))
-
-    total_amount = sum(d['_parsed_amount'] for d in deals)
-
-    # 금액 기준 Top 5
-    deals_with_amount = sorted(deals, key=lambda d: d['_parsed_amount'], reverse=True)
-    top5_deals = deals_with_amount[:5]
-
-    # 최대 규모 딜
-    max_deal = deals_with_amount[0] if deals_with_amount else None
-
-    # 업종별 통계 (DB의 industry_category 사용)
-    industry_stats = {}
-    for deal in deals:
-        cat = deal.get('industry_category')
-        if cat:
-            if cat not in industry_stats:
-                industry_stats[cat] = {'count': 0, 'amount': 0}
-            industry_stats[cat]['count'] += 1
-            industry_stats[cat]['amount'] += deal['_parsed_amount']
-
-    # 건수 기준 정렬
-    industry_sorted = sorted(industry_stats.items(), key=lambda x: x[1]['count'], reverse=True)
-
-    # 가장 활발한 업종 (2건 이상만, 없으면 1건이라도)
-    top_industry = None
-    for item in industry_sorted:
-        if item[1]['count'] >= 2:
-            top_industry = item
-            break
-    if not top_industry and industry_sorted:
-        top_industry = industry_sorted[0]
-
-    # 투자단계별 통계
-    stages = [deal.get('stage') for deal in deals if deal.get('stage')]
-    stage_counts = Counter(stages).most_common()
-
-    # 투자자별 통계
-    investors = []
-    for deal in deals:
-        if deal.get('investors'):
-            investors.extend([inv.strip() for inv in deal['investors'].split(',')])
-    investor_counts = Counter(investors).most_common(5)
-
-    return {
-        'total_deals': len(deals),
-        'total_amount': total_amount,
-        'max_deal': max_deal,
-        'top_industry': top_industry,
-        'top5_deals': top5_deals,
-        'industry_sorted': industry_sorted[:7],
-        'stage_counts': stage_counts,
-        'investor_counts': investor_counts,
-    }
+    return deal_analytics.analyze_deals(deals, previous_deals)
+
+
+def format_week_over_week(wow):
+    """전주 대비 증감 문구 (비교 불가 시 빈 문자열)"""
+    if not wow:
+        return ''
+    parts = [f"건수 {wow['deals_delta']:+d}건"]
+    if wow['amount_pct'] is not None:
+        parts.append(f"금액 {wow['amount_pct']:+.0%}")
+    elif wow['amount'] > 0:
+        parts.append(f"금액 +{wow['amount']:,.0f}억원")
+    return "전주 대비 " + " &#183; ".join(parts)
 
 
 def generate_weekly_html(deals, stats):
@@ -230,6 +159,7 @@ def generate_weekly_html(deals, stats):
         top_ind_count = stats['top_industry'][1]['count'] if stats['top_industry'] else 0
         max_deal = stats['max_deal']
         max_deal_str = f"{max_deal['company_name']} {max_deal.get('amount', '금액 미공개')}" if max_deal else '-'
+        wow_str = format_week_over_week(stats.get('week_over_week'))
 
         html += f"""
     <!-- Section 1: Summary -->
@@ -245,6 +175,7 @@ def generate_weekly_html(deals, stats):
                         <td valign="middle">
                             <p style="margin:0; font-size:14px; color:#6b7280; line-height:1.3;">총 투자 건수 / 금액</p>
                             <p style="margin:4px 0 0; font-size:17px; color:#1a1a1a; font-weight:700;">{stats['total_deals']}건&nbsp;&nbsp;&#183;&nbsp;&nbsp;{total_amount_str}</p>
+                            {f'<p style="margin:4px 0 0; font-size:12px; color:#6b7280;">{wow_str}</p>' if wow_str else ''}
                         </td>
                     </tr>
                 </table>
@@ -585,8 +516,8 @@ def main():
 
     print(f"\nFound {len(deals)} deals from last week")
 
-    # 통계 분석
-    stats = analyze_deals(deals)
+    # 통계 분석 (전주 대비 포함)
+    stats = analyze_deals(deals, get_previous_week_deals())
 
     # 이메일 HTML 생성
     html_content = generate_weekly_html(deals, stats)
@@ -0,0 +1,61 @@
+-- deals.amount_eok: 투자금액 억원 숫자 컬럼 (수집 시 app/services/deal_amounts.parse_amount_eok로 기록)
+-- 주간 리포트 / 대시보드가 amount 문자열을 매번 정규식으로 다시 파싱하지 않도록 한 번만 정규화
+
+ALTER TABLE deals
+ADD COLUMN IF NOT EXISTS amount_eok NUMERIC;
+
+-- parse_amount_eok와 같은 규칙 (기존 행 백필용)
+CREATE OR REPLACE FUNCTION parse_amount_eok(raw TEXT)
+RETURNS NUMERIC
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    cleaned TEXT := trim(regexp_replace(trim(coalesce(raw, '')), '(약|총|최대|규모|원|이상|이내)', '', 'g'));
+    num TEXT;
+    patterns TEXT[] := ARRAY['([\d,.]+)\s*억', '([\d,.]+)\s*만\s*달러', '\$\s*([\d,.]+)\s*[Mm]', '^([\d,.]+)$'];
+    factors NUMERIC[] := ARRAY[1, 0.13, 13, 1];
+BEGIN
+    FOR i IN 1..array_length(patterns, 1) LOOP
+        num := replace(substring(cleaned FROM patterns[i]), ',', '');
+        IF num IS NOT NULL THEN
+            IF num ~ '^(\d+\.?\d*|\.\d+)$' THEN
+                RETURN num::NUMERIC * factors[i];
+            END IF;
+            RETURN 0;
+        END IF;
+    END LOOP;
+    RETURN 0;
+END;
+$$;
+
+UPDATE deals
+SET amount_eok = parse_amount_eok(amount::TEXT)
+WHERE amount_eok IS NULL;
+
+-- 금액 상위 / 기간별 집계
+CREATE INDEX IF NOT EXISTS idx_deals_news_date_amount_eok ON deals(news_date, amount_eok DESC);
+
+-- 주(월요일 시작)별 건수 / 금액과 전주 대비 (deal_analytics.weekly_summary와 같은 집계, 거래 없는 주는 0)
+CREATE OR REPLACE VIEW deals_weekly_summary AS
+WITH weekly AS (
+    SELECT
+        date_trunc('week', news_date::date)::date AS week_start,
+        COUNT(*) AS deals,
+        COALESCE(SUM(amount_eok), 0) AS amount
+    FROM deals
+    WHERE news_date IS NOT NULL
+    GROUP BY 1
+), weeks AS (
+    SELECT generate_series(MIN(week_start), MAX(week_start), INTERVAL '7 days')::date AS week_start
+    FROM weekly
+)
+SELECT
+    weeks.week_start,
+    COALESCE(weekly.deals, 0) AS deals,
+    COALESCE(weekly.amount, 0) AS amount,
+    COALESCE(weekly.deals, 0) - LAG(COALESCE(weekly.deals, 0)) OVER w AS deals_delta,
+    COALESCE(weekly.amount, 0) - LAG(COALESCE(weekly.amount, 0)) OVER w AS amount_delta
+FROM weeks
+LEFT JOIN weekly USING (week_start)
+WINDOW w AS (ORDER BY weeks.week_start);
@@ -7,11 +7,13 @@ Investment Tracker API Endpoints
 """
 import logging
 from datetime import datetime, timedelta
-from typing import List, Optional
+from types import SimpleNamespace
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
 
 from app.core.config import settings
+from app.core.pagination import InvalidCursorError
 from app.schemas.investment_tracker import (
     CompanyResponse,
     CompanyListResponse,
@@ -22,6 +24,8 @@ from app.schemas.investment_tracker import (
     NewsDetailResponse,
     NewsListResponse,
     EmailTemplateResponse,
+    EmailBatchCreate,
+    EmailBatchResponse,
     CollectionResponse,
     CollectionListResponse,
     CollectionTriggerRequest,
@@ -83,9 +87,10 @@ async def list_companies(
     page_size: int = Query(20, ge=1, le=100),
     industry: Optional[str] = None,
     stage: Optional[InvestmentStage] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (있으면 page 대신 사용)")
 ):
-    """기업 목록 조회"""
+    """기업 목록 조회 (총건수는 추정/캐시값)"""
     client = get_supabase()
 
     if not client:
@@ -103,7 +108,8 @@ async def list_companies(
             page_size=page_size,
             industry=industry,
             stage=stage.value if stage else None,
-            search=search
+            search=search,
+            cursor=cursor
         )
 
         return CompanyListResponse(
@@ -111,8 +117,11 @@ async def list_companies(
             total=result["total"],
             page=result["page"],
             page_size=result["page_size"],
-            total_pages=result["total_pages"]
+            total_pages=result["total_pages"],
+            next_cursor=result["next_cursor"]
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"List companies error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -258,18 +267,11 @@ async def regenerate_email_template(
             # 피드백 기반 재생성 (추후 구현)
             generated = original
         else:
-            # 새로 생성
-            class MockCompany:
-                def __init__(self, data):
-                    self.name_ko = data.get("name_ko", "")
-                    self.name_en = data.get("name_en")
-                    self.industry = data.get("industry")
-                    self.sub_industry = data.get("sub_industry")
-                    self.description = data.get("description")
-
+            # 새로 생성 (재생성 요청이므로 캐시된 초안을 쓰지 않음)
             generated = await email_generator.generate_initial_email(
-                MockCompany(company),
-                None
+                to_email_company(company),
+                None,
+                use_cache=False
             )
 
         # 새 템플릿 저장
@@ -293,6 +295,103 @@ async def regenerate_email_template(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def to_email_company(data: Dict) -> SimpleNamespace:
+    """DB 기업 행 → 이메일 생성기 입력"""
+    return SimpleNamespace(
+        name_ko=data.get("name_ko", ""),
+        name_en=data.get("name_en"),
+        industry=data.get("industry"),
+        sub_industry=data.get("sub_industry"),
+        description=data.get("description")
+    )
+
+
+def to_batch_response(job) -> EmailBatchResponse:
+    data = job.to_dict()
+    for draft in data["drafts"]:
+        draft["company_id"] = draft.pop("key")
+    return EmailBatchResponse(**data)
+
+
+@router.post("/email-templates/batch", response_model=EmailBatchResponse)
+async def start_email_batch(request: EmailBatchCreate):
+    """
+    이메일 일괄 생성
+
+    기본 템플릿으로 채운 초안을 즉시 반환하고, AI 버전은 백그라운드에서 생성해
+    완성되는 대로 이메일 템플릿으로 저장한다. 진행 상황은 GET /email-templates/batch/{batch_id}.
+    """
+    client = get_supabase()
+
+    if not client:
+        raise HTTPException(status_code=503, detail="Database not configured")
+
+    try:
+        from app.services.email_generator import EmailDraftRequest, email_generator
+
+        if request.company_ids:
+            companies = await client.get_companies_by_ids(request.company_ids[:request.limit])
+        else:
+            since = datetime.utcnow() - timedelta(days=request.since_days)
+            companies = await client.get_recently_funded_companies(since, limit=request.limit)
+
+        latest_rounds = await client.get_latest_rounds([c["id"] for c in companies])
+
+        async def save_draft(draft_request, generated):
+            existing = await client.get_email_template(draft_request.key)
+            # 캐시 초안이 현재 템플릿과 같으면 새 버전을 만들지 않음
+            if (
+                generated.source == "cache"
+                and existing
+                and existing.get("subject") == generated.subject
+                and existing.get("body") == generated.body
+            ):
+                return
+            await client.create_email_template({
+                "company_id": draft_request.key,
+                "subject": generated.subject,
+                "body": generated.body,
+                "template_type": generated.template_type,
+                "generation_prompt": generated.generation_prompt,
+                "version": (existing.get("version", 0) if existing else 0) + 1,
+                "is_active": True
+            })
+
+        job = email_generator.start_batch(
+            [
+                EmailDraftRequest(
+                    company=to_email_company(company),
+                    latest_round=(
+                        SimpleNamespace(**latest_rounds[company["id"]])
+                        if company["id"] in latest_rounds else None
+                    ),
+                    key=company["id"]
+                )
+                for company in companies
+            ],
+            on_draft=save_draft
+        )
+
+        return to_batch_response(job)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Start email batch error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/email-templates/batch/{batch_id}", response_model=EmailBatchResponse)
+async def get_email_batch(batch_id: str):
+    """이메일 일괄 생성 진행 상황 / 초안 조회"""
+    from app.services.email_generator import email_generator
+
+    job = email_generator.get_batch(batch_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Email batch not found")
+
+    return to_batch_response(job)
+
+
 # ============================================================
 # News
 # ============================================================
@@ -303,9 +402,10 @@ async def list_news(
     page_size: int = Query(20, ge=1, le=100),
     source: Optional[str] = None,
     company_id: Optional[int] = None,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (있으면 page 대신 사용)")
 ):
-    """뉴스 목록 조회"""
+    """뉴스 목록 조회 (총건수는 추정/캐시값)"""
     client = get_supabase()
 
     if not client:
@@ -322,7 +422,8 @@ async def list_news(
             page=page,
             page_size=page_size,
             source=source,
-            company_id=company_id
+            company_id=company_id,
+            cursor=cursor
         )
 
         return NewsListResponse(
@@ -330,8 +431,11 @@ async def list_news(
             total=result["total"],
             page=result["page"],
             page_size=result["page_size"],
-            total_pages=result["total_pages"]
+            total_pages=result["total_pages"],
+            next_cursor=result["next_cursor"]
         )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"List news error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -5,13 +5,21 @@ Valuation API Endpoints
 @task Valuation Platform
 @description FastAPI endpoints for managing the 14-step valuation process
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Literal, Optional
+from typing import Any, AsyncIterator, Dict, Literal, Optional
 from datetime import datetime
+import json
 import logging
 
 from app.db.supabase_client import supabase_client
+from app.services.progress_hub import (
+    MAX_STEP,
+    build_progress_fields,
+    get_status_message,
+    progress_hub
+)
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -23,7 +31,6 @@ logger = logging.getLogger(__name__)
 VALID_METHODS = ["dcf", "relative", "intrinsic", "asset", "inheritance_tax"]
 VALID_STATUSES = ["not_requested", "pending", "approved", "in_progress", "completed"]
 MIN_STEP = 1
-MAX_STEP = 14
 
 # ============================================================
 # Pydantic Models
@@ -116,20 +123,39 @@ def get_field_names(method: str) -> tuple[str, str]:
     """평가법에 따른 필드명 반환"""
     return f"{method}_status", f"{method}_step"
 
-def calculate_progress(step: int) -> int:
-    """단계 번호로부터 진행률 계산"""
-    return int((step / MAX_STEP) * 100)
-
-def get_status_message(status: str, step: int) -> str:
-    """상태 메시지 생성"""
-    messages = {
-        "not_requested": "평가가 신청되지 않았습니다",
-        "pending": "승인 대기 중입니다",
-        "approved": "승인되었습니다",
-        "in_progress": f"진행 중입니다 (단계 {step}/14)",
-        "completed": "평가가 완료되었습니다"
-    }
-    return messages.get(status, "알 수 없는 상태")
+def progress_loader(project_id: str, method: str):
+    """진행 허브 스냅샷이 없을 때 DB에서 한 번 읽어오는 loader"""
+    async def load() -> Dict[str, Any]:
+        project = await validate_project_exists(project_id)
+        status_field, step_field = get_field_names(method)
+        return build_progress_fields(
+            project.get(status_field, "not_requested"),
+            project.get(step_field, 1)
+        )
+    return load
+
+def to_progress_response(event: Dict[str, Any]) -> ProgressResponse:
+    """진행 허브 스냅샷을 응답 모델로 변환"""
+    return ProgressResponse(
+        progress=event["progress"],
+        current_step=event["step"],
+        status=event["status"],
+        message=event.get("message") or get_status_message(event["status"], event["step"])
+    )
+
+async def format_sse(events: AsyncIterator[Optional[Dict[str, Any]]]) -> AsyncIterator[str]:
+    """진행 이벤트를 Server-Sent Events 형식으로 변환 (None은 keep-alive 주석)"""
+    async for event in events:
+        if event is None:
+            yield ": keep-alive\n\n"
+            continue
+
+        payload = {**to_progress_response(event).model_dump(), "detail": event.get("detail")}
+        yield (
+            f"id: {event['seq']}\n"
+            f"event: progress\n"
+            f"data: {json.dumps(payload, ensure_ascii=False)}\n\n"
+        )
 
 # ============================================================
 # API Endpoints
@@ -165,6 +191,10 @@ async def start_valuation(request: StartValuationRequest):
             filters={"id": request.project_id}
         )
 
+        progress_hub.publish(
+            request.project_id, request.method, **build_progress_fields("in_progress", 5)
+        )
+
         logger.info(f"Valuation started successfully: {request.project_id} - {request.method}")
 
         return StartValuationResponse(
@@ -195,42 +225,105 @@ async def get_progress(
 
     - 프로젝트의 특정 평가법 진행 상황을 조회합니다
     - 진행률, 현재 단계, 상태를 반환합니다
+    - 진행 허브 스냅샷이 있으면 DB를 조회하지 않습니다 (실시간 수신은 /progress/stream 권장)
     """
     logger.info(f"Getting progress: project_id={project_id}, method={method}")
 
     try:
-        # 프로젝트 조회
-        project = await validate_project_exists(project_id)
-
-        # 필드명 생성
-        status_field, step_field = get_field_names(method)
+        event = await progress_hub.get_or_load(
+            project_id, method, progress_loader(project_id, method)
+        )
+        return to_progress_response(event)
 
-        # 상태 및 단계 추출
-        status = project.get(status_field, "not_requested")
-        step = project.get(step_field, 1)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting progress: {str(e)}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to get progress: {str(e)}"
+        )
 
-        # 진행률 계산
-        progress = calculate_progress(step)
+@router.get("/progress/stream")
+async def stream_progress(
+    project_id: str = Query(..., description="프로젝트 ID"),
+    method: Literal["dcf", "relative", "intrinsic", "asset", "inheritance_tax"] = Query(
+        ..., description="평가 방법"
+    )
+):
+    """
+    진행 상황 스트림 (Server-Sent Events)
 
-        # 메시지 생성
-        message = get_status_message(status, step)
+    - 현재 상태를 즉시 보내고, 상태가 바뀔 때마다 `progress` 이벤트를 보냅니다
+    - 같은 프로젝트를 보는 모든 구독자는 프로세스 내 진행 허브 하나를 공유합니다
+    - 평가가 완료되면 스트림이 종료됩니다
+    """
+    logger.info(f"Streaming progress: project_id={project_id}, method={method}")
 
-        return ProgressResponse(
-            progress=progress,
-            current_step=step,
-            status=status,
-            message=message
-        )
+    loader = progress_loader(project_id, method)
 
+    try:
+        # 스트림 시작 전에 프로젝트 존재 확인 (404를 일반 응답으로 반환)
+        await progress_hub.get_or_load(project_id, method, loader)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error getting progress: {str(e)}")
+        logger.error(f"Error streaming progress: {str(e)}")
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to get progress: {str(e)}"
+            detail=f"Failed to stream progress: {str(e)}"
         )
 
+    return StreamingResponse(
+        format_sse(progress_hub.watch(project_id, method, loader)),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+@router.websocket("/progress/ws")
+async def websocket_progress(
+    websocket: WebSocket,
+    project_id: str = Query(..., description="프로젝트 ID"),
+    method: Literal["dcf", "relative", "intrinsic", "asset", "inheritance_tax"] = Query(
+        ..., description="평가 방법"
+    )
+):
+    """
+    진행 상황 스트림 (WebSocket)
+
+    - SSE와 같은 이벤트를 JSON 메시지로 보냅니다 ({"type": "progress", ...})
+    - 이벤트가 없을 때는 {"type": "heartbeat"}를 보냅니다
+    - 프로젝트가 없으면 1008 코드로 종료합니다
+    """
+    await websocket.accept()
+
+    try:
+        async for event in progress_hub.watch(
+            project_id, method, progress_loader(project_id, method)
+        ):
+            if event is None:
+                await websocket.send_json({"type": "heartbeat"})
+                continue
+
+            await websocket.send_json({
+                "type": "progress",
+                **to_progress_response(event).model_dump(),
+                "detail": event.get("detail")
+            })
+
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info(f"Progress watcher disconnected: project_id={project_id}, method={method}")
+    except HTTPException as e:
+        await websocket.close(code=1008, reason=str(e.detail))
+    except Exception as e:
+        logger.error(f"Error streaming progress: {str(e)}")
+        await websocket.close(code=1011)
+
 @router.get("/result", response_model=ResultResponse)
 async def get_result(
     project_id: str = Query(..., description="프로젝트 ID"),
@@ -322,6 +415,11 @@ async def advance_step(request: AdvanceStepRequest):
             filters={"id": request.project_id}
         )
 
+        new_status = update_data.get(status_field, project.get(status_field, "in_progress"))
+        progress_hub.publish(
+            request.project_id, request.method, **build_progress_fields(new_status, new_step)
+        )
+
         logger.info(f"Step advanced: {request.project_id} - {request.method} - step {new_step}")
 
         return AdvanceStepResponse(
@@ -354,7 +452,7 @@ async def update_status(request: UpdateStatusRequest):
 
     try:
         # 프로젝트 존재 확인
-        await validate_project_exists(request.project_id)
+        project = await validate_project_exists(request.project_id)
 
         # 필드명 생성
         status_field, step_field = get_field_names(request.method)
@@ -375,6 +473,11 @@ async def update_status(request: UpdateStatusRequest):
             filters={"id": request.project_id}
         )
 
+        step = request.step if request.step is not None else project.get(step_field, 1)
+        progress_hub.publish(
+            request.project_id, request.method, **build_progress_fields(request.status, step)
+        )
+
         logger.info(
             f"Status updated: {request.project_id} - {request.method} - {request.status}"
         )
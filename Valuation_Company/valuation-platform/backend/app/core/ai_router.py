@@ -1,9 +1,26 @@
 """
 AI Router - 50:30:20 하이브리드 전략
 Claude 50% | ChatGPT 30% | Gemini 20%
+
+정적 작업 유형 테이블(select_model)을 기본 선호로 두고,
+제공자별 최근 지연(p50/p95)·오류율·토큰 예산을 보고 실행 순서를 조정한다.
+- 실패 시 다음 제공자로 자동 전환 (failover)
+- 선택적으로 지연 임계치를 넘기면 두 번째 제공자에 동시 요청 (hedged request)
+- 제공자별 동시 실행 수 / 분당 토큰 예산 제한
 """
+import asyncio
+import random
+import time
+from collections import deque
 from enum import Enum
-from typing import Literal
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Literal, Optional, Tuple
+
+from app.core.config import settings
+
+ProviderName = Literal["claude", "gemini", "openai"]
+ProviderHandler = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+PROVIDERS: Tuple[str, ...] = ("claude", "openai", "gemini")
 
 class TaskType(str, Enum):
     # Claude 50% - 핵심 비즈니스 로직
@@ -14,6 +31,7 @@ class TaskType(str, Enum):
     COMPARABLE_CALCULATION = "comparable_calculation"
     PDF_GENERATION = "pdf_generation"
     DATA_VALIDATION = "data_validation"
+    EMAIL_GENERATION = "email_generation"
 
     # OpenAI 30% - 멀티모달/구조화/챗봇
     IMAGE_OCR = "image_ocr"
@@ -28,6 +46,7 @@ class TaskType(str, Enum):
     INDUSTRY_ANALYSIS = "industry_analysis"
     LARGE_CONTEXT = "large_context"
     REAL_TIME_DATA = "real_time_data"
+    NEWS_EXTRACTION = "news_extraction"
 
 class TaskPriority(str, Enum):
     CRITICAL = "CRITICAL"
@@ -35,14 +54,158 @@ class TaskPriority(str, Enum):
     NORMAL = "NORMAL"
     LOW = "LOW"
 
+class NoProviderAvailableError(RuntimeError):
+    """실행 가능한 제공자 없음 (미등록, 컨텍스트 초과, 토큰 예산 소진)"""
+
+
+class AllProvidersFailedError(RuntimeError):
+    """모든 후보 제공자 호출 실패"""
+
+    def __init__(self, errors: Dict[str, Exception]):
+        self.errors = errors
+        detail = ", ".join(f"{name}: {error!r}" for name, error in errors.items())
+        super().__init__(f"All AI providers failed ({detail})")
+
+
+class ProviderStats:
+    """
+    제공자별 최근 호출 통계
+
+    최근 window개 호출의 지연/성공 여부와 최근 1분 토큰 사용량을 유지한다.
+    """
+
+    def __init__(self, window: int = 200):
+        self.samples: Deque[Tuple[float, bool]] = deque(maxlen=window)
+        self.tokens: Deque[Tuple[float, int]] = deque()
+        self.in_flight = 0
+        self.last_error_at: Optional[float] = None
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.samples.append((latency, ok))
+        if not ok:
+            self.last_error_at = time.monotonic()
+
+    def percentile(self, q: float) -> Optional[float]:
+        """성공 호출 지연의 백분위수 (표본 없으면 None)"""
+        latencies = sorted(latency for latency, ok in self.samples if ok)
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, int(round(q * (len(latencies) - 1))))
+        return latencies[index]
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.percentile(0.50)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.percentile(0.95)
+
+    @property
+    def error_rate(self) -> float:
+        if not self.samples:
+            return 0.0
+        return sum(1 for _, ok in self.samples if not ok) / len(self.samples)
+
+    def tokens_last_minute(self) -> int:
+        cutoff = time.monotonic() - 60
+        while self.tokens and self.tokens[0][0] < cutoff:
+            self.tokens.popleft()
+        return sum(count for _, count in self.tokens)
+
+    def add_tokens(self, count: int) -> None:
+        if count:
+            self.tokens.append((time.monotonic(), count))
+
+    def reserve(self, count: int) -> Optional[Tuple[float, int]]:
+        """호출 전 예상 토큰 예약 (release로 되돌릴 수 있는 항목 반환)"""
+        if not count:
+            return None
+        entry = (time.monotonic(), count)
+        self.tokens.append(entry)
+        return entry
+
+    def release(self, entry: Optional[Tuple[float, int]]) -> None:
+        """예약 해제 (이미 1분이 지나 빠졌으면 무시)"""
+        if entry is None:
+            return
+        try:
+            self.tokens.remove(entry)
+        except ValueError:
+            pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "samples": len(self.samples),
+            "p50": self.p50,
+            "p95": self.p95,
+            "error_rate": round(self.error_rate, 3),
+            "in_flight": self.in_flight,
+            "tokens_last_minute": self.tokens_last_minute(),
+        }
+
+
+class StubProvider:
+    """
+    로컬 테스트용 제공자
+
+    지연/오류율을 지정해 실제 API 없이 라우팅·failover·hedging을 검증한다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        tokens: int = 100,
+        seed: Optional[int] = None
+    ):
+        self.name = name
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.tokens = tokens
+        self.calls = 0
+        self._random = random.Random(seed)
+
+    async def __call__(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls += 1
+        await asyncio.sleep(self.latency + self._random.uniform(0, self.jitter))
+        if self._random.random() < self.error_rate:
+            raise RuntimeError(f"{self.name} stub error")
+        return {
+            "content": f"[{self.name}] {request.get('prompt', '')[:40]}",
+            "usage": {"total_tokens": self.tokens},
+        }
+
+
 class AIRouter:
     """
     AI 작업을 최적의 모델로 라우팅
     Claude 50% - 품질 최우선 (핵심 로직, 보안)
     OpenAI 30% - 멀티모달/구조화 (이미지 OCR, PDF 분석, 챗봇)
     Gemini 20% - 실시간 검색/대용량 (기업 리서치, 산업 분석)
+
+    execute()는 select_model()의 선택을 기본으로 하되 제공자 상태에 따라
+    순서를 바꾸고, 실패 시 다음 제공자로 넘어간다.
     """
 
+    def __init__(self, providers: Optional[Dict[str, ProviderHandler]] = None):
+        """
+        Args:
+            providers: {제공자 이름: async handler(request) -> {'content', 'usage'}}
+                       (StubProvider 또는 ai_client 완성 함수)
+        """
+        self.providers: Dict[str, ProviderHandler] = dict(providers or {})
+        self.stats: Dict[str, ProviderStats] = {name: ProviderStats() for name in PROVIDERS}
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def register_provider(self, name: str, handler: ProviderHandler) -> None:
+        """제공자 handler 등록 (같은 이름이면 교체)"""
+        self.providers[name] = handler
+        self.stats.setdefault(name, ProviderStats())
+
     def select_model(
         self,
         task_type: TaskType,
@@ -74,6 +237,7 @@ class AIRouter:
             TaskType.COMPARABLE_CALCULATION,
             TaskType.PDF_GENERATION,
             TaskType.DATA_VALIDATION,
+            TaskType.EMAIL_GENERATION,
         ]:
             return "claude"
 
@@ -94,6 +258,7 @@ class AIRouter:
             TaskType.INDUSTRY_ANALYSIS,
             TaskType.LARGE_CONTEXT,
             TaskType.REAL_TIME_DATA,
+            TaskType.NEWS_EXTRACTION,
         ] or context_size > 200_000:
             return "gemini"
 
@@ -108,21 +273,232 @@ class AIRouter:
                 "max_tokens": 4096,
                 "temperature": 0.0,
                 "usage_ratio": 0.50,
+                "context_window": 200_000,
+                "cost_per_1k_tokens": 0.009,
+                "max_concurrency": 8,
+                "tokens_per_minute": 400_000,
             },
             "openai": {
                 "model": "gpt-4o",
                 "max_tokens": 4096,
                 "temperature": 0.0,
                 "usage_ratio": 0.30,
+                "context_window": 128_000,
+                "cost_per_1k_tokens": 0.00625,
+                "max_concurrency": 8,
+                "tokens_per_minute": 450_000,
             },
             "gemini": {
                 "model": "gemini-1.5-pro",
                 "max_tokens": 8192,
                 "temperature": 0.0,
                 "usage_ratio": 0.20,
+                "context_window": 2_000_000,
+                "cost_per_1k_tokens": 0.003,
+                "max_concurrency": 8,
+                "tokens_per_minute": 2_000_000,
             }
         }
         return configs.get(model, configs["claude"])
 
+    # ============================================================
+    # 상태 기반 라우팅
+    # ============================================================
+
+    def _semaphore(self, name: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.get_model_config(name)["max_concurrency"])
+            self._semaphores[name] = semaphore
+        return semaphore
+
+    def is_healthy(self, name: str) -> bool:
+        """
+        제공자 정상 여부
+
+        최근 오류율이 AI_MAX_ERROR_RATE 이상이고 마지막 오류가 쿨다운 이내면 비정상.
+        쿨다운이 지나면 다시 시도해 본다 (half-open).
+        """
+        stats = self.stats[name]
+        if len(stats.samples) < 5 or stats.error_rate < settings.AI_MAX_ERROR_RATE:
+            return True
+        return time.monotonic() - (stats.last_error_at or 0) > settings.AI_CIRCUIT_COOLDOWN_SECONDS
+
+    def has_budget(self, name: str, tokens: int) -> bool:
+        """분당 토큰 예산 안에서 tokens를 더 쓸 수 있는지"""
+        budget = self.get_model_config(name)["tokens_per_minute"]
+        return self.stats[name].tokens_last_minute() + tokens <= budget
+
+    def rank_providers(
+        self,
+        task_type: TaskType,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        context_size: int = 0,
+        estimated_tokens: int = 0
+    ) -> List[str]:
+        """
+        실행 순서 결정
+
+        1. 등록되어 있고, 컨텍스트가 들어가고, 토큰 예산이 남은 제공자만 후보
+        2. select_model() 선택이 정상이고 p95가 SLO 이내면 맨 앞
+        3. 나머지는 정상 여부 → 비용 → p50 순 (비정상 제공자는 최후 수단)
+        """
+        preferred = self.select_model(task_type, priority, context_size)
+
+        candidates = [
+            name for name in self.providers
+            if context_size <= self.get_model_config(name)["context_window"]
+            and self.has_budget(name, estimated_tokens)
+        ]
+
+        def is_fast(name: str) -> bool:
+            p95 = self.stats[name].p95
+            return p95 is None or p95 <= settings.AI_LATENCY_SLO_SECONDS
+
+        def sort_key(name: str):
+            healthy = self.is_healthy(name)
+            return (
+                0 if name == preferred and healthy and is_fast(name) else 1,
+                0 if healthy else 1,
+                0 if is_fast(name) else 1,
+                self.get_model_config(name)["cost_per_1k_tokens"],
+                self.stats[name].p50 or 0.0,
+            )
+
+        return sorted(candidates, key=sort_key)
+
+    async def _call(self, name: str, request: Dict[str, Any], estimated_tokens: int) -> Dict[str, Any]:
+        """
+        제공자 호출 (동시 실행 제한, 예산 예약, 통계 기록)
+
+        예상 토큰은 호출 동안만 예약하고, 성공하면 실제 사용량으로 바꿔 기록한다.
+        실패하거나 취소(hedging에서 짐)되면 예약을 해제해 예산을 돌려준다.
+        """
+        stats = self.stats[name]
+
+        async with self._semaphore(name):
+            reservation = stats.reserve(estimated_tokens)
+            stats.in_flight += 1
+            started = time.perf_counter()
+            try:
+                response = await self.providers[name](request)
+            except asyncio.CancelledError:
+                # hedging에서 진 요청은 통계에 넣지 않음
+                raise
+            except Exception:
+                stats.record(time.perf_counter() - started, ok=False)
+                raise
+            finally:
+                stats.in_flight -= 1
+                stats.release(reservation)
+
+        stats.record(time.perf_counter() - started, ok=True)
+
+        # usage.total_tokens = 입력 + 출력 토큰 (모르면 예약했던 예상치로 차감)
+        used = (response.get("usage") or {}).get("total_tokens")
+        stats.add_tokens(estimated_tokens if used is None else used)
+
+        return {**response, "provider": name, "latency": time.perf_counter() - started}
+
+    def _hedge_delay(self, name: str) -> float:
+        """hedge 요청을 보낼 대기 시간 (표본이 충분하면 해당 제공자 p95)"""
+        stats = self.stats[name]
+        if len(stats.samples) >= 20 and stats.p95 is not None:
+            return max(stats.p95, 0.05)
+        return settings.AI_HEDGE_AFTER_SECONDS
+
+    async def execute(
+        self,
+        task_type: TaskType,
+        request: Dict[str, Any],
+        priority: TaskPriority = TaskPriority.NORMAL,
+        context_size: int = 0,
+        estimated_tokens: Optional[int] = None,
+        hedge: bool = False
+    ) -> Dict[str, Any]:
+        """
+        작업 실행 (failover + 선택적 hedging)
+
+        Args:
+            task_type: 작업 유형
+            request: 제공자 handler에 그대로 전달할 요청
+                     ({'prompt', 'system', 'max_tokens', 'temperature', 'json', 'models', 'operation'})
+            priority: 우선순위
+            context_size: 입력 컨텍스트 토큰 수
+            estimated_tokens: 예산 예약용 예상 토큰 (None이면 context_size + max_tokens)
+            hedge: True면 첫 요청이 hedge 지연을 넘길 때 다음 제공자에 동시 요청
+
+        Returns:
+            제공자 응답 + {'provider', 'latency'}
+
+        Raises:
+            NoProviderAvailableError: 후보 제공자 없음
+            AllProvidersFailedError: 모든 후보 실패
+        """
+        if estimated_tokens is None:
+            estimated_tokens = context_size + request.get("max_tokens", 0)
+
+        candidates = self.rank_providers(task_type, priority, context_size, estimated_tokens)
+        if not candidates:
+            raise NoProviderAvailableError(f"No AI provider available for {task_type.value}")
+
+        remaining = list(candidates)
+        running: Dict[asyncio.Task, str] = {}
+        errors: Dict[str, Exception] = {}
+
+        def launch_next() -> Optional[str]:
+            while remaining:
+                name = remaining.pop(0)
+                # 대기 중 예산이 소진됐을 수 있음
+                if not self.has_budget(name, estimated_tokens):
+                    errors[name] = NoProviderAvailableError(f"{name} token budget exhausted")
+                    continue
+                task = asyncio.create_task(self._call(name, request, estimated_tokens))
+                running[task] = name
+                return name
+            return None
+
+        launch_next()
+
+        try:
+            while running:
+                timeout = None
+                if hedge and remaining and len(running) == 1:
+                    timeout = self._hedge_delay(next(iter(running.values())))
+
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # 첫 요청이 느림 → 다음 제공자에 hedge 요청
+                    launch_next()
+                    continue
+
+                for task in done:
+                    name = running.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    errors[name] = task.exception()
+
+                if not running:
+                    launch_next()
+        finally:
+            for task in running:
+                task.cancel()
+
+        raise AllProvidersFailedError(errors)
+
+    def get_provider_stats(self) -> Dict[str, Dict[str, Any]]:
+        """제공자별 p50/p95 지연, 오류율, 동시 실행 수, 최근 1분 토큰"""
+        return {
+            name: {
+                **self.stats[name].snapshot(),
+                "healthy": self.is_healthy(name),
+                "registered": name in self.providers,
+            }
+            for name in self.stats
+        }
+
 # 전역 라우터 인스턴스
 ai_router = AIRouter()
@@ -11,6 +11,9 @@ class Settings(BaseSettings):
     SUPABASE_URL: str = ""
     SUPABASE_KEY: str = ""
 
+    # Database - PostgreSQL 직접 연결 (스케줄러 작업 저장소 등)
+    DATABASE_URL: Optional[str] = None
+
     # Application
     DEBUG: bool = True
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
@@ -20,6 +23,65 @@ class Settings(BaseSettings):
     OPENAI_USAGE_RATIO: float = 0.25
     GEMINI_USAGE_RATIO: float = 0.25
 
+    # AI Router - 제공자 상태 기반 라우팅
+    AI_LATENCY_SLO_SECONDS: float = 30.0
+    AI_MAX_ERROR_RATE: float = 0.5
+    AI_CIRCUIT_COOLDOWN_SECONDS: float = 30.0
+    AI_HEDGE_AFTER_SECONDS: float = 8.0
+
+    # AI Client - 공유 HTTP 연결 풀
+    AI_HTTP_MAX_CONNECTIONS: int = 20
+    AI_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    AI_HTTP_TIMEOUT_SECONDS: float = 120.0
+
+    # Scheduler - 작업 저장소 / 워커 간 실행 임대 (URL 미설정 시 DATABASE_URL, 둘 다 없으면 메모리)
+    SCHEDULER_DATABASE_URL: Optional[str] = None
+    SCHEDULER_LEASE_SECONDS: float = 300.0
+
+    # News Crawler - HTML 파서 백엔드 (auto / selectolax / lxml / bs4)
+    CRAWLER_HTML_PARSER: str = "auto"
+
+    # News Crawler - 분할 수집 큐 (URL 미설정 시 DATABASE_URL, 둘 다 없으면 프로세스 내 메모리)
+    CRAWL_QUEUE_DATABASE_URL: Optional[str] = None
+    CRAWL_SHARD_CONCURRENCY: int = 4
+    CRAWL_MAX_SHARDS_PER_SOURCE: int = 2
+    CRAWL_PAGES_PER_SHARD: int = 1
+    CRAWL_SHARD_LEASE_SECONDS: float = 120.0
+    CRAWL_SHARD_MAX_ATTEMPTS: int = 3
+    CRAWL_SHARD_RETRY_BACKOFF_SECONDS: float = 30.0
+    CRAWL_SHARD_RETENTION_DAYS: int = 7  # 끝난 샤드 행(실행 기록) 보존 기간
+    CRAWL_REQUEST_INTERVAL_SECONDS: float = 1.0
+
+    # Valuation Progress - 진행 상황 스트림
+    # DATABASE_URL: 워커 간 발행 전달 (PostgreSQL LISTEN/NOTIFY, 미설정 시 DATABASE_URL, 둘 다 없으면 프로세스 내에서만)
+    # SNAPSHOT_TTL: 발행이 없을 때 스냅샷을 DB 대신 쓰는 시간 (발행자가 멈춘 경우 대비)
+    PROGRESS_DATABASE_URL: Optional[str] = None
+    PROGRESS_SNAPSHOT_TTL_SECONDS: float = 300.0
+    PROGRESS_HEARTBEAT_SECONDS: float = 15.0
+
+    # Valuation Data Collection - Step 5 수집기 (simulated / supabase / fixture)
+    # supabase는 수집 테이블(20261019000001_create_valuation_collection_tables.sql)에 데이터가 채워진 뒤 사용
+    VALUATION_COLLECTOR_SOURCE: str = "simulated"
+    VALUATION_COLLECTOR_TIMEOUT_SECONDS: float = 10.0
+
+    # List API - 목록 총건수 캐시
+    LIST_COUNT_CACHE_TTL_SECONDS: float = 60.0
+
+    # Email Generator - 영업 이메일 일괄 생성
+    EMAIL_BATCH_CONCURRENCY: int = 5
+    EMAIL_CACHE_SIZE: int = 2000
+    EMAIL_CACHE_TTL_SECONDS: float = 7 * 24 * 3600
+
+    # Instrumentation - /metrics, 느린 요청 프로파일 (임계값 미설정 시 프로파일 끔)
+    METRICS_ENABLED: bool = True
+    SLOW_REQUEST_PROFILE_SECONDS: Optional[float] = None
+    PROFILE_SAMPLE_INTERVAL_SECONDS: float = 0.005
+    PROFILE_DUMP_DIR: str = "profiles"
+
+    # Deal Warehouse - deals / 기사 Parquet 스냅샷 (경로 미설정 시 스냅샷 작업 끔, 조회는 backend/data/warehouse)
+    DEAL_WAREHOUSE_DIR: Optional[str] = None
+    DEAL_WAREHOUSE_KEEP_SNAPSHOTS: int = 8
+
     class Config:
         env_file = ".env"
         case_sensitive = True
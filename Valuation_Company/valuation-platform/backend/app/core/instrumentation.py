@@ -0,0 +1,581 @@
+"""
+Instrumentation
+요청 단위 지연/DB·외부 HTTP 호출 계측, 평가 엔진 단계 span, Prometheus /metrics
+
+@task Valuation Platform
+@description 어느 라우트/엔진 단계/DB·HTTP 호출이 느린지 요청 단위로 확인
+
+- MetricsMiddleware: 라우트 템플릿(/api/projects/{project_id})별 지연 히스토그램, 요청당 DB·HTTP 호출 수/시간,
+  Server-Timing 응답 헤더
+- span(): 평가 엔진 단계(normalize, project, wacc, discount, terminal_value ...) 소요 시간
+- instrument_sqlalchemy() / instrument_httpx(): 진행 중인 요청의 통계에 DB 쿼리·외부 HTTP 호출 합산
+- render_metrics(): Prometheus 텍스트 포맷 (prometheus_client 의존성 없음)
+- 느린 요청 프로파일 (선택): 요청 구간의 스레드 스택을 주기적으로 샘플링해 임계값을 넘은 요청만
+  folded stack 파일(flamegraph.pl / speedscope 입력 형식)로 저장
+
+설정/프레임워크(app.core.config)에 의존하지 않으므로 루트 main.py에서도 그대로 사용한다.
+"""
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter as _Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+STAGE_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+CALL_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+# ============================================================
+# Metrics
+# ============================================================
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...] = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: Tuple[str, ...] = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield self.name + "_total", _format_labels(self.labelnames, labels), value
+
+
+class Histogram:
+    """누적 버킷 히스토그램"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels → [버킷별 개수..., 합계, 개수]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: Tuple[str, ...] = ()) -> None:
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    entry[i] += 1
+                    break
+            entry[-2] += value
+            entry[-1] += 1
+
+    def count(self, labels: Tuple[str, ...] = ()) -> int:
+        entry = self._values.get(labels)
+        return entry[-1] if entry else 0
+
+    def sum(self, labels: Tuple[str, ...] = ()) -> float:
+        entry = self._values.get(labels)
+        return entry[-2] if entry else 0.0
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        with self._lock:
+            items = [(labels, list(entry)) for labels, entry in self._values.items()]
+        names = self.labelnames + ("le",)
+        for labels, entry in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, entry):
+                cumulative += bucket_count
+                yield self.name + "_bucket", _format_labels(names, labels + (_format_value(bound),)), cumulative
+            yield self.name + "_bucket", _format_labels(names, labels + ("+Inf",)), entry[-1]
+            yield self.name + "_sum", _format_labels(self.labelnames, labels), entry[-2]
+            yield self.name + "_count", _format_labels(self.labelnames, labels), entry[-1]
+
+
+class MetricsRegistry:
+    """메트릭 등록/Prometheus 텍스트 포맷 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} already registered as {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def get(self, name: str) -> Optional[Any]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4"""
+        lines = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for sample_name, labels, value in metric.samples():
+                lines.append(f"{sample_name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+REQUESTS_TOTAL = registry.counter(
+    "http_requests", "HTTP requests by route template and status", ("method", "route", "status")
+)
+REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+)
+REQUEST_DB_QUERIES = registry.histogram(
+    "http_request_db_queries", "DB queries per HTTP request", ("route",), CALL_COUNT_BUCKETS
+)
+REQUEST_DB_SECONDS = registry.histogram(
+    "http_request_db_seconds", "Time spent in DB queries per HTTP request", ("route",)
+)
+REQUEST_OUTBOUND_CALLS = registry.histogram(
+    "http_request_outbound_calls", "Outbound HTTP calls per HTTP request", ("route",), CALL_COUNT_BUCKETS
+)
+REQUEST_OUTBOUND_SECONDS = registry.histogram(
+    "http_request_outbound_seconds", "Time spent in outbound HTTP calls per HTTP request", ("route",)
+)
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds", "DB query (cursor execute) latency", (), STAGE_BUCKETS + (2.5, 10.0)
+)
+OUTBOUND_DURATION = registry.histogram(
+    "http_client_request_duration_seconds", "Outbound HTTP call latency", ("method", "host", "status")
+)
+STAGE_DURATION = registry.histogram(
+    "valuation_stage_duration_seconds", "Valuation engine stage latency", ("engine", "stage"), STAGE_BUCKETS
+)
+SLOW_REQUEST_PROFILES = registry.counter(
+    "slow_request_profiles", "Slow requests dumped by the sampling profiler", ("route",)
+)
+
+
+def render_metrics() -> str:
+    """기본 레지스트리 Prometheus 텍스트"""
+    return registry.render()
+
+
+# ============================================================
+# 요청 단위 통계
+# ============================================================
+
+class RequestStats:
+    """진행 중인 요청 하나의 DB/HTTP 호출·엔진 단계 합계"""
+
+    __slots__ = ("db_queries", "db_seconds", "http_calls", "http_seconds", "stages")
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.http_calls = 0
+        self.http_seconds = 0.0
+        self.stages: Dict[str, float] = {}
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_request_stats() -> Optional[RequestStats]:
+    """진행 중인 요청의 통계 (요청 밖이면 None)"""
+    return _request_stats.get()
+
+
+@contextmanager
+def span(stage: str, engine: str = "app") -> Iterator[None]:
+    """
+    단계 소요 시간 기록
+
+    Usage:
+        with span("wacc", engine="dcf"):
+            ...
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_DURATION.observe(elapsed, (engine, stage))
+        stats = _request_stats.get()
+        if stats is not None:
+            key = f"{engine}.{stage}"
+            stats.stages[key] = stats.stages.get(key, 0.0) + elapsed
+
+
+def traced(stage: str, engine: str = "app") -> Callable:
+    """span() 데코레이터 버전"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage, engine):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ============================================================
+# DB / 외부 HTTP 계측
+# ============================================================
+
+_sqlalchemy_instrumented = set()
+
+
+def instrument_sqlalchemy(engine: Any = None) -> None:
+    """
+    SQLAlchemy 쿼리 계측 (engine 미지정 시 모든 Engine)
+
+    cursor execute 단위로 db_query_duration_seconds와 진행 중인 요청의 DB 호출 수/시간을 기록한다.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    target = engine if engine is not None else Engine
+    if id(target) in _sqlalchemy_instrumented:
+        return
+    _sqlalchemy_instrumented.add(id(target))
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_instrumentation_query_start", []).append(time.perf_counter())
+
+    def record(conn):
+        starts = conn.info.get("_instrumentation_query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        DB_QUERY_DURATION.observe(elapsed)
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.db_queries += 1
+            stats.db_seconds += elapsed
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        record(conn)
+
+    def handle_error(exception_context):
+        if exception_context.connection is not None:
+            record(exception_context.connection)
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    event.listen(target, "after_cursor_execute", after_cursor_execute)
+    event.listen(target, "handle_error", handle_error)
+
+
+def _record_outbound(request: Any, status: str, elapsed: float) -> None:
+    OUTBOUND_DURATION.observe(elapsed, (request.method, request.url.host or "", status))
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.http_calls += 1
+        stats.http_seconds += elapsed
+
+
+def instrument_httpx() -> None:
+    """
+    httpx Client/AsyncClient.send 계측 (프로세스 전체, 1회)
+
+    클라이언트 생성 위치(Supabase, 크롤러, 알림 등)가 흩어져 있어 send를 감싼다.
+    응답 헤더 수신까지의 시간을 기록한다 (스트리밍 본문 제외).
+    """
+    try:
+        import httpx
+    except ImportError:
+        return
+
+    if getattr(httpx.AsyncClient.send, "_instrumented", False):
+        return
+
+    async_send = httpx.AsyncClient.send
+    sync_send = httpx.Client.send
+
+    @wraps(async_send)
+    async def instrumented_async_send(self, request, *args, **kwargs):
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = await async_send(self, request, *args, **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            _record_outbound(request, status, time.perf_counter() - start)
+
+    @wraps(sync_send)
+    def instrumented_sync_send(self, request, *args, **kwargs):
+        start = time.perf_counter()
+        status = "error"
+        try:
+            response = sync_send(self, request, *args, **kwargs)
+            status = str(response.status_code)
+            return response
+        finally:
+            _record_outbound(request, status, time.perf_counter() - start)
+
+    instrumented_async_send._instrumented = True
+    instrumented_sync_send._instrumented = True
+    httpx.AsyncClient.send = instrumented_async_send
+    httpx.Client.send = instrumented_sync_send
+
+
+# ============================================================
+# 느린 요청 샘플링 프로파일러
+# ============================================================
+
+class StackSampler:
+    """
+    전체 스레드 스택 주기 샘플러
+
+    프로파일 대상 요청이 하나라도 진행 중일 때만 백그라운드 스레드가 샘플링한다.
+    이벤트 루프 스레드는 여러 요청이 공유하므로 동시 요청의 스택이 섞일 수 있다
+    (스택 맨 앞에 스레드 이름을 붙여 구분).
+    """
+
+    def __init__(self, interval_seconds: float = 0.005, max_samples: int = 200_000, max_depth: int = 128):
+        self.interval_seconds = interval_seconds
+        self.max_depth = max_depth
+        self._samples: deque = deque(maxlen=max_samples)
+        self._active = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._frame_names: Dict[Any, str] = {}
+
+    def begin(self) -> float:
+        """샘플링 구간 시작 (시작 시각 반환)"""
+        with self._lock:
+            self._active += 1
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+            self._wake.set()
+        return time.perf_counter()
+
+    def end(self, started_at: float, collect: bool) -> Optional[_Counter]:
+        """샘플링 구간 종료 - collect면 구간 내 샘플을 folded stack별 개수로 반환"""
+        ended_at = time.perf_counter()
+        with self._lock:
+            self._active -= 1
+            if self._active == 0:
+                self._wake.clear()
+            if not collect:
+                return None
+            samples = [stack for ts, stack in self._samples if started_at <= ts <= ended_at]
+        return _Counter(samples)
+
+    def _frame_name(self, code) -> str:
+        name = self._frame_names.get(code)
+        if name is None:
+            name = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            if len(self._frame_names) < 50_000:
+                self._frame_names[code] = name
+        return name
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while True:
+            self._wake.wait()
+            thread_names = {thread.ident: thread.name for thread in threading.enumerate()}
+            now = time.perf_counter()
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                names = []
+                while frame is not None and len(names) < self.max_depth:
+                    names.append(self._frame_name(frame.f_code))
+                    frame = frame.f_back
+                names.append(f"thread:{thread_names.get(ident, ident)}")
+                stack = ";".join(reversed(names))
+                with self._lock:
+                    self._samples.append((now, stack))
+            time.sleep(self.interval_seconds)
+
+
+_route_slug = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def dump_profile(samples: _Counter, profile_dir: str, method: str, route: str, duration: float) -> Optional[Path]:
+    """folded stack 파일 저장 ("frame;frame;frame 개수" 한 줄씩)"""
+    if not samples:
+        return None
+    directory = Path(profile_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    slug = _route_slug.sub("_", route).strip("_") or "root"
+    path = directory / f"{datetime.now().strftime('%Y%m%dT%H%M%S%f')}_{method}_{slug}_{duration * 1000:.0f}ms.folded"
+    path.write_text(
+        "".join(f"{stack} {count}\n" for stack, count in samples.most_common()),
+        encoding="utf-8"
+    )
+    return path
+
+
+# ============================================================
+# ASGI 미들웨어
+# ============================================================
+
+def _route_template(scope: Dict[str, Any]) -> str:
+    """요청 경로 → 라우트 템플릿 (매칭 실패 시 "unmatched" - 라벨 카디널리티 제한)"""
+    from starlette.routing import Match
+
+    app = scope.get("app")
+    for route in getattr(app, "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return getattr(route, "path", "unmatched") or "/"
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    요청 계측 ASGI 미들웨어
+
+    - http_request_duration_seconds{method, route}, http_requests_total{method, route, status}
+    - 요청당 DB 쿼리/외부 HTTP 호출 수·시간 (instrument_sqlalchemy / instrument_httpx 필요)
+    - Server-Timing 응답 헤더 (app, db, http, 엔진 단계)
+    - slow_request_seconds 지정 시 해당 시간을 넘은 요청의 스택 샘플을 profile_dir에 저장
+
+    가장 바깥에서 재도록 다른 미들웨어보다 나중에 add_middleware 한다.
+    """
+
+    def __init__(
+        self,
+        app,
+        slow_request_seconds: Optional[float] = None,
+        profile_dir: str = "profiles",
+        sample_interval_seconds: float = 0.005,
+        exclude_paths: Sequence[str] = ("/metrics",),
+        server_timing: bool = True
+    ):
+        self.app = app
+        self.slow_request_seconds = slow_request_seconds
+        self.profile_dir = profile_dir
+        self.exclude_paths = frozenset(exclude_paths)
+        self.server_timing = server_timing
+        self.sampler = StackSampler(sample_interval_seconds) if slow_request_seconds else None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = _route_template(scope)
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+        sample_started = self.sampler.begin() if self.sampler else None
+        start = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", _server_timing(stats, time.perf_counter() - start).encode("latin-1")))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            _request_stats.reset(token)
+
+            REQUESTS_TOTAL.inc((method, route, str(status_code)))
+            REQUEST_DURATION.observe(duration, (method, route))
+            REQUEST_DB_QUERIES.observe(stats.db_queries, (route,))
+            REQUEST_DB_SECONDS.observe(stats.db_seconds, (route,))
+            REQUEST_OUTBOUND_CALLS.observe(stats.http_calls, (route,))
+            REQUEST_OUTBOUND_SECONDS.observe(stats.http_seconds, (route,))
+
+            if self.sampler is not None:
+                slow = duration >= self.slow_request_seconds
+                samples = self.sampler.end(sample_started, collect=slow)
+                if slow:
+                    self._dump(samples, method, route, duration, stats)
+
+    def _dump(self, samples: _Counter, method: str, route: str, duration: float, stats: RequestStats) -> None:
+        try:
+            path = dump_profile(samples, self.profile_dir, method, route, duration)
+        except OSError as e:
+            logger.error(f"Failed to write slow request profile: {e}")
+            return
+        SLOW_REQUEST_PROFILES.inc((route,))
+        logger.warning(
+            f"Slow request {method} {route} {duration:.3f}s "
+            f"(db {stats.db_queries} queries / {stats.db_seconds:.3f}s, "
+            f"http {stats.http_calls} calls / {stats.http_seconds:.3f}s) - profile: {path}"
+        )
+
+
+def _server_timing(stats: RequestStats, elapsed: float) -> str:
+    """Server-Timing 헤더 값 (ms)"""
+    parts = [
+        f"app;dur={elapsed * 1000:.1f}",
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.db_queries} queries"',
+        f'http;dur={stats.http_seconds * 1000:.1f};desc="{stats.http_calls} calls"',
+    ]
+    parts.extend(f"{name};dur={seconds * 1000:.1f}" for name, seconds in stats.stages.items())
+    return ", ".join(parts)
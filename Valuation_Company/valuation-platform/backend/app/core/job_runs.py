@@ -0,0 +1,191 @@
+"""
+Job Runs
+스케줄 작업 실행 이력 / 프로세스 간 실행 임대(lease)
+
+@task Investment Tracker
+@description 여러 uvicorn 워커가 같은 스케줄을 가져도 작업 1회 실행은 한 워커만 수행하도록 보장
+
+- (job_id, scheduled_at) 행을 먼저 INSERT한 워커만 실행 (UNIQUE 제약으로 원자적 선점)
+- 실행 중인 워커는 lease_until을 주기적으로 연장, 워커가 죽어 임대가 만료되면 다른 워커가 이어받음
+- 같은 테이블이 실행 이력(상태, 소요 시간, 오류)을 겸함
+"""
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    bindparam,
+    text,
+)
+from sqlalchemy.engine import Engine
+
+metadata = MetaData()
+
+job_runs_table = Table(
+    "scheduler_job_runs",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("job_id", String(191), nullable=False),
+    Column("scheduled_at", DateTime(timezone=True), nullable=False),
+    Column("worker_id", String(191), nullable=False),
+    Column("status", String(20), nullable=False),  # running, succeeded, failed
+    Column("attempt", Integer, nullable=False, server_default="1"),
+    Column("started_at", DateTime(timezone=True), nullable=False),
+    Column("finished_at", DateTime(timezone=True)),
+    Column("lease_until", DateTime(timezone=True), nullable=False),
+    Column("duration_seconds", Float),
+    Column("error", Text),
+    UniqueConstraint("job_id", "scheduled_at", name="uq_scheduler_job_runs_job_scheduled"),
+)
+
+CLAIM_SQL = text("""
+    INSERT INTO scheduler_job_runs
+        (job_id, scheduled_at, worker_id, status, attempt, started_at, lease_until)
+    VALUES
+        (:job_id, :scheduled_at, :worker_id, 'running', 1, :now, :lease_until)
+    ON CONFLICT (job_id, scheduled_at) DO UPDATE SET
+        worker_id = excluded.worker_id,
+        status = 'running',
+        attempt = scheduler_job_runs.attempt + 1,
+        started_at = excluded.started_at,
+        lease_until = excluded.lease_until,
+        error = NULL
+    WHERE scheduler_job_runs.status = 'running'
+      AND scheduler_job_runs.lease_until < :now
+    RETURNING id
+""").bindparams(
+    bindparam("scheduled_at", type_=DateTime(timezone=True)),
+    bindparam("now", type_=DateTime(timezone=True)),
+    bindparam("lease_until", type_=DateTime(timezone=True)),
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def default_worker_id() -> str:
+    """호스트명:PID"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class JobRunStore:
+    """
+    scheduler_job_runs 테이블 접근 (동기 - 호출부에서 asyncio.to_thread 사용)
+
+    PostgreSQL / SQLite 공통 SQL (INSERT ... ON CONFLICT ... RETURNING)만 사용한다.
+    """
+
+    def __init__(self, engine: Engine, lease_seconds: float = 300.0, worker_id: Optional[str] = None):
+        self.engine = engine
+        self.lease_seconds = lease_seconds
+        self.worker_id = worker_id or default_worker_id()
+
+    def create_tables(self) -> None:
+        metadata.create_all(self.engine, tables=[job_runs_table], checkfirst=True)
+
+    def claim(self, job_id: str, scheduled_at: datetime) -> Optional[int]:
+        """
+        실행 선점
+
+        Returns:
+            선점한 실행 id (다른 워커가 이미 실행했거나 실행 중이면 None)
+        """
+        now = _utcnow()
+        with self.engine.begin() as conn:
+            row = conn.execute(CLAIM_SQL, {
+                "job_id": job_id,
+                "scheduled_at": scheduled_at.astimezone(timezone.utc),
+                "worker_id": self.worker_id,
+                "now": now,
+                "lease_until": now + timedelta(seconds=self.lease_seconds),
+            }).first()
+        return row[0] if row else None
+
+    def renew(self, run_id: int) -> bool:
+        """임대 연장 (다른 워커가 이어받았으면 False)"""
+        with self.engine.begin() as conn:
+            result = conn.execute(
+                job_runs_table.update()
+                .where(job_runs_table.c.id == run_id)
+                .where(job_runs_table.c.worker_id == self.worker_id)
+                .where(job_runs_table.c.status == "running")
+                .values(lease_until=_utcnow() + timedelta(seconds=self.lease_seconds))
+            )
+        return result.rowcount == 1
+
+    def finish(self, run_id: int, status: str, duration_seconds: float, error: Optional[str] = None) -> None:
+        """실행 종료 기록"""
+        with self.engine.begin() as conn:
+            conn.execute(
+                job_runs_table.update()
+                .where(job_runs_table.c.id == run_id)
+                .where(job_runs_table.c.worker_id == self.worker_id)
+                .values(
+                    status=status,
+                    finished_at=_utcnow(),
+                    duration_seconds=duration_seconds,
+                    error=error[:2000] if error else None
+                )
+            )
+
+    def history(self, job_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """최근 실행 이력 (최신순)"""
+        c = job_runs_table.c
+        with self.engine.connect() as conn:
+            rows = conn.execute(
+                job_runs_table.select()
+                .where(c.job_id == job_id)
+                .order_by(c.scheduled_at.desc(), c.id.desc())
+                .limit(limit)
+            ).mappings().all()
+
+        return [
+            {
+                "scheduled_at": _isoformat(row["scheduled_at"]),
+                "worker_id": row["worker_id"],
+                "status": row["status"],
+                "attempt": row["attempt"],
+                "started_at": _isoformat(row["started_at"]),
+                "finished_at": _isoformat(row["finished_at"]),
+                "duration_seconds": row["duration_seconds"],
+                "error": row["error"],
+            }
+            for row in rows
+        ]
+
+    def metrics(self, job_id: str, window: int = 100) -> Dict[str, Any]:
+        """최근 window회 실행의 성공/실패 수와 소요 시간 통계"""
+        runs = self.history(job_id, limit=window)
+        durations = sorted(r["duration_seconds"] for r in runs if r["duration_seconds"] is not None)
+
+        return {
+            "runs": len(runs),
+            "succeeded": sum(1 for r in runs if r["status"] == "succeeded"),
+            "failed": sum(1 for r in runs if r["status"] == "failed"),
+            "running": sum(1 for r in runs if r["status"] == "running"),
+            "last_duration_seconds": next(
+                (r["duration_seconds"] for r in runs if r["duration_seconds"] is not None), None
+            ),
+            "avg_duration_seconds": sum(durations) / len(durations) if durations else None,
+            "p95_duration_seconds": durations[min(len(durations) - 1, int(len(durations) * 0.95))] if durations else None,
+            "max_duration_seconds": durations[-1] if durations else None,
+        }
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    if value.tzinfo is None:  # SQLite는 타임존을 저장하지 않음 (UTC로 기록)
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
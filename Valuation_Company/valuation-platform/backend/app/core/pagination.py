@@ -0,0 +1,120 @@
+"""
+Pagination
+커서(keyset) 페이지네이션 / 목록 건수 캐시
+
+@task Investment Tracker
+@description 깊은 페이지에서도 OFFSET 스캔 없이 (정렬 키, id) 다음 행부터 조회
+
+- 커서는 마지막 행의 정렬 키 값 목록을 base64url(JSON)로 감싼 불투명 문자열
+- PostgREST(Supabase)용 "desc nulls last" 키셋 필터 생성
+- 목록 총건수는 (테이블, 필터) 단위로 TTL 캐시 - 페이지를 넘길 때마다 COUNT를 다시 하지 않음
+"""
+import base64
+import binascii
+import json
+import threading
+import time
+from datetime import date, datetime
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 커서"""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값 목록 → 커서 문자열"""
+    payload = [v.isoformat() if isinstance(v, (datetime, date)) else v for v in values]
+    raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    커서 문자열 → 정렬 키 값 목록
+
+    Raises:
+        InvalidCursorError: 형식이 맞지 않거나 값 개수가 size와 다를 때
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}")
+    return values
+
+
+def postgrest_keyset_filter(column: str, value: Any, id_value: Any, id_column: str = "id") -> str:
+    """
+    PostgREST or= 필터: ORDER BY column DESC NULLS LAST, id DESC 에서 (value, id_value) 다음 행
+
+    Returns:
+        params["or"]에 넣을 "(...)" 문자열
+    """
+    if value is None:
+        # NULL 구간은 맨 뒤 - 같은 NULL 중 id가 더 작은 행만 남음
+        return f"(and({column}.is.null,{id_column}.lt.{id_value}))"
+
+    # 값에 ':' '+' ',' 등이 들어갈 수 있으므로 큰따옴표로 감쌈
+    quoted = '"' + str(value).replace("\\", "\\\\").replace('"', '\\"') + '"'
+    return (
+        f"({column}.lt.{quoted},"
+        f"and({column}.eq.{quoted},{id_column}.lt.{id_value}),"
+        f"{column}.is.null)"
+    )
+
+
+class CountCache:
+    """
+    (테이블, 필터) → 총건수(또는 건수 관련 값) TTL 캐시
+
+    목록 API가 페이지마다 COUNT를 다시 실행하지 않도록 한다.
+    값은 최대 ttl_seconds만큼 오래될 수 있다 (목록 총건수 표시용).
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 1000):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+                return None
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                # 가장 오래된 항목부터 제거
+                for stale in sorted(self._entries, key=lambda k: self._entries[k][0])[: self.max_entries // 10 or 1]:
+                    del self._entries[stale]
+            self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, prefix: Optional[Hashable] = None) -> None:
+        """전체 또는 key[0] == prefix인 항목 삭제 (예: 테이블명)"""
+        with self._lock:
+            if prefix is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if isinstance(k, tuple) and k and k[0] == prefix]:
+                    del self._entries[key]
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    async def get_or_compute_async(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.get(key)
+        if value is None:
+            value = await compute()
+            self.put(key, value)
+        return value
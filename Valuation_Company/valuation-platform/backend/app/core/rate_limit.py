@@ -0,0 +1,59 @@
+"""
+Rate Limit
+비동기 호출 속도 제한
+
+@task Investment Tracker
+@description 외부 API(Gemini 등) 분당 호출 한도를 지키기 위한 토큰 버킷
+"""
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    토큰 버킷 속도 제한기
+
+    초당 rate개씩 토큰이 채워지고 최대 burst개까지 쌓인다.
+    acquire()는 토큰이 생길 때까지 기다린 뒤 하나를 소비한다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate: 초당 허용 호출 수 (예: 분당 15회 → 15 / 60)
+            burst: 한 번에 몰아서 허용할 최대 호출 수
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, calls: int, burst: int = 1) -> "RateLimiter":
+        """분당 호출 수로 생성"""
+        return cls(calls / 60.0, burst)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """토큰 하나 소비 (없으면 대기)"""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        return None
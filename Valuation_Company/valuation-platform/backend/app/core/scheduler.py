@@ -4,35 +4,143 @@ APScheduler를 사용한 주간 작업 스케줄링
 
 @task Investment Tracker
 @description 매주 일요일 오전 6시 자동 수집 스케줄러
+
+- 작업 정의는 SQL 작업 저장소(SQLAlchemyJobStore)에 저장 (재시작해도 유지)
+- uvicorn 워커마다 스케줄러가 돌아도, 작업 1회 실행은 scheduler_job_runs 임대를 선점한 워커만 수행
+- 실행 이력 / 소요 시간은 get_job_status()로 조회
+- DEAL_WAREHOUSE_DIR가 설정되면 매일 deals / 기사 Parquet 스냅샷 작업도 등록 (app/services/deal_warehouse.py)
+- SCHEDULER_DATABASE_URL / DATABASE_URL이 없으면 메모리 저장소 + 프로세스 내 SQLite 이력 (단일 워커 개발용)
 """
+import asyncio
+import functools
 import logging
-from datetime import datetime
-from typing import Optional
+import time
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.jobstores.memory import MemoryJobStore
+from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
 from apscheduler.executors.asyncio import AsyncIOExecutor
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
 
 from app.core.config import settings
+from app.core.job_runs import JobRunStore
 
 logger = logging.getLogger(__name__)
 
 # 스케줄러 인스턴스
 scheduler: Optional[AsyncIOScheduler] = None
 
+# 실행 이력 / 임대 저장소
+job_run_store: Optional[JobRunStore] = None
+
+# 현재 실행 중인 작업의 예정 실행 시각 (RunTimeAwareExecutor가 설정)
+_scheduled_run_time: ContextVar[Optional[datetime]] = ContextVar("scheduled_run_time", default=None)
+
+
+class RunTimeAwareExecutor(AsyncIOExecutor):
+    """작업 코루틴에 예정 실행 시각을 전달하는 AsyncIOExecutor"""
+
+    def _do_submit_job(self, job, run_times):
+        # create_task가 현재 컨텍스트를 복사하므로 작업 태스크에서 값을 읽을 수 있음
+        token = _scheduled_run_time.set(run_times[-1])
+        try:
+            super()._do_submit_job(job, run_times)
+        finally:
+            _scheduled_run_time.reset(token)
+
+
+def get_database_url() -> Optional[str]:
+    return settings.SCHEDULER_DATABASE_URL or settings.DATABASE_URL
+
+
+def get_job_run_store() -> JobRunStore:
+    """실행 이력 / 임대 저장소 반환"""
+    global job_run_store
+
+    if job_run_store is None:
+        database_url = get_database_url()
+        if database_url:
+            engine = create_engine(database_url, pool_pre_ping=True)
+        else:
+            engine = create_engine(
+                "sqlite://",
+                connect_args={"check_same_thread": False},
+                poolclass=StaticPool
+            )
+
+        job_run_store = JobRunStore(engine, lease_seconds=settings.SCHEDULER_LEASE_SECONDS)
+        job_run_store.create_tables()
+
+    return job_run_store
+
+
+def exclusive_job(job_id: str) -> Callable[[Callable[[], Awaitable]], Callable[[], Awaitable]]:
+    """
+    워커 간 단일 실행 보장 데코레이터
+
+    예정 실행 시각 단위로 임대를 선점한 워커만 실행하고, 실행 중에는 임대를 연장한다.
+    결과(성공/실패, 소요 시간)는 실행 이력에 기록된다.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper():
+            store = get_job_run_store()
+            scheduled_at = _scheduled_run_time.get() or datetime.now(timezone.utc)
+
+            run_id = await asyncio.to_thread(store.claim, job_id, scheduled_at)
+            if run_id is None:
+                logger.info(f"Job {job_id} ({scheduled_at.isoformat()}) is handled by another worker - skipped")
+                return None
+
+            async def keep_lease():
+                while True:
+                    await asyncio.sleep(store.lease_seconds / 3)
+                    if not await asyncio.to_thread(store.renew, run_id):
+                        logger.warning(f"Job {job_id} lease lost (run {run_id})")
+                        return
+
+            heartbeat = asyncio.create_task(keep_lease())
+            started = time.perf_counter()
+            status, error = "succeeded", None
+            try:
+                return await func()
+            except BaseException as e:
+                status, error = "failed", repr(e)
+                raise
+            finally:
+                heartbeat.cancel()
+                duration = time.perf_counter() - started
+                await asyncio.to_thread(store.finish, run_id, status, duration, error)
+                logger.info(f"Job {job_id} run {run_id} {status} in {duration:.1f}s")
+
+        return wrapper
+
+    return decorator
+
 
 def get_scheduler() -> AsyncIOScheduler:
     """스케줄러 인스턴스 반환"""
     global scheduler
 
     if scheduler is None:
-        # 스케줄러 설정
+        # 스케줄러 설정 (작업 정의는 SQL 저장소, 없으면 메모리)
+        database_url = get_database_url()
+        if database_url:
+            jobstore = SQLAlchemyJobStore(engine=get_job_run_store().engine)
+        else:
+            logger.warning("Scheduler DATABASE_URL not set - using MemoryJobStore (single worker only)")
+            jobstore = MemoryJobStore()
+
         jobstores = {
-            'default': MemoryJobStore()
+            'default': jobstore
         }
         executors = {
-            'default': AsyncIOExecutor()
+            'default': RunTimeAwareExecutor()
         }
         job_defaults = {
             'coalesce': True,  # 놓친 작업 하나로 통합
@@ -50,6 +158,7 @@ def get_scheduler() -> AsyncIOScheduler:
     return scheduler
 
 
+@exclusive_job('weekly_investment_collection')
 async def weekly_collection_job():
     """
     주간 수집 작업
@@ -72,6 +181,30 @@ async def weekly_collection_job():
         raise
 
 
+@exclusive_job('deal_warehouse_snapshot')
+async def warehouse_snapshot_job():
+    """
+    deals / 기사 Parquet 스냅샷 내보내기
+    매일 오전 4시 (KST) 실행 (DEAL_WAREHOUSE_DIR 설정 시)
+    """
+    logger.info("Starting scheduled warehouse snapshot")
+
+    try:
+        from app.services.deal_warehouse import export_snapshots
+
+        result = await export_snapshots(
+            settings.DEAL_WAREHOUSE_DIR,
+            keep=settings.DEAL_WAREHOUSE_KEEP_SNAPSHOTS
+        )
+
+        rows = {name: info["rows"] for name, info in result.items()}
+        logger.info(f"Warehouse snapshot completed: {rows}")
+
+    except Exception as e:
+        logger.error(f"Warehouse snapshot failed: {e}")
+        raise
+
+
 def setup_jobs(scheduler: AsyncIOScheduler) -> None:
     """스케줄 작업 등록"""
 
@@ -89,6 +222,16 @@ def setup_jobs(scheduler: AsyncIOScheduler) -> None:
         replace_existing=True
     )
 
+    # Parquet 스냅샷 (매일 오전 4시 KST, 저장 경로가 있을 때만)
+    if settings.DEAL_WAREHOUSE_DIR:
+        scheduler.add_job(
+            warehouse_snapshot_job,
+            trigger=CronTrigger(hour=4, minute=0, timezone='Asia/Seoul'),
+            id='deal_warehouse_snapshot',
+            name='Deal Warehouse Parquet Snapshot',
+            replace_existing=True
+        )
+
     logger.info("Scheduled jobs registered")
 
 
@@ -124,17 +267,23 @@ def get_job_status() -> dict:
     if scheduler is None:
         return {"status": "not_initialized", "jobs": []}
 
+    store = get_job_run_store()
+
     jobs = []
     for job in scheduler.get_jobs():
         jobs.append({
             "id": job.id,
             "name": job.name,
             "next_run_time": job.next_run_time.isoformat() if job.next_run_time else None,
-            "trigger": str(job.trigger)
+            "trigger": str(job.trigger),
+            "metrics": store.metrics(job.id),
+            "history": store.history(job.id)
         })
 
     return {
         "status": "running" if scheduler.running else "stopped",
+        "jobstore": "sqlalchemy" if get_database_url() else "memory",
+        "worker_id": store.worker_id,
         "jobs": jobs
     }
 
@@ -156,8 +305,8 @@ async def trigger_job_now(job_id: str) -> bool:
 
     job = scheduler.get_job(job_id)
     if job:
-        # 즉시 실행
-        scheduler.modify_job(job_id, next_run_time=datetime.now())
+        # 즉시 실행 (다른 워커와 중복 실행되지 않도록 예정 시각 기준으로 임대 선점)
+        scheduler.modify_job(job_id, next_run_time=datetime.now(timezone.utc))
         logger.info(f"Job {job_id} triggered for immediate execution")
         return True
 
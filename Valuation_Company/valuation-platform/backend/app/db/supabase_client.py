@@ -6,11 +6,15 @@ Supabase REST API 클라이언트
 @description Supabase DB와 통신하는 클라이언트
 """
 import httpx
-from typing import Dict, Any, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime
 import json
 
 from app.core.config import settings
+from app.core.pagination import CountCache, decode_cursor, encode_cursor, postgrest_keyset_filter
+
+# 목록 총건수 캐시 (페이지마다 COUNT를 다시 하지 않음)
+list_count_cache = CountCache(ttl_seconds=settings.LIST_COUNT_CACHE_TTL_SECONDS)
 
 
 class SupabaseClient:
@@ -105,62 +109,146 @@ class SupabaseClient:
         filter_str = "?" + "&".join([f"{k}=eq.{v}" for k, v in filters.items()])
         await self._request("DELETE", table, filters=filter_str)
 
-    async def count(self, table: str, filters: Optional[Dict[str, Any]] = None) -> int:
-        """COUNT 쿼리"""
-        headers = {**self.headers, "Prefer": "count=exact"}
-        params = {"select": "*"}
+    async def count(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        estimated: bool = False
+    ) -> int:
+        """
+        COUNT 쿼리
+
+        Args:
+            filters: eq 필터 (컬럼 → 값)
+            params: PostgREST 필터 파라미터 그대로 (예: {"name_ko": "ilike.%abc%"})
+            estimated: 큰 테이블은 플래너 추정치 사용 (Prefer: count=estimated)
+        """
+        headers = {**self.headers, "Prefer": "count=estimated" if estimated else "count=exact"}
+        query = {"select": "*", **(params or {})}
 
         if filters:
             for key, value in filters.items():
                 if value is not None:
-                    params[key] = f"eq.{value}"
+                    query[key] = f"eq.{value}"
 
         url = f"{self.url}/rest/v1/{table}"
 
         async with httpx.AsyncClient() as client:
-            response = await client.head(url, headers=headers, params=params)
+            response = await client.head(url, headers=headers, params=query)
             content_range = response.headers.get("content-range", "0-0/0")
             total = int(content_range.split("/")[-1])
             return total
 
-    # ============================================================
-    # Investment Tracker Specific Methods
-    # ============================================================
+    async def cached_count(self, table: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """목록 총건수 (추정치, LIST_COUNT_CACHE_TTL_SECONDS 동안 캐시)"""
+        key = (table, tuple(sorted((params or {}).items())))
+        return await list_count_cache.get_or_compute_async(
+            key,
+            lambda: self.count(table, params=params, estimated=True)
+        )
 
-    async def get_companies(
+    async def _list_page(
         self,
-        page: int = 1,
-        page_size: int = 20,
-        industry: Optional[str] = None,
-        stage: Optional[str] = None,
-        search: Optional[str] = None
+        table: str,
+        sort_column: str,
+        filters: Dict[str, str],
+        page: int,
+        page_size: int,
+        cursor: Optional[str]
     ) -> Dict:
-        """기업 목록 조회"""
+        """
+        목록 한 페이지 (ORDER BY sort_column DESC NULLS LAST, id DESC)
+
+        cursor가 있으면 키셋 페이지네이션 (이전 페이지 마지막 행 다음부터, OFFSET 없음),
+        없으면 page 기준 OFFSET (첫 페이지 / 기존 호출 호환)
+        """
         params = {
             "select": "*",
-            "order": "latest_round_date.desc.nullslast",
+            "order": f"{sort_column}.desc.nullslast,id.desc",
             "limit": page_size,
-            "offset": (page - 1) * page_size
+            **filters
         }
 
-        if industry:
-            params["industry"] = f"eq.{industry}"
-        if stage:
-            params["latest_stage"] = f"eq.{stage}"
-        if search:
-            params["name_ko"] = f"ilike.%{search}%"
+        if cursor:
+            sort_value, last_id = decode_cursor(cursor, 2)
+            params["or"] = postgrest_keyset_filter(sort_column, sort_value, int(last_id))
+        else:
+            params["offset"] = (page - 1) * page_size
+
+        items = await self._request("GET", table, params=params)
+        total = await self.cached_count(table, filters)
 
-        items = await self._request("GET", "startup_companies", params=params)
-        total = await self.count("startup_companies")
+        next_cursor = None
+        if items and len(items) == page_size:
+            last = items[-1]
+            next_cursor = encode_cursor([last.get(sort_column), last["id"]])
 
         return {
             "items": items,
             "total": total,
             "page": page,
             "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size
+            "total_pages": (total + page_size - 1) // page_size,
+            "next_cursor": next_cursor
         }
 
+    async def iter_pages(
+        self,
+        table: str,
+        columns: str = "*",
+        page_size: int = 1000
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        테이블 전체를 id 오름차순 키셋 페이지로 순회 (스냅샷 내보내기 등)
+
+        OFFSET 없이 이전 페이지 마지막 id 다음부터 읽으므로 뒤 페이지도 같은 비용
+        """
+        last_id = None
+        while True:
+            params = {"select": columns, "order": "id.asc", "limit": page_size}
+            if last_id is not None:
+                params["id"] = f"gt.{last_id}"
+
+            rows = await self._request("GET", table, params=params)
+            if rows:
+                yield rows
+            if not rows or len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
+    # ============================================================
+    # Investment Tracker Specific Methods
+    # ============================================================
+
+    async def get_companies(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        industry: Optional[str] = None,
+        stage: Optional[str] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """기업 목록 조회 (최근 투자일 순, cursor가 있으면 키셋 페이지네이션)"""
+        filters = {}
+
+        if industry:
+            filters["industry"] = f"eq.{industry}"
+        if stage:
+            filters["latest_stage"] = f"eq.{stage}"
+        if search:
+            filters["name_ko"] = f"ilike.%{search}%"
+
+        return await self._list_page(
+            "startup_companies",
+            sort_column="latest_round_date",
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            cursor=cursor
+        )
+
     async def get_company_by_id(self, company_id: int) -> Optional[Dict]:
         """기업 상세 조회"""
         result = await self.select(
@@ -169,6 +257,27 @@ class SupabaseClient:
         )
         return result[0] if result else None
 
+    async def get_recently_funded_companies(self, since: datetime, limit: int = 200) -> List[Dict]:
+        """최근 투자 유치 기업 조회 (latest_round_date >= since)"""
+        params = {
+            "select": "*",
+            "latest_round_date": f"gte.{since.isoformat()}",
+            "order": "latest_round_date.desc",
+            "limit": limit
+        }
+        return await self._request("GET", "startup_companies", params=params)
+
+    async def get_companies_by_ids(self, company_ids: List[int]) -> List[Dict]:
+        """여러 기업 일괄 조회"""
+        if not company_ids:
+            return []
+
+        params = {
+            "select": "*",
+            "id": f"in.({','.join(str(i) for i in company_ids)})"
+        }
+        return await self._request("GET", "startup_companies", params=params)
+
     async def get_company_by_name(self, name_ko: str) -> Optional[Dict]:
         """기업명으로 조회"""
         result = await self.select(
@@ -202,6 +311,23 @@ class SupabaseClient:
             order_by="round_date.desc"
         )
 
+    async def get_latest_rounds(self, company_ids: List[int]) -> Dict[int, Dict]:
+        """기업별 최근 투자 라운드 일괄 조회 (company_id → round)"""
+        if not company_ids:
+            return {}
+
+        params = {
+            "select": "*",
+            "company_id": f"in.({','.join(str(i) for i in company_ids)})",
+            "order": "round_date.desc.nullslast"
+        }
+        rounds = await self._request("GET", "investment_rounds", params=params)
+
+        latest: Dict[int, Dict] = {}
+        for round_data in rounds:
+            latest.setdefault(round_data["company_id"], round_data)
+        return latest
+
     async def create_investment_round(self, data: Dict) -> Dict:
         """투자 라운드 생성"""
         data["created_at"] = datetime.utcnow().isoformat()
@@ -213,31 +339,25 @@ class SupabaseClient:
         page: int = 1,
         page_size: int = 20,
         source: Optional[str] = None,
-        company_id: Optional[int] = None
+        company_id: Optional[int] = None,
+        cursor: Optional[str] = None
     ) -> Dict:
-        """뉴스 목록 조회"""
-        params = {
-            "select": "*",
-            "order": "published_date.desc.nullslast",
-            "limit": page_size,
-            "offset": (page - 1) * page_size
-        }
+        """뉴스 목록 조회 (최신 발행일 순, cursor가 있으면 키셋 페이지네이션)"""
+        filters = {}
 
         if source:
-            params["source"] = f"eq.{source}"
+            filters["source"] = f"eq.{source}"
         if company_id:
-            params["company_id"] = f"eq.{company_id}"
-
-        items = await self._request("GET", "investment_news", params=params)
-        total = await self.count("investment_news")
+            filters["company_id"] = f"eq.{company_id}"
 
-        return {
-            "items": items,
-            "total": total,
-            "page": page,
-            "page_size": page_size,
-            "total_pages": (total + page_size - 1) // page_size
-        }
+        return await self._list_page(
+            "investment_news",
+            sort_column="published_date",
+            filters=filters,
+            page=page,
+            page_size=page_size,
+            cursor=cursor
+        )
 
     async def get_news_by_url(self, source_url: str) -> Optional[Dict]:
         """URL로 뉴스 조회"""
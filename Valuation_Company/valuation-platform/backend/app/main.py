@@ -1,12 +1,23 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api import router
 from app.core.config import settings
 from app.core.scheduler import start_scheduler, shutdown_scheduler, get_job_status
+from app.core.ai_router import ai_router
+from app.core.instrumentation import (
+    CONTENT_TYPE_LATEST,
+    MetricsMiddleware,
+    instrument_httpx,
+    instrument_sqlalchemy,
+    render_metrics,
+)
+from app.services.ai_client_pool import client_registry
+from app.services.progress_hub import progress_hub
 
 # 로깅 설정
 logging.basicConfig(
@@ -30,11 +41,16 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Scheduler not started (debug mode) - use /scheduler/start to enable")
 
+    # 진행 상황 워커 간 전달 (LISTEN/NOTIFY)
+    await progress_hub.start()
+
     yield
 
     # Shutdown
     logger.info("Shutting down Valuation Platform API")
     shutdown_scheduler()
+    await progress_hub.close()
+    await client_registry.aclose()
 
 
 app = FastAPI(
@@ -53,6 +69,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 계측 (가장 바깥 미들웨어)
+if settings.METRICS_ENABLED:
+    instrument_sqlalchemy()
+    instrument_httpx()
+    app.add_middleware(
+        MetricsMiddleware,
+        slow_request_seconds=settings.SLOW_REQUEST_PROFILE_SECONDS,
+        profile_dir=settings.PROFILE_DUMP_DIR,
+        sample_interval_seconds=settings.PROFILE_SAMPLE_INTERVAL_SECONDS
+    )
+
 # API 라우터 포함
 app.include_router(router, prefix="/api/v1")
 
@@ -76,21 +103,28 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (라우트별 지연, 요청당 DB/HTTP 호출, 평가 단계 소요 시간)"""
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 # ============================================================
 # Scheduler Management Endpoints
 # ============================================================
 
 @app.get("/scheduler/status")
 async def scheduler_status():
-    """스케줄러 상태 조회"""
-    return get_job_status()
+    """스케줄러 상태 조회 (작업별 실행 이력 / 소요 시간 포함)"""
+    return await asyncio.to_thread(get_job_status)
 
 
 @app.post("/scheduler/start")
 async def start_scheduler_endpoint():
     """스케줄러 수동 시작"""
     start_scheduler()
-    return {"status": "started", "jobs": get_job_status()["jobs"]}
+    status = await asyncio.to_thread(get_job_status)
+    return {"status": "started", "jobs": status["jobs"]}
 
 
 @app.post("/scheduler/stop")
@@ -98,3 +132,17 @@ async def stop_scheduler_endpoint():
     """스케줄러 수동 중지"""
     shutdown_scheduler()
     return {"status": "stopped"}
+
+
+# ============================================================
+# AI Status Endpoints
+# ============================================================
+
+@app.get("/ai/status")
+async def ai_status():
+    """AI 제공자 상태 (라우팅 지연/오류율, 호출별 TTFT·tokens/sec 요약)"""
+    return {
+        "providers": ai_router.get_provider_stats(),
+        "calls": client_registry.summary(),
+        "recent": client_registry.recent_metrics(limit=20)
+    }
@@ -95,6 +95,7 @@ class CompanyListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 class InvestmentRoundResponse(BaseModel):
@@ -198,6 +199,7 @@ class NewsListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 # ============================================================
@@ -230,6 +232,34 @@ class EmailTemplateResponse(EmailTemplateBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class EmailBatchCreate(BaseModel):
+    """이메일 일괄 생성 요청 (company_ids가 없으면 최근 투자 유치 기업 대상)"""
+    company_ids: Optional[List[int]] = None
+    since_days: int = Field(default=7, ge=1, le=90, description="최근 N일 내 투자 유치 기업")
+    limit: int = Field(default=200, ge=1, le=1000)
+
+
+class EmailDraftItem(BaseModel):
+    """일괄 생성 이메일 1건"""
+    company_id: Optional[int] = None
+    company_name: str
+    status: str = Field(..., description="pending(기본 템플릿) / ai / cache / fallback")
+    subject: str
+    body: str
+    template_type: str
+
+
+class EmailBatchResponse(BaseModel):
+    """이메일 일괄 생성 작업 응답"""
+    batch_id: str
+    status: str
+    total: int
+    completed: int
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    drafts: List[EmailDraftItem]
+
+
 # ============================================================
 # Collection Schemas
 # ============================================================
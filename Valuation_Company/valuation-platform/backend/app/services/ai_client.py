@@ -1,12 +1,15 @@
 """
 AI 클라이언트 - 50:30:20 하이브리드 전략 구현
 Claude 50% | OpenAI 30% | Gemini 20%
+
+SDK 클라이언트는 client_registry가 프로세스당 한 번 만들어 공유한다 (연결 재사용).
+모든 호출은 스트리밍으로 수행되어 TTFT / tokens/sec가 기록되며,
+*_stream 메서드는 받은 텍스트를 즉시 내보낸다.
 """
-import anthropic
-import google.generativeai as genai
-from openai import AsyncOpenAI
-from typing import Dict, Any, Optional
-from app.core.config import settings
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.core.ai_router import TaskType, ai_router
+from app.services.ai_client_pool import AIClientRegistry, CallMetrics, client_registry
 
 class ClaudeClient:
     """
@@ -17,18 +20,89 @@ class ClaudeClient:
     - PDF 보고서 생성
     """
 
-    def __init__(self):
-        self.client = anthropic.AsyncAnthropic(
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+    def __init__(self, registry: AIClientRegistry = client_registry):
+        self.registry = registry
         self.model = "claude-3-5-sonnet-20241022"
 
+    @property
+    def client(self):
+        """공유 AsyncAnthropic"""
+        return self.registry.anthropic()
+
+    async def _stream(
+        self,
+        metrics: CallMetrics,
+        messages: List[Dict],
+        max_tokens: int,
+        model: Optional[str] = None,
+        **options
+    ) -> AsyncIterator[str]:
+        input_tokens = output_tokens = None
+        try:
+            async with self.client.messages.stream(
+                model=model or self.model,
+                max_tokens=max_tokens,
+                messages=messages,
+                **options
+            ) as stream:
+                async for text in stream.text_stream:
+                    metrics.mark_chunk()
+                    yield text
+                final_message = await stream.get_final_message()
+                input_tokens = final_message.usage.input_tokens
+                output_tokens = final_message.usage.output_tokens
+            metrics.completed = True
+        finally:
+            self.registry.finish_call(metrics, output_tokens, input_tokens)
+
+    def stream(
+        self,
+        messages: List[Dict],
+        max_tokens: int = 4096,
+        operation: str = "stream",
+        **options
+    ) -> AsyncIterator[str]:
+        """메시지 스트리밍 (텍스트 조각을 받는 즉시 반환)"""
+        metrics = self.registry.start_call("claude", self.model, operation)
+        return self._stream(metrics, messages, max_tokens, **options)
+
+    async def _complete(
+        self,
+        messages: List[Dict],
+        max_tokens: int = 4096,
+        operation: str = "complete",
+        model: Optional[str] = None,
+        **options
+    ) -> Tuple[str, CallMetrics]:
+        metrics = self.registry.start_call("claude", model or self.model, operation)
+        chunks = [chunk async for chunk in self._stream(metrics, messages, max_tokens, model, **options)]
+        return "".join(chunks), metrics
+
+    async def complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        AIRouter 제공자 handler
+
+        {'prompt', 'system', 'max_tokens', 'temperature', 'models': {'claude': 모델명}, 'operation'}
+        ('json'은 형식 지정 옵션이 없어 프롬프트 지시에 맡김)
+        """
+        options = {"temperature": request["temperature"]} if "temperature" in request else {}
+        if request.get("system"):
+            options["system"] = request["system"]
+        text, metrics = await self._complete(
+            [{"role": "user", "content": request["prompt"]}],
+            max_tokens=request.get("max_tokens", 4096),
+            operation=request.get("operation", "complete"),
+            model=(request.get("models") or {}).get("claude"),
+            **options
+        )
+        return {"content": text, "usage": metrics.usage(), "ttft": metrics.ttft}
+
     async def evaluate_dcf_logic(self, code: str, data: Dict) -> Dict:
         """DCF 계산 로직 검증 (핵심 비즈니스)"""
-        response = await self.client.messages.create(
-            model=self.model,
+        text, _ = await self._complete(
             max_tokens=4096,
             temperature=0.0,
+            operation="evaluate_dcf_logic",
             messages=[{
                 "role": "user",
                 "content": f"""Verify DCF calculation logic:
@@ -46,7 +120,7 @@ Return JSON with:
 """
             }]
         )
-        return {"content": response.content[0].text}
+        return {"content": text}
 
     async def calculate_dcf(
         self,
@@ -72,25 +146,25 @@ Provide detailed calculation with:
 
 Return as JSON.
 """
-        response = await self.client.messages.create(
-            model=self.model,
+        text, _ = await self._complete(
             max_tokens=4096,
             temperature=0.0,
+            operation="calculate_dcf",
             messages=[{"role": "user", "content": prompt}]
         )
-        return {"content": response.content[0].text}
+        return {"content": text}
 
     async def review_security(self, code: str) -> Dict:
         """보안 코드 리뷰 (Claude 담당)"""
-        response = await self.client.messages.create(
-            model=self.model,
+        text, _ = await self._complete(
             max_tokens=2048,
+            operation="review_security",
             messages=[{
                 "role": "user",
                 "content": f"Review this code for security vulnerabilities:\n\n{code}"
             }]
         )
-        return {"content": response.content[0].text}
+        return {"content": text}
 
 
 class GeminiClient:
@@ -102,9 +176,94 @@ class GeminiClient:
     - 실시간 데이터 수집
     """
 
-    def __init__(self):
-        genai.configure(api_key=settings.GOOGLE_API_KEY)
-        self.model = genai.GenerativeModel('gemini-1.5-pro')
+    def __init__(self, registry: AIClientRegistry = client_registry):
+        self.registry = registry
+        self.model_name = 'gemini-1.5-pro'
+
+    @property
+    def model(self):
+        """공유 GenerativeModel"""
+        return self.registry.gemini(self.model_name)
+
+    async def _stream(
+        self,
+        metrics: CallMetrics,
+        prompt: str,
+        model_name: Optional[str] = None,
+        **options
+    ) -> AsyncIterator[str]:
+        input_tokens = output_tokens = None
+        try:
+            model = self.registry.gemini(model_name) if model_name else self.model
+            response = await model.generate_content_async(prompt, stream=True, **options)
+            async for chunk in response:
+                usage = getattr(chunk, "usage_metadata", None)
+                if usage is not None and usage.prompt_token_count:
+                    input_tokens = usage.prompt_token_count
+                if usage is not None and usage.candidates_token_count:
+                    output_tokens = usage.candidates_token_count
+                # 안전 필터 등으로 parts가 없으면 chunk.text가 예외를 던짐
+                if not chunk.parts:
+                    continue
+                metrics.mark_chunk()
+                yield chunk.text
+            metrics.completed = True
+        finally:
+            self.registry.finish_call(metrics, output_tokens, input_tokens)
+
+    def stream(self, prompt: str, operation: str = "stream", **options) -> AsyncIterator[str]:
+        """프롬프트 스트리밍 (텍스트 조각을 받는 즉시 반환)"""
+        metrics = self.registry.start_call("gemini", self.model_name, operation)
+        return self._stream(metrics, prompt, **options)
+
+    async def _complete(
+        self,
+        prompt: str,
+        operation: str = "complete",
+        model_name: Optional[str] = None,
+        **options
+    ) -> Tuple[str, CallMetrics]:
+        metrics = self.registry.start_call("gemini", model_name or self.model_name, operation)
+        chunks = [chunk async for chunk in self._stream(metrics, prompt, model_name, **options)]
+        return "".join(chunks), metrics
+
+    async def complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        AIRouter 제공자 handler
+
+        {'prompt', 'system', 'max_tokens', 'temperature', 'json', 'models': {'gemini': 모델명}, 'operation'}
+        (system은 프롬프트 앞에 붙임 - 모델별 GenerativeModel 캐시를 공유하기 위해)
+        """
+        generation_config = {}
+        if "max_tokens" in request:
+            generation_config["max_output_tokens"] = request["max_tokens"]
+        if "temperature" in request:
+            generation_config["temperature"] = request["temperature"]
+        if request.get("json"):
+            generation_config["response_mime_type"] = "application/json"
+
+        prompt = request["prompt"]
+        if request.get("system"):
+            prompt = f"{request['system']}\n\n{prompt}"
+
+        text, metrics = await self._complete(
+            prompt,
+            operation=request.get("operation", "complete"),
+            model_name=(request.get("models") or {}).get("gemini"),
+            generation_config=generation_config or None
+        )
+        return {"content": text, "usage": metrics.usage(), "ttft": metrics.ttft}
+
+    def analyze_large_document_stream(
+        self,
+        text: str,
+        max_context: int = 2_000_000
+    ) -> AsyncIterator[str]:
+        """대용량 문서 분석 스트리밍 (분석 결과를 생성되는 대로 반환)"""
+        return self.stream(
+            f"Analyze this document and extract key information:\n\n{text[:max_context]}",
+            operation="analyze_large_document"
+        )
 
     async def analyze_large_document(
         self,
@@ -112,10 +271,8 @@ class GeminiClient:
         max_context: int = 2_000_000
     ) -> Dict:
         """대용량 문서 분석 (Gemini 2M 토큰 활용)"""
-        response = self.model.generate_content(
-            f"Analyze this document and extract key information:\n\n{text[:max_context]}"
-        )
-        return {"content": response.text}
+        chunks = [chunk async for chunk in self.analyze_large_document_stream(text, max_context)]
+        return {"content": "".join(chunks)}
 
     async def research_company(
         self,
@@ -133,8 +290,8 @@ class GeminiClient:
 
 Provide comprehensive analysis using latest information.
 """
-        response = self.model.generate_content(query)
-        return {"content": response.text}
+        text, _ = await self._complete(query, operation="research_company")
+        return {"content": text}
 
     async def analyze_industry(
         self,
@@ -152,8 +309,8 @@ Provide comprehensive analysis using latest information.
 
 Use latest market data.
 """
-        response = self.model.generate_content(query)
-        return {"content": response.text}
+        text, _ = await self._complete(query, operation="analyze_industry")
+        return {"content": text}
 
 
 class OpenAIClient:
@@ -166,17 +323,93 @@ class OpenAIClient:
     - 구조화된 데이터 출력
     """
 
-    def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(self, registry: AIClientRegistry = client_registry):
+        self.registry = registry
         self.model = "gpt-4o"
 
+    @property
+    def client(self):
+        """공유 AsyncOpenAI"""
+        return self.registry.openai()
+
+    async def _stream(
+        self,
+        metrics: CallMetrics,
+        messages: List[Dict],
+        model: Optional[str] = None,
+        **options
+    ) -> AsyncIterator[str]:
+        input_tokens = output_tokens = None
+        try:
+            stream = await self.client.chat.completions.create(
+                model=model or self.model,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},
+                **options
+            )
+            async for chunk in stream:
+                # include_usage: 마지막 청크에 choices 없이 usage만 옴
+                if chunk.usage is not None:
+                    input_tokens = chunk.usage.prompt_tokens
+                    output_tokens = chunk.usage.completion_tokens
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                metrics.mark_chunk()
+                yield chunk.choices[0].delta.content
+            metrics.completed = True
+        finally:
+            self.registry.finish_call(metrics, output_tokens, input_tokens)
+
+    def stream(self, messages: List[Dict], operation: str = "stream", **options) -> AsyncIterator[str]:
+        """채팅 완성 스트리밍 (텍스트 조각을 받는 즉시 반환)"""
+        metrics = self.registry.start_call("openai", self.model, operation)
+        return self._stream(metrics, messages, **options)
+
+    async def _complete(
+        self,
+        messages: List[Dict],
+        operation: str = "complete",
+        model: Optional[str] = None,
+        **options
+    ) -> Tuple[str, CallMetrics]:
+        metrics = self.registry.start_call("openai", model or self.model, operation)
+        chunks = [chunk async for chunk in self._stream(metrics, messages, model, **options)]
+        return "".join(chunks), metrics
+
+    async def complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        AIRouter 제공자 handler
+
+        {'prompt', 'system', 'max_tokens', 'temperature', 'json', 'models': {'openai': 모델명}, 'operation'}
+        """
+        options = {}
+        if "max_tokens" in request:
+            options["max_tokens"] = request["max_tokens"]
+        if "temperature" in request:
+            options["temperature"] = request["temperature"]
+        if request.get("json"):
+            options["response_format"] = {"type": "json_object"}
+
+        messages = [{"role": "user", "content": request["prompt"]}]
+        if request.get("system"):
+            messages.insert(0, {"role": "system", "content": request["system"]})
+
+        text, metrics = await self._complete(
+            messages,
+            operation=request.get("operation", "complete"),
+            model=(request.get("models") or {}).get("openai"),
+            **options
+        )
+        return {"content": text, "usage": metrics.usage(), "ttft": metrics.ttft}
+
     async def analyze_pdf_financial_statement(
         self,
         pdf_text: str
     ) -> Dict:
         """재무제표 PDF 분석 (OpenAI로 이동 - 30% 사용)"""
-        response = await self.client.chat.completions.create(
-            model=self.model,
+        text, _ = await self._complete(
+            operation="analyze_pdf_financial_statement",
             messages=[
                 {
                     "role": "system",
@@ -189,7 +422,7 @@ class OpenAIClient:
             ],
             response_format={"type": "json_object"}
         )
-        return {"content": response.choices[0].message.content}
+        return {"content": text}
 
     async def extract_from_image(
         self,
@@ -197,8 +430,8 @@ class OpenAIClient:
         image_type: str = "financial_statement"
     ) -> Dict:
         """이미지에서 재무 데이터 추출 (Vision API)"""
-        response = await self.client.chat.completions.create(
-            model=self.model,
+        text, _ = await self._complete(
+            operation="extract_from_image",
             messages=[
                 {
                     "role": "user",
@@ -218,7 +451,7 @@ class OpenAIClient:
             ],
             response_format={"type": "json_object"}
         )
-        return {"content": response.choices[0].message.content}
+        return {"content": text}
 
     async def generate_excel_formula(
         self,
@@ -226,8 +459,8 @@ class OpenAIClient:
         cell_references: Dict
     ) -> Dict:
         """Excel 수식 생성 (Structured Outputs)"""
-        response = await self.client.chat.completions.create(
-            model=self.model,
+        text, _ = await self._complete(
+            operation="generate_excel_formula",
             messages=[
                 {
                     "role": "system",
@@ -254,14 +487,14 @@ class OpenAIClient:
                 }
             }
         )
-        return {"content": response.choices[0].message.content}
+        return {"content": text}
 
-    async def chatbot_response(
+    def chatbot_response_stream(
         self,
         user_message: str,
         conversation_history: list
-    ) -> Dict:
-        """사용자 챗봇 응답 (OpenAI 담당)"""
+    ) -> AsyncIterator[str]:
+        """사용자 챗봇 응답 스트리밍 (답변을 생성되는 대로 반환)"""
         messages = [
             {
                 "role": "system",
@@ -271,15 +504,48 @@ class OpenAIClient:
             {"role": "user", "content": user_message}
         ]
 
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            temperature=0.7
-        )
-        return {"content": response.choices[0].message.content}
+        return self.stream(messages, operation="chatbot_response", temperature=0.7)
+
+    async def chatbot_response(
+        self,
+        user_message: str,
+        conversation_history: list
+    ) -> Dict:
+        """사용자 챗봇 응답 (OpenAI 담당)"""
+        chunks = [
+            chunk async for chunk in self.chatbot_response_stream(user_message, conversation_history)
+        ]
+        return {"content": "".join(chunks)}
 
 
-# 전역 클라이언트 인스턴스
+# 전역 클라이언트 인스턴스 (모두 client_registry의 SDK 클라이언트 공유)
 claude_client = ClaudeClient()
 gemini_client = GeminiClient()
 openai_client = OpenAIClient()
+
+# AIRouter.execute()에서 사용할 제공자 등록
+ai_router.register_provider("claude", claude_client.complete)
+ai_router.register_provider("openai", openai_client.complete)
+ai_router.register_provider("gemini", gemini_client.complete)
+
+
+async def extract_financial_statement(pdf_text: str) -> Dict[str, Any]:
+    """
+    재무제표 텍스트에서 구조화된 데이터 추출 (AIRouter 경유)
+
+    기본은 OpenAI(FINANCIAL_STATEMENT_EXTRACTION), 느리거나 실패하면 다른 제공자로 넘어간다.
+
+    Returns:
+        {'content': JSON 문자열, 'provider', 'latency', ...}
+    """
+    return await ai_router.execute(
+        TaskType.FINANCIAL_STATEMENT_EXTRACTION,
+        {
+            "system": "You are a financial statement analysis expert. Extract data as structured JSON.",
+            "prompt": f"Extract financial data from this statement: {pdf_text}",
+            "json": True,
+            "max_tokens": 4096,
+            "operation": "analyze_pdf_financial_statement"
+        },
+        context_size=len(pdf_text) // 2
+    )
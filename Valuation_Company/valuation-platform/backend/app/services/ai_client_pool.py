@@ -0,0 +1,234 @@
+"""
+AI Client Pool
+프로세스 공용 AI SDK 클라이언트 레지스트리
+
+@task AI Client
+@description SDK 클라이언트를 프로세스당 한 번만 만들어 HTTP 연결을 재사용하고, 호출별 TTFT / tokens/sec 기록
+
+- Claude / OpenAI: 제공자별 httpx.AsyncClient 연결 풀을 SDK에 주입
+- Gemini: genai.configure 1회 + 모델명별 GenerativeModel 캐시 (SDK 내부 채널 재사용)
+- SDK는 처음 사용할 때 import (앱 시작 시 SDK가 없어도 됨)
+"""
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CallMetrics:
+    """AI 호출 1건의 지연/처리량"""
+    provider: str
+    model: str
+    operation: str
+    started_at: float = field(default_factory=time.perf_counter)
+    first_token_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    input_tokens: Optional[int] = None
+    output_tokens: Optional[int] = None
+    chunks: int = 0
+    completed: bool = False
+
+    def mark_chunk(self) -> None:
+        """스트림 청크 수신"""
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+        self.chunks += 1
+
+    @property
+    def ttft(self) -> Optional[float]:
+        """time-to-first-token (초)"""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+    @property
+    def total_tokens(self) -> Optional[int]:
+        """입력 + 출력 토큰 (API usage 기준, 둘 다 모르면 None)"""
+        if self.input_tokens is None and self.output_tokens is None:
+            return None
+        return (self.input_tokens or 0) + (self.output_tokens or 0)
+
+    @property
+    def tokens_per_sec(self) -> Optional[float]:
+        """첫 토큰 이후 출력 토큰 처리량 (토큰 수를 모르면 청크 수 기준, 중단된 호출은 None)"""
+        if not self.completed or self.first_token_at is None or self.finished_at is None:
+            return None
+        generation_time = self.finished_at - self.first_token_at
+        if generation_time <= 0:
+            return None
+        return (self.output_tokens or self.chunks) / generation_time
+
+    def usage(self) -> Dict[str, Optional[int]]:
+        """AIRouter 응답 usage (total_tokens로 분당 토큰 예산 차감)"""
+        return {
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "provider": self.provider,
+            "model": self.model,
+            "operation": self.operation,
+            "ttft": self.ttft,
+            "duration": self.duration,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "tokens_per_sec": self.tokens_per_sec,
+            "completed": self.completed,
+        }
+
+
+class AIClientRegistry:
+    """
+    AI SDK 클라이언트 레지스트리
+
+    ClaudeClient / OpenAIClient / GeminiClient 인스턴스가 몇 개든
+    같은 SDK 클라이언트(같은 연결 풀)를 사용한다.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = settings.AI_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections: int = settings.AI_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        timeout: float = settings.AI_HTTP_TIMEOUT_SECONDS,
+        metrics_window: int = 500
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections
+        )
+        self.timeout = timeout
+        self._http_clients: Dict[str, httpx.AsyncClient] = {}
+        self._anthropic = None
+        self._openai = None
+        self._gemini_configured = False
+        self._gemini_models: Dict[str, Any] = {}
+        self.metrics: Deque[CallMetrics] = deque(maxlen=metrics_window)
+
+    # ============================================================
+    # SDK 클라이언트
+    # ============================================================
+
+    def _http_client(self, provider: str) -> httpx.AsyncClient:
+        """제공자별 공유 httpx 연결 풀"""
+        client = self._http_clients.get(provider)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+            self._http_clients[provider] = client
+        return client
+
+    def anthropic(self):
+        """공유 AsyncAnthropic"""
+        if self._anthropic is None:
+            import anthropic
+
+            self._anthropic = anthropic.AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                http_client=self._http_client("claude")
+            )
+        return self._anthropic
+
+    def openai(self):
+        """공유 AsyncOpenAI"""
+        if self._openai is None:
+            from openai import AsyncOpenAI
+
+            self._openai = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self._http_client("openai")
+            )
+        return self._openai
+
+    def gemini(self, model_name: str):
+        """모델명별 공유 GenerativeModel"""
+        model = self._gemini_models.get(model_name)
+        if model is None:
+            import google.generativeai as genai
+
+            if not self._gemini_configured:
+                genai.configure(api_key=settings.GOOGLE_API_KEY)
+                self._gemini_configured = True
+
+            model = genai.GenerativeModel(model_name)
+            self._gemini_models[model_name] = model
+        return model
+
+    async def aclose(self) -> None:
+        """연결 풀 종료 (앱 종료 시)"""
+        for client in self._http_clients.values():
+            await client.aclose()
+        self._http_clients.clear()
+        self._anthropic = None
+        self._openai = None
+
+    # ============================================================
+    # 호출 지표
+    # ============================================================
+
+    def start_call(self, provider: str, model: str, operation: str) -> CallMetrics:
+        return CallMetrics(provider=provider, model=model, operation=operation)
+
+    def finish_call(
+        self,
+        metrics: CallMetrics,
+        output_tokens: Optional[int] = None,
+        input_tokens: Optional[int] = None
+    ) -> None:
+        metrics.finished_at = time.perf_counter()
+        metrics.input_tokens = input_tokens
+        metrics.output_tokens = output_tokens
+        self.metrics.append(metrics)
+
+        ttft = metrics.ttft
+        tokens_per_sec = metrics.tokens_per_sec
+        logger.info(
+            f"AI call {metrics.provider}/{metrics.operation}: "
+            f"ttft={'-' if ttft is None else f'{ttft:.2f}s'}, "
+            f"duration={metrics.duration:.2f}s, "
+            f"tokens={metrics.input_tokens}+{metrics.output_tokens}, "
+            f"tokens/sec={'-' if tokens_per_sec is None else f'{tokens_per_sec:.1f}'}"
+            f"{'' if metrics.completed else ' (incomplete)'}"
+        )
+
+    def recent_metrics(self, provider: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 호출 지표 (최신순)"""
+        items = [m for m in reversed(self.metrics) if provider is None or m.provider == provider]
+        return [m.to_dict() for m in items[:limit]]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """제공자별 호출 수, TTFT p50/p95, 평균 tokens/sec"""
+        result: Dict[str, Dict[str, Any]] = {}
+
+        for provider in sorted({m.provider for m in self.metrics}):
+            calls = [m for m in self.metrics if m.provider == provider]
+            ttfts = sorted(m.ttft for m in calls if m.ttft is not None)
+            rates = [m.tokens_per_sec for m in calls if m.tokens_per_sec is not None]
+
+            result[provider] = {
+                "calls": len(calls),
+                "ttft_p50": ttfts[len(ttfts) // 2] if ttfts else None,
+                "ttft_p95": ttfts[min(len(ttfts) - 1, int(len(ttfts) * 0.95))] if ttfts else None,
+                "tokens_per_sec_avg": sum(rates) / len(rates) if rates else None,
+            }
+
+        return result
+
+
+# 프로세스 전역 레지스트리
+client_registry = AIClientRegistry()
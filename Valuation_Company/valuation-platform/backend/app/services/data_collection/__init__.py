@@ -0,0 +1,22 @@
+# Data Collection module (Valuation Step 5)
+from app.services.data_collection.collectors import (
+    DataCollector,
+    FixtureCollector,
+    SimulatedCollector,
+    default_collectors,
+    fixture_collectors,
+    simulated_collectors,
+    supabase_collectors
+)
+from app.services.data_collection.pipeline import CollectionPipeline
+
+__all__ = [
+    "DataCollector",
+    "FixtureCollector",
+    "SimulatedCollector",
+    "default_collectors",
+    "fixture_collectors",
+    "simulated_collectors",
+    "supabase_collectors",
+    "CollectionPipeline"
+]
@@ -0,0 +1,266 @@
+"""
+Data Collectors
+평가 Step 5 데이터 수집기
+
+@task Valuation Orchestrator
+@description 재무제표/시장/비교기업/자산/업종 벤치마크 수집기 정의
+
+수집기는 key, 표시 이름, 선행 수집기(depends_on), 타임아웃, 필수 여부를 선언하고
+collect(project_id, upstream)에서 수집 결과 dict를 반환한다.
+upstream에는 선행 수집기의 결과가 key별로 들어 있다.
+
+- SimulatedCollector: 지연만 주고 빈 결과 반환 (기본값, 수집 테이블이 채워지기 전까지 기존 시뮬레이션 동작)
+- Supabase*Collector: Supabase 테이블에서 프로젝트 데이터 조회 (VALUATION_COLLECTOR_SOURCE=supabase,
+  테이블: supabase/migrations/20261019000001_create_valuation_collection_tables.sql)
+- FixtureCollector: 로컬 JSON fixture 반환 (개발/테스트, 지연 시뮬레이션 가능)
+"""
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.db.supabase_client import supabase_client
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+class DataCollector:
+    """
+    데이터 수집기 기본 클래스
+
+    Attributes:
+        key: 수집 결과 키 (평가 입력 이름)
+        name: 진행 표시용 작업 이름
+        depends_on: 먼저 끝나야 하는 수집기 key 목록
+        timeout: 수집 타임아웃 (초)
+        required: 실패 시 평가를 진행할 수 없는지 여부
+    """
+
+    key: str = ""
+    name: str = ""
+    depends_on: Tuple[str, ...] = ()
+    required: bool = False
+
+    def __init__(self, timeout: Optional[float] = None):
+        self.timeout = timeout if timeout is not None else settings.VALUATION_COLLECTOR_TIMEOUT_SECONDS
+
+    async def collect(self, project_id: str, upstream: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        데이터 수집
+
+        Args:
+            project_id: 프로젝트 ID
+            upstream: 선행 수집기 결과 {key: data}
+
+        Returns:
+            수집 데이터
+        """
+        raise NotImplementedError
+
+
+# ============================================================
+# Supabase 수집기 (운영)
+# ============================================================
+
+class SupabaseTableCollector(DataCollector):
+    """프로젝트 ID (또는 업종)로 Supabase 테이블 조회"""
+
+    table: str = ""
+
+    def filters(self, project_id: str, upstream: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """조회 필터 (기본: project_id)"""
+        return {"project_id": project_id}
+
+    async def collect(self, project_id: str, upstream: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        rows = await supabase_client.select(self.table, filters=self.filters(project_id, upstream))
+        return {"rows": rows or []}
+
+
+class FinancialStatementCollector(SupabaseTableCollector):
+    key = "financial_statements"
+    name = "재무제표 수집"
+    table = "financial_statements"
+    required = True
+
+    async def collect(self, project_id: str, upstream: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        rows = await supabase_client.select(
+            self.table,
+            filters={"project_id": project_id},
+            order_by="fiscal_year.asc"
+        )
+        if not rows:
+            raise LookupError(f"재무제표가 없습니다: {project_id}")
+
+        return {"rows": rows, "industry": rows[-1].get("industry")}
+
+
+class MarketDataCollector(SupabaseTableCollector):
+    key = "market_data"
+    name = "시장 데이터 수집"
+    table = "market_data"
+
+
+class IndustryScopedCollector(SupabaseTableCollector):
+    """재무제표의 업종으로 조회하는 수집기"""
+
+    depends_on = ("financial_statements",)
+
+    def filters(self, project_id: str, upstream: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        industry = upstream["financial_statements"].get("industry")
+        if not industry:
+            # select()는 None 필터를 버리므로 그대로 조회하면 테이블 전체를 읽음
+            raise LookupError(f"재무제표에 업종 정보가 없습니다: {project_id}")
+        return {"industry": industry}
+
+
+class ComparableCompanyCollector(IndustryScopedCollector):
+    key = "comparable_companies"
+    name = "비교기업 데이터 수집"
+    table = "comparable_companies"
+
+
+class AssetCollector(SupabaseTableCollector):
+    key = "assets"
+    name = "자산 정보 수집"
+    table = "company_assets"
+
+
+class IndustryBenchmarkCollector(IndustryScopedCollector):
+    key = "industry_benchmarks"
+    name = "업종 벤치마크 수집"
+    table = "industry_benchmarks"
+
+
+def supabase_collectors() -> List[DataCollector]:
+    """Supabase 테이블 수집기"""
+    return [
+        FinancialStatementCollector(),
+        MarketDataCollector(),
+        ComparableCompanyCollector(),
+        AssetCollector(),
+        IndustryBenchmarkCollector()
+    ]
+
+
+def default_collectors() -> List[DataCollector]:
+    """VALUATION_COLLECTOR_SOURCE에 따른 수집기 (simulated / supabase / fixture)"""
+    source = settings.VALUATION_COLLECTOR_SOURCE
+    if source == "fixture":
+        return fixture_collectors()
+    if source == "supabase":
+        return supabase_collectors()
+    if source != "simulated":
+        raise ValueError(f"Unknown VALUATION_COLLECTOR_SOURCE: {source}")
+    return simulated_collectors()
+
+
+# ============================================================
+# 시뮬레이션 수집기 (기본값)
+# ============================================================
+
+class SimulatedCollector(DataCollector):
+    """
+    지연 후 빈 결과를 반환하는 수집기
+
+    수집 테이블에 데이터가 채워지기 전까지의 기본 동작 (이전 Step 5 시뮬레이션과 같이 항상 Step 6으로 진행)
+    """
+
+    def __init__(self, source: DataCollector, delay: float = 1.0):
+        super().__init__(source.timeout)
+        self.key = source.key
+        self.name = source.name
+        self.depends_on = source.depends_on
+        self.required = source.required
+        self.delay = delay
+
+    async def collect(self, project_id: str, upstream: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        await asyncio.sleep(self.delay)
+        return {"rows": [], "simulated": True}
+
+
+def simulated_collectors(delay: float = 1.0) -> List[DataCollector]:
+    """운영 수집기와 같은 의존 관계를 갖는 시뮬레이션 수집기 목록"""
+    return [SimulatedCollector(source, delay=delay) for source in supabase_collectors()]
+
+
+# ============================================================
+# Fixture 수집기 (개발/테스트)
+# ============================================================
+
+class FixtureCollector(DataCollector):
+    """
+    로컬 JSON fixture 수집기
+
+    {fixture_dir}/{project_id}/{key}.json이 있으면 그것을,
+    없으면 {fixture_dir}/default/{key}.json을 반환한다.
+    """
+
+    def __init__(
+        self,
+        source: DataCollector,
+        fixture_dir: Path = FIXTURE_DIR,
+        delay: float = 0.0,
+        error: Optional[Exception] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Args:
+            source: key/name/depends_on/required를 가져올 운영 수집기
+            fixture_dir: fixture 디렉토리
+            delay: 응답 지연 시뮬레이션 (초)
+            error: 지정하면 지연 후 이 예외 발생 (실패 시뮬레이션)
+        """
+        super().__init__(timeout if timeout is not None else source.timeout)
+        self.key = source.key
+        self.name = source.name
+        self.depends_on = source.depends_on
+        self.required = source.required
+        self.fixture_dir = fixture_dir
+        self.delay = delay
+        self.error = error
+
+    def _fixture_path(self, project_id: str) -> Path:
+        path = self.fixture_dir / project_id / f"{self.key}.json"
+        if path.exists():
+            return path
+        return self.fixture_dir / "default" / f"{self.key}.json"
+
+    async def collect(self, project_id: str, upstream: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+
+        path = self._fixture_path(project_id)
+        return await asyncio.to_thread(lambda: json.loads(path.read_text(encoding="utf-8")))
+
+
+def fixture_collectors(
+    fixture_dir: Path = FIXTURE_DIR,
+    delays: Optional[Dict[str, float]] = None,
+    errors: Optional[Dict[str, Exception]] = None,
+    timeout: Optional[float] = None
+) -> List[DataCollector]:
+    """
+    운영 수집기와 같은 의존 관계를 갖는 fixture 수집기 목록
+
+    Args:
+        fixture_dir: fixture 디렉토리
+        delays: key별 지연 (초)
+        errors: key별 발생시킬 예외
+        timeout: 전체 수집기 타임아웃 (초)
+    """
+    delays = delays or {}
+    errors = errors or {}
+
+    return [
+        FixtureCollector(
+            source,
+            fixture_dir=fixture_dir,
+            delay=delays.get(source.key, 0.0),
+            error=errors.get(source.key),
+            timeout=timeout
+        )
+        for source in supabase_collectors()
+    ]
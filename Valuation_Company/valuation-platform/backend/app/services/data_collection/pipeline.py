@@ -0,0 +1,150 @@
+"""
+Collection Pipeline
+데이터 수집기 동시 실행
+
+@task Valuation Orchestrator
+@description 선언된 의존 관계에 따라 수집기를 동시에 실행 (단계 지연 = 가장 긴 의존 경로)
+
+- 의존 관계가 없는 수집기는 바로 시작, 선행 수집기가 끝나는 즉시 후행 수집기 시작
+- 수집기별 타임아웃, 실패해도 나머지 결과는 유지 (부분 결과 허용)
+- 선행 수집기가 실패하면 후행 수집기는 건너뜀
+- 수집기가 끝날 때마다 진행 콜백 호출
+"""
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.services.data_collection.collectors import DataCollector
+
+ProgressCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class CollectionPipeline:
+    """
+    수집기 의존 그래프 실행기
+
+    생성 시 의존 관계를 검증하고 위상 정렬해 둔다.
+    """
+
+    def __init__(self, collectors: List[DataCollector]):
+        """
+        Raises:
+            ValueError: key 중복, 없는 수집기 의존, 순환 의존
+        """
+        self.collectors: Dict[str, DataCollector] = {}
+        for collector in collectors:
+            if collector.key in self.collectors:
+                raise ValueError(f"Duplicate collector key: {collector.key}")
+            self.collectors[collector.key] = collector
+
+        for collector in collectors:
+            for dependency in collector.depends_on:
+                if dependency not in self.collectors:
+                    raise ValueError(
+                        f"Collector '{collector.key}' depends on unknown collector '{dependency}'"
+                    )
+
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """의존 순서 (Kahn 알고리즘, 같은 단계는 선언 순서 유지)"""
+        remaining = {key: set(collector.depends_on) for key, collector in self.collectors.items()}
+        order: List[str] = []
+
+        while remaining:
+            ready = [key for key, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Circular collector dependency: {sorted(remaining)}")
+
+            for key in ready:
+                order.append(key)
+                del remaining[key]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return order
+
+    async def run(self, project_id: str, on_progress: Optional[ProgressCallback] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        모든 수집기 실행
+
+        Args:
+            project_id: 프로젝트 ID
+            on_progress: 수집기가 끝날 때마다 호출 (task, progress, status, task_status)
+
+        Returns:
+            {key: {
+                'key', 'name', 'status' ('completed' | 'failed' | 'timeout' | 'skipped'),
+                'data', 'error', 'elapsed', 'timestamp'
+            }} - 선언 순서
+        """
+        total = len(self.collectors)
+        finished = 0
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_collector(collector: DataCollector) -> Dict[str, Any]:
+            nonlocal finished
+
+            upstream: Dict[str, Dict[str, Any]] = {}
+            failed_dependency = None
+            for dependency in collector.depends_on:
+                dependency_outcome = await tasks[dependency]
+                if dependency_outcome["status"] != "completed":
+                    failed_dependency = dependency
+                    break
+                upstream[dependency] = dependency_outcome["data"]
+
+            started = time.perf_counter()
+            data = None
+            error = None
+
+            if failed_dependency is not None:
+                status = "skipped"
+                error = f"선행 수집 실패: {self.collectors[failed_dependency].name}"
+            else:
+                try:
+                    data = await asyncio.wait_for(
+                        collector.collect(project_id, upstream),
+                        timeout=collector.timeout
+                    )
+                    status = "completed"
+                except asyncio.TimeoutError:
+                    status = "timeout"
+                    error = f"{collector.timeout}초 내에 응답이 없습니다"
+                except Exception as e:
+                    status = "failed"
+                    error = str(e)
+
+            outcome = {
+                "key": collector.key,
+                "name": collector.name,
+                "status": status,
+                "data": data,
+                "error": error,
+                "elapsed": round(time.perf_counter() - started, 3),
+                "timestamp": datetime.utcnow().isoformat()
+            }
+
+            finished += 1
+            if on_progress:
+                await on_progress({
+                    "task": collector.name,
+                    "progress": int(finished / total * 100),
+                    "status": "collecting",
+                    "task_status": status
+                })
+
+            return outcome
+
+        # 위상 순서로 생성해야 run_collector가 선행 태스크를 찾을 수 있다
+        for key in self.order:
+            tasks[key] = asyncio.create_task(run_collector(self.collectors[key]))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+        return {key: tasks[key].result() for key in self.collectors}
@@ -0,0 +1,45 @@
+"""
+Deal Amounts
+
+투자금액 문자열 → 억원 숫자 (deals.amount_eok)
+수집 스크립트(daily_auto_collect.py 등)도 쓰므로 표준 라이브러리만 사용 (통계는 deal_analytics)
+"""
+
+import re
+from typing import Any
+
+# 환산 기준 (대략적): 1만 달러 ≈ 1,300만원, 100만 달러 ≈ 13억원
+USD_MAN_TO_EOK = 0.13
+USD_MILLION_TO_EOK = 13.0
+
+_NOISE = re.compile(r'(약|총|최대|규모|원|이상|이내)')
+# (패턴, 억원 환산 배수) - 앞에서부터 처음 맞는 패턴 사용
+_AMOUNT_PATTERNS = (
+    (re.compile(r'([\d,.]+)\s*억'), 1.0),
+    (re.compile(r'([\d,.]+)\s*만\s*달러'), USD_MAN_TO_EOK),
+    (re.compile(r'\$\s*([\d,.]+)\s*[Mm]'), USD_MILLION_TO_EOK),
+    (re.compile(r'^([\d,.]+)$'), 1.0),  # 숫자만 (수집 프롬프트: "억원 숫자만")
+)
+
+
+def parse_amount_eok(value: Any) -> float:
+    """
+    투자금액 → 억원 단위 숫자 (파싱 불가 시 0)
+
+    Args:
+        value: "100억원", "약 50억", "1000만 달러", "$5M", 숫자(억원) 등
+    """
+    if not value and value != 0:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    cleaned = _NOISE.sub('', str(value).strip()).strip()
+    for pattern, factor in _AMOUNT_PATTERNS:
+        match = pattern.search(cleaned)
+        if match:
+            try:
+                return float(match.group(1).replace(',', '')) * factor
+            except ValueError:
+                return 0.0
+    return 0.0
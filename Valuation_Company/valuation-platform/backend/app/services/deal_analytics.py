@@ -0,0 +1,190 @@
+"""
+Deal Analytics
+
+deals 테이블 통계 공용 모듈 (주간 리포트 이메일, 벤치마크)
+- 투자금액 문자열("100억원", "1,000만 달러", "$5M")은 수집 시 deal_amounts.parse_amount_eok()로 한 번만 억원 숫자로 바꿔
+  deals.amount_eok 컬럼에 저장 (daily_auto_collect.py / daily_automation.py / reprocess_deals.py)
+- 통계는 저장된 amount_eok를 한 번 훑어 계산 (정렬 대신 heapq.nlargest, 집계는 dict / Counter)
+  amount_eok가 비어 있는 예전 행만 parse_amount_eok로 보충
+- 리포트 크기(수백 건)에서는 DataFrame 생성 비용이 집계보다 커서 pandas를 쓰지 않음
+  (수집 스크립트도 표준 라이브러리만으로 실행) - 전체 이력 주별 추이는 DB의 deals_weekly_summary 뷰
+- 결과 형식은 send_weekly_email.analyze_deals 기존 dict와 동일 (+ week_over_week)
+"""
+
+import heapq
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.services.deal_amounts import parse_amount_eok
+
+FRAME_COLUMNS = ('company_name', 'amount', 'amount_eok', 'industry_category', 'stage', 'investors', 'news_date')
+
+
+def deal_amount(deal: Dict[str, Any]) -> float:
+    """억원 금액 (저장된 amount_eok 우선, 없으면 amount 정규화)"""
+    stored = deal.get('amount_eok')
+    if stored is not None:
+        try:
+            return float(stored)
+        except (TypeError, ValueError):
+            pass
+    return parse_amount_eok(deal.get('amount'))
+
+
+def deals_frame(deals: Sequence[Dict[str, Any]]):
+    """
+    Deal dict 목록 → DataFrame (amount_eok 보충, 행 순서 = 입력 순서)
+
+    벤치마크에서 'PostgREST 행 목록 + pandas' 방식 비교용 - pandas는 여기서만 import
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame({column: [deal.get(column) for deal in deals] for column in FRAME_COLUMNS})
+    frame['amount_eok'] = [deal_amount(deal) for deal in deals]
+    return frame
+
+
+def _news_day(value: Any) -> Optional[date]:
+    """news_date("2025-01-03", "2025-01-03T09:00:00+09:00" 등) → 날짜 (형식 오류는 None)"""
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def top_investors(deals: Sequence[Dict[str, Any]], limit: Optional[int] = 5) -> List[tuple]:
+    """투자자별 참여 건수 [(투자자, 건수)] - investors는 쉼표 구분 문자열"""
+    counts = Counter(
+        name.strip()
+        for deal in deals if deal.get('investors')
+        for name in str(deal['investors']).split(',')
+    )
+    return counts.most_common(limit)
+
+
+def _delta(deals: int, amount: float, prev_deals: int, prev_amount: float) -> Dict[str, Any]:
+    return {
+        'deals': deals,
+        'amount': amount,
+        'prev_deals': prev_deals,
+        'prev_amount': prev_amount,
+        'deals_delta': deals - prev_deals,
+        'amount_delta': amount - prev_amount,
+        'amount_pct': (amount - prev_amount) / prev_amount if prev_amount > 0 else None,
+    }
+
+
+def weekly_summary(deals: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    주(월~일)별 건수 / 금액과 전주 대비 증감 (거래 없는 주도 0으로 포함)
+
+    DB에 있는 전체 이력은 deals_weekly_summary 뷰가 같은 집계를 SQL로 한다.
+
+    Returns:
+        [{'week_start': 월요일, 'deals', 'amount', 'deals_delta', 'amount_delta', 'amount_pct'}] (주 오름차순)
+    """
+    weeks: Dict[date, List[float]] = {}
+    for deal in deals:
+        day = _news_day(deal.get('news_date'))
+        if day is None:
+            continue
+        row = weeks.setdefault(day - timedelta(days=day.weekday()), [0, 0.0])
+        row[0] += 1
+        row[1] += deal_amount(deal)
+
+    if not weeks:
+        return []
+
+    result = []
+    week, last = min(weeks), max(weeks)
+    previous = None
+    while week <= last:
+        count, amount = weeks.get(week, (0, 0.0))
+        row = {'week_start': week, 'deals': count, 'amount': amount,
+               'deals_delta': None, 'amount_delta': None, 'amount_pct': None}
+        if previous is not None:
+            delta = _delta(count, amount, previous['deals'], previous['amount'])
+            row.update({key: delta[key] for key in ('deals_delta', 'amount_delta', 'amount_pct')})
+        result.append(row)
+        previous = row
+        week += timedelta(days=7)
+    return result
+
+
+def period_delta(current: Sequence[Dict[str, Any]], previous: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """두 기간(이번 / 직전) 건수·금액 증감"""
+    return _delta(
+        len(current), sum(deal_amount(deal) for deal in current),
+        len(previous), sum(deal_amount(deal) for deal in previous)
+    )
+
+
+def week_over_week(deals: Sequence[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """이력의 마지막 주(월~일)와 그 전 주 비교 (비교할 전주가 없으면 None)"""
+    weekly = weekly_summary(deals)
+    if len(weekly) < 2:
+        return None
+    current, previous = weekly[-1], weekly[-2]
+    result = _delta(current['deals'], current['amount'], previous['deals'], previous['amount'])
+    result['week_start'] = current['week_start']
+    return result
+
+
+def analyze_deals(
+    deals: Sequence[Dict[str, Any]],
+    previous_deals: Optional[Sequence[Dict[str, Any]]] = None,
+    top_n: int = 5
+) -> Optional[Dict[str, Any]]:
+    """
+    Deal 목록 통계 (주간 리포트)
+
+    Args:
+        deals: 이번 기간 Deal 리스트
+        previous_deals: 직전 기간 Deal 리스트 (주면 week_over_week에 증감 포함)
+        top_n: 금액 기준 상위 딜 수
+
+    Returns:
+        total_deals, total_amount, max_deal, top_industry, top5_deals, industry_sorted(7개),
+        stage_counts, investor_counts(5개), week_over_week / 딜이 없으면 None
+    """
+    if not deals:
+        return None
+
+    amounts = [deal_amount(deal) for deal in deals]
+
+    # 금액 내림차순 상위 N개 (동률은 원래 순서 - 전체 정렬과 같은 결과)
+    top_indexes = heapq.nlargest(top_n, range(len(deals)), key=amounts.__getitem__)
+    top_deals = [deals[i] for i in top_indexes]
+
+    # 업종별 건수 / 금액 (건수 내림차순, 동률은 처음 나온 순서)
+    industry_stats: Dict[str, Dict[str, Any]] = {}
+    for deal, amount in zip(deals, amounts):
+        category = deal.get('industry_category')
+        if category:
+            entry = industry_stats.setdefault(category, {'count': 0, 'amount': 0.0})
+            entry['count'] += 1
+            entry['amount'] += amount
+    industry_sorted = sorted(industry_stats.items(), key=lambda item: item[1]['count'], reverse=True)
+
+    # 가장 활발한 업종 (2건 이상만, 없으면 1건이라도)
+    top_industry = next((item for item in industry_sorted if item[1]['count'] >= 2), None)
+    if not top_industry and industry_sorted:
+        top_industry = industry_sorted[0]
+
+    stats = {
+        'total_deals': len(deals),
+        'total_amount': sum(amounts),
+        'max_deal': deals[max(range(len(deals)), key=amounts.__getitem__)],
+        'top_industry': top_industry,
+        'top5_deals': top_deals,
+        'industry_sorted': industry_sorted[:7],
+        'stage_counts': Counter(deal.get('stage') for deal in deals if deal.get('stage')).most_common(),
+        'investor_counts': top_investors(deals, limit=5),
+        'week_over_week': None,
+    }
+    if previous_deals is not None:
+        stats['week_over_week'] = period_delta(deals, previous_deals)
+    return stats
@@ -0,0 +1,613 @@
+"""
+Deal Warehouse
+
+deals / investment_news_articles 이력의 Parquet 스냅샷 + 로컬 DuckDB 조회 계층
+- export_snapshots(): Supabase 테이블 전체를 id 키셋 페이지로 읽어 월(month) / 업종(industry) 파티션 Parquet로 저장
+  (스케줄러 deal_warehouse_snapshot 작업 또는 export_deal_warehouse.py로 주기 실행)
+- 스냅샷은 <루트>/<테이블>/<스냅샷 ID>/month=YYYY-MM/industry=.../part-0.parquet
+  임시 디렉터리에 다 쓴 뒤 이름을 바꾸고 LATEST를 교체하므로, 읽는 쪽은 항상 완성된 스냅샷만 봄
+- DealWarehouse: 최신 스냅샷 위에 DuckDB 뷰(deals, investment_news_articles)를 만들어
+  여러 해 투자 추이 / 투자사 순위 / 단계 전환 분석을 라이브 DB 조회 없이 실행
+  (기간 / 업종 조건은 파티션 디렉터리 단위로 걸러짐)
+
+pyarrow(내보내기), duckdb(조회)는 선택 의존성 - 사용할 때 import
+"""
+
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.services.deal_amounts import parse_amount_eok
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = Path(__file__).resolve().parents[2] / "data" / "warehouse"
+LATEST_FILE = "LATEST"
+MANIFEST_FILE = "_snapshot.json"
+UNKNOWN_MONTH = "unknown"
+UNCLASSIFIED_INDUSTRY = "미분류"
+PERIODS = ("month", "quarter", "year")
+
+_SNAPSHOT_ID = re.compile(r"^\d{8}T\d{6}Z$")
+_PATH_UNSAFE = re.compile(r'[/\\=%:*?"<>|]')
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """스냅샷 대상 테이블 (컬럼 → 'string' / 'int' / 'float' / 'bool' / 'date')"""
+    name: str
+    date_column: str
+    columns: Dict[str, str]
+    industry_column: Optional[str] = None
+    select: str = "*"
+
+    @property
+    def partitions(self) -> Tuple[str, ...]:
+        return ("month", "industry") if self.industry_column else ("month",)
+
+
+DEALS = TableSpec(
+    name="deals",
+    date_column="news_date",
+    industry_column="industry_category",
+    columns={
+        "id": "int",
+        "number": "int",
+        "company_name": "string",
+        "industry": "string",
+        "industry_category": "string",
+        "stage": "string",
+        "investors": "string",
+        "amount": "string",
+        "amount_eok": "float",
+        "location": "string",
+        "news_title": "string",
+        "news_url": "string",
+        "news_date": "date",
+        "site_name": "string",
+        "parser_version": "string",
+    },
+)
+
+# 기사 본문(content)은 추이 분석에 쓰지 않고 크기만 커서 제외 / 업종 컬럼이 없어 월 파티션만
+ARTICLE_COLUMNS = {
+    "id": "int",
+    "site_number": "int",
+    "site_name": "string",
+    "site_url": "string",
+    "article_title": "string",
+    "article_url": "string",
+    "published_date": "date",
+    "collected_at": "string",
+    "company_name": "string",
+    "score": "int",
+    "has_amount": "bool",
+    "has_investors": "bool",
+    "has_stage": "bool",
+    "has_industry": "bool",
+    "has_location": "bool",
+    "has_employees": "bool",
+    "processed": "bool",
+}
+ARTICLES = TableSpec(
+    name="investment_news_articles",
+    date_column="published_date",
+    columns=ARTICLE_COLUMNS,
+    select=",".join(ARTICLE_COLUMNS),
+)
+
+TABLES: Dict[str, TableSpec] = {spec.name: spec for spec in (DEALS, ARTICLES)}
+
+
+@dataclass
+class SnapshotInfo:
+    """내보낸 스냅샷 1개 요약 (_snapshot.json)"""
+    table: str
+    snapshot_id: str
+    rows: int
+    files: int
+    bytes: int
+    partitions: List[str]
+    exported_at: str
+    seconds: float = 0.0
+    removed: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self.__dict__)
+
+
+def _require(module: str):
+    """선택 의존성 import (없으면 설치 안내)"""
+    try:
+        return __import__(module)
+    except ImportError as e:
+        raise ImportError(f"deal_warehouse requires '{module}' (pip install {module})") from e
+
+
+def resolve_root(root: Optional[os.PathLike] = None) -> Path:
+    """스냅샷 루트: 인자 → DEAL_WAREHOUSE_DIR 설정 → backend/data/warehouse"""
+    if root:
+        return Path(root)
+    from app.core.config import settings
+    return Path(settings.DEAL_WAREHOUSE_DIR) if settings.DEAL_WAREHOUSE_DIR else DEFAULT_ROOT
+
+
+# ============================================================
+# 행 → Arrow 테이블
+# ============================================================
+
+def _to_date(value: Any) -> Optional[date]:
+    """"2025-01-03", "2025-01-03T09:00:00+09:00", date → date (형식 오류는 None)"""
+    if isinstance(value, date):
+        return value if not isinstance(value, datetime) else value.date()
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+    return None
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
+
+
+_CONVERTERS = {
+    "string": _to_string,
+    "int": _to_int,
+    "float": _to_float,
+    "bool": lambda value: None if value is None else bool(value),
+    "date": _to_date,
+}
+
+
+def partition_value(value: Any, empty: str) -> str:
+    """파티션 디렉터리 이름 (경로에 쓸 수 없는 문자는 '_')"""
+    text = str(value).strip() if value is not None else ""
+    return _PATH_UNSAFE.sub("_", text) if text else empty
+
+
+def to_arrow(rows: Iterable[Dict[str, Any]], spec: TableSpec):
+    """
+    Supabase 행 → pyarrow.Table (spec.columns 순서 + month / industry 파티션 컬럼)
+
+    스냅샷마다 스키마가 같도록 spec에 없는 컬럼은 버리고 없는 컬럼은 null,
+    deals.amount_eok가 비어 있으면 amount를 parse_amount_eok로 보충 (마이그레이션 전 행)
+    """
+    pa = _require("pyarrow")
+    arrow_types = {
+        "string": pa.string(), "int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "date": pa.date32()
+    }
+
+    values: Dict[str, List[Any]] = {name: [] for name in spec.columns}
+    months: List[str] = []
+    industries: List[str] = []
+    converters = [(name, _CONVERTERS[kind]) for name, kind in spec.columns.items()]
+
+    for row in rows:
+        for name, convert in converters:
+            values[name].append(convert(row.get(name)))
+        if "amount_eok" in values and values["amount_eok"][-1] is None:
+            values["amount_eok"][-1] = parse_amount_eok(row.get("amount"))
+
+        day = values[spec.date_column][-1]
+        months.append(day.strftime("%Y-%m") if day else UNKNOWN_MONTH)
+        if spec.industry_column:
+            industries.append(partition_value(row.get(spec.industry_column), UNCLASSIFIED_INDUSTRY))
+
+    arrays = {name: pa.array(values[name], type=arrow_types[kind]) for name, kind in spec.columns.items()}
+    arrays["month"] = pa.array(months, type=pa.string())
+    if spec.industry_column:
+        arrays["industry"] = pa.array(industries, type=pa.string())
+    return pa.table(arrays)
+
+
+# ============================================================
+# 스냅샷 쓰기 / 관리
+# ============================================================
+
+def _write_text(path: Path, text: str) -> None:
+    """임시 파일에 쓴 뒤 교체 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)"""
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def list_snapshots(root: os.PathLike, table: str) -> List[str]:
+    """완성된 스냅샷 ID 목록 (오래된 순)"""
+    table_dir = Path(root) / table
+    if not table_dir.is_dir():
+        return []
+    return sorted(p.name for p in table_dir.iterdir() if p.is_dir() and _SNAPSHOT_ID.match(p.name))
+
+
+def latest_snapshot(root: os.PathLike, table: str) -> Optional[Path]:
+    """LATEST가 가리키는 스냅샷 디렉터리 (없으면 None)"""
+    table_dir = Path(root) / table
+    try:
+        snapshot_id = (table_dir / LATEST_FILE).read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        return None
+    path = table_dir / snapshot_id
+    return path if path.is_dir() else None
+
+
+def prune_snapshots(root: os.PathLike, table: str, keep: int) -> List[str]:
+    """최근 keep개와 LATEST 스냅샷만 남기고 삭제 (남은 임시 디렉터리 포함)"""
+    table_dir = Path(root) / table
+    latest = latest_snapshot(root, table)
+    removed = []
+    for snapshot_id in list_snapshots(root, table)[:-keep] if keep > 0 else []:
+        if latest is not None and latest.name == snapshot_id:
+            continue
+        shutil.rmtree(table_dir / snapshot_id, ignore_errors=True)
+        removed.append(snapshot_id)
+    for leftover in table_dir.glob(".tmp-*"):
+        shutil.rmtree(leftover, ignore_errors=True)
+    return removed
+
+
+def write_snapshot(
+    rows: Iterable[Dict[str, Any]],
+    spec: TableSpec,
+    root: Optional[os.PathLike] = None,
+    snapshot_id: Optional[str] = None,
+    keep: int = 8
+) -> SnapshotInfo:
+    """
+    행 → 파티션 Parquet 스냅샷 1개 (완성 후 LATEST 교체, 오래된 스냅샷 정리)
+
+    파티션 안에서는 날짜순으로 정렬해 써서 행 그룹 min/max 통계로 기간 조건을 더 걸러냄
+    """
+    _require("pyarrow")
+    import pyarrow.dataset as ds
+
+    started = time.perf_counter()
+    root = resolve_root(root)
+    now = datetime.now(timezone.utc)
+    snapshot_id = snapshot_id or now.strftime("%Y%m%dT%H%M%SZ")
+    table_dir = root / spec.name
+    table_dir.mkdir(parents=True, exist_ok=True)
+
+    table = to_arrow(rows, spec)
+    sort_keys = [(name, "ascending") for name in (*spec.partitions, spec.date_column, "id")]
+    table = table.sort_by(sort_keys)
+
+    tmp_dir = table_dir / f".tmp-{snapshot_id}"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    partitioning = ds.partitioning(table.select(list(spec.partitions)).schema, flavor="hive")
+    if table.num_rows == 0:
+        # 빈 테이블도 조회 뷰가 같은 스키마로 열리도록 빈 파일 1개
+        import pyarrow.parquet as pq
+        empty_dir = tmp_dir.joinpath(*(
+            f"{name}={UNKNOWN_MONTH if name == 'month' else UNCLASSIFIED_INDUSTRY}" for name in spec.partitions
+        ))
+        empty_dir.mkdir(parents=True)
+        pq.write_table(table.drop_columns(list(spec.partitions)), empty_dir / "part-0.parquet")
+    else:
+        ds.write_dataset(
+            table,
+            tmp_dir,
+            format="parquet",
+            partitioning=partitioning,
+            basename_template="part-{i}.parquet",
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+            max_rows_per_group=64 * 1024,
+            existing_data_behavior="error",
+        )
+
+    files = list(tmp_dir.rglob("*.parquet"))
+    info = SnapshotInfo(
+        table=spec.name,
+        snapshot_id=snapshot_id,
+        rows=table.num_rows,
+        files=len(files),
+        bytes=sum(f.stat().st_size for f in files),
+        partitions=list(spec.partitions),
+        exported_at=now.isoformat(),
+    )
+    _write_text(tmp_dir / MANIFEST_FILE, json.dumps(info.to_dict(), ensure_ascii=False, indent=2))
+
+    final_dir = table_dir / snapshot_id
+    if final_dir.exists():
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise FileExistsError(f"Snapshot {spec.name}/{snapshot_id} already exists")
+    os.rename(tmp_dir, final_dir)
+    _write_text(table_dir / LATEST_FILE, snapshot_id)
+
+    info.removed = prune_snapshots(root, spec.name, keep)
+    info.seconds = time.perf_counter() - started
+    logger.info(
+        f"Warehouse snapshot {spec.name}/{snapshot_id}: {info.rows} rows, {info.files} files, "
+        f"{info.bytes / 1024:.0f} KiB in {info.seconds:.1f}s"
+    )
+    return info
+
+
+async def export_snapshots(
+    root: Optional[os.PathLike] = None,
+    tables: Sequence[str] = tuple(TABLES),
+    keep: int = 8,
+    page_size: int = 1000,
+    client=None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Supabase 테이블 → Parquet 스냅샷 (주기 실행용)
+
+    Args:
+        root: 스냅샷 루트 (기본 DEAL_WAREHOUSE_DIR / backend/data/warehouse)
+        tables: 내보낼 테이블 (deals, investment_news_articles)
+        keep: 테이블별로 남길 스냅샷 수
+        client: SupabaseClient (기본 공용 인스턴스)
+
+    Returns:
+        {테이블: SnapshotInfo dict}
+    """
+    if client is None:
+        from app.db.supabase_client import supabase_client as client
+
+    results = {}
+    for name in tables:
+        spec = TABLES[name]
+        rows: List[Dict[str, Any]] = []
+        async for page in client.iter_pages(spec.name, columns=spec.select, page_size=page_size):
+            rows.extend(page)
+        results[name] = write_snapshot(rows, spec, root=root, keep=keep).to_dict()
+    return results
+
+
+# ============================================================
+# 조회 계층 (DuckDB)
+# ============================================================
+
+# deals에서 파생되는 조회용 테이블 (in_memory면 적재 시 한 번 계산, 아니면 뷰)
+DERIVED_TABLES = {
+    # 투자사 참여 1건 = 1행 (investors 쉼표 구분 문자열 분해)
+    "deal_investors": """
+        SELECT id, investor, company_name, amount_eok, news_date, month, industry
+        FROM (
+            SELECT id, trim(unnest(string_split(investors, ','))) AS investor,
+                   company_name, amount_eok, news_date, month, industry
+            FROM deals
+            WHERE investors IS NOT NULL
+        )
+        WHERE investor <> ''
+    """,
+    # 기업별 라운드 (전체 이력 기준 직전 라운드의 단계 / 날짜)
+    "deal_rounds": """
+        SELECT id, company_name, stage, amount_eok, news_date, month, industry,
+               LAG(stage) OVER w AS from_stage,
+               LAG(news_date) OVER w AS from_date
+        FROM deals
+        WHERE company_name IS NOT NULL AND stage IS NOT NULL AND stage <> '' AND news_date IS NOT NULL
+        WINDOW w AS (PARTITION BY company_name ORDER BY news_date, id)
+    """,
+}
+
+
+class DealWarehouse:
+    """
+    최신 Parquet 스냅샷 위의 읽기 전용 DuckDB 조회 계층
+
+    테이블: deals, investment_news_articles (스냅샷이 있는 테이블만)
+           + deal_investors(투자사 참여 1건 = 1행), deal_rounds(기업별 직전 라운드) - DERIVED_TABLES
+    - in_memory=True(기본): 열 때 스냅샷을 DuckDB 메모리 테이블로 한 번 읽어 두고 조회는 메모리에서
+      (파티션 파일이 많아 파일마다 여는 비용이 조회 시간보다 큼 - 오래 쓰는 인스턴스는 get_warehouse())
+    - in_memory=False: Parquet 파일을 직접 조회 (기간 / 업종 조건은 파티션 디렉터리째 걸러짐, 일회성 조회용)
+    각 메서드는 pandas DataFrame 반환, query()로 임의 SQL도 실행 가능
+    한 인스턴스를 여러 스레드에서 써도 됨 (조회마다 커서 분리)
+    """
+
+    def __init__(self, root: Optional[os.PathLike] = None, in_memory: bool = True):
+        duckdb = _require("duckdb")
+        self.root = resolve_root(root)
+        self.connection = duckdb.connect(":memory:")
+        self.snapshots: Dict[str, str] = {}
+
+        for spec in TABLES.values():
+            snapshot = latest_snapshot(self.root, spec.name)
+            if snapshot is None:
+                continue
+            hive_types = ", ".join(f"'{name}': VARCHAR" for name in spec.partitions)
+            pattern = (snapshot / "**" / "*.parquet").as_posix().replace("'", "''")
+            self.connection.execute(
+                f"CREATE {'TABLE' if in_memory else 'VIEW'} {spec.name} AS SELECT * FROM read_parquet('{pattern}', "
+                f"hive_partitioning = true, hive_types = {{{hive_types}}})"
+            )
+            self.snapshots[spec.name] = snapshot.name
+
+        if "deals" in self.snapshots:
+            for name, sql in DERIVED_TABLES.items():
+                self.connection.execute(f"CREATE {'TABLE' if in_memory else 'VIEW'} {name} AS {sql}")
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "DealWarehouse":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def query(self, sql: str, params: Optional[Sequence[Any]] = None):
+        """임의 SQL → DataFrame"""
+        if not self.snapshots:
+            raise LookupError(f"No snapshot under {self.root} - run export_deal_warehouse.py first")
+        cursor = self.connection.cursor()
+        try:
+            return cursor.execute(sql, list(params or [])).df()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _deal_filters(
+        start: Optional[date],
+        end: Optional[date],
+        industry: Optional[str]
+    ) -> Tuple[str, List[Any]]:
+        """기간 / 업종 조건 (month / industry 파티션 컬럼으로 디렉터리째 걸러짐)"""
+        clauses, params = ["news_date IS NOT NULL"], []
+        if start:
+            clauses.append("month >= ? AND news_date >= ?")
+            params += [start.strftime("%Y-%m"), start]
+        if end:
+            clauses.append("month <= ? AND news_date <= ?")
+            params += [end.strftime("%Y-%m"), end]
+        if industry:
+            clauses.append("industry = ?")
+            params.append(partition_value(industry, UNCLASSIFIED_INDUSTRY))
+        return " AND ".join(clauses), params
+
+    def funding_trends(
+        self,
+        period: str = "month",
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        industry: Optional[str] = None,
+        by_industry: bool = False
+    ):
+        """
+        기간(month / quarter / year)별 투자 건수 / 금액 추이
+
+        Returns:
+            period, [industry_category], deals, amount_eok, median_amount_eok(금액 공개 딜 기준)
+        """
+        if period not in PERIODS:
+            raise ValueError(f"period must be one of {PERIODS}")
+        where, params = self._deal_filters(start, end, industry)
+        group = f", COALESCE(industry_category, '{UNCLASSIFIED_INDUSTRY}') AS industry_category" if by_industry else ""
+        return self.query(
+            f"""
+            SELECT date_trunc('{period}', news_date)::DATE AS period{group},
+                   COUNT(*) AS deals,
+                   COALESCE(SUM(amount_eok), 0) AS amount_eok,
+                   MEDIAN(amount_eok) FILTER (WHERE amount_eok > 0) AS median_amount_eok
+            FROM deals
+            WHERE {where}
+            GROUP BY ALL
+            ORDER BY ALL
+            """,
+            params,
+        )
+
+    def investor_league(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        industry: Optional[str] = None,
+        limit: int = 20
+    ):
+        """
+        투자사 순위 (참여 딜 수 → 참여 딜 금액 합 순)
+
+        investors는 쉼표 구분 문자열, 공동 투자 딜 금액은 참여사마다 전액 합산
+
+        Returns:
+            investor, deals, companies, amount_eok, first_deal, last_deal
+        """
+        where, params = self._deal_filters(start, end, industry)
+        return self.query(
+            f"""
+            SELECT investor,
+                   COUNT(*) AS deals,
+                   COUNT(DISTINCT company_name) AS companies,
+                   COALESCE(SUM(amount_eok), 0) AS amount_eok,
+                   MIN(news_date) AS first_deal,
+                   MAX(news_date) AS last_deal
+            FROM deal_investors
+            WHERE {where}
+            GROUP BY investor
+            ORDER BY deals DESC, amount_eok DESC, investor
+            LIMIT ?
+            """,
+            params + [limit],
+        )
+
+    def stage_transitions(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        industry: Optional[str] = None
+    ):
+        """
+        기업별 연속 라운드의 단계 전환 (예: 시드 → 프리A) 건수와 소요 기간
+
+        기업명 기준으로 전체 이력의 라운드를 날짜순으로 이어, 기간 안에 있는 라운드 중
+        직전 라운드와 단계가 다른 경우만 집계 (기간은 바뀐 뒤 라운드의 날짜 기준)
+
+        Returns:
+            from_stage, to_stage, transitions, companies, median_days, avg_amount_eok(전환 후 라운드)
+        """
+        where, params = self._deal_filters(start, end, industry)
+        return self.query(
+            f"""
+            SELECT from_stage,
+                   stage AS to_stage,
+                   COUNT(*) AS transitions,
+                   COUNT(DISTINCT company_name) AS companies,
+                   MEDIAN(date_diff('day', from_date, news_date)) AS median_days,
+                   AVG(amount_eok) FILTER (WHERE amount_eok > 0) AS avg_amount_eok
+            FROM deal_rounds
+            WHERE from_stage IS NOT NULL AND from_stage <> stage AND {where}
+            GROUP BY from_stage, to_stage
+            ORDER BY transitions DESC, from_stage, to_stage
+            """,
+            params,
+        )
+
+
+_warehouse: Optional[DealWarehouse] = None
+_warehouse_lock = threading.Lock()
+
+
+def get_warehouse(root: Optional[os.PathLike] = None) -> DealWarehouse:
+    """
+    공용 조회 계층 (메모리 적재는 한 번만, 새 스냅샷이 LATEST가 되면 다시 적재)
+
+    Raises:
+        LookupError: 스냅샷이 하나도 없을 때
+    """
+    global _warehouse
+
+    root = resolve_root(root)
+    current = {}
+    for name in TABLES:
+        snapshot = latest_snapshot(root, name)
+        if snapshot is not None:
+            current[name] = snapshot.name
+    if not current:
+        raise LookupError(f"No snapshot under {root} - run export_deal_warehouse.py first")
+
+    with _warehouse_lock:
+        if _warehouse is None or _warehouse.root != root or _warehouse.snapshots != current:
+            # 이전 인스턴스는 닫지 않음 (다른 스레드가 조회 중일 수 있음 - 참조가 없어지면 정리됨)
+            _warehouse = DealWarehouse(root)
+        return _warehouse
@@ -4,15 +4,29 @@ AI 기반 영업 이메일 템플릿 생성
 
 @task Investment Tracker
 @description Claude를 사용하여 맞춤형 영업 이메일 생성
+
+- 프롬프트는 기업과 무관한 고정 지시문(system)과 기업 정보(user)로 나뉜다
+  (지시문이 약 300토큰으로 프롬프트 캐싱 최소 길이 1024토큰에 못 미쳐 cache_control은 붙이지 않음)
+- 생성 결과는 (TEMPLATE_VERSION, 모델, 기업 정보 프롬프트) 키로 캐시 - 같은 프로필은 다시 생성하지 않음
+  (명시적 재생성은 use_cache=False로 캐시를 건너뛰고 새 결과로 캐시를 갱신)
+- 일괄 모드(start_batch): 기본 템플릿을 즉시 채워 두고, 동시 실행 한도 안에서 AI 버전으로 교체
+- 모델 호출은 AIRouter(EMAIL_GENERATION)를 거친다 - 기본은 Claude, 느리거나 실패하면 다른 제공자로 넘어감
 """
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
-
-import anthropic
-
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field
+
+from app.core.ai_router import AIRouter, TaskType, ai_router
 from app.core.config import settings
 from app.models.investment_tracker import StartupCompany, InvestmentRound
+from app.services import ai_client  # noqa: F401 - AIRouter 제공자 등록
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +38,148 @@ class GeneratedEmail:
     body: str
     template_type: str  # initial, follow_up
     generation_prompt: str
+    source: str = "ai"  # ai, cache, fallback
+
+
+# 초기 접촉 이메일 고정 지시문 (모든 기업 공통 프롬프트 접두부)
+INITIAL_EMAIL_INSTRUCTIONS = """당신은 B2B 영업 전문가입니다. 최근 투자를 유치한 스타트업에 보낼 초기 접촉 이메일을 작성합니다.
+
+[이메일 요구사항]
+1. 제목은 간결하고 호기심을 유발하되 스팸처럼 보이지 않게
+2. 투자 유치 축하로 시작하되 과하지 않게
+3. 발신자의 서비스가 기업 성장에 도움이 될 수 있음을 자연스럽게 언급
+4. 짧은 미팅이나 통화 요청으로 마무리
+5. 전체 길이는 200자 내외로 간결하게
+6. 한국어로 작성, 존칭 사용
+
+다음 형식으로 응답하세요:
+[제목]
+(이메일 제목)
+
+[본문]
+(이메일 본문)"""
+
+# 후속 이메일 고정 지시문
+FOLLOW_UP_EMAIL_INSTRUCTIONS = """당신은 B2B 영업 전문가입니다. 이전에 연락한 스타트업에 보낼 후속 이메일을 작성합니다.
+
+[이메일 요구사항]
+1. 이전 연락을 자연스럽게 상기시키기
+2. 부담스럽지 않게 관심 확인
+3. 추가 가치 제안 (사례, 자료 등)
+4. 간단한 다음 단계 제안
+5. 150자 내외로 더욱 간결하게
+6. 한국어로 작성, 존칭 사용
+
+다음 형식으로 응답하세요:
+[제목]
+(이메일 제목)
+
+[본문]
+(이메일 본문)"""
+
+
+class EmailDraftCache:
+    """
+    생성된 이메일 LRU 캐시 (TTL)
+
+    키는 템플릿 버전 + 모델 + 기업 정보 프롬프트의 해시.
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.EMAIL_CACHE_SIZE,
+        ttl_seconds: float = settings.EMAIL_CACHE_TTL_SECONDS
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[str, Tuple[float, GeneratedEmail]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[GeneratedEmail]:
+        item = self._items.get(key)
+        if item is None or time.monotonic() - item[0] > self.ttl_seconds:
+            self._items.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._items.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def put(self, key: str, email: GeneratedEmail) -> None:
+        self._items[key] = (time.monotonic(), email)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+@dataclass
+class EmailDraftRequest:
+    """일괄 생성 요청 1건"""
+    company: Any  # StartupCompany 또는 같은 속성을 가진 객체
+    latest_round: Optional[Any] = None
+    template_type: str = "initial"  # initial, follow_up
+    previous_contact_summary: str = ""
+    key: Optional[Any] = None  # 결과 식별자 (예: company_id)
+
+
+DraftCallback = Callable[[EmailDraftRequest, GeneratedEmail], Awaitable[None]]
+
+
+@dataclass
+class EmailBatchJob:
+    """
+    이메일 일괄 생성 작업
+
+    drafts는 생성 즉시 기본 템플릿으로 채워지고, AI 버전이 완성되는 대로 교체된다.
+    statuses: pending → ai / cache / fallback(AI 실패)
+    """
+    batch_id: str
+    requests: List[EmailDraftRequest]
+    drafts: List[GeneratedEmail]
+    statuses: List[str]
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.completed_at is not None
+
+    @property
+    def completed(self) -> int:
+        return sum(1 for status in self.statuses if status != "pending")
+
+    async def wait(self) -> List[GeneratedEmail]:
+        """모든 AI 버전 생성 완료까지 대기"""
+        if self.task is not None:
+            await asyncio.shield(self.task)
+        return self.drafts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "batch_id": self.batch_id,
+            "status": "completed" if self.done else "in_progress",
+            "total": len(self.requests),
+            "completed": self.completed,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+            "drafts": [
+                {
+                    "key": request.key,
+                    "company_name": request.company.name_ko,
+                    "status": status,
+                    "subject": draft.subject,
+                    "body": draft.body,
+                    "template_type": draft.template_type,
+                }
+                for request, draft, status in zip(self.requests, self.drafts, self.statuses)
+            ],
+        }
 
 
 class EmailGenerator:
@@ -32,18 +188,104 @@ class EmailGenerator:
     투자 유치 기업에 맞춤형 영업 이메일 생성
     """
 
-    def __init__(self):
-        self.client = anthropic.AsyncAnthropic(
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+    # 프롬프트/응답 형식이 바뀌면 올려서 캐시를 무효화
+    TEMPLATE_VERSION = "2"
+
+    # 보관할 최근 일괄 작업 수
+    MAX_BATCHES = 50
+
+    def __init__(
+        self,
+        router: AIRouter = ai_router,
+        cache: Optional[EmailDraftCache] = None
+    ):
+        self.router = router
         self.model = "claude-3-5-sonnet-20241022"
+        self.cache = cache or EmailDraftCache()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._batches: "OrderedDict[str, EmailBatchJob]" = OrderedDict()
+
+    # ============================================================
+    # 생성 공통
+    # ============================================================
+
+    def _cache_key(self, template_type: str, company_prompt: str) -> str:
+        payload = json.dumps([self.TEMPLATE_VERSION, self.model, template_type, company_prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _call_model(self, instructions: Optional[str], prompt: str, operation: str) -> str:
+        """AIRouter로 모델 호출 - 고정 지시문은 system, 기업 정보는 user로 전달"""
+        request = {
+            "prompt": prompt,
+            "max_tokens": 2048,
+            "temperature": 0.7,  # 약간의 창의성
+            "models": {"claude": self.model},
+            "operation": operation
+        }
+        if instructions:
+            request["system"] = instructions
+
+        response = await self.router.execute(TaskType.EMAIL_GENERATION, request)
+        return response["content"]
+
+    async def _generate(
+        self,
+        template_type: str,
+        instructions: str,
+        company_prompt: str,
+        use_cache: bool = True
+    ) -> GeneratedEmail:
+        """
+        캐시 조회 → 없으면 모델 호출 (같은 키 동시 요청은 한 번만 호출)
+
+        use_cache=False면 캐시와 진행 중인 호출을 건너뛰고 항상 새로 생성한다
+        (결과는 캐시에 덮어써 이후 일괄 생성이 최신 초안을 쓰게 함).
+        실패 시 예외를 그대로 올린다 (호출부에서 기본 템플릿으로 대체).
+        """
+        key = self._cache_key(template_type, company_prompt)
+
+        cached = self.cache.get(key) if use_cache else None
+        if cached is not None:
+            return GeneratedEmail(
+                subject=cached.subject,
+                body=cached.body,
+                template_type=cached.template_type,
+                generation_prompt=cached.generation_prompt,
+                source="cache"
+            )
+
+        if use_cache:
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(
+                    self._call_model(instructions, company_prompt, f"{template_type}_email")
+                )
+                self._inflight[key] = pending
+                pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+            text = await asyncio.shield(pending)
+        else:
+            text = await self._call_model(instructions, company_prompt, f"{template_type}_email")
+        result = self._parse_email_response(text)
+        if not result["subject"] or not result["body"]:
+            raise ValueError("AI 응답에서 제목/본문을 찾지 못함")
+
+        generated = GeneratedEmail(
+            subject=result["subject"],
+            body=result["body"],
+            template_type=template_type,
+            generation_prompt=f"{instructions}\n\n{company_prompt}"
+        )
+        self.cache.put(key, generated)
+        return generated
 
     async def generate_initial_email(
         self,
         company: StartupCompany,
         latest_round: Optional[InvestmentRound] = None,
         sender_company: str = "밸류링크",
-        sender_service: str = "기업가치평가 서비스"
+        sender_service: str = "기업가치평가 서비스",
+        use_cache: bool = True
     ) -> GeneratedEmail:
         """
         초기 접촉 이메일 생성
@@ -53,6 +295,7 @@ class EmailGenerator:
             latest_round: 최근 투자 라운드 정보
             sender_company: 발신 회사명
             sender_service: 제공 서비스명
+            use_cache: False면 캐시를 건너뛰고 새로 생성 (명시적 재생성)
 
         Returns:
             생성된 이메일 객체
@@ -65,24 +308,7 @@ class EmailGenerator:
         )
 
         try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                temperature=0.7,  # 약간의 창의성
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            result = self._parse_email_response(response.content[0].text)
-
-            return GeneratedEmail(
-                subject=result["subject"],
-                body=result["body"],
-                template_type="initial",
-                generation_prompt=prompt
-            )
+            return await self._generate("initial", INITIAL_EMAIL_INSTRUCTIONS, prompt, use_cache=use_cache)
 
         except Exception as e:
             logger.error(f"Error generating email for {company.name_ko}: {e}")
@@ -93,7 +319,8 @@ class EmailGenerator:
         self,
         company: StartupCompany,
         previous_contact_summary: str,
-        sender_company: str = "밸류링크"
+        sender_company: str = "밸류링크",
+        use_cache: bool = True
     ) -> GeneratedEmail:
         """
         후속 이메일 생성
@@ -102,6 +329,7 @@ class EmailGenerator:
             company: 스타트업 기업 정보
             previous_contact_summary: 이전 연락 요약
             sender_company: 발신 회사명
+            use_cache: False면 캐시를 건너뛰고 새로 생성 (명시적 재생성)
 
         Returns:
             생성된 이메일 객체
@@ -113,29 +341,109 @@ class EmailGenerator:
         )
 
         try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                temperature=0.7,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            result = self._parse_email_response(response.content[0].text)
-
-            return GeneratedEmail(
-                subject=result["subject"],
-                body=result["body"],
-                template_type="follow_up",
-                generation_prompt=prompt
-            )
+            return await self._generate("follow_up", FOLLOW_UP_EMAIL_INSTRUCTIONS, prompt, use_cache=use_cache)
 
         except Exception as e:
             logger.error(f"Error generating follow-up email for {company.name_ko}: {e}")
             return self._get_fallback_email(company, "follow_up")
 
+    # ============================================================
+    # 일괄 생성
+    # ============================================================
+
+    def start_batch(
+        self,
+        requests: Sequence[EmailDraftRequest],
+        sender_company: str = "밸류링크",
+        sender_service: str = "기업가치평가 서비스",
+        concurrency: int = settings.EMAIL_BATCH_CONCURRENCY,
+        on_draft: Optional[DraftCallback] = None
+    ) -> EmailBatchJob:
+        """
+        이메일 일괄 생성 시작 (즉시 반환)
+
+        반환된 작업의 drafts는 기본 템플릿으로 채워져 있어 바로 사용할 수 있고,
+        AI 버전은 동시 concurrency건씩 생성되어 완성되는 대로 교체된다.
+
+        Args:
+            requests: 생성 요청 목록
+            sender_company: 발신 회사명
+            sender_service: 제공 서비스명
+            concurrency: 동시 모델 호출 수
+            on_draft: AI 버전(또는 캐시) 완성 시 호출 (예: DB 저장)
+
+        Returns:
+            일괄 생성 작업
+        """
+        requests = list(requests)
+        job = EmailBatchJob(
+            batch_id=uuid.uuid4().hex,
+            requests=requests,
+            drafts=[self._get_fallback_email(r.company, r.template_type) for r in requests],
+            statuses=["pending"] * len(requests)
+        )
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(index: int, request: EmailDraftRequest):
+            async with semaphore:
+                if request.template_type == "follow_up":
+                    draft = await self.generate_follow_up_email(
+                        request.company,
+                        request.previous_contact_summary,
+                        sender_company=sender_company
+                    )
+                else:
+                    draft = await self.generate_initial_email(
+                        request.company,
+                        request.latest_round,
+                        sender_company=sender_company,
+                        sender_service=sender_service
+                    )
+
+            job.drafts[index] = draft
+            job.statuses[index] = draft.source
+
+            if on_draft is not None and draft.source != "fallback":
+                try:
+                    await on_draft(request, draft)
+                except Exception as e:
+                    logger.error(f"Error saving email draft for {request.company.name_ko}: {e}")
+
+        async def run_all():
+            try:
+                await asyncio.gather(*(run_one(i, r) for i, r in enumerate(requests)))
+            finally:
+                job.completed_at = datetime.utcnow()
+                logger.info(
+                    f"Email batch {job.batch_id}: {len(requests)} drafts, "
+                    f"ai={job.statuses.count('ai')}, cache={job.statuses.count('cache')}, "
+                    f"fallback={job.statuses.count('fallback')}"
+                )
+
+        job.task = asyncio.create_task(run_all())
+
+        self._batches[job.batch_id] = job
+        while len(self._batches) > self.MAX_BATCHES:
+            self._batches.popitem(last=False)
+
+        return job
+
+    async def generate_batch(
+        self,
+        requests: Sequence[EmailDraftRequest],
+        **options
+    ) -> List[GeneratedEmail]:
+        """이메일 일괄 생성 (완료까지 대기, 옵션은 start_batch와 동일)"""
+        return await self.start_batch(requests, **options).wait()
+
+    def get_batch(self, batch_id: str) -> Optional[EmailBatchJob]:
+        """일괄 생성 작업 조회"""
+        return self._batches.get(batch_id)
+
+    # ============================================================
+    # 프롬프트
+    # ============================================================
+
     def _build_initial_email_prompt(
         self,
         company: StartupCompany,
@@ -143,17 +451,18 @@ class EmailGenerator:
         sender_company: str,
         sender_service: str
     ) -> str:
-        """초기 접촉 이메일 프롬프트 생성"""
+        """초기 접촉 이메일 기업별 프롬프트 생성 (고정 지시문은 INITIAL_EMAIL_INSTRUCTIONS)"""
 
         # 투자 정보 문자열 구성
         investment_info = ""
         if latest_round:
+            stage = getattr(latest_round.stage, "value", latest_round.stage)
             investment_info = f"""
-- 최근 투자 단계: {latest_round.stage.value if latest_round.stage else '알 수 없음'}
+- 최근 투자 단계: {stage or '알 수 없음'}
 - 투자 금액: {latest_round.investment_amount_krw}억원
 - 리드 투자자: {latest_round.lead_investor or '알 수 없음'}"""
 
-        return f"""당신은 B2B 영업 전문가입니다. 다음 스타트업에 초기 접촉 이메일을 작성해주세요.
+        return f"""다음 스타트업에 초기 접촉 이메일을 작성해주세요.
 
 [대상 기업 정보]
 - 기업명: {company.name_ko}
@@ -164,22 +473,7 @@ class EmailGenerator:
 
 [발신자 정보]
 - 회사: {sender_company}
-- 서비스: {sender_service}
-
-[이메일 요구사항]
-1. 제목은 간결하고 호기심을 유발하되 스팸처럼 보이지 않게
-2. 투자 유치 축하로 시작하되 과하지 않게
-3. {sender_service}가 기업 성장에 도움이 될 수 있음을 자연스럽게 언급
-4. 짧은 미팅이나 통화 요청으로 마무리
-5. 전체 길이는 200자 내외로 간결하게
-6. 한국어로 작성, 존칭 사용
-
-다음 형식으로 응답하세요:
-[제목]
-(이메일 제목)
-
-[본문]
-(이메일 본문)"""
+- 서비스: {sender_service}"""
 
     def _build_follow_up_prompt(
         self,
@@ -187,9 +481,9 @@ class EmailGenerator:
         previous_contact_summary: str,
         sender_company: str
     ) -> str:
-        """후속 이메일 프롬프트 생성"""
+        """후속 이메일 기업별 프롬프트 생성 (고정 지시문은 FOLLOW_UP_EMAIL_INSTRUCTIONS)"""
 
-        return f"""당신은 B2B 영업 전문가입니다. 다음 스타트업에 후속 이메일을 작성해주세요.
+        return f"""다음 스타트업에 후속 이메일을 작성해주세요.
 
 [대상 기업 정보]
 - 기업명: {company.name_ko}
@@ -199,22 +493,7 @@ class EmailGenerator:
 {previous_contact_summary}
 
 [발신자 정보]
-- 회사: {sender_company}
-
-[이메일 요구사항]
-1. 이전 연락을 자연스럽게 상기시키기
-2. 부담스럽지 않게 관심 확인
-3. 추가 가치 제안 (사례, 자료 등)
-4. 간단한 다음 단계 제안
-5. 150자 내외로 더욱 간결하게
-6. 한국어로 작성, 존칭 사용
-
-다음 형식으로 응답하세요:
-[제목]
-(이메일 제목)
-
-[본문]
-(이메일 본문)"""
+- 회사: {sender_company}"""
 
     def _parse_email_response(self, response_text: str) -> Dict[str, str]:
         """AI 응답에서 제목과 본문 분리"""
@@ -266,7 +545,8 @@ class EmailGenerator:
 
 감사합니다.""",
                 template_type="initial",
-                generation_prompt="fallback"
+                generation_prompt="fallback",
+                source="fallback"
             )
         else:
             return GeneratedEmail(
@@ -280,7 +560,8 @@ class EmailGenerator:
 
 좋은 하루 되세요.""",
                 template_type="follow_up",
-                generation_prompt="fallback"
+                generation_prompt="fallback",
+                source="fallback"
             )
 
     async def regenerate_email(
@@ -320,17 +601,8 @@ class EmailGenerator:
 (수정된 본문)"""
 
         try:
-            response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=2048,
-                temperature=0.7,
-                messages=[{
-                    "role": "user",
-                    "content": prompt
-                }]
-            )
-
-            result = self._parse_email_response(response.content[0].text)
+            text = await self._call_model(None, prompt, "regenerate_email")
+            result = self._parse_email_response(text)
 
             return GeneratedEmail(
                 subject=result["subject"],
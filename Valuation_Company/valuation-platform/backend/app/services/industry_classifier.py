@@ -0,0 +1,292 @@
+"""
+Industry Classifier
+Deal 업종 분류 / 일괄 반영
+
+@task Investment Tracker
+@description 업종 키워드 표를 한 번 컴파일해 세부 업종 → 대분류를 판정하고, 변경분을 집합 단위 UPDATE로 반영
+
+- 대분류: INDUSTRY_CATEGORIES 순서가 우선순위 (앞 카테고리 키워드가 하나라도 포함되면 그 카테고리)
+  pyahocorasick이 있으면 Aho-Corasick 오토마톤으로 한 번만 스캔, 없으면 카테고리별 컴파일된 정규식
+- 기업별 업종 보정: COMPANY_INDUSTRY_OVERRIDES (포괄 업종 "AI"/"IT" 구체화)
+- 일괄 반영: UPDATE ... FROM (VALUES ...) SQL 생성, 또는 임시 스테이징 테이블에 COPY 후 UPDATE 한 번
+"""
+import csv
+import io
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치
+    ahocorasick = None
+
+
+# 업종 대분류 카테고리 매핑 (순서 = 우선순위)
+INDUSTRY_CATEGORIES: Dict[str, List[str]] = {
+    'AI': ['AI', '인공지능', 'AI 기반', 'AI 에이전트', 'AI·양자', '머신러닝', '딥러닝', 'LLM', '생성형'],
+    '헬스케어': ['헬스케어', '바이오', '의료', '제약', '건강', '체성분', '클리닉', '메디', '진단', '신약', '헬스'],
+    '핀테크': ['핀테크', '금융', '공급망 금융', '자산', '보험', '페이', '결제', '증권', '인슈어'],
+    '이커머스': ['이커머스', '커머스', 'M&A 플랫폼', '쇼핑', '리테일', '유통'],
+    '모빌리티': ['모빌리티', '자동차', '리스', '렌트', '자율주행', '물류', '배송'],
+    '뷰티/패션': ['뷰티', '스킨케어', '화장품', '패션', '의류'],
+    '콘텐츠/엔터': ['콘텐츠', '웹툰', 'IP 제작', '엔터', '게임', '미디어', '영상'],
+    '우주항공': ['위성', '우주', '항공', '에어로스페이스', '드론'],
+    'IT/하드웨어': ['IT 기기', '하드웨어', '반도체', '센서', '로봇', '제조'],
+    'SaaS/B2B': ['SaaS', '솔루션', '클라우드', 'B2B', 'HR', 'ERP'],
+    '농업/푸드': ['스마트팜', '농업', '푸드', '식품', '푸드테크', '에어로포닉'],
+    '에듀테크': ['에듀', '교육', '학습', '러닝'],
+    '부동산/건설': ['부동산', '프롭', '건설', '건축', '인테리어'],
+    '에너지/환경': ['에너지', '태양광', '배터리', '탄소', '환경', '그린', '수소', '친환경'],
+}
+
+# 키워드가 하나도 없을 때의 대분류
+DEFAULT_CATEGORY = '기타'
+
+# 포괄 업종(AI/IT 등)으로 저장된 기업의 구체 업종
+COMPANY_INDUSTRY_OVERRIDES: Dict[str, str] = {
+    "SDT": "Quantum/DX",
+    "에디트콜렉티브": "Proptech/AI",
+    "타이디비": "Database/Infra",
+    "Konnect": "Web3/Platform",
+    "코넥트": "Web3/Platform",
+    "한국딥러닝": "AI/OCR",
+    "리벨리온": "AI Semiconductor",
+    "크라우드웍스": "AI Data Platform",
+    "메타 플랫폼스": "Metaverse/SNS",
+    "올거나이즈": "AI/LLM",
+    "로그프레소": "Cybersecurity",
+    "큐빅": "AI/Synthetic Data",
+    "아이에스티이": "Semiconductor Equipment",
+    "그린다": "Waste Management",
+    "오피스허브": "Shared Office",
+    "탄탄코어": "Semiconductor IP",
+    "알스퀘어": "Proptech/Data",
+    "밸류맵": "Proptech/Data",
+    "십일리터": "Pet Healthcare",
+    "위드포인츠": "Loyalty Platform",
+    "퓨어스페이스": "Food Tech",
+    "휴이노": "Digital Healthcare",
+    "인탑스": "Manufacturing/EMS",
+    "어메스": "Mobility/AI",
+    "뉴패러다임인베스트먼트": "VC/Accelerator",
+    "아워스팟": "Edutech",
+    "한패스": "Fintech/Forex",
+    "법무법인 미션": "Legal Service",
+    "세종창조경제혁신센터": "Accelerator",
+    "아크리얼": "Display Materials",
+    "와디즈임팩트": "Crowdfunding",
+    "와디즈": "Crowdfunding/Platform",
+    "자비스앤빌런즈": "Tax Tech",
+    "아셉틱": "Medical Device",
+    "퍼슬리": "Data Platform",
+    "워터베이션": "Eco Tech",
+    "주미당": "F&B",
+    "긱스로프트": "Game/Content",
+    "플로라운지": "O2O/Flower",
+    "네이버클라우드": "Cloud/AI",
+    "바이버": "Luxury Commerce",
+    "KRG그룹": "Mobility/Logistics",  # Estimated
+    "피키": "Social/Platform",  # Piky
+    "매니패스트": "IT/Software",
+    "엘바": "AgriTech/Smart Farm",  # Estimated
+    "블루포인트파트너스": "Accelerator/VC",
+    "넥스트파이낸스이니셔티브": "Fintech",
+    "뉴아이": "Fintech/AI",
+    "빅웨이브카": "Mobility/Used Car",
+    "차봇 모빌리티": "Mobility Platform",
+    "열다컴퍼니": "O2O/Service",
+    "클래시스": "Medical Device/Aesthetics",
+}
+
+
+@dataclass(frozen=True)
+class IndustryUpdate:
+    """기업 1곳의 업종 변경분"""
+    company_name: str
+    industry: str
+    industry_category: Optional[str]
+
+
+class IndustryClassifier:
+    """
+    세부 업종 → 대분류 분류기
+
+    생성 시 키워드 표를 한 번 컴파일한다.
+    같은 세부 업종 문자열은 결과를 메모해 재사용한다 (Deal 업종은 종류가 적고 반복이 많음).
+    """
+
+    def __init__(
+        self,
+        categories: Mapping[str, Sequence[str]] = INDUSTRY_CATEGORIES,
+        overrides: Mapping[str, str] = COMPANY_INDUSTRY_OVERRIDES,
+        default: str = DEFAULT_CATEGORY,
+        memo_size: int = 100_000
+    ):
+        self.categories = list(categories)
+        self.overrides = dict(overrides)
+        self.default = default
+        self.memo_size = memo_size
+        self._memo: Dict[str, str] = {}
+
+        if ahocorasick is not None:
+            # 키워드 → 가장 앞선 카테고리 순위
+            ranks: Dict[str, int] = {}
+            for rank, keywords in enumerate(categories.values()):
+                for keyword in keywords:
+                    ranks.setdefault(keyword, rank)
+
+            self._automaton = ahocorasick.Automaton()
+            for keyword, rank in ranks.items():
+                self._automaton.add_word(keyword, rank)
+            self._automaton.make_automaton()
+            self._patterns = None
+        else:
+            # 카테고리별 alternation 정규식 (우선순위 순서로 검사)
+            self._automaton = None
+            self._patterns = [
+                re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+                for keywords in categories.values()
+            ]
+
+    def _best_rank(self, text: str) -> Optional[int]:
+        best = None
+
+        if self._automaton is not None:
+            for _, rank in self._automaton.iter(text):
+                if best is None or rank < best:
+                    best = rank
+                    if best == 0:
+                        break
+        else:
+            for rank, pattern in enumerate(self._patterns):
+                if pattern.search(text) is not None:
+                    return rank
+
+        return best
+
+    def categorize(self, raw_industry: Optional[str]) -> Optional[str]:
+        """세부 업종을 대분류 카테고리로 매핑 (빈 값은 None, 해당 없음은 '기타')"""
+        if not raw_industry:
+            return None
+
+        category = self._memo.get(raw_industry)
+        if category is None:
+            rank = self._best_rank(raw_industry)
+            category = self.default if rank is None else self.categories[rank]
+            if len(self._memo) < self.memo_size:
+                self._memo[raw_industry] = category
+        return category
+
+    def categorize_many(self, raw_industries: Iterable[Optional[str]]) -> List[Optional[str]]:
+        """여러 세부 업종 일괄 분류"""
+        categorize = self.categorize
+        return [categorize(raw) for raw in raw_industries]
+
+    def resolve_industry(self, company_name: Optional[str], industry: Optional[str]) -> Optional[str]:
+        """기업별 보정이 있으면 보정 업종, 없으면 기존 업종"""
+        if company_name:
+            return self.overrides.get(company_name, industry)
+        return industry
+
+    def build_updates(self, companies: Iterable[Mapping[str, Any]]) -> List[IndustryUpdate]:
+        """
+        {'company', 'industry'} 목록 → 기업별 업종 변경분
+
+        보정 표를 적용하고 대분류를 붙인다. 같은 기업이 여러 번 나오면 마지막 값을 사용.
+        """
+        updates: Dict[str, IndustryUpdate] = {}
+
+        for item in companies:
+            company_name = item.get('company') or item.get('company_name')
+            industry = self.resolve_industry(company_name, item.get('industry'))
+            if not company_name or not industry:
+                continue
+            updates[company_name] = IndustryUpdate(
+                company_name=company_name,
+                industry=industry,
+                industry_category=self.categorize(industry)
+            )
+
+        return list(updates.values())
+
+
+# ============================================================
+# 일괄 반영
+# ============================================================
+
+def _sql_literal(value: Optional[str]) -> str:
+    if value is None:
+        return "NULL"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def build_update_sql(updates: Sequence[IndustryUpdate], table: str = "deals") -> str:
+    """
+    집합 단위 UPDATE 문 1개 생성 (Supabase SQL Editor 등에서 실행)
+
+    값이 실제로 바뀌는 행만 갱신한다.
+    """
+    if not updates:
+        return ""
+
+    values = ",\n    ".join(
+        f"({_sql_literal(u.company_name)}, {_sql_literal(u.industry)}, {_sql_literal(u.industry_category)})"
+        for u in updates
+    )
+    return (
+        f"UPDATE {table} AS d\n"
+        f"SET industry = v.industry,\n"
+        f"    industry_category = v.industry_category\n"
+        f"FROM (VALUES\n    {values}\n) AS v(company_name, industry, industry_category)\n"
+        f"WHERE d.company_name = v.company_name\n"
+        f"  AND (d.industry IS DISTINCT FROM v.industry\n"
+        f"       OR d.industry_category IS DISTINCT FROM v.industry_category);\n"
+    )
+
+
+def apply_updates_copy(conn, updates: Sequence[IndustryUpdate], table: str = "deals") -> int:
+    """
+    임시 스테이징 테이블에 COPY 후 UPDATE 한 번으로 반영 (psycopg2 연결)
+
+    한 트랜잭션으로 실행되며, 실제로 바뀐 행 수를 반환한다.
+    """
+    if not updates:
+        return 0
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for u in updates:
+        writer.writerow([u.company_name, u.industry, u.industry_category if u.industry_category is not None else ""])
+    buffer.seek(0)
+
+    with conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                "CREATE TEMP TABLE industry_updates ("
+                "company_name TEXT PRIMARY KEY, industry TEXT NOT NULL, industry_category TEXT"
+                ") ON COMMIT DROP"
+            )
+            cursor.copy_expert(
+                "COPY industry_updates (company_name, industry, industry_category) "
+                "FROM STDIN WITH (FORMAT csv, NULL '')",
+                buffer
+            )
+            cursor.execute(
+                f"UPDATE {table} AS d "
+                f"SET industry = s.industry, industry_category = s.industry_category "
+                f"FROM industry_updates AS s "
+                f"WHERE d.company_name = s.company_name "
+                f"AND (d.industry IS DISTINCT FROM s.industry "
+                f"OR d.industry_category IS DISTINCT FROM s.industry_category)"
+            )
+            return cursor.rowcount
+
+
+# 공용 분류기
+industry_classifier = IndustryClassifier()
+
+
+def categorize_industry(raw_industry: Optional[str]) -> Optional[str]:
+    """세부 업종을 대분류 카테고리로 매핑"""
+    return industry_classifier.categorize(raw_industry)
@@ -1,44 +1,235 @@
 """
 Data Enricher Module (Naver Search)
 네이버 검색을 통한 데이터 보강
+
+- httpx 연결 풀 1개를 모든 검색이 공유
+- 동시 요청 수 / 초당 요청 수 / 일일 호출 한도(NAVER_DAILY_QUOTA) 안에서만 호출
+- 검색 결과는 (검색 종류, 질의) 단위로 디스크에 TTL 캐시 (실행 간 공유 - 같은 기업을 매일 다시 조회하지 않음)
+- 여러 기업을 한 번에 처리하는 일괄 API (daily_automation, daily_auto_collect 공용)
 """
+import asyncio
+import hashlib
+import json
 import os
+import time
 import httpx
 import logging
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.rate_limit import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+NAVER_SEARCH_URL = "https://openapi.naver.com/v1/search/{kind}.json"
+
+ENRICHMENT_CACHE_DIR = Path(os.getenv("ENRICHMENT_CACHE_DIR", ".cache/naver_search"))
+ENRICHMENT_CACHE_TTL_DAYS = float(os.getenv("ENRICHMENT_CACHE_TTL_DAYS", "7"))
+
+# 네이버 검색 API 한도 (일 25,000회, 초당 호출 제한)
+NAVER_MAX_CONCURRENCY = int(os.getenv("NAVER_MAX_CONCURRENCY", "5"))
+NAVER_REQUESTS_PER_SECOND = float(os.getenv("NAVER_REQUESTS_PER_SECOND", "8"))
+NAVER_DAILY_QUOTA = int(os.getenv("NAVER_DAILY_QUOTA", "25000"))
+
+
+class QuotaExceededError(RuntimeError):
+    """일일 호출 한도 초과"""
+
+
+class SearchCache:
+    """(검색 종류, 질의) → 검색 결과 디스크 캐시"""
+
+    def __init__(self, cache_dir: Path = ENRICHMENT_CACHE_DIR, ttl_days: float = ENRICHMENT_CACHE_TTL_DAYS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_days * 86400
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """캐시된 검색 결과 (없거나 만료되면 None)"""
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                self.misses += 1
+                return None
+            items = json.loads(path.read_text(encoding="utf-8"))["items"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return items
+
+    def put(self, key: str, items: List[Dict[str, Any]]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"key": key, "items": items}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+
 class DataEnricher:
-    def __init__(self):
+    def __init__(
+        self,
+        cache: Optional[SearchCache] = None,
+        max_concurrency: int = NAVER_MAX_CONCURRENCY,
+        requests_per_second: float = NAVER_REQUESTS_PER_SECOND,
+        daily_quota: int = NAVER_DAILY_QUOTA
+    ):
         self.client_id = os.getenv("NAVER_CLIENT_ID")
         self.client_secret = os.getenv("NAVER_CLIENT_SECRET")
         self.enabled = bool(self.client_id and self.client_secret)
 
+        self.cache = cache or SearchCache()
+        self.max_concurrency = max_concurrency
+        self.requests_per_second = requests_per_second
+        self.daily_quota = daily_quota
+        self.calls_made = 0
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._limiter: Optional[RateLimiter] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    # ============================================================
+    # 연결 / 호출 제한
+    # ============================================================
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """공유 연결 풀 (현재 이벤트 루프에서 처음 사용할 때 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "X-Naver-Client-Id": self.client_id or "",
+                    "X-Naver-Client-Secret": self.client_secret or ""
+                },
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=self.max_concurrency
+                ),
+                timeout=10.0
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._limiter = RateLimiter(self.requests_per_second, burst=self.max_concurrency)
+        return self._client
+
+    async def aclose(self) -> None:
+        """연결 풀 종료"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "DataEnricher":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    async def _fetch(self, kind: str, query: str, display: int, sort: str) -> List[Dict[str, Any]]:
+        if self.calls_made >= self.daily_quota:
+            raise QuotaExceededError(f"Naver API daily quota reached ({self.daily_quota})")
+
+        client = self._get_client()
+        async with self._semaphore:
+            await self._limiter.acquire()
+            self.calls_made += 1
+            response = await client.get(
+                NAVER_SEARCH_URL.format(kind=kind),
+                params={"query": query, "display": display, "sort": sort}
+            )
+        response.raise_for_status()
+        return response.json().get("items", [])
+
+    # ============================================================
+    # 검색
+    # ============================================================
+
+    async def search(self, kind: str, query: str, display: int = 5, sort: str = "sim") -> List[Dict[str, Any]]:
+        """
+        네이버 검색 (캐시 우선, 같은 질의 동시 요청은 한 번만 호출)
+
+        Args:
+            kind: 검색 종류 (webkr, news 등)
+            query: 검색어
+            display: 결과 수
+            sort: sim(정확도) / date(최신순)
+
+        Returns:
+            검색 결과 items (실패 시 예외)
+        """
+        key = f"{kind}:{sort}:{display}:{query}"
+
+        items = self.cache.get(key)
+        if items is not None:
+            return items
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(kind, query, display, sort))
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        items = await asyncio.shield(pending)
+        self.cache.put(key, items)
+        return items
+
     async def enrich_company_info(self, company_name: str) -> Dict[str, Any]:
         """네이버 검색을 통해 기업 정보 보강"""
         if not self.enabled:
             logger.warning("Naver API keys not found. Skipping enrichment.")
             return {}
 
-        headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret
-        }
-        
         # 1. 기업 주요사업/업종 검색
-        query = f"{company_name} 주요사업 업종"
-        url = f"https://openapi.naver.com/v1/search/webkr.json?query={query}&display=5"
-        
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.get(url, headers=headers)
-                if response.status_code == 200:
-                    data = response.json()
-                    # 여기서 검색 결과를 분석하여 업종 정보 추출 (간단한 로직 또는 AI 활용)
-                    # 현재는 로직 뼈대만 구축
-                    return {"enriched": True, "search_results": data.get("items", [])}
-            except Exception as e:
-                logger.error(f"Error enriching data for {company_name}: {e}")
-        
+        try:
+            items = await self.search("webkr", f"{company_name} 주요사업 업종")
+            # 여기서 검색 결과를 분석하여 업종 정보 추출 (간단한 로직 또는 AI 활용)
+            # 현재는 로직 뼈대만 구축
+            return {"enriched": True, "search_results": items}
+        except Exception as e:
+            logger.error(f"Error enriching data for {company_name}: {e}")
+
         return {}
+
+    async def search_investment_news(self, company_name: str) -> List[Dict[str, Any]]:
+        """기업 투자 관련 최신 뉴스 검색 (실패 시 빈 목록)"""
+        if not self.enabled:
+            return []
+
+        try:
+            return await self.search("news", f"{company_name} 투자", sort="date")
+        except Exception as e:
+            logger.error(f"Error searching investment news for {company_name}: {e}")
+            return []
+
+    # ============================================================
+    # 일괄 API
+    # ============================================================
+
+    async def enrich_companies(self, company_names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 기업 정보 보강 (기업명 → enrich_company_info 결과)"""
+        names = list(dict.fromkeys(name for name in company_names if name))
+        if not self.enabled:
+            logger.warning("Naver API keys not found. Skipping enrichment.")
+            return {name: {} for name in names}
+
+        results = await asyncio.gather(*(self.enrich_company_info(name) for name in names))
+        self._log_batch("enrich_companies", len(names))
+        return dict(zip(names, results))
+
+    async def search_investment_news_batch(self, company_names: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 기업 투자 뉴스 검색 (기업명 → items)"""
+        names = list(dict.fromkeys(name for name in company_names if name))
+        results = await asyncio.gather(*(self.search_investment_news(name) for name in names))
+        self._log_batch("search_investment_news_batch", len(names))
+        return dict(zip(names, results))
+
+    def _log_batch(self, operation: str, count: int) -> None:
+        logger.info(
+            f"Naver {operation}: {count} companies, "
+            f"cache hit {self.cache.hits} / miss {self.cache.misses}, "
+            f"API calls {self.calls_made}/{self.daily_quota}"
+        )
@@ -0,0 +1,96 @@
+"""
+Article Cache
+기사 본문 공유 캐시
+
+@task Investment Tracker
+@description 같은 기사 URL을 여러 작업(재정제, 수집)이 반복해서 가져오지 않도록 디스크에 캐시
+
+- {cache_dir}/{sha256(url)[:2]}/{sha256(url)}.json 에 CrawledNews 저장 (프로세스/실행 간 공유)
+- TTL이 지나면 다시 가져옴, 가져오기 실패(None)는 캐시하지 않음
+- 같은 URL을 동시에 요청하면 한 번만 가져와 결과를 공유
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.services.news_crawler.base_crawler import CrawledNews
+
+ArticleFetcher = Callable[[str], Awaitable[Optional[CrawledNews]]]
+
+ARTICLE_CACHE_DIR = Path(os.getenv("ARTICLE_CACHE_DIR", ".cache/articles"))
+ARTICLE_CACHE_TTL_DAYS = float(os.getenv("ARTICLE_CACHE_TTL_DAYS", "30"))
+
+
+class ArticleCache:
+    """URL → CrawledNews 디스크 캐시"""
+
+    def __init__(self, cache_dir: Path = ARTICLE_CACHE_DIR, ttl_days: float = ARTICLE_CACHE_TTL_DAYS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_days * 86400
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, url: str) -> Path:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json"
+
+    def get(self, url: str) -> Optional[CrawledNews]:
+        """캐시된 기사 (없거나 만료되면 None)"""
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if data.get("published_at"):
+            data["published_at"] = datetime.fromisoformat(data["published_at"])
+        return CrawledNews(**data)
+
+    def put(self, url: str, article: CrawledNews) -> None:
+        """기사 저장 (원본 HTML은 저장하지 않음)"""
+        path = self._path(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = asdict(article)
+        data["raw_html"] = None
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, default=str), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    async def get_or_fetch(self, url: str, fetcher: ArticleFetcher) -> Optional[CrawledNews]:
+        """
+        캐시 조회, 없으면 fetcher로 가져와 저장
+
+        Args:
+            url: 기사 URL
+            fetcher: async (url) -> CrawledNews | None (예: crawler.parse_article)
+        """
+        article = await asyncio.to_thread(self.get, url)
+        if article is not None:
+            self.hits += 1
+            return article
+
+        pending = self._inflight.get(url)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        pending = asyncio.ensure_future(fetcher(url))
+        self._inflight[url] = pending
+        try:
+            article = await asyncio.shield(pending)
+        finally:
+            self._inflight.pop(url, None)
+
+        if article is not None:
+            await asyncio.to_thread(self.put, url, article)
+        return article
@@ -6,17 +6,37 @@ All news crawlers inherit from this class
 @description 뉴스 크롤러 추상 기반 클래스
 """
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import logging
 
 import httpx
-from bs4 import BeautifulSoup
+
+from app.core.config import settings
+from app.services.news_crawler.html_backend import parse_document, resolve_backend
+from app.services.news_crawler.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
 
+# 투자 관련 뉴스 판별 키워드 (모듈 로드 시 1회 컴파일)
+INVESTMENT_KEYWORDS = [
+    "투자", "유치", "시드", "시리즈", "프리A", "엔젤",
+    "펀딩", "밸류에이션", "VC", "벤처캐피탈",
+    "인베스트", "투자자", "리드투자"
+]
+INVESTMENT_KEYWORD_MATCHER = KeywordMatcher(INVESTMENT_KEYWORDS)
+
+
+# 재시도 후에도 가져오지 못한 URL (샤드 실행 중에만 설정 - 실패한 샤드를 재시도 대상으로 판정)
+fetch_failures: ContextVar[Optional[List[str]]] = ContextVar("fetch_failures", default=None)
+
+# 수집 작업 분할 단위 (keyword, page_start, page_end) - keyword가 None이면 키워드 없는 목록 페이지
+ShardSpec = Tuple[Optional[str], int, int]
+
+
 @dataclass
 class CrawledNews:
     """크롤링된 뉴스 데이터"""
@@ -60,13 +80,16 @@ class BaseCrawler(ABC):
         source_name: str,
         base_url: str,
         timeout: float = 30.0,
-        max_retries: int = 3
+        max_retries: int = 3,
+        html_parser: Optional[str] = None
     ):
         self.source_name = source_name
         self.base_url = base_url
         self.timeout = timeout
         self.max_retries = max_retries
         self.client: Optional[httpx.AsyncClient] = None
+        # HTML 파서 백엔드 (selectolax / lxml / bs4, 기본값은 설정값)
+        self.html_parser = resolve_backend(html_parser or settings.CRAWLER_HTML_PARSER)
 
     async def __aenter__(self):
         """비동기 컨텍스트 매니저 진입"""
@@ -110,11 +133,19 @@ class BaseCrawler(ABC):
                 await asyncio.sleep(2 ** attempt)  # Exponential backoff
 
         logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
+        failures = fetch_failures.get()
+        if failures is not None:
+            failures.append(url)
         return None
 
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """HTML을 BeautifulSoup 객체로 파싱"""
-        return BeautifulSoup(html, "lxml")
+    def parse_html(self, html: str):
+        """
+        HTML 파싱
+
+        설정된 백엔드로 파싱하며, 반환 객체는 select/select_one/get/get_text/decompose
+        등 크롤러가 쓰는 BeautifulSoup 인터페이스를 지원한다.
+        """
+        return parse_document(html, self.html_parser)
 
     @abstractmethod
     async def get_search_results(
@@ -176,26 +207,78 @@ class BaseCrawler(ABC):
         urls = await self.get_search_results(keywords, max_pages)
         logger.info(f"Found {len(urls)} article URLs from {self.source_name}")
 
-        # 중복 제거
-        urls = list(set(urls))
+        results = await self.parse_articles(urls)
+        logger.info(f"Successfully crawled {len(results)} articles from {self.source_name}")
+        return results
+
+    async def parse_articles(
+        self,
+        urls: List[str],
+        article_cache=None,
+        request_interval: float = 1.0
+    ) -> List[CrawledNews]:
+        """
+        기사 URL 목록 파싱 (중복 제거, 요청 간격 유지)
+
+        Args:
+            urls: 기사 URL 목록
+            article_cache: ArticleCache (있으면 이미 가져온 기사는 다시 요청하지 않음)
+            request_interval: 요청 사이 대기 시간 (서버 부하 방지)
 
-        # 각 기사 파싱 (요청 간격 추가)
+        Returns:
+            파싱된 뉴스 목록
+        """
         import asyncio
+
+        urls = list(dict.fromkeys(urls))
         results: List[CrawledNews] = []
         for i, url in enumerate(urls):
             try:
-                article = await self.parse_article(url)
+                article = await asyncio.to_thread(article_cache.get, url) if article_cache is not None else None
+                fetched = article is None
+                if fetched:
+                    if article_cache is not None:
+                        article = await article_cache.get_or_fetch(url, self.parse_article)
+                    else:
+                        article = await self.parse_article(url)
                 if article:
                     results.append(article)
-                # 요청 사이에 딜레이 (서버 부하 방지)
-                if i < len(urls) - 1:
-                    await asyncio.sleep(1)
+                # 요청 사이에 딜레이 (실제로 요청한 경우만)
+                if fetched and i < len(urls) - 1:
+                    await asyncio.sleep(request_interval)
             except Exception as e:
                 logger.error(f"Error parsing article {url}: {e}")
 
-        logger.info(f"Successfully crawled {len(results)} articles from {self.source_name}")
         return results
 
+    # ============================================================
+    # 분할 수집 (shard) - CrawlerManager.crawl_sharded / crawl_worker.py
+    # ============================================================
+
+    def plan_shards(
+        self,
+        keywords: List[str],
+        max_pages: int = 3,
+        pages_per_shard: int = 1
+    ) -> List[ShardSpec]:
+        """
+        수집 작업 분할 계획
+
+        기본값은 소스 전체를 샤드 1개로 처리 (목록 페이지 1개뿐인 소스).
+        키워드/페이지 단위로 나눌 수 있는 크롤러는 재정의한다.
+        """
+        return [(None, 1, max_pages)]
+
+    async def get_shard_urls(self, keyword: Optional[str], page_start: int, page_end: int) -> List[str]:
+        """샤드 하나의 기사 URL 목록 (plan_shards를 재정의한 크롤러는 함께 재정의)"""
+        return await self.get_search_results([keyword] if keyword else [], page_end)
+
+    @staticmethod
+    def page_windows(max_pages: int, pages_per_shard: int) -> List[Tuple[int, int]]:
+        """1..max_pages를 pages_per_shard 크기의 (시작, 끝) 구간으로 분할"""
+        step = max(1, pages_per_shard)
+        return [(start, min(start + step - 1, max_pages)) for start in range(1, max_pages + 1, step)]
+
     def is_investment_news(self, title: str, content: str = "") -> bool:
         """
         투자 관련 뉴스인지 확인
@@ -207,11 +290,7 @@ class BaseCrawler(ABC):
         Returns:
             투자 관련 여부
         """
-        investment_keywords = [
-            "투자", "유치", "시드", "시리즈", "프리A", "엔젤",
-            "펀딩", "밸류에이션", "VC", "벤처캐피탈",
-            "인베스트", "투자자", "리드투자"
-        ]
-
-        text = f"{title} {content}".lower()
-        return any(keyword in text for keyword in investment_keywords)
+        return (
+            INVESTMENT_KEYWORD_MATCHER.contains(title)
+            or INVESTMENT_KEYWORD_MATCHER.contains(content)
+        )
@@ -4,27 +4,49 @@ Crawler Manager
 
 @task Investment Tracker
 @description 뉴스 크롤러들을 통합 관리
+
+수집은 (소스, 키워드, 페이지 구간) 샤드 단위로 작업 큐(shard_queue)에 올려 실행한다.
+같은 큐 DB를 쓰는 다른 프로세스/서버(crawl_worker.py)도 샤드를 나눠 가져갈 수 있고,
+실패한 샤드만 재시도된다.
 """
 import asyncio
 import logging
+import time
+import uuid
+from contextlib import AsyncExitStack
 from typing import List, Dict, Optional, Type
-from datetime import datetime
+from datetime import datetime, timedelta
+from urllib.parse import urlsplit
 
-from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews
+from app.core.config import settings
+from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews, fetch_failures
 from app.services.news_crawler.naver_crawler import NaverNewsCrawler
 from app.services.news_crawler.platum_crawler import PlatumCrawler
 from app.services.news_crawler.venturesquare_crawler import VentureSquareCrawler
 from app.services.news_crawler.wowtale_crawler import WowtaleCrawler
 from app.services.news_crawler.startuptoday_crawler import StartupTodayCrawler
 from app.services.news_crawler.outstanding_crawler import OutstandingCrawler
+from app.services.news_crawler.shard_queue import (
+    CrawlShard,
+    CrawlShardQueue,
+    ShardPlanItem,
+    get_shard_queue,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_KEYWORDS = [
+    "스타트업 투자 유치",
+    "시드 투자",
+    "시리즈A",
+    "프리A 투자"
+]
+
 
 class CrawlerManager:
     """
     크롤러 매니저
-    여러 크롤러를 동시에 실행하고 결과를 통합
+    여러 크롤러를 샤드 단위로 병렬 실행하고 결과를 통합
     """
 
     # 사용 가능한 크롤러 목록
@@ -37,16 +59,40 @@ class CrawlerManager:
         "outstanding": OutstandingCrawler,
     }
 
-    def __init__(self):
+    # 기사 URL 호스트 → 크롤러 (하위 도메인 포함, 예: n.news.naver.com → naver)
+    SOURCE_HOSTS: Dict[str, str] = {
+        "platum.kr": "platum",
+        "venturesquare.net": "venturesquare",
+        "news.naver.com": "naver",
+        "wowtale.net": "wowtale",
+        "startuptoday.kr": "startuptoday",
+        "outstanding.kr": "outstanding",
+    }
+
+    @classmethod
+    def source_for_url(cls, url: Optional[str]) -> Optional[str]:
+        """기사 URL을 파싱할 수 있는 크롤러 이름 (없으면 None)"""
+        host = (urlsplit(url or "").hostname or "").lower()
+        for domain, source in cls.SOURCE_HOSTS.items():
+            if host == domain or host.endswith("." + domain):
+                return source
+        return None
+
+    def __init__(self, queue: Optional[CrawlShardQueue] = None, article_cache=None):
+        self.queue = queue
+        self.article_cache = article_cache
         self.results: List[CrawledNews] = []
         self.errors: List[Dict] = []
         self.stats: Dict[str, int] = {}
+        self.run_id: Optional[str] = None
 
     async def crawl_all(
         self,
         sources: Optional[List[str]] = None,
         keywords: Optional[List[str]] = None,
-        max_pages: int = 3
+        max_pages: int = 3,
+        pages_per_shard: Optional[int] = None,
+        concurrency: Optional[int] = None
     ) -> List[CrawledNews]:
         """
         모든 소스에서 뉴스 수집
@@ -55,6 +101,8 @@ class CrawlerManager:
             sources: 수집할 소스 목록 (None이면 전체)
             keywords: 검색 키워드 목록
             max_pages: 최대 페이지 수
+            pages_per_shard: 샤드 하나가 맡을 페이지 수 (기본값: CRAWL_PAGES_PER_SHARD)
+            concurrency: 이 프로세스에서 동시에 실행할 샤드 수 (기본값: CRAWL_SHARD_CONCURRENCY)
 
         Returns:
             수집된 뉴스 목록
@@ -63,30 +111,47 @@ class CrawlerManager:
             sources = list(self.AVAILABLE_CRAWLERS.keys())
 
         if keywords is None:
-            keywords = [
-                "스타트업 투자 유치",
-                "시드 투자",
-                "시리즈A",
-                "프리A 투자"
-            ]
+            keywords = DEFAULT_KEYWORDS
+
+        unknown = [source for source in sources if source not in self.AVAILABLE_CRAWLERS]
+        for source in unknown:
+            logger.warning(f"Unknown source: {source}")
+        sources = [source for source in sources if source in self.AVAILABLE_CRAWLERS]
 
         self.results = []
         self.errors = []
         self.stats = {source: 0 for source in sources}
 
-        logger.info(f"Starting crawl from sources: {sources}")
+        queue = self.queue or await asyncio.to_thread(get_shard_queue)
+        plan = self.plan_shards(sources, keywords, max_pages, pages_per_shard or settings.CRAWL_PAGES_PER_SHARD)
+        self.run_id = f"crawl-{datetime.utcnow():%Y%m%d%H%M%S}-{uuid.uuid4().hex[:8]}"
+        await asyncio.to_thread(queue.enqueue, self.run_id, plan)
+
+        logger.info(f"Starting crawl {self.run_id} from sources: {sources} ({len(plan)} shards)")
         start_time = datetime.utcnow()
 
-        # 각 소스별로 크롤링 실행
-        tasks = []
-        for source in sources:
-            if source in self.AVAILABLE_CRAWLERS:
-                tasks.append(self._crawl_source(source, keywords, max_pages))
-            else:
-                logger.warning(f"Unknown source: {source}")
+        # 이 프로세스도 워커로 참여 (다른 워커가 같은 큐를 보고 있으면 샤드를 나눠 가져감)
+        await self.run_shard_worker(queue, run_id=self.run_id, concurrency=concurrency)
 
-        # 병렬 실행
-        await asyncio.gather(*tasks, return_exceptions=True)
+        self.results = await asyncio.to_thread(queue.results, self.run_id)
+        # 모은 결과(JSON)는 큐에서 비우고, 보존 기간이 지난 실행의 샤드 행은 삭제
+        await asyncio.to_thread(queue.clear_results, self.run_id)
+        await asyncio.to_thread(queue.purge, timedelta(days=settings.CRAWL_SHARD_RETENTION_DAYS))
+        shards = await asyncio.to_thread(queue.shard_stats, self.run_id)
+        for shard in shards:
+            self.stats[shard["source"]] = self.stats.get(shard["source"], 0) + (shard["article_count"] or 0)
+        self.errors = [
+            {
+                "source": shard["source"],
+                "keyword": shard["keyword"] or None,
+                "pages": f"{shard['page_start']}-{shard['page_end']}",
+                "attempts": shard["attempt"],
+                "error": shard["error"],
+                "timestamp": shard["finished_at"].isoformat() if shard["finished_at"] else None
+            }
+            for shard in shards
+            if shard["status"] == "failed"
+        ]
 
         # 중복 제거 (URL 기준)
         unique_results = self._deduplicate_results()
@@ -95,42 +160,142 @@ class CrawlerManager:
         logger.info(
             f"Crawl completed in {elapsed:.2f}s. "
             f"Total: {len(unique_results)} unique articles. "
-            f"Stats: {self.stats}"
+            f"Stats: {self.stats}, failed shards: {len(self.errors)}"
         )
 
         return unique_results
 
-    async def _crawl_source(
+    def plan_shards(
         self,
-        source: str,
+        sources: List[str],
         keywords: List[str],
-        max_pages: int
-    ) -> None:
+        max_pages: int,
+        pages_per_shard: int = 1
+    ) -> List[ShardPlanItem]:
+        """소스별 크롤러의 분할 계획을 합친 샤드 목록"""
+        plan: List[ShardPlanItem] = []
+        for source in sources:
+            crawler = self.AVAILABLE_CRAWLERS[source]()
+            plan.extend(
+                (source, keyword, page_start, page_end)
+                for keyword, page_start, page_end in crawler.plan_shards(keywords, max_pages, pages_per_shard)
+            )
+        return plan
+
+    async def run_shard_worker(
+        self,
+        queue: CrawlShardQueue,
+        run_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        max_shards_per_source: Optional[int] = None,
+        poll_interval: float = 1.0,
+        wait: bool = True
+    ) -> int:
         """
-        단일 소스에서 크롤링
+        큐에서 샤드를 선점해 실행
 
         Args:
-            source: 소스 이름
-            keywords: 검색 키워드
-            max_pages: 최대 페이지 수
+            queue: 샤드 큐
+            run_id: 특정 수집 실행의 샤드만 (None이면 전체)
+            concurrency: 동시에 실행할 샤드 수
+            max_shards_per_source: 소스별 동시 실행 한도 (같은 사이트에 요청이 몰리지 않도록)
+            poll_interval: 선점할 샤드가 없을 때 대기 간격
+            wait: run_id의 샤드가 모두 끝날 때까지 대기 (재시도 대기 / 다른 워커 실행 중 포함)
+                  False면 당장 선점할 샤드가 없을 때 종료
+
+        Returns:
+            이 워커가 실행한 샤드 수
         """
-        crawler_class = self.AVAILABLE_CRAWLERS[source]
+        concurrency = concurrency or settings.CRAWL_SHARD_CONCURRENCY
+        per_source = max_shards_per_source or settings.CRAWL_MAX_SHARDS_PER_SOURCE
+        active: Dict[str, int] = {}
+        executed = 0
+
+        async with AsyncExitStack() as stack:
+            crawlers: Dict[str, BaseCrawler] = {}
+
+            async def get_crawler(source: str) -> BaseCrawler:
+                # 소스별 크롤러(HTTP 연결 풀)를 워커 안에서 재사용
+                if source not in crawlers:
+                    crawlers[source] = await stack.enter_async_context(self.AVAILABLE_CRAWLERS[source]())
+                return crawlers[source]
+
+            async def worker_loop() -> None:
+                nonlocal executed
+                while True:
+                    busy = [source for source, count in active.items() if count >= per_source]
+                    shard = await asyncio.to_thread(queue.claim, run_id, busy)
+                    if shard is None:
+                        if not wait or run_id is None:
+                            return
+                        if await asyncio.to_thread(queue.is_finished, run_id):
+                            return
+                        await asyncio.sleep(poll_interval)
+                        continue
+
+                    active[shard.source] = active.get(shard.source, 0) + 1
+                    try:
+                        await self._run_shard(queue, shard, get_crawler)
+                        executed += 1
+                    finally:
+                        active[shard.source] -= 1
+
+            await asyncio.gather(*(worker_loop() for _ in range(concurrency)))
+
+        return executed
 
+    async def _run_shard(self, queue: CrawlShardQueue, shard: CrawlShard, get_crawler) -> None:
+        """샤드 1개 실행 (임대 연장, 결과/실패 기록)"""
+
+        async def keep_lease():
+            while True:
+                await asyncio.sleep(queue.lease_seconds / 3)
+                if not await asyncio.to_thread(queue.renew, shard.id):
+                    logger.warning(f"Lost lease on shard {shard.id} ({shard.source})")
+                    return
+
+        heartbeat = asyncio.create_task(keep_lease())
+        started = time.perf_counter()
+        error: Optional[Exception] = None
         try:
-            async with crawler_class() as crawler:
-                articles = await crawler.crawl(keywords, max_pages)
-                self.results.extend(articles)
-                self.stats[source] = len(articles)
-                logger.info(f"Crawled {len(articles)} articles from {source}")
+            if shard.source not in self.AVAILABLE_CRAWLERS:
+                raise ValueError(f"Unknown source: {shard.source}")
+            crawler = await get_crawler(shard.source)
 
+            # 목록 페이지를 못 가져오면 샤드 실패 → 이 샤드만 재시도 (기사 단위 실패는 건너뜀)
+            failures: List[str] = []
+            token = fetch_failures.set(failures)
+            try:
+                urls = await crawler.get_shard_urls(shard.keyword, shard.page_start, shard.page_end)
+            finally:
+                fetch_failures.reset(token)
+            if failures:
+                raise RuntimeError(f"Failed to fetch listing page(s): {', '.join(failures)}")
+
+            articles = await crawler.parse_articles(
+                urls,
+                article_cache=self.article_cache,
+                request_interval=settings.CRAWL_REQUEST_INTERVAL_SECONDS
+            )
         except Exception as e:
-            error_info = {
-                "source": source,
-                "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
-            }
-            self.errors.append(error_info)
-            logger.error(f"Error crawling {source}: {e}")
+            error = e
+        finally:
+            # 성공 / 실패 / 취소 모두 임대 연장 중단
+            heartbeat.cancel()
+
+        if error is not None:
+            status = await asyncio.to_thread(queue.fail, shard.id, repr(error), time.perf_counter() - started)
+            logger.error(
+                f"Shard {shard.id} {shard.source}/{shard.keyword or '-'}/p{shard.page_start}-{shard.page_end} "
+                f"failed (attempt {shard.attempt}, now {status}): {error}"
+            )
+            return
+
+        await asyncio.to_thread(queue.complete, shard.id, articles, time.perf_counter() - started)
+        logger.info(
+            f"Shard {shard.source}/{shard.keyword or '-'}/p{shard.page_start}-{shard.page_end}: "
+            f"{len(urls)} urls, {len(articles)} articles"
+        )
 
     def _deduplicate_results(self) -> List[CrawledNews]:
         """
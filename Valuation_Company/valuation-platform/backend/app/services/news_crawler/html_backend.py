@@ -0,0 +1,151 @@
+"""
+HTML Parser Backends
+크롤러용 HTML 파서 백엔드
+
+@task Investment Tracker
+@description 목록/기사 페이지에서 CSS 셀렉터 몇 개만 뽑기 위한 경량 파서 선택
+
+크롤러가 사용하는 최소 인터페이스만 제공:
+    doc.select(css) / doc.select_one(css)
+    node.get(attr, default) / node.get_text(separator, strip) / node.decompose()
+
+백엔드:
+    - selectolax: Lexbor 기반 C 파서 (가장 빠름, 선택 설치)
+    - lxml: lxml.html + cssselect (BeautifulSoup 트리 생성 없이 lxml만 사용)
+    - bs4: BeautifulSoup + lxml (기존 방식, 항상 사용 가능)
+"""
+import logging
+from typing import Any, List, Optional
+
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax 미설치
+    LexborHTMLParser = None
+
+try:
+    import lxml.html as lxml_html
+    import cssselect  # noqa: F401  (lxml CSS 셀렉터 지원 확인)
+except ImportError:  # lxml/cssselect 미설치
+    lxml_html = None
+
+
+AVAILABLE_BACKENDS = ("selectolax", "lxml", "bs4")
+
+# BeautifulSoup.get_text()가 건너뛰는 태그 (빠른 백엔드는 파싱 직후 제거해 결과를 맞춤)
+NON_TEXT_TAGS = ("script", "style", "template")
+
+
+class SelectolaxNode:
+    """selectolax Node를 BeautifulSoup 호환 인터페이스로 감싼 래퍼"""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    def select(self, selector: str) -> List["SelectolaxNode"]:
+        return [SelectolaxNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector: str) -> Optional["SelectolaxNode"]:
+        node = self._node.css_first(selector)
+        return SelectolaxNode(node) if node is not None else None
+
+    def get(self, attr: str, default: Any = None) -> Any:
+        value = self._node.attributes.get(attr)
+        return default if value is None else value
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+    def decompose(self) -> None:
+        self._node.decompose()
+
+
+class LxmlNode:
+    """lxml.html 요소를 BeautifulSoup 호환 인터페이스로 감싼 래퍼"""
+
+    __slots__ = ("_element",)
+
+    def __init__(self, element):
+        self._element = element
+
+    def select(self, selector: str) -> List["LxmlNode"]:
+        return [LxmlNode(element) for element in self._element.cssselect(selector)]
+
+    def select_one(self, selector: str) -> Optional["LxmlNode"]:
+        matches = self._element.cssselect(selector)
+        return LxmlNode(matches[0]) if matches else None
+
+    def get(self, attr: str, default: Any = None) -> Any:
+        return self._element.get(attr, default)
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        texts = self._element.itertext()
+        if strip:
+            return separator.join(text.strip() for text in texts if text.strip())
+        return separator.join(texts)
+
+    def decompose(self) -> None:
+        self._element.drop_tree()
+
+
+def resolve_backend(name: Optional[str] = None) -> str:
+    """
+    사용할 파서 백엔드 결정
+
+    Args:
+        name: 'selectolax' | 'lxml' | 'bs4' | 'auto' (None이면 'auto')
+
+    Returns:
+        실제 사용 가능한 백엔드 이름 ('auto'는 selectolax → lxml → bs4 순으로 선택)
+    """
+    name = (name or "auto").lower()
+
+    if name == "auto":
+        if LexborHTMLParser is not None:
+            return "selectolax"
+        if lxml_html is not None:
+            return "lxml"
+        return "bs4"
+
+    if name == "selectolax" and LexborHTMLParser is None:
+        logger.warning("selectolax is not installed, falling back to bs4")
+        return "bs4"
+
+    if name == "lxml" and lxml_html is None:
+        logger.warning("lxml/cssselect is not installed, falling back to bs4")
+        return "bs4"
+
+    if name not in AVAILABLE_BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+
+    return name
+
+
+def parse_document(html: str, backend: str = "bs4"):
+    """
+    HTML 파싱
+
+    Args:
+        html: HTML 문자열
+        backend: resolve_backend()로 결정된 백엔드 이름
+
+    Returns:
+        select/select_one을 지원하는 문서 객체
+    """
+    if backend == "selectolax":
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(list(NON_TEXT_TAGS))
+        return SelectolaxNode(tree.root)
+
+    if backend == "lxml":
+        document = lxml_html.document_fromstring(html)
+        for element in list(document.iter(*NON_TEXT_TAGS)):
+            element.drop_tree()
+        return LxmlNode(document)
+
+    return BeautifulSoup(html, "lxml")
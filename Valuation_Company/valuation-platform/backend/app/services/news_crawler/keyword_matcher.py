@@ -0,0 +1,70 @@
+"""
+Keyword Matcher
+컴파일된 키워드 매처
+
+@task Investment Tracker
+@description 여러 키워드 포함 여부를 텍스트 한 번 스캔으로 판정
+
+pyahocorasick이 설치되어 있으면 Aho-Corasick 오토마톤을,
+없으면 키워드 alternation 정규식(대소문자 무시)을 사용한다.
+"""
+import re
+from typing import Iterable, List
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick 미설치
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    대소문자 무시 다중 키워드 매처
+
+    생성 시 한 번 컴파일하고, contains()/find_all()은 텍스트를 한 번만 훑는다.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        # 긴 키워드 우선 (정규식 alternation에서 "투자자"가 "투자"보다 먼저 매칭되도록)
+        self.keywords: List[str] = sorted(
+            {keyword.lower() for keyword in keywords if keyword},
+            key=len,
+            reverse=True
+        )
+
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+            self._pattern = None
+        else:
+            self._automaton = None
+            self._pattern = re.compile(
+                "|".join(re.escape(keyword) for keyword in self.keywords),
+                re.IGNORECASE
+            )
+
+    def contains(self, text: str) -> bool:
+        """키워드가 하나라도 포함되어 있는지"""
+        if not text or not self.keywords:
+            return False
+
+        if self._automaton is not None:
+            for _ in self._automaton.iter(text.lower()):
+                return True
+            return False
+
+        return self._pattern.search(text) is not None
+
+    def find_all(self, text: str) -> List[str]:
+        """포함된 키워드 목록 (중복 제거, 등장 순)"""
+        if not text or not self.keywords:
+            return []
+
+        if self._automaton is not None:
+            found = (keyword for _, keyword in self._automaton.iter(text.lower()))
+        else:
+            found = (match.group(0).lower() for match in self._pattern.finditer(text))
+
+        return list(dict.fromkeys(found))
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import List, Optional
 from urllib.parse import quote, urljoin
 
-from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews
+from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews, ShardSpec
 
 logger = logging.getLogger(__name__)
 
@@ -44,30 +44,48 @@ class NaverNewsCrawler(BaseCrawler):
             뉴스 URL 목록
         """
         urls = []
-
         for keyword in keywords:
             for page in range(1, max_pages + 1):
-                start = (page - 1) * 10 + 1
-                search_url = (
-                    f"{self.base_url}?where=news&query={quote(keyword)}"
-                    f"&sort=1&pd=4&start={start}"  # sort=1: 최신순, pd=4: 1주일
-                )
+                urls.extend(await self._search_page(keyword, page))
+        return urls
 
-                html = await self.fetch_page(search_url)
-                if not html:
-                    continue
+    async def _search_page(self, keyword: str, page: int) -> List[str]:
+        """검색 결과 한 페이지의 뉴스 URL"""
+        start = (page - 1) * 10 + 1
+        search_url = (
+            f"{self.base_url}?where=news&query={quote(keyword)}"
+            f"&sort=1&pd=4&start={start}"  # sort=1: 최신순, pd=4: 1주일
+        )
 
-                soup = self.parse_html(html)
+        html = await self.fetch_page(search_url)
+        if not html:
+            return []
 
-                # 뉴스 링크 추출
-                news_items = soup.select("a.news_tit")
-                for item in news_items:
-                    href = item.get("href", "")
-                    if href and "news.naver.com" in href:
-                        urls.append(href)
+        soup = self.parse_html(html)
 
-                logger.debug(f"Found {len(news_items)} items for '{keyword}' page {page}")
+        # 뉴스 링크 추출
+        news_items = soup.select("a.news_tit")
+        urls = []
+        for item in news_items:
+            href = item.get("href", "")
+            if href and "news.naver.com" in href:
+                urls.append(href)
 
+        logger.debug(f"Found {len(news_items)} items for '{keyword}' page {page}")
+        return urls
+
+    def plan_shards(self, keywords: List[str], max_pages: int = 3, pages_per_shard: int = 1) -> List[ShardSpec]:
+        """키워드 × 페이지 구간"""
+        return [
+            (keyword, start, end)
+            for keyword in keywords
+            for start, end in self.page_windows(max_pages, pages_per_shard)
+        ]
+
+    async def get_shard_urls(self, keyword: Optional[str], page_start: int, page_end: int) -> List[str]:
+        urls = []
+        for page in range(page_start, page_end + 1):
+            urls.extend(await self._search_page(keyword, page))
         return urls
 
     async def parse_article(self, url: str) -> Optional[CrawledNews]:
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urljoin
 
-from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews
+from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews, ShardSpec
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,15 @@ class PlatumCrawler(BaseCrawler):
     스타트업 전문 매체로 투자 뉴스 품질이 높음
     """
 
+    # 투자 관련 검색 키워드 (플래텀 사이트 검색용, 입력 키워드와 별개)
+    SEARCH_KEYWORDS = [
+        "투자 유치",
+        "시리즈A",
+        "시리즈B",
+        "시드 투자",
+        "펀딩"
+    ]
+
     def __init__(self):
         super().__init__(
             source_name="platum",
@@ -44,49 +53,58 @@ class PlatumCrawler(BaseCrawler):
             뉴스 URL 목록
         """
         urls = []
+        for keyword in self.SEARCH_KEYWORDS:
+            for page in range(1, max_pages + 1):
+                urls.extend(await self._search_page(keyword, page))
+        return urls
+
+    async def _search_page(self, keyword: str, page: int) -> List[str]:
+        """사이트 검색 결과 한 페이지의 기사 URL"""
+        if page == 1:
+            search_url = f"{self.base_url}/?s={keyword.replace(' ', '+')}"
+        else:
+            search_url = f"{self.base_url}/page/{page}/?s={keyword.replace(' ', '+')}"
+
+        html = await self.fetch_page(search_url)
+        if not html:
+            return []
+
+        soup = self.parse_html(html)
 
-        # 투자 관련 키워드로 검색
-        search_keywords = [
-            "투자 유치",
-            "시리즈A",
-            "시리즈B",
-            "시드 투자",
-            "펀딩"
+        # 다양한 셀렉터 시도
+        selectors = [
+            "article.post h2.entry-title a",
+            "h2.entry-title a",
+            "article a[href*='/archives/']",
+            ".post-title a",
+            "a.article-link"
         ]
 
-        for keyword in search_keywords:
-            for page in range(1, max_pages + 1):
-                if page == 1:
-                    search_url = f"{self.base_url}/?s={keyword.replace(' ', '+')}"
-                else:
-                    search_url = f"{self.base_url}/page/{page}/?s={keyword.replace(' ', '+')}"
-
-                html = await self.fetch_page(search_url)
-                if not html:
-                    continue
-
-                soup = self.parse_html(html)
-
-                # 다양한 셀렉터 시도
-                selectors = [
-                    "article.post h2.entry-title a",
-                    "h2.entry-title a",
-                    "article a[href*='/archives/']",
-                    ".post-title a",
-                    "a.article-link"
-                ]
-
-                for selector in selectors:
-                    articles = soup.select(selector)
-                    if articles:
-                        for article in articles:
-                            href = article.get("href", "")
-                            if href and "/archives/" in href:
-                                urls.append(href)
-                        break
-
-                logger.debug(f"Found items for '{keyword}' page {page}")
+        urls = []
+        for selector in selectors:
+            articles = soup.select(selector)
+            if articles:
+                for article in articles:
+                    href = article.get("href", "")
+                    if href and "/archives/" in href:
+                        urls.append(href)
+                break
+
+        logger.debug(f"Found items for '{keyword}' page {page}")
+        return urls
 
+    def plan_shards(self, keywords: List[str], max_pages: int = 3, pages_per_shard: int = 1) -> List[ShardSpec]:
+        """사이트 검색 키워드 × 페이지 구간"""
+        return [
+            (keyword, start, end)
+            for keyword in self.SEARCH_KEYWORDS
+            for start, end in self.page_windows(max_pages, pages_per_shard)
+        ]
+
+    async def get_shard_urls(self, keyword: Optional[str], page_start: int, page_end: int) -> List[str]:
+        urls = []
+        for page in range(page_start, page_end + 1):
+            urls.extend(await self._search_page(keyword, page))
         return urls
 
     async def parse_article(self, url: str) -> Optional[CrawledNews]:
@@ -0,0 +1,469 @@
+"""
+Crawl Shard Queue
+분할 수집 작업 큐
+
+@task Investment Tracker
+@description (소스, 키워드, 페이지 구간) 샤드를 SQL 테이블에 올려 여러 프로세스/서버가 나눠서 수집
+
+- 워커는 샤드를 임대(lease)로 선점하고, 실행 중에는 임대를 연장 (워커가 죽으면 만료 후 다른 워커가 이어받음)
+- 실패한 샤드만 지수 백오프 후 재시도 (max_attempts 초과 시 failed), 다른 샤드는 다시 수집하지 않음
+- 샤드 결과(기사 목록)는 같은 행에 JSON으로 저장 → 수집을 시작한 쪽이 모아서 중복 제거한 뒤 비움
+  (끝난 샤드 행은 보존 기간 후 purge로 삭제)
+- PostgreSQL / SQLite 공통 SQL만 사용 (선점은 조건부 UPDATE의 rowcount로 판정)
+"""
+import json
+import random
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    and_,
+    bindparam,
+    create_engine,
+    func,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.job_runs import default_worker_id
+from app.services.news_crawler.base_crawler import CrawledNews
+
+metadata = MetaData()
+
+crawl_shards_table = Table(
+    "crawl_shards",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("run_id", String(64), nullable=False),
+    Column("source", String(50), nullable=False),
+    Column("keyword", String(200), nullable=False, server_default=""),  # ""는 키워드 없는 목록 페이지
+    Column("page_start", Integer, nullable=False),
+    Column("page_end", Integer, nullable=False),
+    Column("status", String(20), nullable=False),  # pending, running, done, failed
+    Column("attempt", Integer, nullable=False, server_default="0"),
+    Column("max_attempts", Integer, nullable=False),
+    Column("available_at", DateTime(timezone=True), nullable=False),
+    Column("worker_id", String(191)),
+    Column("lease_until", DateTime(timezone=True)),
+    Column("started_at", DateTime(timezone=True)),
+    Column("finished_at", DateTime(timezone=True)),
+    Column("duration_seconds", Float),
+    Column("article_count", Integer),
+    Column("result", Text),
+    Column("error", Text),
+    UniqueConstraint("run_id", "source", "keyword", "page_start", name="uq_crawl_shards_run_shard"),
+)
+
+ENQUEUE_SQL = text("""
+    INSERT INTO crawl_shards
+        (run_id, source, keyword, page_start, page_end, status, attempt, max_attempts, available_at)
+    VALUES
+        (:run_id, :source, :keyword, :page_start, :page_end, 'pending', 0, :max_attempts, :available_at)
+    ON CONFLICT (run_id, source, keyword, page_start) DO NOTHING
+""").bindparams(bindparam("available_at", type_=DateTime(timezone=True)))
+
+# (source, keyword, page_start, page_end)
+ShardPlanItem = Tuple[str, Optional[str], int, int]
+
+
+@dataclass(frozen=True)
+class CrawlShard:
+    """선점한 샤드"""
+    id: int
+    run_id: str
+    source: str
+    keyword: Optional[str]
+    page_start: int
+    page_end: int
+    attempt: int
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def article_to_dict(article: CrawledNews) -> Dict[str, Any]:
+    """CrawledNews → JSON 저장용 dict (원본 HTML 제외)"""
+    data = asdict(article)
+    data["raw_html"] = None
+    if article.published_at:
+        data["published_at"] = article.published_at.isoformat()
+    return data
+
+
+def article_from_dict(data: Dict[str, Any]) -> CrawledNews:
+    if data.get("published_at"):
+        data["published_at"] = datetime.fromisoformat(data["published_at"])
+    return CrawledNews(**data)
+
+
+class CrawlShardQueue:
+    """
+    crawl_shards 테이블 접근 (동기 - 호출부에서 asyncio.to_thread 사용)
+    """
+
+    # 선점 경합 시 한 번에 살펴볼 후보 수
+    CLAIM_CANDIDATES = 8
+
+    def __init__(
+        self,
+        engine: Engine,
+        lease_seconds: float = 120.0,
+        max_attempts: int = 3,
+        retry_backoff_seconds: float = 30.0,
+        worker_id: Optional[str] = None
+    ):
+        self.engine = engine
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.worker_id = worker_id or default_worker_id()
+        # SQLite는 연결 1개를 스레드 간 공유하므로 트랜잭션을 직렬화
+        self._lock = threading.Lock() if engine.dialect.name == "sqlite" else None
+
+    def _begin(self):
+        if self._lock is None:
+            return self.engine.begin()
+        return _LockedTransaction(self.engine, self._lock)
+
+    def create_tables(self) -> None:
+        metadata.create_all(self.engine, tables=[crawl_shards_table], checkfirst=True)
+
+    # ============================================================
+    # 등록 / 선점 / 완료
+    # ============================================================
+
+    def enqueue(self, run_id: str, plan: Iterable[ShardPlanItem]) -> int:
+        """
+        샤드 등록 (같은 run_id로 다시 등록해도 기존 샤드는 유지)
+
+        Returns:
+            등록 요청한 샤드 수
+        """
+        now = _utcnow()
+        rows = [
+            {
+                "run_id": run_id,
+                "source": source,
+                "keyword": keyword or "",
+                "page_start": page_start,
+                "page_end": page_end,
+                "max_attempts": self.max_attempts,
+                "available_at": now,
+            }
+            for source, keyword, page_start, page_end in plan
+        ]
+        if rows:
+            with self._begin() as conn:
+                conn.execute(ENQUEUE_SQL, rows)
+        return len(rows)
+
+    def claim(self, run_id: Optional[str] = None, exclude_sources: Sequence[str] = ()) -> Optional[CrawlShard]:
+        """
+        실행 가능한 샤드 1개 선점
+
+        Args:
+            run_id: 특정 수집 실행의 샤드만 (None이면 전체)
+            exclude_sources: 이 워커에서 동시 실행 한도에 걸린 소스
+
+        Returns:
+            선점한 샤드 (없으면 None)
+        """
+        c = crawl_shards_table.c
+
+        while True:
+            now = _utcnow()
+            claimable = or_(
+                and_(c.status == "pending", c.available_at <= now),
+                and_(c.status == "running", c.lease_until < now, c.attempt < c.max_attempts),
+            )
+            query = select(c.id).where(claimable)
+            if run_id:
+                query = query.where(c.run_id == run_id)
+            if exclude_sources:
+                query = query.where(c.source.notin_(list(exclude_sources)))
+
+            with self._begin() as conn:
+                candidates = list(conn.execute(query.order_by(c.id).limit(self.CLAIM_CANDIDATES)).scalars())
+            if not candidates:
+                return None
+
+            # 워커끼리 같은 행을 두고 경합하지 않도록 후보 중 무작위 선택
+            random.shuffle(candidates)
+            for shard_id in candidates:
+                with self._begin() as conn:
+                    result = conn.execute(
+                        crawl_shards_table.update()
+                        .where(c.id == shard_id)
+                        .where(claimable)
+                        .values(
+                            status="running",
+                            worker_id=self.worker_id,
+                            attempt=c.attempt + 1,
+                            started_at=now,
+                            lease_until=now + timedelta(seconds=self.lease_seconds),
+                            error=None
+                        )
+                    )
+                    if result.rowcount != 1:
+                        continue
+                    row = conn.execute(select(crawl_shards_table).where(c.id == shard_id)).mappings().one()
+
+                return CrawlShard(
+                    id=row["id"],
+                    run_id=row["run_id"],
+                    source=row["source"],
+                    keyword=row["keyword"] or None,
+                    page_start=row["page_start"],
+                    page_end=row["page_end"],
+                    attempt=row["attempt"]
+                )
+            # 후보를 모두 다른 워커가 가져감 → 다시 조회
+
+    def renew(self, shard_id: int) -> bool:
+        """임대 연장 (다른 워커가 이어받았으면 False)"""
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            result = conn.execute(
+                crawl_shards_table.update()
+                .where(c.id == shard_id)
+                .where(c.worker_id == self.worker_id)
+                .where(c.status == "running")
+                .values(lease_until=_utcnow() + timedelta(seconds=self.lease_seconds))
+            )
+        return result.rowcount == 1
+
+    def complete(self, shard_id: int, articles: List[CrawledNews], duration_seconds: float) -> bool:
+        """
+        샤드 완료 및 결과 저장
+
+        Returns:
+            기록 여부 (임대를 잃어 다른 워커가 실행 중이면 False)
+        """
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            result = conn.execute(
+                crawl_shards_table.update()
+                .where(c.id == shard_id)
+                .where(c.worker_id == self.worker_id)
+                .where(c.status == "running")
+                .values(
+                    status="done",
+                    finished_at=_utcnow(),
+                    duration_seconds=duration_seconds,
+                    article_count=len(articles),
+                    result=json.dumps([article_to_dict(a) for a in articles], ensure_ascii=False)
+                )
+            )
+        return result.rowcount == 1
+
+    def fail(self, shard_id: int, error: str, duration_seconds: float) -> Optional[str]:
+        """
+        샤드 실패 기록 - 재시도 횟수가 남았으면 백오프 후 다시 pending
+
+        Returns:
+            변경된 상태 (pending / failed, 임대를 잃었으면 None)
+        """
+        c = crawl_shards_table.c
+        owned = and_(c.id == shard_id, c.worker_id == self.worker_id, c.status == "running")
+
+        # 읽기 / 쓰기 트랜잭션을 분리 (SQLite 잠금 승격 교착 방지 - 행은 이 워커가 임대 중)
+        with self._begin() as conn:
+            row = conn.execute(select(c.attempt, c.max_attempts).where(owned)).first()
+        if row is None:
+            return None
+
+        now = _utcnow()
+        retry = row.attempt < row.max_attempts
+        with self._begin() as conn:
+            result = conn.execute(
+                crawl_shards_table.update()
+                .where(owned)
+                .values(
+                    status="pending" if retry else "failed",
+                    available_at=now + timedelta(seconds=self.retry_backoff_seconds * 2 ** (row.attempt - 1)),
+                    finished_at=None if retry else now,
+                    duration_seconds=duration_seconds,
+                    error=error[:2000]
+                )
+            )
+        if result.rowcount != 1:
+            return None
+        return "pending" if retry else "failed"
+
+    def retry_failed(self, run_id: str) -> int:
+        """최종 실패한 샤드만 다시 대기열로 (재시도 횟수 초기화)"""
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            result = conn.execute(
+                crawl_shards_table.update()
+                .where(c.run_id == run_id)
+                .where(c.status == "failed")
+                .values(status="pending", attempt=0, available_at=_utcnow(), finished_at=None)
+            )
+        return result.rowcount
+
+    # ============================================================
+    # 진행 상황 / 결과
+    # ============================================================
+
+    def expire_abandoned(self, run_id: Optional[str] = None) -> int:
+        """재시도 횟수를 다 쓴 채 임대가 만료된 샤드를 failed로 정리"""
+        c = crawl_shards_table.c
+        now = _utcnow()
+        query = (
+            crawl_shards_table.update()
+            .where(c.status == "running")
+            .where(c.lease_until < now)
+            .where(c.attempt >= c.max_attempts)
+            .values(status="failed", finished_at=now, error="lease expired")
+        )
+        if run_id:
+            query = query.where(c.run_id == run_id)
+        with self._begin() as conn:
+            return conn.execute(query).rowcount
+
+    def progress(self, run_id: str) -> Dict[str, int]:
+        """상태별 샤드 수"""
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            rows = conn.execute(
+                select(c.status, func.count()).where(c.run_id == run_id).group_by(c.status)
+            ).all()
+        counts = {"pending": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def is_finished(self, run_id: str) -> bool:
+        """남은 샤드(pending / running)가 없는지"""
+        self.expire_abandoned(run_id)
+        counts = self.progress(run_id)
+        return counts["pending"] == 0 and counts["running"] == 0
+
+    def results(self, run_id: str) -> List[CrawledNews]:
+        """완료된 샤드의 기사 목록 (샤드 순서)"""
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            payloads = conn.execute(
+                select(c.result).where(c.run_id == run_id).where(c.status == "done").order_by(c.id)
+            ).scalars().all()
+
+        return [article_from_dict(item) for payload in payloads if payload for item in json.loads(payload)]
+
+    def clear_results(self, run_id: str) -> int:
+        """모아 간 결과(JSON) 비우기 - 샤드 행(상태/기사 수/오류)은 남김"""
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            result = conn.execute(
+                crawl_shards_table.update()
+                .where(c.run_id == run_id)
+                .where(c.result.isnot(None))
+                .values(result=None)
+            )
+        return result.rowcount
+
+    def purge(self, older_than: timedelta) -> int:
+        """끝난 지 older_than이 지난 샤드 행 삭제 (done / failed)"""
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            result = conn.execute(
+                crawl_shards_table.delete()
+                .where(c.status.in_(["done", "failed"]))
+                .where(c.finished_at < _utcnow() - older_than)
+            )
+        return result.rowcount
+
+    def shard_stats(self, run_id: str) -> List[Dict[str, Any]]:
+        """샤드별 상태 (소스, 키워드, 페이지, 시도 횟수, 실행 시각, 기사 수, 오류)"""
+        c = crawl_shards_table.c
+        with self._begin() as conn:
+            rows = conn.execute(
+                select(
+                    c.source, c.keyword, c.page_start, c.page_end, c.status,
+                    c.attempt, c.worker_id, c.started_at, c.finished_at,
+                    c.duration_seconds, c.article_count, c.error
+                ).where(c.run_id == run_id).order_by(c.id)
+            ).mappings().all()
+        return [dict(row) for row in rows]
+
+
+class _LockedTransaction:
+    """engine.begin()을 프로세스 내 잠금으로 감싼 컨텍스트 매니저"""
+
+    def __init__(self, engine: Engine, lock: threading.Lock):
+        self._engine = engine
+        self._lock = lock
+        self._ctx = None
+
+    def __enter__(self):
+        self._lock.acquire()
+        try:
+            self._ctx = self._engine.begin()
+            return self._ctx.__enter__()
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        try:
+            return self._ctx.__exit__(exc_type, exc_val, exc_tb)
+        finally:
+            self._lock.release()
+
+
+# 전역 큐 (지연 생성)
+shard_queue: Optional[CrawlShardQueue] = None
+
+
+def get_database_url() -> Optional[str]:
+    return settings.CRAWL_QUEUE_DATABASE_URL or settings.DATABASE_URL
+
+
+def create_shard_queue(database_url: Optional[str] = None, **kwargs) -> CrawlShardQueue:
+    """
+    큐 생성 (테이블이 없으면 생성)
+
+    database_url이 없으면 프로세스 내 SQLite 메모리 DB (단일 프로세스 병렬 수집만 가능)
+    """
+    if database_url:
+        connect_args = {"timeout": 30} if database_url.startswith("sqlite") else {}
+        engine = create_engine(database_url, pool_pre_ping=True, connect_args=connect_args)
+    else:
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+
+    kwargs.setdefault("lease_seconds", settings.CRAWL_SHARD_LEASE_SECONDS)
+    kwargs.setdefault("max_attempts", settings.CRAWL_SHARD_MAX_ATTEMPTS)
+    kwargs.setdefault("retry_backoff_seconds", settings.CRAWL_SHARD_RETRY_BACKOFF_SECONDS)
+
+    queue = CrawlShardQueue(engine, **kwargs)
+    queue.create_tables()
+    return queue
+
+
+def get_shard_queue() -> CrawlShardQueue:
+    """전역 큐 반환 (CRAWL_QUEUE_DATABASE_URL → DATABASE_URL → 메모리)"""
+    global shard_queue
+
+    if shard_queue is None:
+        shard_queue = create_shard_queue(get_database_url())
+
+    return shard_queue
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import List, Optional
 from urllib.parse import urljoin
 
-from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews
+from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews, ShardSpec
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +22,17 @@ class VentureSquareCrawler(BaseCrawler):
     스타트업/벤처 전문 매체
     """
 
+    # 기사 링크 셀렉터 (순서대로 시도)
+    LINK_SELECTORS = [
+        "article h2 a",
+        "h2.entry-title a",
+        ".post-title a",
+        "article a[href*='venturesquare.net']"
+    ]
+
+    # 사이트 검색 키워드 (첫 페이지만)
+    SEARCH_KEYWORDS = ["투자 유치", "시리즈A", "펀딩"]
+
     def __init__(self):
         super().__init__(
             source_name="venturesquare",
@@ -47,53 +58,63 @@ class VentureSquareCrawler(BaseCrawler):
 
         # 뉴스 카테고리 페이지 크롤링
         for page in range(1, max_pages + 1):
-            if page == 1:
-                page_url = f"{self.base_url}/category/news-contents/news-trends/news/"
-            else:
-                page_url = f"{self.base_url}/category/news-contents/news-trends/news/page/{page}/"
+            urls.extend(await self._category_page(page))
 
-            html = await self.fetch_page(page_url)
-            if not html:
-                continue
+        # 키워드 검색 추가
+        for keyword in self.SEARCH_KEYWORDS:
+            urls.extend(await self._search_keyword(keyword))
+
+        return list(set(urls))  # 중복 제거
 
-            soup = self.parse_html(html)
+    def _extract_links(self, html: str) -> List[str]:
+        """목록 페이지에서 기사 링크 추출 - 여러 셀렉터 시도"""
+        soup = self.parse_html(html)
+        urls = []
+        for selector in self.LINK_SELECTORS:
+            articles = soup.select(selector)
+            if articles:
+                for article in articles:
+                    href = article.get("href", "")
+                    if href and "venturesquare.net" in href:
+                        urls.append(href)
+                break
+        return urls
+
+    async def _category_page(self, page: int) -> List[str]:
+        """뉴스 카테고리 한 페이지의 기사 URL"""
+        if page == 1:
+            page_url = f"{self.base_url}/category/news-contents/news-trends/news/"
+        else:
+            page_url = f"{self.base_url}/category/news-contents/news-trends/news/page/{page}/"
+
+        html = await self.fetch_page(page_url)
+        if not html:
+            return []
 
-            # 기사 링크 추출 - 여러 셀렉터 시도
-            selectors = [
-                "article h2 a",
-                "h2.entry-title a",
-                ".post-title a",
-                "article a[href*='venturesquare.net']"
-            ]
+        urls = self._extract_links(html)
+        logger.debug(f"Found {len(urls)} items from page {page}")
+        return urls
 
-            for selector in selectors:
-                articles = soup.select(selector)
-                if articles:
-                    for article in articles:
-                        href = article.get("href", "")
-                        if href and "venturesquare.net" in href:
-                            urls.append(href)
-                    break
+    async def _search_keyword(self, keyword: str) -> List[str]:
+        """사이트 검색 결과 첫 페이지의 기사 URL"""
+        search_url = f"{self.base_url}/?s={keyword.replace(' ', '+')}"
+        html = await self.fetch_page(search_url)
+        return self._extract_links(html) if html else []
 
-            logger.debug(f"Found {len(articles) if articles else 0} items from page {page}")
+    def plan_shards(self, keywords: List[str], max_pages: int = 3, pages_per_shard: int = 1) -> List[ShardSpec]:
+        """카테고리 페이지 구간 + 검색 키워드별 1개"""
+        shards: List[ShardSpec] = [(None, start, end) for start, end in self.page_windows(max_pages, pages_per_shard)]
+        shards.extend((keyword, 1, 1) for keyword in self.SEARCH_KEYWORDS)
+        return shards
 
-        # 키워드 검색 추가
-        search_keywords = ["투자 유치", "시리즈A", "펀딩"]
-        for keyword in search_keywords:
-            search_url = f"{self.base_url}/?s={keyword.replace(' ', '+')}"
-            html = await self.fetch_page(search_url)
-            if html:
-                soup = self.parse_html(html)
-                for selector in selectors:
-                    articles = soup.select(selector)
-                    if articles:
-                        for article in articles:
-                            href = article.get("href", "")
-                            if href and "venturesquare.net" in href:
-                                urls.append(href)
-                        break
+    async def get_shard_urls(self, keyword: Optional[str], page_start: int, page_end: int) -> List[str]:
+        if keyword:
+            return await self._search_keyword(keyword)
 
-        return list(set(urls))  # 중복 제거
+        urls = []
+        for page in range(page_start, page_end + 1):
+            urls.extend(await self._category_page(page))
+        return urls
 
     async def parse_article(self, url: str) -> Optional[CrawledNews]:
         """
@@ -7,7 +7,7 @@ Wowtale News Crawler
 """
 import logging
 from typing import List, Optional
-from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews
+from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews, ShardSpec
 
 logger = logging.getLogger(__name__)
 
@@ -24,19 +24,30 @@ class WowtaleCrawler(BaseCrawler):
         # 와우테일은 '투자' 카테고리가 명확하므로 카테고리 페이지 직접 크롤링 권장
         # https://wowtale.net/category/investment/
         for page in range(1, max_pages + 1):
-            url = f"{self.base_url}/category/investment/page/{page}/" if page > 1 else f"{self.base_url}/category/investment/"
-            html = await self.fetch_page(url)
-            if not html: continue
-            
-            soup = self.parse_html(html)
-            # 기사 링크 추출 (와우테일 테마에 따라 셀렉터 조정 필요)
-            items = soup.select("h2.entry-title a")
-            for item in items:
-                href = item.get("href")
-                if href: urls.append(href)
-        
+            urls.extend(await self._category_page(page))
+
         return list(set(urls))
 
+    async def _category_page(self, page: int) -> List[str]:
+        url = f"{self.base_url}/category/investment/page/{page}/" if page > 1 else f"{self.base_url}/category/investment/"
+        html = await self.fetch_page(url)
+        if not html: return []
+
+        soup = self.parse_html(html)
+        # 기사 링크 추출 (와우테일 테마에 따라 셀렉터 조정 필요)
+        items = soup.select("h2.entry-title a")
+        return [item.get("href") for item in items if item.get("href")]
+
+    def plan_shards(self, keywords: List[str], max_pages: int = 1, pages_per_shard: int = 1) -> List[ShardSpec]:
+        """카테고리 페이지 구간"""
+        return [(None, start, end) for start, end in self.page_windows(max_pages, pages_per_shard)]
+
+    async def get_shard_urls(self, keyword: Optional[str], page_start: int, page_end: int) -> List[str]:
+        urls = []
+        for page in range(page_start, page_end + 1):
+            urls.extend(await self._category_page(page))
+        return urls
+
     async def parse_article(self, url: str) -> Optional[CrawledNews]:
         html = await self.fetch_page(url)
         if not html: return None
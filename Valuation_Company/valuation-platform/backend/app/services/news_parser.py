@@ -4,16 +4,16 @@ AI 기반 뉴스 파싱 및 데이터 추출
 
 @task Investment Tracker
 @description Gemini를 사용하여 투자 뉴스에서 구조화된 데이터 추출
+
+모델 호출은 AIRouter(NEWS_EXTRACTION)를 거친다 - 기본은 Gemini, 느리거나 실패하면 다른 제공자로 넘어감
 """
 import json
 import logging
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
-from datetime import datetime
-
-from google import genai
 
-from app.core.config import settings
+from app.core.ai_router import AIRouter, TaskType, ai_router
+from app.services import ai_client  # noqa: F401 - AIRouter 제공자 등록
 from app.services.news_crawler.base_crawler import CrawledNews
 
 logger = logging.getLogger(__name__)
@@ -42,6 +42,9 @@ class NewsParser:
     투자 뉴스에서 구조화된 데이터 추출
     """
 
+    # 추출 프롬프트/후처리 버전 - 바꾸면 reprocess_deals가 기존 Deal을 다시 추출함
+    PARSER_VERSION = "2"
+
     # 투자 단계 매핑
     STAGE_MAPPING = {
         "시드": "seed",
@@ -63,15 +66,22 @@ class NewsParser:
         "angel": "seed",
     }
 
-    def __init__(self):
-        self.client = genai.Client(api_key=settings.GOOGLE_API_KEY)
-        self.model_name = 'gemini-2.0-flash'  # 최신 무료 모델
-        self.generation_config = {
-            "temperature": 0.1,  # 낮은 온도로 일관된 추출
-            "top_p": 0.95,
-            "top_k": 40,
-            "max_output_tokens": 2048,
-        }
+    def __init__(self, router: AIRouter = ai_router):
+        self.router = router
+        self.model_name = 'gemini-2.0-flash'  # 최신 무료 모델 (Gemini로 라우팅될 때)
+
+    async def _execute(self, prompt: str, operation: str, **options) -> str:
+        """AIRouter로 모델 호출 (응답 텍스트 반환)"""
+        response = await self.router.execute(
+            TaskType.NEWS_EXTRACTION,
+            {
+                "prompt": prompt,
+                "models": {"gemini": self.model_name},
+                "operation": operation,
+                **options
+            }
+        )
+        return response["content"]
 
     async def parse_news(self, news: CrawledNews) -> Optional[ExtractedInvestmentData]:
         """
@@ -86,12 +96,14 @@ class NewsParser:
         prompt = self._build_extraction_prompt(news.title, news.content or "")
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=self.generation_config
+            response_text = await self._execute(
+                prompt,
+                "parse_news",
+                temperature=0.1,  # 낮은 온도로 일관된 추출
+                max_tokens=2048,
+                json=True
             )
-            extracted = self._parse_response(response.text)
+            extracted = self._parse_response(response_text)
 
             if extracted and extracted.company_name_ko:
                 logger.info(f"Successfully extracted data for: {extracted.company_name_ko}")
@@ -267,11 +279,8 @@ class NewsParser:
 요약:"""
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
-            )
-            return response.text.strip()
+            response_text = await self._execute(prompt, "news_summary", max_tokens=512)
+            return response_text.strip()
         except Exception as e:
             logger.error(f"Error generating summary: {e}")
             return None
@@ -0,0 +1,397 @@
+"""
+Progress Hub
+평가 진행 상황 pub/sub
+
+@task Valuation Platform
+@description 진행 상황을 DB 폴링 대신 push로 전달하기 위한 팬아웃 허브
+
+- 발행자: ValuationOrchestrator.update_status / collect_data 진행 콜백, 평가 API 상태 변경
+- 구독자: SSE / WebSocket 진행 스트림, /progress 조회
+- (project_id, method)별 최신 스냅샷을 유지하므로 평가가 진행되는 동안 DB 조회가 없다
+- 스냅샷 필드(진행률 / 메시지)는 모든 발행자가 build_progress_fields 하나로 만든다
+- 워커가 여러 개면 PostgreSQL LISTEN/NOTIFY로 발행을 다른 워커의 허브에도 전달한다
+  (PROGRESS_DATABASE_URL → DATABASE_URL, 둘 다 없으면 이 프로세스 안에서만 전달 - 단일 워커용)
+- 스냅샷이 없거나 만료됐을 때만 DB에서 읽으며, 동시에 들어온 구독자들은 그 한 번의 조회를 공유한다
+"""
+import asyncio
+import itertools
+import json
+import logging
+import time
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ProgressKey = Tuple[str, str]
+SnapshotLoader = Callable[[], Awaitable[Dict[str, Any]]]
+
+# 평가 단계 수
+MAX_STEP = 14
+
+# 이 상태가 발행되면 스트림 종료
+TERMINAL_STATUSES = ("completed", "failed")
+
+# 응답으로 쓸 수 있는 스냅샷의 필수 필드 (detail만 발행된 스냅샷은 조회 미스로 취급)
+REQUIRED_FIELDS = ("status", "step", "progress")
+
+# 워커 간 발행 채널 (pg_notify 채널명)
+PROGRESS_CHANNEL = "valuation_progress"
+
+
+def calculate_progress(step: int) -> int:
+    """단계 번호로부터 진행률 계산"""
+    return int((step / MAX_STEP) * 100)
+
+
+def get_status_message(status: str, step: int) -> str:
+    """상태 메시지 생성"""
+    messages = {
+        "not_requested": "평가가 신청되지 않았습니다",
+        "not_started": "평가가 시작되지 않았습니다",
+        "pending": "승인 대기 중입니다",
+        "approved": "승인되었습니다",
+        "in_progress": f"진행 중입니다 (단계 {step}/{MAX_STEP})",
+        "pending_review": f"회계사 검토 대기 중입니다 (단계 {step}/{MAX_STEP})",
+        "completed": "평가가 완료되었습니다",
+        "failed": "평가가 실패했습니다"
+    }
+    return messages.get(status, "알 수 없는 상태")
+
+
+def build_progress_fields(status: str, step: int) -> Dict[str, Any]:
+    """
+    진행 허브에 발행할 상태 필드 생성
+
+    오케스트레이터 / 평가 API / DB 적재가 모두 이 함수로 만들어
+    같은 키의 진행률 / 메시지가 발행자에 따라 달라지지 않게 한다.
+    (detail은 단계가 바뀌면 지움)
+    """
+    return {
+        "status": status,
+        "step": step,
+        "progress": calculate_progress(step),
+        "message": get_status_message(status, step),
+        "detail": None
+    }
+
+
+def is_complete(event: Dict[str, Any]) -> bool:
+    """상태 필드가 모두 있는 스냅샷인지"""
+    return all(field in event for field in REQUIRED_FIELDS)
+
+
+class PostgresProgressBus:
+    """
+    워커 간 진행 상황 전달 (PostgreSQL LISTEN/NOTIFY)
+
+    수신: LISTEN 전용 연결을 이벤트 루프 reader로 등록 (폴링 없음)
+    송신: 전용 연결 하나를 단일 스레드에서 사용 (발행 순서 유지, 이벤트 루프 블로킹 없음)
+    """
+
+    def __init__(self, database_url: str, channel: str = PROGRESS_CHANNEL):
+        # SQLAlchemy URL(postgresql+psycopg2://)도 그대로 받을 수 있게 드라이버 표기 제거
+        scheme, sep, rest = database_url.partition("://")
+        self.dsn = scheme.split("+", 1)[0] + sep + rest
+        self.channel = channel
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listen_conn = None
+        self._send_conn = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="progress-notify")
+
+    def _connect(self):
+        import psycopg2
+
+        conn = psycopg2.connect(self.dsn)
+        conn.autocommit = True
+        return conn
+
+    async def start(self, on_message: Callable[[Dict[str, Any]], None]) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._listen_conn = await asyncio.to_thread(self._connect)
+        with self._listen_conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel}")
+        self._send_conn = await self._loop.run_in_executor(self._executor, self._connect)
+        self._loop.add_reader(self._listen_conn.fileno(), self._drain, on_message)
+
+    def _drain(self, on_message: Callable[[Dict[str, Any]], None]) -> None:
+        try:
+            self._listen_conn.poll()
+        except Exception as e:
+            logger.error(f"Progress bus connection lost: {e}")
+            self._loop.remove_reader(self._listen_conn.fileno())
+            return
+
+        while self._listen_conn.notifies:
+            notify = self._listen_conn.notifies.pop(0)
+            try:
+                on_message(json.loads(notify.payload))
+            except Exception as e:
+                logger.warning(f"Invalid progress notification: {e}")
+
+    def send(self, message: Dict[str, Any]) -> None:
+        payload = json.dumps(message, ensure_ascii=False, default=str)
+        self._executor.submit(self._notify, payload)
+
+    def _notify(self, payload: str) -> None:
+        try:
+            with self._send_conn.cursor() as cursor:
+                cursor.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+        except Exception as e:
+            logger.warning(f"Progress notification failed: {e}")
+
+    async def close(self) -> None:
+        if self._listen_conn is not None:
+            self._loop.remove_reader(self._listen_conn.fileno())
+            self._listen_conn.close()
+            self._listen_conn = None
+
+        await asyncio.to_thread(self._executor.shutdown, True)
+        if self._send_conn is not None:
+            self._send_conn.close()
+            self._send_conn = None
+
+
+class ProgressHub:
+    """
+    (project_id, method)별 진행 상황 팬아웃 허브
+
+    구독자마다 작은 asyncio.Queue를 두고, 느린 구독자는 오래된 이벤트를 버린다.
+    이벤트는 누적 스냅샷이므로 중간 이벤트가 빠져도 최신 상태는 항상 전달된다.
+    """
+
+    def __init__(
+        self,
+        snapshot_ttl: float = settings.PROGRESS_SNAPSHOT_TTL_SECONDS,
+        queue_size: int = 16
+    ):
+        """
+        Args:
+            snapshot_ttl: 스냅샷 유효 시간 (초) - 발행자가 멈춘 경우를 대비해 만료되면 DB 재조회
+            queue_size: 구독자별 대기 이벤트 수
+        """
+        self.snapshot_ttl = snapshot_ttl
+        self.queue_size = queue_size
+        self.origin = uuid.uuid4().hex
+        self._bus: Optional[PostgresProgressBus] = None
+        self._snapshots: Dict[ProgressKey, Tuple[float, Dict[str, Any]]] = {}
+        self._subscribers: Dict[ProgressKey, Set[asyncio.Queue]] = defaultdict(set)
+        self._loading: Dict[ProgressKey, asyncio.Future] = {}
+        self._sequence = itertools.count(1)
+
+    # ============================================================
+    # 워커 간 전달
+    # ============================================================
+
+    async def start(self, database_url: Optional[str] = None) -> None:
+        """
+        워커 간 전달 시작 (앱 시작 시 한 번)
+
+        database_url이 없으면 PROGRESS_DATABASE_URL → DATABASE_URL,
+        PostgreSQL이 아니면 이 프로세스 안에서만 전달한다.
+        """
+        database_url = database_url or settings.PROGRESS_DATABASE_URL or settings.DATABASE_URL
+        if self._bus is not None or not database_url or not database_url.startswith("postgres"):
+            if self._bus is None:
+                logger.warning("Progress DATABASE_URL not set - progress is pushed within this worker only")
+            return
+
+        bus = PostgresProgressBus(database_url)
+        await bus.start(self._on_remote)
+        self._bus = bus
+
+    async def close(self) -> None:
+        if self._bus is not None:
+            bus, self._bus = self._bus, None
+            await bus.close()
+
+    def _on_remote(self, message: Dict[str, Any]) -> None:
+        """다른 워커의 발행 적용 (자신이 보낸 알림은 이미 적용됨)"""
+        if message.get("origin") == self.origin:
+            return
+        self._apply((message["project_id"], message["method"]), message["fields"])
+
+    # ============================================================
+    # 발행
+    # ============================================================
+
+    def publish(self, project_id: str, method: str, **fields: Any) -> Dict[str, Any]:
+        """
+        진행 상황 발행
+
+        이전 스냅샷에 fields를 덮어써 새 스냅샷을 만들고 모든 구독자에게 전달한다.
+        (다른 워커의 구독자에게도 전달)
+        seq는 허브 내에서 단조 증가하며 SSE 이벤트 id로도 쓰인다.
+        (collect_data 세부 진행처럼 detail만 발행해도 status/step은 유지됨)
+
+        Returns:
+            새 스냅샷
+        """
+        event = self._apply((project_id, method), fields)
+
+        if self._bus is not None:
+            self._bus.send({
+                "origin": self.origin,
+                "project_id": project_id,
+                "method": method,
+                "fields": fields
+            })
+
+        return event
+
+    def _apply(self, key: ProgressKey, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """이 프로세스의 스냅샷 갱신 + 구독자 전달"""
+        previous = self._snapshots.get(key)
+
+        event = dict(previous[1]) if previous else {}
+        event.update(fields)
+        event["project_id"], event["method"] = key
+        event["updated_at"] = datetime.utcnow().isoformat()
+        event["seq"] = next(self._sequence)
+
+        self._snapshots[key] = (time.monotonic(), event)
+
+        for queue in self._subscribers.get(key, ()):
+            self._offer(queue, event)
+
+        return event
+
+    def _offer(self, queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        """큐가 가득 차면 가장 오래된 이벤트를 버리고 추가"""
+        if queue.full():
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait(event)
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def snapshot(self, project_id: str, method: str) -> Optional[Dict[str, Any]]:
+        """유효한 최신 스냅샷 (없거나, 만료됐거나, 상태 필드가 없으면 None)"""
+        entry = self._snapshots.get((project_id, method))
+        if entry is None:
+            return None
+
+        published_at, event = entry
+        if time.monotonic() - published_at > self.snapshot_ttl or not is_complete(event):
+            return None
+
+        return event
+
+    async def get_or_load(
+        self,
+        project_id: str,
+        method: str,
+        loader: SnapshotLoader
+    ) -> Dict[str, Any]:
+        """
+        스냅샷 조회, 없으면 loader로 한 번만 적재
+
+        같은 키에 대해 동시에 호출되면 DB 조회 한 번을 공유한다.
+        loader 예외는 대기 중인 모든 호출자에게 그대로 전달된다.
+        """
+        event = self.snapshot(project_id, method)
+        if event is not None:
+            return event
+
+        key = (project_id, method)
+        pending = self._loading.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._load(key, loader))
+            self._loading[key] = pending
+
+        return await asyncio.shield(pending)
+
+    async def _load(self, key: ProgressKey, loader: SnapshotLoader) -> Dict[str, Any]:
+        try:
+            fields = await loader()
+            # 적재 중에 발행된 값이 있으면 그쪽이 더 최신
+            event = self.snapshot(*key)
+            if event is not None:
+                return event
+
+            entry = self._snapshots.get(key)
+            if entry is None:
+                return self._apply(key, fields)
+
+            previous = entry[1]
+            if not is_complete(previous):
+                # detail만 발행된 스냅샷 - DB 상태에 이 프로세스의 detail을 얹는다
+                return self._apply(key, {k: v for k, v in fields.items() if k not in previous})
+
+            if all(previous.get(k) == v for k, v in fields.items() if k != "detail"):
+                # DB 값이 그대로면 새 이벤트 없이 유효 시간만 갱신
+                self._snapshots[key] = (time.monotonic(), previous)
+                return previous
+
+            return self._apply(key, fields)
+        finally:
+            self._loading.pop(key, None)
+
+    # ============================================================
+    # 구독
+    # ============================================================
+
+    async def watch(
+        self,
+        project_id: str,
+        method: str,
+        loader: SnapshotLoader,
+        heartbeat: float = settings.PROGRESS_HEARTBEAT_SECONDS
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        진행 상황 스트림
+
+        현재 스냅샷을 먼저 내보낸 뒤 발행될 때마다 이벤트를 내보낸다 (DB 폴링 없음).
+        heartbeat 초 동안 이벤트가 없으면 None (연결 유지용)을 내보내고,
+        그때 스냅샷이 만료됐으면 (발행자가 멈춤) DB를 한 번 다시 읽는다.
+        종료 상태(completed/failed)를 내보내면 끝난다.
+        """
+        key = (project_id, method)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        # 스냅샷 조회 전에 구독해야 그 사이 발행된 이벤트를 놓치지 않는다
+        self._subscribers[key].add(queue)
+        try:
+            event = await self.get_or_load(project_id, method, loader)
+            last_seq = event["seq"]
+            yield event
+
+            while event.get("status") not in TERMINAL_STATUSES:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    if self.snapshot(project_id, method) is None:
+                        # 바뀌었으면 발행되어 큐로 들어오므로 여기서는 적재만
+                        await self.get_or_load(project_id, method, loader)
+                    yield None
+                    continue
+
+                # 스냅샷으로 이미 내보낸 이벤트는 건너뜀
+                if event["seq"] <= last_seq:
+                    continue
+
+                last_seq = event["seq"]
+                yield event
+        finally:
+            subscribers = self._subscribers.get(key)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[key]
+
+    def subscriber_count(self, project_id: str, method: str) -> int:
+        """현재 구독자 수"""
+        return len(self._subscribers.get((project_id, method), ()))
+
+
+# 프로세스 전역 허브
+progress_hub = ProgressHub()
@@ -0,0 +1,83 @@
+"""
+5가지 평가법 엔진 패키지 / 엔진 레지스트리
+
+평가 방법 이름 → 엔진 클래스 매핑만 가지고 있고, 엔진 모듈은 처음 요청될 때 import 한다.
+(무거운 의존성(scipy 등)은 해당 계산 함수 안에서 import)
+
+Usage:
+    from app.services.valuation_engine import create_engine
+    engine = create_engine('dcf', verbose=False)
+"""
+import importlib
+from typing import Any, Dict, List, Type
+
+# 평가 방법 → "모듈:클래스"
+ENGINE_REGISTRY: Dict[str, str] = {
+    'dcf': 'app.services.valuation_engine.dcf.dcf_engine:DCFEngine',
+    'relative': 'app.services.valuation_engine.relative.relative_engine:RelativeValuationEngine',
+    'intrinsic': 'app.services.valuation_engine.intrinsic.intrinsic_value_engine:CapitalMarketLawEngine',
+    'asset': 'app.services.valuation_engine.asset.asset_engine:AssetValuationEngine',
+    'inheritance_tax': 'app.services.valuation_engine.tax.tax_law_engine:InheritanceTaxLawEngine',
+}
+
+# 라우터/DB에서 쓰는 다른 이름 (main.py의 5가지 평가법 표기)
+ENGINE_ALIASES: Dict[str, str] = {
+    'capital_market_law': 'intrinsic',
+    'inheritance_tax_law': 'inheritance_tax',
+}
+
+_engine_classes: Dict[str, Type] = {}
+
+
+def register_engine(method: str, target: str) -> None:
+    """엔진 등록/교체 (target: "패키지.모듈:클래스")"""
+    ENGINE_REGISTRY[method] = target
+    _engine_classes.pop(method, None)
+
+
+def available_methods() -> List[str]:
+    return list(ENGINE_REGISTRY)
+
+
+def get_engine_class(method: str) -> Type:
+    """
+    평가 방법 → 엔진 클래스 (최초 호출 시 모듈 import)
+
+    Raises:
+        ValueError: 등록되지 않은 평가 방법
+    """
+    method = ENGINE_ALIASES.get(method, method)
+    engine_class = _engine_classes.get(method)
+    if engine_class is not None:
+        return engine_class
+
+    target = ENGINE_REGISTRY.get(method)
+    if target is None:
+        raise ValueError(f"Unknown valuation method: {method}")
+
+    module_name, class_name = target.split(':')
+    engine_class = _engine_classes[method] = getattr(importlib.import_module(module_name), class_name)
+    return engine_class
+
+
+def create_engine(method: str, **kwargs: Any):
+    """평가 방법 → 엔진 인스턴스"""
+    return get_engine_class(method)(**kwargs)
+
+
+def __getattr__(name: str):
+    """from app.services.valuation_engine import DCFEngine 같은 클래스 접근도 지연 import"""
+    for method, target in ENGINE_REGISTRY.items():
+        if target.split(':')[1] == name:
+            return get_engine_class(method)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "ENGINE_REGISTRY",
+    "ENGINE_ALIASES",
+    "register_engine",
+    "available_methods",
+    "get_engine_class",
+    "create_engine",
+]
@@ -0,0 +1 @@
+# Asset Valuation (NAV) Engine module
@@ -6,9 +6,12 @@ Net Asset Value Approach
 핵심 질문: "지금 자산을 모두 팔면 얼마를 받을 수 있을까?"
 """
 
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 from dataclasses import dataclass
 
+if TYPE_CHECKING:
+    from app.services.valuation_engine.inputs import AssetInput
+
 
 @dataclass
 class AssetValuation:
@@ -72,6 +75,10 @@ class AssetValuationEngine:
             'total_adjustments': round(assets_fv['total_adjustment'] - liabilities_fv['total_adjustment'], 0)
         }
 
+    def evaluate_input(self, inputs: 'AssetInput') -> Dict:
+        """검증된 AssetInput으로 run_valuation (항목별 평가가 dict 기반이라 dict로 풀어서 전달)"""
+        return self.run_valuation(**inputs.engine_kwargs())
+
     # ==================== 자산 평가 ====================
 
     def _value_assets(self, balance_sheet: Dict, fair_value_data: Dict) -> Dict:
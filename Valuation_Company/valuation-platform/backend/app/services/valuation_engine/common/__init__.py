@@ -0,0 +1 @@
+# Valuation Engine common module
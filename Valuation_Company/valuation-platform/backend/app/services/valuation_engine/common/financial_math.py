@@ -11,8 +11,6 @@ Date: 2025-10-17
 """
 
 from typing import List, Dict, Optional, Tuple
-import numpy as np
-from scipy.optimize import newton
 
 
 class FinancialCalculator:
@@ -221,6 +219,8 @@ class FinancialCalculator:
             )
 
         try:
+            from scipy.optimize import newton  # scipy는 IRR 계산 시에만 로드
+
             return newton(npv, x0=0.10)  # 초기값 10%
         except RuntimeError:
             raise ValueError("IRR 계산 실패: 수렴하지 않음")
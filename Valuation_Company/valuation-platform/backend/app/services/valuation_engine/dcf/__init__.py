@@ -0,0 +1 @@
+# DCF Engine module
@@ -11,20 +11,195 @@ Date: 2025-10-17
 Version: 1.0
 """
 
-import sys
-sys.path.append('..')
-
-from typing import List, Dict, Optional
+import time
+from array import array
+from typing import TYPE_CHECKING, Any, List, Dict, Optional, Sequence, Union
 from datetime import datetime
-from common.financial_math import FinancialCalculator, ValidationLibrary
+
+from app.core.instrumentation import span
+from app.services.valuation_engine.common.financial_math import FinancialCalculator, ValidationLibrary
+
+if TYPE_CHECKING:
+    from app.services.valuation_engine.inputs import DCFInput
+
+
+def render_explanation(summary: Dict) -> str:
+    """단계별 평가 설명 텍스트 (verbose 실행 시 출력하던 내용)"""
+    return "\n".join([
+        "",
+        "[Step 1] 과거 재무제표 정규화...",
+        f"  - 평균 매출 성장률: {summary['avg_revenue_growth']:.2%}",
+        f"  - 평균 영업이익률: {summary['avg_operating_margin']:.2%}",
+        "",
+        "[Step 2] 재무제표 예측 (5년)...",
+        f"  - 예측 기간: {summary['first_year']} ~ {summary['last_year']}",
+        f"  - 최종 연도 FCF: {summary['last_fcf']:,.0f}",
+        "",
+        "[Step 3] WACC 계산...",
+        f"  - WACC: {summary['wacc']:.4f} ({summary['wacc']:.2%})",
+        f"  - 자기자본비용: {summary['cost_of_equity']:.2%}",
+        "",
+        "[Step 4] FCF 현재가치 할인...",
+        f"  - PV(FCF): {summary['total_pv_fcf']:,.0f}",
+        "",
+        "[Step 5] 영구가치 계산...",
+        f"  - 영구가치: {summary['terminal_value']:,.0f}",
+        f"  - PV(TV): {summary['pv_terminal_value']:,.0f}",
+        "",
+        "[Step 6] 기업가치 및 주당가치 산출...",
+        f"  - 기업가치: {summary['enterprise_value']:,.0f}",
+        f"  - 주주가치: {summary['equity_value']:,.0f}",
+        f"  - 주당가치: {summary['value_per_share']:,.0f}원",
+        f"  - 영구가치 비중: {summary['terminal_value_ratio']:.2%}",
+    ])
+
+
+class DCFResult:
+    """
+    DCF 평가 결과 (DCFEngine.evaluate)
+
+    연도별 예측값은 array('d')로, 나머지는 스칼라 슬롯으로 보관한다.
+    정규화 재무제표, 연도별 dict, 설명 텍스트는 보고서가 필요할 때(to_dict / explain)만 만든다.
+    입력(dict 또는 DCFInput)은 참조만 하므로 dict 입력은 결과를 쓰는 동안 변경하지 않는다.
+    """
+
+    __slots__ = (
+        'valuation_id', 'company_id', 'company_name', 'valuation_date', 'created_at',
+        'years', 'revenue', 'operating_income', 'nopat', 'depreciation', 'capex', 'wc_change', 'fcf',
+        'discount_factor', 'pv_fcf', 'operating_margin',
+        'wacc', 'cost_of_equity', 'terminal_growth', 'terminal_value', 'pv_terminal_value', 'total_pv_fcf',
+        'enterprise_value', 'net_debt', 'non_operating_assets', 'equity_value', 'shares_outstanding',
+        'value_per_share', 'terminal_value_ratio', 'tv_ratio_is_normal',
+        '_inputs', '_engine', '_normalized',
+    )
+
+    @property
+    def normalized(self) -> Dict:
+        """정규화된 과거 재무 데이터 (최초 접근 시 계산)"""
+        if self._normalized is None:
+            inputs = self._inputs
+            historical = inputs['historical_financials'] if isinstance(inputs, dict) else inputs.historical_dicts()
+            self._normalized = self._engine.normalize_financials(historical)
+        return self._normalized
+
+    def projections(self) -> List[Dict]:
+        """연도별 예측 재무제표 (project_financials 형식)"""
+        return [
+            {
+                'year': self.years[i],
+                'revenue': self.revenue[i],
+                'operating_income': self.operating_income[i],
+                'nopat': self.nopat[i],
+                'depreciation': self.depreciation[i],
+                'capex': self.capex[i],
+                'wc_change': self.wc_change[i],
+                'fcf': self.fcf[i],
+                'operating_margin': self.operating_margin,
+                'fcf_margin': self.fcf[i] / self.revenue[i]
+            }
+            for i in range(len(self.years))
+        ]
+
+    def summary(self) -> Dict:
+        """설명 텍스트에 쓰는 주요 수치"""
+        normalized = self.normalized
+        return {
+            'avg_revenue_growth': normalized['avg_revenue_growth'],
+            'avg_operating_margin': normalized['avg_operating_margin'],
+            'first_year': self.years[0],
+            'last_year': self.years[-1],
+            'last_fcf': self.fcf[-1],
+            'wacc': self.wacc,
+            'cost_of_equity': self.cost_of_equity,
+            'total_pv_fcf': self.total_pv_fcf,
+            'terminal_value': self.terminal_value,
+            'pv_terminal_value': self.pv_terminal_value,
+            'enterprise_value': self.enterprise_value,
+            'equity_value': self.equity_value,
+            'value_per_share': self.value_per_share,
+            'terminal_value_ratio': self.terminal_value_ratio,
+        }
+
+    def explain(self) -> str:
+        """단계별 평가 설명 텍스트"""
+        return render_explanation(self.summary())
+
+    def to_dict(self) -> Dict:
+        """run_valuation과 같은 형식의 전체 결과"""
+        inputs = self._inputs
+        wacc_inputs = inputs['wacc_inputs'] if isinstance(inputs, dict) else inputs.wacc_inputs.model_dump()
+        last_period = len(self.years)
+        return {
+            'valuation_id': self.valuation_id,
+            'company_id': self.company_id,
+            'company_name': self.company_name,
+            'valuation_date': self.valuation_date,
+            'normalized_financials': self.normalized,
+            'projections': self.projections(),
+            'wacc': {
+                'wacc': self.wacc,
+                'cost_of_equity': self.cost_of_equity,
+                'cost_of_debt': wacc_inputs['cost_of_debt'],
+                'after_tax_cost_of_debt': wacc_inputs['cost_of_debt'] * (1 - wacc_inputs['tax_rate']),
+                'equity_weight': 1 - wacc_inputs['debt_ratio'],
+                'debt_weight': wacc_inputs['debt_ratio'],
+                'components': wacc_inputs
+            },
+            'discounted_fcf': {
+                'total_pv_fcf': self.total_pv_fcf,
+                'pv_fcf_by_year': [
+                    {
+                        'year': self.years[i],
+                        'fcf': self.fcf[i],
+                        'discount_factor': self.discount_factor[i],
+                        'pv_fcf': self.pv_fcf[i]
+                    }
+                    for i in range(last_period)
+                ]
+            },
+            'terminal_value': {
+                'last_fcf': self.fcf[-1],
+                'terminal_growth': self.terminal_growth,
+                'fcf_next_year': self.fcf[-1] * (1 + self.terminal_growth),
+                'terminal_value': self.terminal_value,
+                'pv_terminal_value': self.pv_terminal_value,
+                'discount_factor': 1 / ((1 + self.wacc) ** last_period),
+                'capitalization_rate': self.wacc - self.terminal_growth
+            },
+            'valuation_result': {
+                'enterprise_value': self.enterprise_value,
+                'pv_fcf': self.total_pv_fcf,
+                'pv_terminal_value': self.pv_terminal_value,
+                'net_debt': self.net_debt,
+                'non_operating_assets': self.non_operating_assets,
+                'equity_value': self.equity_value,
+                'shares_outstanding': self.shares_outstanding,
+                'value_per_share': self.value_per_share,
+                'terminal_value_ratio': self.terminal_value_ratio,
+                'tv_ratio_is_normal': self.tv_ratio_is_normal
+            },
+            'created_at': datetime.fromtimestamp(self.created_at).isoformat()
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"DCFResult({self.valuation_id}, enterprise_value={self.enterprise_value:,.0f}, "
+            f"equity_value={self.equity_value:,.0f}, value_per_share={self.value_per_share:,.0f})"
+        )
 
 
 class DCFEngine:
     """DCF 평가 엔진 핵심 클래스"""
 
-    def __init__(self):
+    def __init__(self, verbose: bool = True):
+        """
+        Args:
+            verbose: run_valuation 실행 시 단계별 설명 출력 여부
+                     (일괄/시뮬레이션 실행은 False 또는 evaluate 사용)
+        """
         self.calc = FinancialCalculator()
         self.validator = ValidationLibrary()
+        self.verbose = verbose
 
     def normalize_financials(self, raw_financials: List[Dict]) -> Dict:
         """
@@ -350,60 +525,65 @@ class DCFEngine:
                 }
 
         Returns:
-            Dict: 전체 평가 결과
+            Dict: 전체 평가 결과 (verbose면 단계별 설명도 출력)
         """
         valuation_id = f"DCF_{inputs['company_id']}_{inputs['valuation_date'].replace('-', '')}"
 
         # Step 1: 과거 재무제표 정규화
-        print(f"\n[Step 1] 과거 재무제표 정규화...")
-        normalized = self.normalize_financials(inputs['historical_financials'])
-        print(f"  - 평균 매출 성장률: {normalized['avg_revenue_growth']:.2%}")
-        print(f"  - 평균 영업이익률: {normalized['avg_operating_margin']:.2%}")
+        with span("normalize", engine="dcf"):
+            normalized = self.normalize_financials(inputs['historical_financials'])
 
         # Step 2: 재무제표 예측
-        print(f"\n[Step 2] 재무제표 예측 (5년)...")
-        projections = self.project_financials(
-            normalized,
-            inputs['assumptions'],
-            periods=inputs.get('projection_period', 5)
-        )
-        print(f"  - 예측 기간: {projections[0]['year']} ~ {projections[-1]['year']}")
-        print(f"  - 최종 연도 FCF: {projections[-1]['fcf']:,.0f}")
+        with span("project", engine="dcf"):
+            projections = self.project_financials(
+                normalized,
+                inputs['assumptions'],
+                periods=inputs.get('projection_period', 5)
+            )
 
         # Step 3: WACC 계산
-        print(f"\n[Step 3] WACC 계산...")
-        wacc_result = self.calculate_wacc_detailed(inputs['wacc_inputs'])
-        print(f"  - WACC: {wacc_result['wacc']:.4f} ({wacc_result['wacc']:.2%})")
-        print(f"  - 자기자본비용: {wacc_result['cost_of_equity']:.2%}")
+        with span("wacc", engine="dcf"):
+            wacc_result = self.calculate_wacc_detailed(inputs['wacc_inputs'])
 
         # Step 4: FCF 할인
-        print(f"\n[Step 4] FCF 현재가치 할인...")
-        discounted = self.discount_cash_flows(projections, wacc_result['wacc'])
-        print(f"  - PV(FCF): {discounted['total_pv_fcf']:,.0f}")
+        with span("discount", engine="dcf"):
+            discounted = self.discount_cash_flows(projections, wacc_result['wacc'])
 
         # Step 5: 영구가치
-        print(f"\n[Step 5] 영구가치 계산...")
         terminal_growth = inputs['assumptions']['terminal_growth']
-        tv_result = self.calculate_terminal_value_detailed(
-            projections[-1]['fcf'],
-            terminal_growth,
-            wacc_result['wacc'],
-            len(projections)
-        )
-        print(f"  - 영구가치: {tv_result['terminal_value']:,.0f}")
-        print(f"  - PV(TV): {tv_result['pv_terminal_value']:,.0f}")
+        with span("terminal_value", engine="dcf"):
+            tv_result = self.calculate_terminal_value_detailed(
+                projections[-1]['fcf'],
+                terminal_growth,
+                wacc_result['wacc'],
+                len(projections)
+            )
 
         # Step 6: 기업가치 및 주당가치
-        print(f"\n[Step 6] 기업가치 및 주당가치 산출...")
-        equity_result = self.calculate_equity_value(
-            discounted['total_pv_fcf'],
-            tv_result['pv_terminal_value'],
-            inputs['adjustments']
-        )
-        print(f"  - 기업가치: {equity_result['enterprise_value']:,.0f}")
-        print(f"  - 주주가치: {equity_result['equity_value']:,.0f}")
-        print(f"  - 주당가치: {equity_result['value_per_share']:,.0f}원")
-        print(f"  - 영구가치 비중: {equity_result['terminal_value_ratio']:.2%}")
+        with span("equity", engine="dcf"):
+            equity_result = self.calculate_equity_value(
+                discounted['total_pv_fcf'],
+                tv_result['pv_terminal_value'],
+                inputs['adjustments']
+            )
+
+        if self.verbose:
+            print(render_explanation({
+                'avg_revenue_growth': normalized['avg_revenue_growth'],
+                'avg_operating_margin': normalized['avg_operating_margin'],
+                'first_year': projections[0]['year'],
+                'last_year': projections[-1]['year'],
+                'last_fcf': projections[-1]['fcf'],
+                'wacc': wacc_result['wacc'],
+                'cost_of_equity': wacc_result['cost_of_equity'],
+                'total_pv_fcf': discounted['total_pv_fcf'],
+                'terminal_value': tv_result['terminal_value'],
+                'pv_terminal_value': tv_result['pv_terminal_value'],
+                'enterprise_value': equity_result['enterprise_value'],
+                'equity_value': equity_result['equity_value'],
+                'value_per_share': equity_result['value_per_share'],
+                'terminal_value_ratio': equity_result['terminal_value_ratio'],
+            }))
 
         # 최종 결과
         return {
@@ -421,6 +601,188 @@ class DCFEngine:
         }
 
 
+    def evaluate(self, inputs: Union[Dict, 'DCFInput']) -> DCFResult:
+        """
+        DCF 평가 (조용한 실행 - 출력 없음, 압축 결과)
+
+        run_valuation과 같은 계산을 연도별 dict / 설명 문자열 없이 수행한다.
+        일괄 평가·시뮬레이션처럼 최종 수치만 필요한 경우에 사용하고,
+        보고서가 필요하면 결과의 to_dict() / explain()을 호출한다.
+
+        Args:
+            inputs: run_valuation과 같은 입력 dict 또는 검증된 DCFInput
+                    (DCFInput은 기본값이 채워져 있어 속성을 바로 읽는다)
+
+        Returns:
+            DCFResult
+        """
+        with span("evaluate", engine="dcf"):
+            return self._evaluate(inputs)
+
+    def evaluate_many(self, inputs_list: Sequence[Union[Dict, 'DCFInput']]) -> List[DCFResult]:
+        """여러 건 일괄 평가 (evaluate 반복)"""
+        with span("evaluate_many", engine="dcf"):
+            return [self._evaluate(inputs) for inputs in inputs_list]
+
+    def evaluate_input(self, inputs: 'DCFInput') -> DCFResult:
+        """검증된 DCFInput으로 evaluate (다른 엔진의 evaluate_input과 같은 이름)"""
+        return self.evaluate(inputs)
+
+    def _evaluate(self, inputs: Union[Dict, 'DCFInput']) -> DCFResult:
+        result = DCFResult()
+        result._inputs = inputs
+        result._engine = self
+        result._normalized = None
+        result.created_at = time.time()
+
+        if isinstance(inputs, dict):
+            result.company_id = inputs['company_id']
+            result.company_name = inputs.get('company_name', '')
+            result.valuation_date = inputs['valuation_date']
+            assumptions = inputs['assumptions']
+            last_revenue = inputs['historical_financials'][-1]['revenue']
+            target_margin = assumptions.get('target_operating_margin')
+            tax_rate = assumptions.get('tax_rate', 0.25)
+            depreciation_rate = assumptions.get('depreciation_rate', 0.03)
+            capex_rate = assumptions.get('capex_rate', 0.05)
+            wc_rate = assumptions.get('wc_rate', 0.10)
+            revenue_growth = assumptions['revenue_growth']
+            base_year = assumptions['base_year']
+            terminal_growth = assumptions['terminal_growth']
+            periods = inputs.get('projection_period', 5)
+            wacc_inputs = inputs['wacc_inputs']
+            risk_free_rate = wacc_inputs['risk_free_rate']
+            beta = wacc_inputs['beta']
+            market_premium = wacc_inputs['market_premium']
+            cost_of_debt = wacc_inputs['cost_of_debt']
+            debt_ratio = wacc_inputs['debt_ratio']
+            wacc_tax_rate = wacc_inputs['tax_rate']
+            adjustments = inputs['adjustments']
+            total_debt = adjustments.get('total_debt', 0)
+            cash = adjustments.get('cash', 0)
+            non_operating_assets = adjustments.get('non_operating_assets', 0)
+            shares = adjustments['shares_outstanding']
+        else:
+            # DCFInput - 검증 시 기본값이 채워져 있으므로 속성을 그대로 읽는다
+            result.company_id = inputs.company_id
+            result.company_name = inputs.company_name
+            result.valuation_date = inputs.valuation_date
+            assumptions = inputs.assumptions
+            last_revenue = inputs.historical_financials[-1].revenue
+            target_margin = assumptions.target_operating_margin
+            tax_rate = assumptions.tax_rate
+            depreciation_rate = assumptions.depreciation_rate
+            capex_rate = assumptions.capex_rate
+            wc_rate = assumptions.wc_rate
+            revenue_growth = assumptions.revenue_growth
+            base_year = assumptions.base_year
+            terminal_growth = assumptions.terminal_growth
+            periods = inputs.projection_period
+            wacc_inputs = inputs.wacc_inputs
+            risk_free_rate = wacc_inputs.risk_free_rate
+            beta = wacc_inputs.beta
+            market_premium = wacc_inputs.market_premium
+            cost_of_debt = wacc_inputs.cost_of_debt
+            debt_ratio = wacc_inputs.debt_ratio
+            wacc_tax_rate = wacc_inputs.tax_rate
+            adjustments = inputs.adjustments
+            total_debt = adjustments.total_debt
+            cash = adjustments.cash
+            non_operating_assets = adjustments.non_operating_assets
+            shares = adjustments.shares_outstanding
+
+        result.valuation_id = f"DCF_{result.company_id}_{result.valuation_date.replace('-', '')}"
+
+        # Step 1~2: 마지막 연도 매출 기준 예측 (정규화 평균은 목표 마진이 없을 때만 필요)
+        if target_margin is None:
+            target_margin = result.normalized['avg_operating_margin']
+
+        # Step 3: WACC
+        result.cost_of_equity = risk_free_rate + beta * market_premium
+        wacc = self.calc.wacc(
+            risk_free_rate=risk_free_rate,
+            beta=beta,
+            market_premium=market_premium,
+            cost_of_debt=cost_of_debt,
+            debt_ratio=debt_ratio,
+            tax_rate=wacc_tax_rate
+        )
+        result.wacc = wacc
+
+        # Step 2 + 4: 연도별 예측과 할인을 한 번에
+        years = array('i')
+        revenues = array('d')
+        operating_incomes = array('d')
+        nopats = array('d')
+        depreciations = array('d')
+        capexes = array('d')
+        wc_changes = array('d')
+        fcfs = array('d')
+        discount_factors = array('d')
+        pv_fcfs = array('d')
+        total_pv_fcf = 0
+
+        for t in range(1, periods + 1):
+            revenue = last_revenue * (1 + revenue_growth[t - 1])
+            operating_income = revenue * target_margin
+            nopat = operating_income * (1 - tax_rate)
+            depreciation = revenue * depreciation_rate
+            capex = revenue * capex_rate
+            wc_change = (revenue - last_revenue) * wc_rate
+            fcf = nopat + depreciation - capex - wc_change
+            discount_factor = 1 / ((1 + wacc) ** t)
+            pv_fcf = fcf * discount_factor
+
+            years.append(base_year + t)
+            revenues.append(revenue)
+            operating_incomes.append(operating_income)
+            nopats.append(nopat)
+            depreciations.append(depreciation)
+            capexes.append(capex)
+            wc_changes.append(wc_change)
+            fcfs.append(fcf)
+            discount_factors.append(discount_factor)
+            pv_fcfs.append(pv_fcf)
+            total_pv_fcf += pv_fcf
+            last_revenue = revenue
+
+        result.years = years
+        result.revenue = revenues
+        result.operating_income = operating_incomes
+        result.nopat = nopats
+        result.depreciation = depreciations
+        result.capex = capexes
+        result.wc_change = wc_changes
+        result.fcf = fcfs
+        result.discount_factor = discount_factors
+        result.pv_fcf = pv_fcfs
+        result.operating_margin = target_margin
+        result.total_pv_fcf = total_pv_fcf
+
+        # Step 5: 영구가치
+        terminal_value = self.calc.terminal_value(fcfs[-1], terminal_growth, wacc)
+        pv_terminal_value = self.calc.pv_terminal_value(terminal_value, wacc, periods)
+        result.terminal_growth = terminal_growth
+        result.terminal_value = terminal_value
+        result.pv_terminal_value = pv_terminal_value
+
+        # Step 6: 기업가치 / 주주가치 / 주당가치
+        enterprise_value = total_pv_fcf + pv_terminal_value
+        net_debt = total_debt - cash
+        equity_value = enterprise_value - net_debt + non_operating_assets
+
+        result.enterprise_value = enterprise_value
+        result.net_debt = net_debt
+        result.non_operating_assets = non_operating_assets
+        result.equity_value = equity_value
+        result.shares_outstanding = shares
+        result.value_per_share = (equity_value * 1_000_000) / shares  # 백만원 → 원
+        result.terminal_value_ratio, result.tv_ratio_is_normal = \
+            self.validator.sanity_check_terminal_value_ratio(total_pv_fcf, pv_terminal_value)
+
+        return result
+
+
 # 테스트 케이스
 if __name__ == "__main__":
     print("=" * 80)
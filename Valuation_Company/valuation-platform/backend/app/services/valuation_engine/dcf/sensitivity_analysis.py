@@ -7,12 +7,9 @@ Author: Valuation Engine Team
 Date: 2025-10-17
 """
 
-import sys
-sys.path.append('..')
-
 from typing import List, Dict, Tuple
 import numpy as np
-from common.financial_math import FinancialCalculator
+from app.services.valuation_engine.common.financial_math import FinancialCalculator
 
 
 class SensitivityAnalyzer:
@@ -0,0 +1,447 @@
+"""
+5가지 평가법 입력 모델 (Pydantic v2)
+
+서비스/라우터에서 받은 원본 dict를 한 번에 검증·정규화해 변경 불가(frozen) 모델로 만든다.
+엔진은 이 모델의 속성을 바로 읽으므로 `.get(key, default)` 체인을 반복하지 않는다.
+기본값은 기존 엔진의 `.get()` 기본값과 같다.
+
+Usage:
+    from app.services.valuation_engine.inputs import DCFInput, InputValidationError, parse_input
+
+    try:
+        typed = parse_input('dcf', raw_dict)
+    except InputValidationError as e:
+        e.errors  # [{'loc': 'historical_financials[2].revenue', 'msg': ..., 'type': ...}, ...]
+    result = create_engine('dcf', verbose=False).evaluate(typed)
+"""
+from datetime import date, datetime
+from typing import Annotated, Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, ValidationError, ValidationInfo, field_validator
+
+
+class InputValidationError(ValueError):
+    """입력 검증 실패 (errors: 필드 경로별 오류 목록)"""
+
+    def __init__(self, errors: List[Dict[str, str]]):
+        self.errors = errors
+        super().__init__(format_errors(errors))
+
+    @classmethod
+    def from_pydantic(cls, exc: ValidationError) -> "InputValidationError":
+        return cls([
+            {
+                'loc': field_path(error['loc']),
+                'msg': _clean_message(error),
+                'type': error['type'],
+            }
+            for error in exc.errors(include_url=False)
+        ])
+
+    def first_message(self) -> str:
+        """서비스 응답용 한 줄 메시지 (첫 번째 오류)"""
+        return format_error(self.errors[0])
+
+
+def field_path(loc: Tuple) -> str:
+    """('historical_financials', 2, 'revenue') → 'historical_financials[2].revenue'"""
+    path = ''
+    for part in loc:
+        if isinstance(part, int):
+            path += f'[{part}]'
+        else:
+            path += f'.{part}' if path else str(part)
+    return path
+
+
+def _clean_message(error: Dict[str, Any]) -> str:
+    # field_validator에서 올린 ValueError는 "Value error, " 접두어가 붙는다
+    if error['type'] == 'value_error':
+        return str(error['ctx']['error'])
+    return error['msg']
+
+
+def format_error(error: Dict[str, str]) -> str:
+    if error['type'] == 'missing':
+        return f"필수 필드 누락: {error['loc']}"
+    if not error['loc']:
+        return error['msg']
+    return f"{error['loc']}: {error['msg']}"
+
+
+def format_errors(errors: List[Dict[str, str]]) -> str:
+    return '; '.join(format_error(error) for error in errors)
+
+
+class _Frozen(BaseModel):
+    """공통 설정 - 변경 불가, 모르는 키는 무시, 숫자 ID(company_id=123)는 문자열로 (기존 dict 입력과 호환)"""
+    model_config = ConfigDict(frozen=True, extra='ignore', coerce_numbers_to_str=True)
+
+
+def _isoformat_date(value: Any) -> Any:
+    # 기존 엔진은 date / datetime 평가기준일도 받았으므로 'YYYY-MM-DD' 문자열로 맞춘다
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+# 평가기준일 ('2025-12-31' / date / datetime → 'YYYY-MM-DD')
+DateString = Annotated[str, BeforeValidator(_isoformat_date)]
+
+
+# ---------------------------------------------------------------------------
+# 1. DCF평가법
+# ---------------------------------------------------------------------------
+
+class HistoricalFinancials(_Frozen):
+    """과거 연도 재무제표 (normalize_financials 입력 1건)"""
+    year: int
+    revenue: float = Field(ge=0)
+    operating_income: float
+    net_income: float = 0
+    depreciation: float = 0
+    capex: float = 0
+    working_capital_change: float = 0
+    tax_rate: float = Field(0.25, ge=0, le=1)
+    one_time_items: Tuple[float, ...] = ()
+
+
+class DCFAssumptions(_Frozen):
+    """예측 가정"""
+    base_year: int
+    revenue_growth: Tuple[float, ...] = Field(min_length=1)
+    target_operating_margin: Optional[float] = None  # 없으면 과거 평균 영업이익률
+    tax_rate: float = Field(0.25, ge=0, le=1)
+    depreciation_rate: float = Field(0.03, ge=0)
+    capex_rate: float = Field(0.05, ge=0)
+    wc_rate: float = Field(0.10, ge=0)
+    terminal_growth: float
+
+
+class WACCInputs(_Frozen):
+    """WACC 계산 입력"""
+    risk_free_rate: float
+    beta: float
+    market_premium: float
+    cost_of_debt: float = Field(ge=0)
+    debt_ratio: float = Field(ge=0, le=1)
+    tax_rate: float = Field(ge=0, le=1)
+
+
+class DCFAdjustments(_Frozen):
+    """기업가치 → 주주가치 조정"""
+    cash: float = 0
+    total_debt: float = 0
+    non_operating_assets: float = 0
+    shares_outstanding: float = Field(gt=0)
+
+
+class DCFInput(_Frozen):
+    """DCFEngine.evaluate / DCFService 입력"""
+    company_id: str = Field(min_length=1)
+    company_name: str = ''
+    valuation_date: DateString = Field(pattern=r'^\d{4}-\d{2}-\d{2}$')
+    historical_financials: Tuple[HistoricalFinancials, ...]
+    projection_period: int = Field(5, ge=1, le=30)  # assumptions 검증에서 참조하므로 먼저 선언
+    assumptions: DCFAssumptions
+    wacc_inputs: WACCInputs
+    adjustments: DCFAdjustments
+
+    @field_validator('historical_financials')
+    @classmethod
+    def _at_least_three_years(cls, value):
+        if len(value) < 3:
+            raise ValueError("과거 재무제표는 최소 3년 이상 필요합니다.")
+        return value
+
+    @field_validator('assumptions')
+    @classmethod
+    def _growth_covers_projection(cls, value: DCFAssumptions, info: ValidationInfo):
+        periods = info.data.get('projection_period')
+        if periods is not None and len(value.revenue_growth) < periods:
+            raise ValueError(
+                f"revenue_growth는 예측 기간({periods}년) 이상 필요합니다 (현재 {len(value.revenue_growth)}개)."
+            )
+        return value
+
+    def historical_dicts(self) -> List[Dict]:
+        """normalize_financials용 dict 목록 (보고서 생성 시에만 사용)"""
+        return [year.model_dump() for year in self.historical_financials]
+
+
+# ---------------------------------------------------------------------------
+# 2. 상대가치평가법
+# ---------------------------------------------------------------------------
+
+class RelativeCompanyData(_Frozen):
+    """대상 기업 재무 데이터"""
+    shares_outstanding: float = Field(gt=0)
+    net_income: float = 0
+    book_value: float
+    revenue: float
+    ebitda: float = 0
+    roe: float = 0
+    growth_rate_3yr: float = 0
+    industry: str = ''
+    total_debt: float = 0
+    cash: float = 0
+
+
+class ComparableCompany(_Frozen):
+    """비교기업 배수 (없는 배수는 None)"""
+    name: Optional[str] = None
+    per: Optional[float] = None
+    pbr: Optional[float] = None
+    psr: Optional[float] = None
+    ev_ebitda: Optional[float] = None
+
+
+class IndustryBenchmarks(_Frozen):
+    """업종 평균/중앙값 배수"""
+    avg_per: Optional[float] = None
+    median_per: Optional[float] = None
+    avg_pbr: Optional[float] = None
+    median_pbr: Optional[float] = None
+    avg_psr: Optional[float] = None
+    median_psr: Optional[float] = None
+    avg_ev_ebitda: Optional[float] = None
+    median_ev_ebitda: Optional[float] = None
+
+
+class RelativeInput(_Frozen):
+    """RelativeValuationEngine.run_valuation 입력"""
+    company_data: RelativeCompanyData
+    comparable_companies: Optional[Tuple[ComparableCompany, ...]] = None
+    industry_benchmarks: Optional[IndustryBenchmarks] = None
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        """run_valuation 인자 (비교기업/업종 배수는 값이 있는 키만 - 엔진의 `in`/get 판정 유지)"""
+        return {
+            'company_data': self.company_data.model_dump(),
+            'comparable_companies': None if self.comparable_companies is None else [
+                company.model_dump(exclude_none=True) for company in self.comparable_companies
+            ],
+            'industry_benchmarks': None if self.industry_benchmarks is None
+            else self.industry_benchmarks.model_dump(exclude_none=True),
+        }
+
+
+# ---------------------------------------------------------------------------
+# 3. 본질가치평가법 (자본시장법)
+# ---------------------------------------------------------------------------
+
+class IntrinsicInput(_Frozen):
+    """CapitalMarketLawEngine 입력 (백만원)"""
+    asset_value: float
+    income_value: float
+    purpose: str = '합병'
+
+
+# ---------------------------------------------------------------------------
+# 4. 자산가치평가법 (NAV)
+# ---------------------------------------------------------------------------
+
+class BalanceSheet(_Frozen):
+    """재무상태표 (백만원)"""
+    total_assets: float = 0
+    total_liabilities: float = 0
+    shares_outstanding: float = Field(1_000_000, gt=0)
+    cash: float = 0
+    short_term_investments: float = 0
+    accounts_receivable: float = 0
+    inventory: float = 0
+    land: float = 0
+    building: float = 0
+    machinery: float = 0
+    goodwill: float = 0
+    patents: float = 0
+    listed_stocks: float = 0
+    unlisted_stocks: float = 0
+    current_liabilities: float = 0
+    long_term_debt: float = 0
+    debt_interest_rate: float = Field(0.05, ge=0)
+
+
+class FairValueData(_Frozen):
+    """공정가치 조정 데이터 (감정평가서 등, 없는 항목은 장부가 기준)"""
+    bad_debt_rate: float = Field(0.02, ge=0, le=1)
+    inventory_markdown: float = Field(0.05, ge=0, le=1)
+    machinery_depreciation: float = Field(0.20, ge=0, le=1)
+    goodwill_impairment: float = Field(0, ge=0, le=1)
+    contingent_liabilities: float = 0
+    land_appraisal: Optional[float] = None
+    building_appraisal: Optional[float] = None
+    patents_valuation: Optional[float] = None
+    listed_stocks_market_value: Optional[float] = None
+    unlisted_stocks_valuation: Optional[float] = None
+    market_interest_rate: Optional[float] = None
+
+
+class AssetInput(_Frozen):
+    """AssetValuationEngine.run_valuation 입력"""
+    balance_sheet: BalanceSheet
+    fair_value_data: Optional[FairValueData] = None
+
+    def engine_kwargs(self) -> Dict[str, Any]:
+        return {
+            'balance_sheet': self.balance_sheet.model_dump(),
+            'fair_value_data': None if self.fair_value_data is None
+            else self.fair_value_data.model_dump(exclude_none=True),
+        }
+
+
+# ---------------------------------------------------------------------------
+# 5. 상증세법평가법
+# ---------------------------------------------------------------------------
+
+class InheritanceTaxInput(_Frozen):
+    """InheritanceTaxLawEngine 입력 (백만원)"""
+    net_income_3yr: float
+    net_assets: float
+    controlling_premium: bool = False
+    minority_discount: float = Field(0.0, ge=0, lt=1)
+    marketability_discount: float = Field(0.0, ge=0, lt=1)
+
+
+# ---------------------------------------------------------------------------
+# 서비스 요청 모델 (services/*_service.validate_inputs)
+# 엔진 입력과 모양이 다른 서비스 요청 - 필수 필드/형식만 검증하고 오류 메시지는 기존 문구를 유지
+# ---------------------------------------------------------------------------
+
+class ValuationRequest(_Frozen):
+    """평가 서비스 공통 요청 필드"""
+    company_id: str
+    company_name: str
+    valuation_date: DateString
+
+
+class RelativeRequest(ValuationRequest):
+    """RelativeService 요청"""
+    financial_data: Dict[str, Any]
+    comparable_companies: Tuple[Dict[str, Any], ...]
+    multiples: Any
+
+    @field_validator('comparable_companies', mode='before')
+    @classmethod
+    def _at_least_three_comparables(cls, value):
+        if not isinstance(value, list) or len(value) < 3:
+            raise ValueError("비교 대상 기업은 최소 3개 이상 필요합니다.")
+        return value
+
+
+class IntrinsicRequest(ValuationRequest):
+    """IntrinsicService 요청"""
+    transaction_type: str
+    shares_outstanding: float
+    net_asset_value: float
+    earning_power_value: float
+
+    @field_validator('transaction_type')
+    @classmethod
+    def _known_transaction_type(cls, value):
+        if value not in ('merger', 'acquisition', 'capital_increase', 'stock_exchange'):
+            raise ValueError(f"유효하지 않은 거래 유형: {value}")
+        return value
+
+
+class AssetRequest(ValuationRequest):
+    """AssetService 요청"""
+    assets: Dict[str, Any]
+    liabilities: Dict[str, Any]
+
+    @field_validator('assets', 'liabilities', mode='before')
+    @classmethod
+    def _must_be_dict(cls, value, info: ValidationInfo):
+        if not isinstance(value, dict):
+            label = '자산' if info.field_name == 'assets' else '부채'
+            raise ValueError(f"{label} 데이터는 딕셔너리 형태여야 합니다.")
+        return value
+
+
+class TaxRequest(ValuationRequest):
+    """TaxService 요청"""
+    company_type: str
+    net_asset_value: float
+    earnings: Tuple[float, ...]
+    weighted_average_per: float
+
+    @field_validator('company_type')
+    @classmethod
+    def _listed_or_unlisted(cls, value):
+        if value not in ('listed', 'unlisted'):
+            raise ValueError("회사 유형은 'listed' 또는 'unlisted'여야 합니다.")
+        return value
+
+    @field_validator('earnings', mode='before')
+    @classmethod
+    def _three_years(cls, value):
+        if not isinstance(value, list) or len(value) < 3:
+            raise ValueError("최근 3년 순손익 데이터가 필요합니다.")
+        return value
+
+
+# 평가 방법 → 입력 모델 (ENGINE_REGISTRY와 같은 키)
+INPUT_MODELS: Dict[str, Type[BaseModel]] = {
+    'dcf': DCFInput,
+    'relative': RelativeInput,
+    'intrinsic': IntrinsicInput,
+    'asset': AssetInput,
+    'inheritance_tax': InheritanceTaxInput,
+}
+
+
+def validate_model(model: Type[BaseModel], data: Any) -> BaseModel:
+    """model.model_validate + 오류를 InputValidationError(필드 경로)로 변환"""
+    if isinstance(data, model):
+        return data
+    try:
+        return model.model_validate(data)
+    except ValidationError as e:
+        raise InputValidationError.from_pydantic(e) from None
+
+
+def parse_input(method: str, data: Any) -> BaseModel:
+    """
+    평가 방법별 원본 입력 → 입력 모델
+
+    Raises:
+        ValueError: 등록되지 않은 평가 방법
+        InputValidationError: 입력 검증 실패
+    """
+    from app.services.valuation_engine import ENGINE_ALIASES
+
+    model = INPUT_MODELS.get(ENGINE_ALIASES.get(method, method))
+    if model is None:
+        raise ValueError(f"Unknown valuation method: {method}")
+    return validate_model(model, data)
+
+
+__all__ = [
+    "InputValidationError",
+    "field_path",
+    "format_errors",
+    "HistoricalFinancials",
+    "DCFAssumptions",
+    "WACCInputs",
+    "DCFAdjustments",
+    "DCFInput",
+    "RelativeCompanyData",
+    "ComparableCompany",
+    "IndustryBenchmarks",
+    "RelativeInput",
+    "IntrinsicInput",
+    "BalanceSheet",
+    "FairValueData",
+    "AssetInput",
+    "InheritanceTaxInput",
+    "ValuationRequest",
+    "RelativeRequest",
+    "IntrinsicRequest",
+    "AssetRequest",
+    "TaxRequest",
+    "INPUT_MODELS",
+    "validate_model",
+    "parse_input",
+]
@@ -0,0 +1 @@
+# Capital Market Law (Intrinsic Value) Engine module
@@ -7,7 +7,48 @@
 핵심 질문: "기업의 본질적인 가치는 얼마인가?"
 """
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from app.services.valuation_engine.inputs import IntrinsicInput
+
+
+class CMLResult:
+    """자본시장법 평가 결과 (평가액과 입력값만 보관, 산식/내역은 to_dict에서 생성)"""
+
+    __slots__ = ('cml_value', 'asset_value', 'income_value', 'purpose')
+
+    ASSET_WEIGHT = 1.0
+    INCOME_WEIGHT = 1.5
+    DIVISOR = 2.5
+    LEGAL_BASIS = '자본시장과 금융투자업에 관한 법률 시행령 제176조의5'
+
+    def formula(self) -> str:
+        return (
+            f'({self.asset_value:,.0f} × {self.ASSET_WEIGHT} + '
+            f'{self.income_value:,.0f} × {self.INCOME_WEIGHT}) ÷ {self.DIVISOR}'
+        )
+
+    def to_dict(self) -> Dict:
+        """run_valuation 형식의 결과"""
+        asset_weighted = self.asset_value * self.ASSET_WEIGHT
+        income_weighted = self.income_value * self.INCOME_WEIGHT
+        return {
+            'cml_value': round(self.cml_value, 0),
+            'asset_value': round(self.asset_value, 0),
+            'income_value': round(self.income_value, 0),
+            'asset_weight': self.ASSET_WEIGHT,
+            'income_weight': self.INCOME_WEIGHT,
+            'divisor': self.DIVISOR,
+            'purpose': self.purpose,
+            'legal_basis': self.LEGAL_BASIS,
+            'formula': self.formula(),
+            'calculation_breakdown': {
+                'asset_weighted': round(asset_weighted, 0),
+                'income_weighted': round(income_weighted, 0),
+                'sum': round(asset_weighted + income_weighted, 0)
+            }
+        }
 
 
 class CapitalMarketLawEngine:
@@ -45,29 +86,27 @@ class CapitalMarketLawEngine:
             }
         """
 
-        # 1. 자본시장법 평가액 계산
-        asset_weight = 1.0
-        income_weight = 1.5
-        divisor = 2.5
+        return self.evaluate(asset_value, income_value, purpose).to_dict()
 
-        cml_value = (asset_value * asset_weight + income_value * income_weight) / divisor
+    def evaluate(self, asset_value: float, income_value: float, purpose: str = '합병') -> 'CMLResult':
+        """
+        자본시장법 평가 (조용한 실행 - 산식 문자열 등은 to_dict() 호출 시 생성)
 
-        return {
-            'cml_value': round(cml_value, 0),
-            'asset_value': round(asset_value, 0),
-            'income_value': round(income_value, 0),
-            'asset_weight': asset_weight,
-            'income_weight': income_weight,
-            'divisor': divisor,
-            'purpose': purpose,
-            'legal_basis': '자본시장과 금융투자업에 관한 법률 시행령 제176조의5',
-            'formula': f'({asset_value:,.0f} × {asset_weight} + {income_value:,.0f} × {income_weight}) ÷ {divisor}',
-            'calculation_breakdown': {
-                'asset_weighted': round(asset_value * asset_weight, 0),
-                'income_weighted': round(income_value * income_weight, 0),
-                'sum': round(asset_value * asset_weight + income_value * income_weight, 0)
-            }
-        }
+        Returns:
+            CMLResult
+        """
+        result = CMLResult()
+        result.asset_value = asset_value
+        result.income_value = income_value
+        result.purpose = purpose
+        result.cml_value = (
+            asset_value * CMLResult.ASSET_WEIGHT + income_value * CMLResult.INCOME_WEIGHT
+        ) / CMLResult.DIVISOR
+        return result
+
+    def evaluate_input(self, inputs: 'IntrinsicInput') -> 'CMLResult':
+        """검증된 IntrinsicInput으로 evaluate"""
+        return self.evaluate(inputs.asset_value, inputs.income_value, inputs.purpose)
 
     def calculate_income_value_method1(self, net_income_3yr_avg: float) -> float:
         """
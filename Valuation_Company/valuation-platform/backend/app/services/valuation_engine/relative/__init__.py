@@ -0,0 +1 @@
+# Relative Valuation Engine module
@@ -6,10 +6,13 @@ Market Approach - PER, PBR, PSR, EV/EBITDA
 핵심 질문: "시장은 유사 기업을 얼마라고 평가할까?"
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import statistics
 
+if TYPE_CHECKING:
+    from app.services.valuation_engine.inputs import RelativeInput
+
 
 @dataclass
 class ValuationResult:
@@ -78,6 +81,10 @@ class RelativeValuationEngine:
 
         return results
 
+    def evaluate_input(self, inputs: 'RelativeInput') -> Dict:
+        """검증된 RelativeInput으로 run_valuation (배수별 계산이 dict 기반이라 dict로 풀어서 전달)"""
+        return self.run_valuation(**inputs.engine_kwargs())
+
     # ==================== PER 평가 ====================
 
     def calculate_per_valuation(self,
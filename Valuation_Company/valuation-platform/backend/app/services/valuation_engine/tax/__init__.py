@@ -0,0 +1 @@
+# Inheritance Tax Law Engine module
@@ -6,7 +6,66 @@
 핵심 질문: "상속세 및 증여세법상 평가액은?"
 """
 
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from app.services.valuation_engine.inputs import InheritanceTaxInput
+
+
+class TaxLawResult:
+    """상증세법 평가 결과 (수치만 보관, 할증/할인 내역과 산식은 to_dict에서 생성)"""
+
+    __slots__ = (
+        'final_value', 'income_value', 'asset_value', 'base_value', 'avg_net_income',
+        'controlling_premium', 'minority_discount', 'marketability_discount',
+    )
+
+    CONTROLLING_PREMIUM_RATE = 0.20
+    LEGAL_BASIS = '상속세 및 증여세법 시행령 제54조'
+
+    def adjustments(self) -> List[Dict]:
+        """할증/할인 내역"""
+        adjustments = []
+        if self.controlling_premium:
+            adjustments.append({
+                'type': '지배주주 할증',
+                'rate': self.CONTROLLING_PREMIUM_RATE,
+                'amount': self.base_value * self.CONTROLLING_PREMIUM_RATE,
+                'reason': '상증세법 시행령 제54조 - 지배주주 20% 할증'
+            })
+        elif self.minority_discount:
+            adjustments.append({
+                'type': '소액주주 할인',
+                'rate': -self.minority_discount,
+                'amount': -(self.base_value * self.minority_discount),
+                'reason': f'소액주주 {self.minority_discount:.0%} 할인'
+            })
+
+        if self.marketability_discount:
+            adjustments.append({
+                'type': '유동성 할인',
+                'rate': -self.marketability_discount,
+                'amount': -(self.base_value * self.marketability_discount),
+                'reason': f'비상장 주식 유동성 할인 {self.marketability_discount:.0%}'
+            })
+        return adjustments
+
+    def formula(self) -> str:
+        return f'({self.income_value:,.0f} × 3 + {self.asset_value:,.0f} × 2) ÷ 5'
+
+    def to_dict(self) -> Dict:
+        """run_valuation 형식의 결과"""
+        return {
+            'itl_value': round(self.final_value, 0),
+            'income_value': round(self.income_value, 0),
+            'asset_value': round(self.asset_value, 0),
+            'base_value': round(self.base_value, 0),
+            'avg_net_income': round(self.avg_net_income, 0),
+            'adjustments': self.adjustments(),
+            'total_adjustment': round(self.final_value - self.base_value, 0),
+            'legal_basis': self.LEGAL_BASIS,
+            'formula': self.formula()
+        }
 
 
 class InheritanceTaxLawEngine:
@@ -45,66 +104,58 @@ class InheritanceTaxLawEngine:
             }
         """
 
-        # 1. 순손익가치 계산
-        # 순손익가치 = (최근 3년 순손익 합계 / 3) × 3 / 0.10
-        # = 평균 순손익 × 30
-        avg_net_income = net_income_3yr / 3
-        income_value = avg_net_income * 3 / 0.10  # 할인율 10% 적용
+        return self.evaluate(
+            net_income_3yr, net_assets, controlling_premium, minority_discount, marketability_discount
+        ).to_dict()
+
+    def evaluate(self,
+                 net_income_3yr: float,
+                 net_assets: float,
+                 controlling_premium: bool = False,
+                 minority_discount: float = 0.0,
+                 marketability_discount: float = 0.0) -> 'TaxLawResult':
+        """
+        상증세법 평가 (조용한 실행 - 할증/할인 내역·산식 문자열은 to_dict() 호출 시 생성)
+
+        Returns:
+            TaxLawResult
+        """
+        result = TaxLawResult()
+
+        # 1. 순손익가치 = 평균 순손익 × 3 / 0.10 (할인율 10%)
+        result.avg_net_income = net_income_3yr / 3
+        result.income_value = result.avg_net_income * 3 / 0.10
 
         # 2. 순자산가치
-        asset_value = net_assets
+        result.asset_value = net_assets
 
         # 3. 가중평균 (순손익가치 × 3, 순자산가치 × 2)
-        base_value = (income_value * 3 + asset_value * 2) / 5
+        base_value = (result.income_value * 3 + result.asset_value * 2) / 5
+        result.base_value = base_value
 
-        # 4. 할증/할인 적용
-        adjustments = []
+        # 4. 할증/할인 (지배주주 할증 20% / 소액주주 할인, 비상장 유동성 할인)
         final_value = base_value
-
+        result.controlling_premium = controlling_premium
+        result.minority_discount = 0.0
         if controlling_premium:
-            # 지배주주 할증 20%
-            premium = base_value * 0.20
-            final_value += premium
-            adjustments.append({
-                'type': '지배주주 할증',
-                'rate': 0.20,
-                'amount': premium,
-                'reason': '상증세법 시행령 제54조 - 지배주주 20% 할증'
-            })
-        else:
-            # 소액주주 할인
-            if minority_discount > 0:
-                discount_amount = base_value * minority_discount
-                final_value -= discount_amount
-                adjustments.append({
-                    'type': '소액주주 할인',
-                    'rate': -minority_discount,
-                    'amount': -discount_amount,
-                    'reason': f'소액주주 {minority_discount:.0%} 할인'
-                })
-
-        # 유동성 할인 (비상장)
-        if marketability_discount > 0:
-            discount_amount = base_value * marketability_discount
-            final_value -= discount_amount
-            adjustments.append({
-                'type': '유동성 할인',
-                'rate': -marketability_discount,
-                'amount': -discount_amount,
-                'reason': f'비상장 주식 유동성 할인 {marketability_discount:.0%}'
-            })
-
-        return {
-            'itl_value': round(final_value, 0),
-            'income_value': round(income_value, 0),
-            'asset_value': round(asset_value, 0),
-            'base_value': round(base_value, 0),
-            'avg_net_income': round(avg_net_income, 0),
-            'adjustments': adjustments,
-            'total_adjustment': round(final_value - base_value, 0),
-            'legal_basis': '상속세 및 증여세법 시행령 제54조',
-            'formula': f'({income_value:,.0f} × 3 + {asset_value:,.0f} × 2) ÷ 5'
-        }
+            final_value += base_value * TaxLawResult.CONTROLLING_PREMIUM_RATE
+        elif minority_discount > 0:
+            result.minority_discount = minority_discount
+            final_value -= base_value * minority_discount
+
+        result.marketability_discount = marketability_discount if marketability_discount > 0 else 0.0
+        if result.marketability_discount:
+            final_value -= base_value * marketability_discount
+
+        result.final_value = final_value
+        return result
+
+    def evaluate_input(self, inputs: 'InheritanceTaxInput') -> 'TaxLawResult':
+        """검증된 InheritanceTaxInput으로 evaluate"""
+        return self.evaluate(
+            inputs.net_income_3yr, inputs.net_assets, inputs.controlling_premium,
+            inputs.minority_discount, inputs.marketability_discount
+        )
 
     def calculate_value_per_share(self, itl_value: float, shares_outstanding: int) -> float:
         """
@@ -6,16 +6,15 @@ Valuation Orchestrator
 @description 5개 평가 엔진 통합, 워크플로 관리, 진행률 추적, 자동 단계 전환
 """
 
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any
 from datetime import datetime
 import asyncio
 
+from app.core.instrumentation import span
 from app.db.supabase_client import supabase_client
-from app.services.valuation_engine.dcf.dcf_engine import DCFEngine
-from app.services.valuation_engine.relative.relative_engine import RelativeValuationEngine
-from app.services.valuation_engine.intrinsic.intrinsic_value_engine import CapitalMarketLawEngine
-from app.services.valuation_engine.asset.asset_engine import AssetValuationEngine
-from app.services.valuation_engine.tax.tax_law_engine import InheritanceTaxLawEngine
+from app.services.data_collection import CollectionPipeline, DataCollector, default_collectors
+from app.services.progress_hub import build_progress_fields, calculate_progress, progress_hub
+from app.services.valuation_engine import create_engine
 
 
 class ValuationOrchestrator:
@@ -29,50 +28,47 @@ class ValuationOrchestrator:
     - DB 상태 업데이트
     """
 
-    # 단계별 진행률 매핑
-    STEP_PROGRESS = {
-        1: 0,    # Home 프로세스
-        2: 0,    # Home 프로세스
-        3: 0,    # Home 프로세스
-        4: 0,    # 평가 방법 선택
-        5: 10,   # 데이터 수집
-        6: 30,   # 평가 실행
-        7: 50,   # 회계사 검토 제출
-        8: 60,   # 초안 보고서 생성
-        9: 70,   # 초안 검토
-        10: 75,  # 피드백 반영
-        11: 80,  # 최종 보고서 생성
-        12: 90,  # 최종 승인
-        13: 95,  # 보고서 전달
-        14: 100  # 완료
+    # 단계명 매핑
+    STEP_NAMES = {
+        4: '평가 방법 선택',
+        5: '데이터 수집',
+        6: '평가 실행',
+        7: '회계사 검토 제출',
+        8: '초안 보고서 생성',
+        9: '초안 검토',
+        10: '피드백 반영',
+        11: '최종 보고서 생성',
+        12: '최종 승인',
+        13: '보고서 전달',
+        14: '완료'
     }
 
-    def __init__(self, project_id: str, method: str):
+    def __init__(
+        self,
+        project_id: str,
+        method: str,
+        collectors: Optional[List[DataCollector]] = None
+    ):
         """
         Args:
             project_id: 프로젝트 ID
             method: 평가 방법 ('dcf', 'relative', 'intrinsic', 'asset', 'inheritance_tax')
+            collectors: Step 5 데이터 수집기 (None이면 default_collectors())
         """
         self.project_id = project_id
         self.method = method
         self.engine = self._load_engine()
         self.supabase = supabase_client
+        self.progress_hub = progress_hub
+        self.collection_pipeline = CollectionPipeline(
+            collectors if collectors is not None else default_collectors()
+        )
 
     def _load_engine(self):
-        """평가 방법에 따라 적절한 엔진 로드"""
-        engines = {
-            'dcf': DCFEngine(),
-            'relative': RelativeValuationEngine(),
-            'intrinsic': CapitalMarketLawEngine(),
-            'asset': AssetValuationEngine(),
-            'inheritance_tax': InheritanceTaxLawEngine()
-        }
-
-        engine = engines.get(self.method)
-        if not engine:
-            raise ValueError(f"Unknown valuation method: {self.method}")
-
-        return engine
+        """평가 방법에 따라 적절한 엔진 로드 (해당 엔진 모듈만 import)"""
+        if self.method == 'dcf':
+            return create_engine('dcf', verbose=False)
+        return create_engine(self.method)
 
     async def start_valuation(self) -> Dict:
         """
@@ -84,7 +80,7 @@ class ValuationOrchestrator:
                 'method': str,
                 'status': 'in_progress',
                 'step': 5,
-                'progress': 10
+                'progress': 35
             }
         """
         # 1. 상태를 'in_progress'로 업데이트
@@ -96,67 +92,88 @@ class ValuationOrchestrator:
             'method': self.method,
             'status': 'in_progress',
             'step': 5,
-            'progress': self.STEP_PROGRESS[5],
+            'progress': calculate_progress(5),
             'message': '평가를 시작합니다. 데이터 수집 중...'
         }
 
     async def collect_data(self, on_progress=None) -> Dict:
         """
-        Step 5: 데이터 수집 시뮬레이션
+        Step 5: 데이터 수집
+
+        재무제표/시장/비교기업/자산/업종 벤치마크 수집기를 의존 관계에 따라 동시에 실행
+        (단계 소요 시간 = 합계가 아니라 가장 긴 의존 경로)
+        수집기가 끝날 때마다 진행률 업데이트, 일부 실패해도 나머지 결과로 진행
+        필수 수집기(재무제표)가 실패하면 'failed'로 전환, 아니면 자동으로 Step 6으로 전환
 
-        5개 데이터 수집 작업을 시뮬레이션하고 진행률 업데이트
-        완료 시 자동으로 Step 6으로 전환
+        각 작업 진행은 진행 허브에도 detail로 발행되어 SSE/WebSocket 구독자에게 전달됨
 
         Args:
             on_progress: 진행률 콜백 함수 (optional)
 
         Returns:
             {
-                'completed': True,
-                'data': {...},
-                'next_step': 6
+                'completed': bool,
+                'data': {작업명: {'status', 'timestamp', 'elapsed', 'error'}},
+                'inputs': {수집기 key: 수집 데이터},
+                'failed': [실패/타임아웃/건너뛴 작업명],
+                'next_step': 6 (필수 수집 실패 시 5)
             }
         """
-        data_tasks = [
-            {'name': '재무제표 수집', 'duration': 1},
-            {'name': '시장 데이터 수집', 'duration': 1},
-            {'name': '비교기업 데이터 수집', 'duration': 1},
-            {'name': '자산 정보 수집', 'duration': 1},
-            {'name': '업종 벤치마크 수집', 'duration': 1}
-        ]
-
-        total_tasks = len(data_tasks)
+        async def report(info: Dict):
+            # 진행 허브 발행 + 콜백 호출
+            self.progress_hub.publish(self.project_id, self.method, detail=info)
+            if on_progress:
+                await on_progress(info)
+
+        outcomes = await self.collection_pipeline.run(self.project_id, on_progress=report)
+
         collected_data = {}
+        inputs = {}
+        failed = []
+        missing_required = []
+
+        for key, outcome in outcomes.items():
+            collected_data[outcome['name']] = {
+                'status': outcome['status'],
+                'timestamp': outcome['timestamp'],
+                'elapsed': outcome['elapsed'],
+                'error': outcome['error']
+            }
 
-        for i, task in enumerate(data_tasks):
-            # 진행률 계산 (0 -> 100)
-            progress = int((i + 1) / total_tasks * 100)
+            if outcome['status'] == 'completed':
+                inputs[key] = outcome['data']
+                continue
 
-            # 콜백 호출
-            if on_progress:
-                await on_progress({
-                    'task': task['name'],
-                    'progress': progress,
-                    'status': 'collecting'
-                })
-
-            # 작업 시뮬레이션 (실제 환경에서는 실제 데이터 수집)
-            await asyncio.sleep(task['duration'])
-
-            # 데이터 저장 (예시)
-            collected_data[task['name']] = {
-                'status': 'completed',
-                'timestamp': datetime.utcnow().isoformat()
+            failed.append(outcome['name'])
+            if self.collection_pipeline.collectors[key].required:
+                missing_required.append(outcome['name'])
+
+        if missing_required:
+            await self.update_status('failed', 5)
+
+            return {
+                'completed': False,
+                'data': collected_data,
+                'inputs': inputs,
+                'failed': failed,
+                'next_step': 5,
+                'message': f"필수 데이터 수집에 실패했습니다: {', '.join(missing_required)}"
             }
 
         # Step 6으로 자동 전환
         await self.update_status('in_progress', 6)
 
+        message = '데이터 수집이 완료되었습니다. 평가를 실행합니다.'
+        if failed:
+            message = f"일부 데이터 없이 평가를 실행합니다 (누락: {', '.join(failed)})"
+
         return {
             'completed': True,
             'data': collected_data,
+            'inputs': inputs,
+            'failed': failed,
             'next_step': 6,
-            'message': '데이터 수집이 완료되었습니다. 평가를 실행합니다.'
+            'message': message
         }
 
     async def run_evaluation(self, inputs: Dict) -> Dict:
@@ -178,35 +195,36 @@ class ValuationOrchestrator:
             }
         """
         # 1. 평가 실행
-        if self.method == 'dcf':
-            result = self.engine.run_valuation(inputs)
-        elif self.method == 'relative':
-            result = self.engine.run_valuation(
-                company_data=inputs.get('company_data'),
-                comparable_companies=inputs.get('comparable_companies'),
-                industry_benchmarks=inputs.get('industry_benchmarks')
-            )
-        elif self.method == 'intrinsic':
-            result = self.engine.run_valuation(
-                asset_value=inputs.get('asset_value'),
-                income_value=inputs.get('income_value'),
-                purpose=inputs.get('purpose', '합병')
-            )
-        elif self.method == 'asset':
-            result = self.engine.run_valuation(
-                balance_sheet=inputs.get('balance_sheet'),
-                fair_value_data=inputs.get('fair_value_data')
-            )
-        elif self.method == 'inheritance_tax':
-            result = self.engine.run_valuation(
-                net_income_3yr=inputs.get('net_income_3yr'),
-                net_assets=inputs.get('net_assets'),
-                controlling_premium=inputs.get('controlling_premium', False),
-                minority_discount=inputs.get('minority_discount', 0.0),
-                marketability_discount=inputs.get('marketability_discount', 0.0)
-            )
-        else:
-            raise ValueError(f"Unsupported method: {self.method}")
+        with span("run", engine=self.method):
+            if self.method == 'dcf':
+                result = self.engine.run_valuation(inputs)
+            elif self.method == 'relative':
+                result = self.engine.run_valuation(
+                    company_data=inputs.get('company_data'),
+                    comparable_companies=inputs.get('comparable_companies'),
+                    industry_benchmarks=inputs.get('industry_benchmarks')
+                )
+            elif self.method == 'intrinsic':
+                result = self.engine.run_valuation(
+                    asset_value=inputs.get('asset_value'),
+                    income_value=inputs.get('income_value'),
+                    purpose=inputs.get('purpose', '합병')
+                )
+            elif self.method == 'asset':
+                result = self.engine.run_valuation(
+                    balance_sheet=inputs.get('balance_sheet'),
+                    fair_value_data=inputs.get('fair_value_data')
+                )
+            elif self.method == 'inheritance_tax':
+                result = self.engine.run_valuation(
+                    net_income_3yr=inputs.get('net_income_3yr'),
+                    net_assets=inputs.get('net_assets'),
+                    controlling_premium=inputs.get('controlling_premium', False),
+                    minority_discount=inputs.get('minority_discount', 0.0),
+                    marketability_discount=inputs.get('marketability_discount', 0.0)
+                )
+            else:
+                raise ValueError(f"Unsupported method: {self.method}")
 
         # 2. 결과를 DB에 저장
         await self._save_valuation_result(result)
@@ -290,7 +308,8 @@ class ValuationOrchestrator:
         """
         현재 진행률 조회
 
-        DB에서 현재 step과 status 조회
+        진행 허브 스냅샷이 있으면 그대로 사용 (평가 진행 중에는 DB 조회 없음)
+        없으면 DB에서 현재 step과 status 조회
         진행률 퍼센트 계산
 
         Returns:
@@ -303,6 +322,17 @@ class ValuationOrchestrator:
                 'step_name': str
             }
         """
+        snapshot = self.progress_hub.snapshot(self.project_id, self.method)
+        if snapshot is not None and 'step' in snapshot:
+            return {
+                'project_id': self.project_id,
+                'method': self.method,
+                'status': snapshot['status'],
+                'step': snapshot['step'],
+                'progress': snapshot['progress'],
+                'step_name': self.STEP_NAMES.get(snapshot['step'], '알 수 없음')
+            }
+
         # DB에서 프로젝트 조회 (테이블명은 실제 스키마에 따라 조정)
         # 여기서는 'valuation_projects' 테이블 가정
         result = await self.supabase.select(
@@ -320,28 +350,13 @@ class ValuationOrchestrator:
         current_step = project.get('current_step', 4)
         status = project.get('status', 'not_started')
 
-        # 단계명 매핑
-        step_names = {
-            4: '평가 방법 선택',
-            5: '데이터 수집',
-            6: '평가 실행',
-            7: '회계사 검토 제출',
-            8: '초안 보고서 생성',
-            9: '초안 검토',
-            10: '피드백 반영',
-            11: '최종 보고서 생성',
-            12: '최종 승인',
-            13: '보고서 전달',
-            14: '완료'
-        }
-
         return {
             'project_id': self.project_id,
             'method': self.method,
             'status': status,
             'step': current_step,
-            'progress': self.STEP_PROGRESS.get(current_step, 0),
-            'step_name': step_names.get(current_step, '알 수 없음')
+            'progress': calculate_progress(current_step),
+            'step_name': self.STEP_NAMES.get(current_step, '알 수 없음')
         }
 
     async def advance_step(self) -> Dict:
@@ -375,7 +390,7 @@ class ValuationOrchestrator:
 
         return {
             'step': next_step,
-            'progress': self.STEP_PROGRESS.get(next_step, 0),
+            'progress': calculate_progress(next_step),
             'message': f'Step {next_step}로 이동했습니다.'
         }
 
@@ -383,15 +398,19 @@ class ValuationOrchestrator:
         """
         평가 방법의 상태 및 단계 업데이트
 
+        DB 업데이트 후 진행 허브에 발행 (진행 스트림 구독자에게 즉시 전달)
+        진행률 / 메시지는 평가 API와 같은 build_progress_fields로 만든다
+
         Args:
             status: 'not_started', 'in_progress', 'pending_review', 'completed', 'failed'
             step: 현재 단계 (4~14)
         """
         # valuation_projects 테이블 업데이트 (실제 스키마에 따라 조정)
+        fields = build_progress_fields(status, step)
         update_data = {
             'status': status,
             'current_step': step,
-            'progress': self.STEP_PROGRESS.get(step, 0),
+            'progress': fields['progress'],
             'updated_at': datetime.utcnow().isoformat()
         }
 
@@ -401,6 +420,8 @@ class ValuationOrchestrator:
             filters={'project_id': self.project_id}
         )
 
+        self.progress_hub.publish(self.project_id, self.method, **fields)
+
     async def _save_valuation_result(self, result: Dict):
         """평가 결과를 DB에 저장"""
         result_data = {
@@ -0,0 +1,89 @@
+"""
+AI Router failover / hedging 벤치마크
+
+로컬 StubProvider로 제공자 지연·오류를 흉내 내 다음을 비교한다.
+- 25번에 한 번 매우 느려지는 Claude: hedging 없음 vs hedging (p50/p95/최대 지연)
+- 오류율 30% Claude: failover 후 성공률
+
+실행:
+    python benchmarks/bench_ai_router.py [요청 수]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.ai_router import AIRouter, AllProvidersFailedError, StubProvider, TaskType
+
+
+class SpikyProvider(StubProvider):
+    """spike_every번째 호출마다 spike_latency만큼 느려지는 제공자"""
+
+    def __init__(self, name: str, latency: float, spike_latency: float, spike_every: int):
+        super().__init__(name, latency=latency)
+        self.spike_latency = spike_latency
+        self.spike_every = spike_every
+
+    async def __call__(self, request):
+        if (self.calls + 1) % self.spike_every == 0:
+            self.calls += 1
+            await asyncio.sleep(self.spike_latency)
+            return {"content": "", "usage": {"total_tokens": self.tokens}}
+        return await super().__call__(request)
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    p50 = latencies[len(latencies) // 2]
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    return f"p50 {p50 * 1000:6.1f}ms  p95 {p95 * 1000:6.1f}ms  max {latencies[-1] * 1000:6.1f}ms"
+
+
+async def run_requests(router: AIRouter, count: int, hedge: bool):
+    latencies = []
+    providers = {}
+    failures = 0
+
+    for _ in range(count):
+        started = time.perf_counter()
+        try:
+            result = await router.execute(TaskType.DCF_CALCULATION, {"prompt": "bench"}, hedge=hedge)
+            providers[result["provider"]] = providers.get(result["provider"], 0) + 1
+        except AllProvidersFailedError:
+            failures += 1
+        latencies.append(time.perf_counter() - started)
+
+    return latencies, providers, failures
+
+
+def make_router(claude):
+    return AIRouter({
+        "claude": claude,
+        "openai": StubProvider("openai", latency=0.03, jitter=0.01, seed=2),
+        "gemini": StubProvider("gemini", latency=0.04, jitter=0.01, seed=3),
+    })
+
+
+async def main(count: int) -> None:
+    print("=" * 60)
+    print(f"AI Router 벤치마크 ({count}회 요청)")
+    print("=" * 60)
+
+    for hedge in (False, True):
+        router = make_router(SpikyProvider("claude", latency=0.02, spike_latency=0.5, spike_every=25))
+        latencies, providers, _ = await run_requests(router, count, hedge)
+        label = "hedging" if hedge else "기본   "
+        print(f"  느린 Claude, {label}: {summarize(latencies)}  {providers}")
+
+    router = make_router(StubProvider("claude", latency=0.02, error_rate=0.3, seed=1))
+    latencies, providers, failures = await run_requests(router, count, hedge=False)
+    print(f"  오류 30% Claude, failover: 실패 {failures}/{count}  {providers}")
+    print(f"  Claude 상태: {router.get_provider_stats()['claude']}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -0,0 +1,70 @@
+"""
+평가 Step 5 데이터 수집 벤치마크
+
+fixture 수집기에 수집기별 지연을 주고 CollectionPipeline(동시 실행)과
+선언 순서대로 하나씩 기다리는 기존 방식(순차 실행)의 단계 소요 시간을 비교한다.
+동시 실행 시간은 가장 긴 의존 경로(재무제표 → 비교기업/업종 벤치마크)에 가까워야 한다.
+
+실행:
+    python benchmarks/bench_collect_data.py [반복 횟수]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.data_collection import CollectionPipeline, fixture_collectors
+
+# 수집기별 지연 (초) - 외부 API/DB 응답 시간 가정
+DELAYS = {
+    "financial_statements": 0.30,
+    "market_data": 0.45,
+    "comparable_companies": 0.25,
+    "assets": 0.20,
+    "industry_benchmarks": 0.15,
+}
+
+
+async def run_sequential(collectors, project_id: str) -> None:
+    upstream = {}
+    for collector in collectors:
+        upstream[collector.key] = await collector.collect(project_id, upstream)
+
+
+async def run_concurrent(pipeline: CollectionPipeline, project_id: str) -> None:
+    await pipeline.run(project_id)
+
+
+async def main(iterations: int) -> None:
+    collectors = fixture_collectors(delays=DELAYS)
+    pipeline = CollectionPipeline(collectors)
+
+    critical_path = max(
+        DELAYS["financial_statements"] + max(DELAYS["comparable_companies"], DELAYS["industry_benchmarks"]),
+        DELAYS["market_data"],
+        DELAYS["assets"],
+    )
+
+    print("=" * 60)
+    print(f"Step 5 데이터 수집 ({len(collectors)}개 수집기, {iterations}회 평균)")
+    print("=" * 60)
+    print(f"  지연 합계:        {sum(DELAYS.values()):.3f}s")
+    print(f"  최장 의존 경로:   {critical_path:.3f}s")
+
+    for label, runner in (
+        ("순차 실행", lambda: run_sequential(collectors, "BENCH")),
+        ("동시 실행", lambda: run_concurrent(pipeline, "BENCH")),
+    ):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await runner()
+        elapsed = (time.perf_counter() - started) / iterations
+        print(f"  {label}:        {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5))
@@ -0,0 +1,158 @@
+"""
+분할 수집(샤드 큐) 다중 프로세스 벤치마크
+
+네이버 크롤러의 실제 검색 목록/기사 파싱 코드를 그대로 쓰되 fetch_page만 fixture + 지연(네트워크 대기)으로 바꾸고,
+(키워드 × 페이지) 샤드를 공유 SQLite 큐에 올린 뒤 워커 프로세스 수(1, 2, 4 ...)별로 처리 시간을 측정한다.
+일부 샤드는 첫 시도에서 목록 페이지를 못 가져오도록 해 그 샤드만 재시도되는지도 확인한다.
+
+실행:
+    python benchmarks/bench_crawl_shards.py [키워드 수] [페이지 수] [최대 워커 수]
+"""
+import asyncio
+import hashlib
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.services.news_crawler.base_crawler import fetch_failures
+from app.services.news_crawler.crawler_manager import CrawlerManager
+from app.services.news_crawler.naver_crawler import NaverNewsCrawler
+from app.services.news_crawler.shard_queue import create_shard_queue
+
+ARTICLE_HTML = (Path(__file__).resolve().parent / "fixtures" / "news" / "naver_article.html").read_text(encoding="utf-8")
+ARTICLES_PER_PAGE = 10
+FETCH_LATENCY_SECONDS = 0.05
+FAILURE_RATE = 0.1  # 첫 시도에 목록 페이지를 못 가져오는 샤드 비율
+
+settings.CRAWL_REQUEST_INTERVAL_SECONDS = 0.05
+
+
+class BenchNaverCrawler(NaverNewsCrawler):
+    """fixture를 돌려주는 네이버 크롤러 (네트워크 사용 안 함)"""
+
+    marker_dir: Path = None
+
+    async def fetch_page(self, url: str):
+        await asyncio.sleep(FETCH_LATENCY_SECONDS)
+
+        if "search.naver.com" not in url:
+            return ARTICLE_HTML
+
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        marker = self.marker_dir / digest
+        if int(digest[:8], 16) / 0xFFFFFFFF < FAILURE_RATE and not marker.exists():
+            marker.touch()
+            fetch_failures.get().append(url)
+            return None
+
+        links = "".join(
+            f'<a class="news_tit" href="https://n.news.naver.com/article/{digest[:12]}/{i}">기사 {i}</a>'
+            for i in range(ARTICLES_PER_PAGE)
+        )
+        return f"<html><body>{links}</body></html>"
+
+
+CrawlerManager.AVAILABLE_CRAWLERS["bench"] = BenchNaverCrawler
+
+
+def worker_process(database_url: str, run_id: str, marker_dir: str, concurrency: int) -> None:
+    BenchNaverCrawler.marker_dir = Path(marker_dir)
+    queue = create_shard_queue(database_url, retry_backoff_seconds=0.2)
+    manager = CrawlerManager(queue=queue)
+    asyncio.run(manager.run_shard_worker(
+        queue,
+        run_id=run_id,
+        concurrency=concurrency,
+        max_shards_per_source=concurrency,
+        poll_interval=0.1
+    ))
+
+
+def run(workers: int, keywords, max_pages: int, concurrency: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/queue.db"
+        marker_dir = Path(tmp) / "markers"
+        marker_dir.mkdir()
+
+        queue = create_shard_queue(database_url)
+        manager = CrawlerManager(queue=queue)
+        run_id = f"bench-{workers}"
+        plan = manager.plan_shards(["bench"], keywords, max_pages)
+        queue.enqueue(run_id, plan)
+
+        ctx = multiprocessing.get_context("spawn")
+        processes = [
+            ctx.Process(target=worker_process, args=(database_url, run_id, str(marker_dir), concurrency))
+            for _ in range(workers)
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        shards = queue.shard_stats(run_id)
+        articles = queue.results(run_id)
+        injected = len(list(marker_dir.iterdir()))
+        retried = sum(1 for shard in shards if shard["attempt"] > 1)
+        # 프로세스 기동(import) 시간을 뺀 처리 구간: 첫 샤드 시작 ~ 마지막 샤드 완료
+        window = (
+            max(shard["finished_at"] for shard in shards) - min(shard["started_at"] for shard in shards)
+        ).total_seconds()
+        return {
+            "shards": len(plan),
+            "done": sum(1 for shard in shards if shard["status"] == "done"),
+            "attempts": sum(shard["attempt"] for shard in shards),
+            "injected": injected,
+            "retried": retried,
+            "articles": len(articles),
+            "elapsed": elapsed,
+            "window": window,
+        }
+
+
+def main():
+    keyword_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    max_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    concurrency = 2
+
+    keywords = [f"투자 키워드 {i}" for i in range(keyword_count)]
+    worker_counts = [n for n in (1, 2, 4, 8, 16) if n <= max_workers]
+
+    print("=" * 96)
+    print(
+        f"분할 수집 벤치마크: {keyword_count} 키워드 × {max_pages} 페이지, "
+        f"프로세스당 동시 샤드 {concurrency}, 요청 지연 {FETCH_LATENCY_SECONDS * 1000:.0f}ms"
+    )
+    print("work s = 첫 샤드 시작 ~ 마지막 샤드 완료 (프로세스 기동 제외), shards/s는 work s 기준")
+    print("=" * 96)
+    print(f"{'workers':>8}{'shards':>8}{'done':>6}{'attempts':>10}{'retried':>9}{'articles':>10}"
+          f"{'wall s':>9}{'work s':>9}{'shards/s':>10}{'speedup':>9}")
+
+    baseline = None
+    for workers in worker_counts:
+        result = run(workers, keywords, max_pages, concurrency)
+        throughput = result["shards"] / result["window"]
+        baseline = baseline or throughput
+        print(
+            f"{workers:>8}{result['shards']:>8}{result['done']:>6}{result['attempts']:>10}"
+            f"{result['retried']:>9}{result['articles']:>10}{result['elapsed']:>9.2f}{result['window']:>9.2f}"
+            f"{throughput:>10.1f}{throughput / baseline:>8.1f}x"
+        )
+        # 실패 주입한 샤드만 재시도되고, 나머지는 정확히 1회 실행되어야 함
+        assert result["done"] == result["shards"], result
+        assert result["retried"] == result["injected"], result
+        assert result["attempts"] == result["shards"] + result["injected"], result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+뉴스 크롤러 기사 파싱 벤치마크
+
+6개 소스(Naver, Platum, Wowtale, Outstanding, StartupToday, VentureSquare)의
+기사 fixture를 파서 백엔드별(bs4 / lxml / selectolax)로 parse_article에 통과시켜
+기사당 파싱 시간을 측정하고, 백엔드 간 추출 결과(제목/본문)가 같은지 확인한다.
+
+실행:
+    python benchmarks/bench_crawler_parse.py [반복 횟수]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.news_crawler.crawler_manager import CrawlerManager
+from app.services.news_crawler.html_backend import AVAILABLE_BACKENDS, resolve_backend
+
+FIXTURE_DIR = Path(__file__).resolve().parent / "fixtures" / "news"
+
+
+def make_crawler(source: str, backend: str, html: str):
+    """fixture HTML을 돌려주는 크롤러 생성 (네트워크 사용 안 함)"""
+    crawler = CrawlerManager.AVAILABLE_CRAWLERS[source]()
+    crawler.html_parser = backend
+
+    async def fetch_fixture(url: str) -> str:
+        return html
+
+    crawler.fetch_page = fetch_fixture
+    return crawler
+
+
+async def bench_source(source: str, backends, iterations: int):
+    html = (FIXTURE_DIR / f"{source}_article.html").read_text(encoding="utf-8")
+    url = f"https://example.com/{source}/article"
+
+    timings = {}
+    outputs = {}
+    for backend in backends:
+        crawler = make_crawler(source, backend, html)
+        article = await crawler.parse_article(url)
+        outputs[backend] = (article.title, article.content) if article else None
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await crawler.parse_article(url)
+        timings[backend] = (time.perf_counter() - start) / iterations * 1000
+
+    reference = outputs["bs4"]
+    consistent = all(output == reference for output in outputs.values())
+    return timings, consistent, reference is not None
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    # 설치된 백엔드만 측정 (미설치 백엔드는 bs4로 대체되므로 제외)
+    backends = [b for b in AVAILABLE_BACKENDS if resolve_backend(b) == b]
+
+    print("=" * 78)
+    print(f"기사 파싱 벤치마크 (ms/article, {iterations}회 평균)")
+    print("=" * 78)
+    print(f"{'source':<15}" + "".join(f"{b:>12}" for b in backends) + f"{'speedup':>12}  결과")
+
+    for source in ["naver", "platum", "wowtale", "outstanding", "startuptoday", "venturesquare"]:
+        timings, consistent, parsed = await bench_source(source, backends, iterations)
+        fastest = min(timings.values())
+        row = f"{source:<15}" + "".join(f"{timings[b]:>12.2f}" for b in backends)
+        row += f"{timings['bs4'] / fastest:>11.1f}x"
+        row += "  일치" if consistent and parsed else ("  불일치" if parsed else "  파싱 실패")
+        print(row)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,203 @@
+"""
+Deal 통계 벤치마크 (주간 리포트 / 대시보드)
+
+여러 해 분량의 deals 이력을 만들어
+  - 이전 구현: send_weekly_email.parse_amount(정규식 체인) + 순수 파이썬 정렬/집계
+  - deal_analytics: amount_eok 저장값 사용 / amount만 있을 때 parse_amount_eok 보충
+  - pandas: 같은 행 목록을 DataFrame으로 만들어 groupby (컬럼 연산 방식 참고용)
+를 비교한다. 전체 이력 통계(Top-N·업종·단계·투자자), 주별 건수·금액·전주 대비,
+한 주 리포트 1회를 따로 재고, 결과가 이전 구현과 같은지 확인한다 (금액은 같은 규칙으로 정규화한 값 기준).
+
+실행:
+    python benchmarks/bench_deal_analytics.py [연수] [하루 딜 수]
+"""
+import gc
+import random
+import re
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd
+
+from app.services.deal_analytics import analyze_deals, deals_frame, parse_amount_eok, weekly_summary
+
+INDUSTRIES = ['AI/딥테크', '헬스케어', '핀테크', '커머스', '모빌리티', '콘텐츠', '에듀테크', '기후테크', None]
+STAGES = ['프리시드', '시드', '프리A', '시리즈A', '시리즈B', '시리즈C', 'M&A', None]
+INVESTORS = [f'투자사{i:03d}' for i in range(300)]
+
+
+def make_history(years: int, per_day: int):
+    random.seed(42)
+    deals = []
+    start = date.today() - timedelta(days=365 * years)
+    for day in range(365 * years):
+        news_date = (start + timedelta(days=day)).isoformat()
+        for _ in range(random.randint(0, per_day * 2)):
+            roll = random.random()
+            if roll < 0.55:
+                amount = f"{random.choice(['', '약 ', '총 '])}{random.randint(1, 500) * 5:,}억원"
+            elif roll < 0.65:
+                amount = f"{random.randint(10, 5000):,}만 달러"
+            elif roll < 0.75:
+                amount = random.randint(1, 300)
+            else:
+                amount = random.choice([None, '', '비공개'])
+            deals.append({
+                'company_name': f'기업{len(deals):06d}',
+                'amount': amount,
+                'industry_category': random.choice(INDUSTRIES),
+                'stage': random.choice(STAGES),
+                'investors': ', '.join(random.sample(INVESTORS, random.randint(1, 4))) if random.random() < 0.85 else None,
+                'news_date': news_date,
+            })
+    return deals
+
+
+# ============================================================
+# 이전 구현 (send_weekly_email.py) - 금액 규칙만 parse_amount_eok와 맞춰 결과 비교
+# ============================================================
+def legacy_parse_amount(amount_str):
+    if not amount_str and amount_str != 0:
+        return 0
+    if isinstance(amount_str, (int, float)):
+        return float(amount_str)
+    amount_str = str(amount_str).strip()
+    cleaned = re.sub(r'(약|총|최대|규모|원|이상|이내)', '', amount_str).strip()
+    match = re.search(r'([\d,.]+)\s*억', cleaned)
+    if match:
+        try:
+            return float(match.group(1).replace(',', ''))
+        except ValueError:
+            return 0
+    match = re.search(r'([\d,.]+)\s*만\s*달러', cleaned)
+    if match:
+        try:
+            return float(match.group(1).replace(',', '')) * 0.13
+        except ValueError:
+            return 0
+    return 0
+
+
+def legacy_analyze(deals):
+    for deal in deals:
+        deal['_parsed_amount'] = legacy_parse_amount(deal.get('amount', ''))
+    total_amount = sum(d['_parsed_amount'] for d in deals)
+    deals_with_amount = sorted(deals, key=lambda d: d['_parsed_amount'], reverse=True)
+    industry_stats = {}
+    for deal in deals:
+        cat = deal.get('industry_category')
+        if cat:
+            if cat not in industry_stats:
+                industry_stats[cat] = {'count': 0, 'amount': 0}
+            industry_stats[cat]['count'] += 1
+            industry_stats[cat]['amount'] += deal['_parsed_amount']
+    industry_sorted = sorted(industry_stats.items(), key=lambda x: x[1]['count'], reverse=True)
+    stage_counts = Counter([deal.get('stage') for deal in deals if deal.get('stage')]).most_common()
+    investors = []
+    for deal in deals:
+        if deal.get('investors'):
+            investors.extend([inv.strip() for inv in deal['investors'].split(',')])
+    return {
+        'total_amount': total_amount,
+        'top5_deals': deals_with_amount[:5],
+        'industry_sorted': industry_sorted[:7],
+        'stage_counts': stage_counts,
+        'investor_counts': Counter(investors).most_common(5),
+    }
+
+
+def legacy_weekly(deals):
+    """주(월요일 시작)별 건수·금액·전주 대비 (dict 누적)"""
+    weeks = {}
+    for deal in deals:
+        day = date.fromisoformat(deal['news_date'][:10])
+        week = day - timedelta(days=day.weekday())
+        row = weeks.setdefault(week, [0, 0.0])
+        row[0] += 1
+        row[1] += legacy_parse_amount(deal.get('amount'))
+    result = []
+    previous = None
+    for week in sorted(weeks):
+        count, amount = weeks[week]
+        delta = (count - previous[0], amount - previous[1]) if previous else (None, None)
+        result.append((week, count, amount, *delta))
+        previous = (count, amount)
+    return result
+
+
+def pandas_weekly(deals):
+    """DataFrame groupby로 주별 건수·금액·전주 대비"""
+    frame = deals_frame(deals)
+    dates = pd.to_datetime(frame['news_date'].str[:10])
+    week_start = dates - pd.to_timedelta(dates.dt.weekday, unit='D')
+    weekly = frame['amount_eok'].groupby(week_start).agg(deals='size', amount='sum')
+    weekly = weekly.reindex(pd.date_range(weekly.index.min(), weekly.index.max(), freq='7D'), fill_value=0)
+    weekly['deals_delta'] = weekly['deals'].diff()
+    weekly['amount_delta'] = weekly['amount'].diff()
+    return weekly
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 15
+    raw = make_history(years, per_day)
+    stored = [dict(deal, amount_eok=parse_amount_eok(deal['amount'])) for deal in raw]  # 수집 시 정규화된 행
+    last_week_start = date.fromisoformat(raw[-1]['news_date']) - timedelta(days=6)
+    week_raw = [d for d in raw if d['news_date'] >= last_week_start.isoformat()]
+    week_stored = [d for d in stored if d['news_date'] >= last_week_start.isoformat()]
+
+    # 결과 동일성
+    legacy = legacy_analyze([dict(d) for d in raw])
+    for deals in (raw, stored):
+        new = analyze_deals(deals)
+        assert abs(new['total_amount'] - legacy['total_amount']) < 1e-6 * legacy['total_amount']
+        assert [d['company_name'] for d in new['top5_deals']] == [d['company_name'] for d in legacy['top5_deals']]
+        assert [(n, v['count']) for n, v in new['industry_sorted']] == [(n, v['count']) for n, v in legacy['industry_sorted']]
+        assert new['stage_counts'] == legacy['stage_counts']
+        assert new['investor_counts'] == legacy['investor_counts']
+    weekly = weekly_summary(stored)
+    legacy_weeks = legacy_weekly(raw)
+    assert len(weekly) == len(legacy_weeks)  # 합성 이력은 빈 주가 없음
+    assert [row['deals'] for row in weekly] == [row[1] for row in legacy_weeks]
+    assert max(abs(row['amount'] - legacy[2]) for row, legacy in zip(weekly, legacy_weeks)) < 1e-6
+    assert list(pandas_weekly(stored)['deals']) == [row['deals'] for row in weekly]
+
+    rows = [
+        ("전체 이력 통계: 이전 구현", lambda: legacy_analyze(raw)),
+        ("전체 이력 통계: amount만 (정규화 포함)", lambda: analyze_deals(raw)),
+        ("전체 이력 통계: amount_eok 저장값", lambda: analyze_deals(stored)),
+        ("주별 추이 + 전주 대비: 이전 구현", lambda: legacy_weekly(raw)),
+        ("주별 추이 + 전주 대비: weekly_summary", lambda: weekly_summary(stored)),
+        ("주별 추이 + 전주 대비: pandas groupby", lambda: pandas_weekly(stored)),
+        ("한 주 리포트: 이전 구현", lambda: legacy_analyze(week_raw)),
+        ("한 주 리포트: analyze_deals", lambda: analyze_deals(week_stored)),
+    ]
+
+    print("=" * 80)
+    print(f"Deal 통계: {years}년 {len(raw):,}건 ({len(weekly)}주), 마지막 주 {len(week_raw)}건 - 결과 동일성 확인")
+    print("=" * 80)
+    for name, fn in rows:
+        seconds, _ = timed(fn)
+        print(f"{name:44}{seconds * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Deal Warehouse 벤치마크 (Parquet 스냅샷 + DuckDB 조회)
+
+여러 해 분량의 deals 이력을 만들어
+  - 스냅샷 내보내기 시간 / 크기 (월 × 업종 파티션)
+  - 조회 계층 메모리 적재 시간
+  - 조회: 연도별·월별 투자 추이, 투자사 순위, 단계 전환, 한 업종·1년 조건 조회
+    (메모리 적재 후 / Parquet 파일 직접 조회 - 파티션 걸러냄)
+를 지금 방식(PostgREST로 받은 행 목록을 파이썬/pandas로 집계 - 네트워크 전송 시간은 빼고 집계만)과 비교하고,
+결과가 같은지 확인한다.
+
+실행:
+    python benchmarks/bench_deal_warehouse.py [연수] [하루 딜 수]
+"""
+import gc
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from statistics import median
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import pandas as pd
+
+from app.services.deal_analytics import deals_frame, parse_amount_eok
+from app.services.deal_warehouse import DEALS, DealWarehouse, write_snapshot
+
+INDUSTRIES = ['AI/딥테크', '헬스케어', '핀테크', '커머스', '모빌리티', '콘텐츠', '에듀테크', '기후테크', None]
+STAGES = ['프리시드', '시드', '프리A', '시리즈A', '시리즈B', '시리즈C', '시리즈D']
+INVESTORS = [f'투자사{i:03d}' for i in range(300)]
+
+
+def make_history(years: int, per_day: int):
+    """기업마다 단계가 올라가는 라운드 이력 (PostgREST 응답 형태의 dict 목록)"""
+    random.seed(42)
+    start = date.today() - timedelta(days=365 * years)
+    companies = {}
+    deals = []
+    for day in range(365 * years):
+        news_date = (start + timedelta(days=day)).isoformat()
+        for _ in range(random.randint(0, per_day * 2)):
+            if companies and random.random() < 0.35:
+                name = random.choice(list(companies))
+                companies[name] = min(companies[name] + random.choice([0, 1, 1, 2]), len(STAGES) - 1)
+            else:
+                name = f'기업{len(companies):06d}'
+                companies[name] = random.randint(0, 2)
+            amount = random.choice([f'{random.randint(1, 500) * 5:,}억원', f'{random.randint(10, 5000):,}만 달러', None])
+            deals.append({
+                'id': len(deals) + 1,
+                'company_name': name,
+                'industry_category': random.choice(INDUSTRIES),
+                'stage': STAGES[companies[name]],
+                'investors': ', '.join(random.sample(INVESTORS, random.randint(1, 4))) if random.random() < 0.85 else None,
+                'amount': amount,
+                'amount_eok': parse_amount_eok(amount),
+                'news_date': news_date,
+            })
+    return deals
+
+
+# ============================================================
+# 지금 방식: 전체 행을 받아 파이썬 / pandas로 집계
+# ============================================================
+def rows_yearly(deals):
+    frame = deals_frame(deals)
+    years = pd.to_datetime(frame['news_date']).dt.year
+    return frame.groupby(years)['amount_eok'].agg(['size', 'sum'])
+
+
+def rows_monthly_by_industry(deals):
+    frame = deals_frame(deals)
+    months = frame['news_date'].str[:7]
+    return frame.groupby([months, frame['industry_category'].fillna('미분류')])['amount_eok'].agg(['size', 'sum'])
+
+
+def rows_investor_league(deals, limit=20, start=None, industry=None):
+    counts, amounts = Counter(), defaultdict(float)
+    for deal in deals:
+        if not deal['investors'] or (start and deal['news_date'] < start) or (industry and deal['industry_category'] != industry):
+            continue
+        for name in deal['investors'].split(','):
+            name = name.strip()
+            counts[name] += 1
+            amounts[name] += deal['amount_eok']
+    return sorted(counts, key=lambda n: (-counts[n], -amounts[n], n))[:limit]
+
+
+def rows_stage_transitions(deals):
+    by_company = defaultdict(list)
+    for deal in deals:
+        by_company[deal['company_name']].append(deal)
+    transitions = defaultdict(list)
+    for rounds in by_company.values():
+        rounds.sort(key=lambda d: (d['news_date'], d['id']))
+        for prev, cur in zip(rounds, rounds[1:]):
+            if prev['stage'] != cur['stage']:
+                days = (date.fromisoformat(cur['news_date']) - date.fromisoformat(prev['news_date'])).days
+                transitions[(prev['stage'], cur['stage'])].append(days)
+    return {key: (len(days), median(days)) for key, days in transitions.items()}
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    years = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    deals = make_history(years, per_day)
+    last_year = (date.fromisoformat(deals[-1]['news_date']) - timedelta(days=365))
+
+    with tempfile.TemporaryDirectory() as root:
+        export_seconds, info = timed(lambda: write_snapshot(deals, DEALS, root=root, keep=1), repeat=1)
+
+        open_seconds, warehouse = timed(lambda: DealWarehouse(root), repeat=1)
+        with DealWarehouse(root, in_memory=False) as files, warehouse:
+            # 결과 동일성
+            yearly = warehouse.funding_trends('year')
+            expected = rows_yearly(deals)
+            assert list(yearly['deals']) == list(expected['size'])
+            assert max(abs(a - b) for a, b in zip(yearly['amount_eok'], expected['sum'])) < 1e-6
+            league = warehouse.investor_league(limit=20)
+            assert list(league['investor']) == rows_investor_league(deals)
+            filtered = warehouse.investor_league(start=last_year, industry='핀테크', limit=20)
+            assert list(filtered['investor']) == rows_investor_league(deals, start=last_year.isoformat(), industry='핀테크')
+            transitions = warehouse.stage_transitions()
+            assert {(r.from_stage, r.to_stage): (r.transitions, r.median_days) for r in transitions.itertuples()} \
+                == rows_stage_transitions(deals)
+
+            rows = [
+                ("연도별 추이: 행 목록 + pandas", lambda: rows_yearly(deals)),
+                ("연도별 추이: DuckDB", lambda: warehouse.funding_trends('year')),
+                ("월 × 업종 추이: 행 목록 + pandas", lambda: rows_monthly_by_industry(deals)),
+                ("월 × 업종 추이: DuckDB", lambda: warehouse.funding_trends('month', by_industry=True)),
+                ("투자사 순위: 행 목록 + Counter", lambda: rows_investor_league(deals)),
+                ("투자사 순위: DuckDB", lambda: warehouse.investor_league()),
+                ("단계 전환: 행 목록 + 정렬", lambda: rows_stage_transitions(deals)),
+                ("단계 전환: DuckDB", lambda: warehouse.stage_transitions()),
+                ("핀테크·최근 1년 순위: 행 목록", lambda: rows_investor_league(deals, start=last_year.isoformat(), industry='핀테크')),
+                ("핀테크·최근 1년 순위: DuckDB", lambda: warehouse.investor_league(start=last_year, industry='핀테크')),
+                ("연도별 추이: Parquet 직접 (in_memory=False)", lambda: files.funding_trends('year')),
+                ("핀테크·최근 1년: Parquet 직접 (파티션 걸러냄)", lambda: files.investor_league(start=last_year, industry='핀테크')),
+            ]
+
+            print("=" * 80)
+            print(f"Deal Warehouse: {years}년 {len(deals):,}건 - 결과 동일성 확인")
+            print(f"스냅샷 내보내기 {export_seconds * 1000:.0f} ms, 파일 {info.files}개, {info.bytes / 1024 / 1024:.1f} MiB "
+                  f"(PostgREST 1,000행 페이지 {len(deals) // 1000 + 1}회 분량) / 메모리 적재 {open_seconds * 1000:.0f} ms")
+            print("=" * 80)
+            for name, fn in rows:
+                seconds, _ = timed(fn)
+                print(f"{name:44}{seconds * 1000:>10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+평가 엔진 조용한 실행(evaluate) 벤치마크
+
+입력을 조금씩 바꾼 DCF 평가 N건(기본 10,000)을
+- run_valuation (verbose, 단계별 설명 출력 → /dev/null)
+- run_valuation (verbose=False, 연도별 dict 결과)
+- evaluate / evaluate_many (출력 없음, __slots__ + array 결과)
+로 실행해 처리량과 결과 보관 메모리를 비교한다. 상증세법/본질가치 엔진의 evaluate도 함께 잰다.
+
+실행:
+    python benchmarks/bench_engine_quiet.py [평가 건수]
+"""
+import contextlib
+import copy
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.valuation_engine.dcf.dcf_engine import DCFEngine
+from app.services.valuation_engine.intrinsic.intrinsic_value_engine import CapitalMarketLawEngine
+from app.services.valuation_engine.tax.tax_law_engine import InheritanceTaxLawEngine
+from bench_instrumentation import DCF_INPUTS
+
+
+def make_inputs(count: int):
+    """성장률/베타/영구성장률을 흔든 시나리오 입력"""
+    rng = random.Random(42)
+    scenarios = []
+    for i in range(count):
+        inputs = copy.deepcopy(DCF_INPUTS)
+        inputs['company_id'] = f"SIM{i:05d}"
+        inputs['assumptions']['revenue_growth'] = [g * rng.uniform(0.7, 1.3) for g in inputs['assumptions']['revenue_growth']]
+        inputs['assumptions']['terminal_growth'] = rng.uniform(0.01, 0.03)
+        inputs['wacc_inputs']['beta'] = rng.uniform(0.8, 1.6)
+        scenarios.append(inputs)
+    return scenarios
+
+
+def timed(label: str, func, count: int, baseline=None, stdout=None):
+    gc.collect()
+    start = time.perf_counter()
+    if stdout is not None:
+        with contextlib.redirect_stdout(stdout):
+            results = func()
+    else:
+        results = func()
+    elapsed = time.perf_counter() - start
+    del results  # 이전 결과가 다음 측정의 GC 비용에 섞이지 않도록
+    speedup = f"{baseline / elapsed:>8.1f}x" if baseline else f"{'1.0x':>9}"
+    print(f"{label:42}{elapsed:>9.3f}s{count / elapsed:>12,.0f}/s{speedup}")
+    return elapsed
+
+
+def retained_bytes(func) -> int:
+    tracemalloc.start()
+    results = func()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del results
+    return size
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    scenarios = make_inputs(count)
+
+    verbose_engine = DCFEngine(verbose=True)
+    quiet_engine = DCFEngine(verbose=False)
+
+    print("=" * 80)
+    print(f"DCF {count:,}건 평가")
+    print("=" * 80)
+
+    # 같은 수치인지 먼저 확인 (created_at 제외)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for inputs in scenarios[:1000]:
+            verbose_result = verbose_engine.run_valuation(inputs)
+            dict_result = quiet_engine.run_valuation(inputs)
+            full = quiet_engine.evaluate(inputs).to_dict()
+            for key in ('normalized_financials', 'projections', 'wacc', 'discounted_fcf', 'terminal_value', 'valuation_result'):
+                assert full[key] == dict_result[key] == verbose_result[key], key
+
+    with open(os.devnull, "w") as devnull:
+        baseline = timed(
+            "run_valuation (verbose → /dev/null)",
+            lambda: [verbose_engine.run_valuation(inputs) for inputs in scenarios], count, stdout=devnull
+        )
+    timed("run_valuation (verbose=False)", lambda: [quiet_engine.run_valuation(inputs) for inputs in scenarios], count, baseline)
+    timed("evaluate", lambda: [quiet_engine.evaluate(inputs) for inputs in scenarios], count, baseline)
+    timed("evaluate_many", lambda: quiet_engine.evaluate_many(scenarios), count, baseline)
+    timed("evaluate + to_dict (보고서용 전체 결과)", lambda: [quiet_engine.evaluate(inputs).to_dict() for inputs in scenarios], count, baseline)
+
+    dict_bytes = retained_bytes(lambda: [quiet_engine.run_valuation(inputs) for inputs in scenarios])
+    compact_bytes = retained_bytes(lambda: quiet_engine.evaluate_many(scenarios))
+    print(f"\n결과 보관 메모리: dict {dict_bytes / count:,.0f} B/건, DCFResult {compact_bytes / count:,.0f} B/건")
+
+    print("\n" + "=" * 80)
+    print(f"상증세법 / 본질가치 {count:,}건 평가")
+    print("=" * 80)
+    rng = random.Random(7)
+    tax_args = [(rng.uniform(1e3, 1e4), rng.uniform(1e4, 1e5), i % 2 == 0, 0.1, 0.2) for i in range(count)]
+    tax_engine = InheritanceTaxLawEngine()
+    baseline = timed("상증세법 run_valuation", lambda: [tax_engine.run_valuation(*args) for args in tax_args], count)
+    timed("상증세법 evaluate", lambda: [tax_engine.evaluate(*args) for args in tax_args], count, baseline)
+
+    cml_engine = CapitalMarketLawEngine()
+    baseline = timed("본질가치 run_valuation", lambda: [cml_engine.run_valuation(a, b) for a, b, *_ in tax_args], count)
+    timed("본질가치 evaluate", lambda: [cml_engine.evaluate(a, b) for a, b, *_ in tax_args], count, baseline)
+
+
+if __name__ == "__main__":
+    main()
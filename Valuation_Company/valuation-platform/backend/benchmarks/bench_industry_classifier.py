@@ -0,0 +1,96 @@
+"""
+업종 분류 벤치마크
+
+기존 daily_auto_collect.categorize_industry 방식(카테고리 × 키워드 이중 루프)과
+컴파일된 IndustryClassifier(Aho-Corasick 또는 정규식, 메모 유/무)를 같은 업종 문자열에 돌려
+처리량(names/sec)과 결과 일치 여부를 비교하고, 일괄 UPDATE SQL 생성 시간도 측정한다.
+
+실행:
+    python benchmarks/bench_industry_classifier.py [업종 문자열 수]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services import industry_classifier as ic
+from app.services.industry_classifier import (
+    INDUSTRY_CATEGORIES,
+    IndustryClassifier,
+    IndustryUpdate,
+    build_update_sql,
+)
+
+WORDS = [
+    "AI 기반", "헬스케어", "바이오", "핀테크", "커머스", "모빌리티", "뷰티", "웹툰", "위성", "반도체",
+    "SaaS", "스마트팜", "에듀", "프롭", "태양광", "플랫폼", "서비스", "솔루션", "데이터", "로봇",
+    "O2O", "Proptech/AI", "Quantum/DX", "Web3", "소셜", "여행", "펫", "법률", "HR", "게임",
+]
+
+
+def naive_categorize(raw_industry):
+    """기존 구현 (비교 기준)"""
+    if not raw_industry:
+        return None
+    for category, keywords in INDUSTRY_CATEGORIES.items():
+        for kw in keywords:
+            if kw in raw_industry:
+                return category
+    return '기타'
+
+
+def make_names(count: int, distinct: int, seed: int = 7):
+    rng = random.Random(seed)
+    pool = [" ".join(rng.sample(WORDS, rng.randint(1, 3))) + f" {i}" for i in range(distinct)]
+    return [pool[rng.randrange(distinct)] for _ in range(count)]
+
+
+def measure(label: str, func, names):
+    start = time.perf_counter()
+    result = func(names)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34}{elapsed * 1000:>10.1f} ms{len(names) / elapsed:>16,.0f} names/s")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    for distinct in (1_000, count):
+        names = make_names(count, distinct)
+        print("=" * 78)
+        print(f"업종 분류 벤치마크 ({count:,}건, 서로 다른 문자열 {distinct:,}개)")
+        print("=" * 78)
+
+        expected = measure("naive (이중 루프)", lambda xs: [naive_categorize(x) for x in xs], names)
+
+        backends = [("aho-corasick", ic.ahocorasick)] if ic.ahocorasick is not None else []
+        backends.append(("regex", None))
+        for backend, module in backends:
+            saved = ic.ahocorasick
+            ic.ahocorasick = module
+            try:
+                cold = IndustryClassifier(memo_size=0)
+                warm = IndustryClassifier()
+            finally:
+                ic.ahocorasick = saved
+
+            result = measure(f"compiled {backend} (메모 없음)", cold.categorize_many, names)
+            assert result == expected, f"{backend} 결과 불일치"
+            result = measure(f"compiled {backend} (메모)", warm.categorize_many, names)
+            assert result == expected, f"{backend} (메모) 결과 불일치"
+
+    print("=" * 78)
+    updates = [IndustryUpdate(f"기업{i}", "AI 기반 헬스케어", "AI") for i in range(100_000)]
+    start = time.perf_counter()
+    sql = build_update_sql(updates)
+    print(f"UPDATE ... FROM (VALUES) 생성: 100,000곳 {(time.perf_counter() - start) * 1000:.1f} ms, {len(sql) / 1e6:.1f} MB")
+    print("결과: 모든 분류기 결과가 기존 구현과 일치")
+
+
+if __name__ == "__main__":
+    main()
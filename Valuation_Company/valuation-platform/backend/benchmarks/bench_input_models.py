@@ -0,0 +1,114 @@
+"""
+입력 검증/정규화 처리량 벤치마크
+
+DCF 입력 한 건을 기준으로
+  - dict 경로: DCFService 이전 방식의 수기 검증 + DCFEngine.evaluate(dict) (엔진이 .get(key, default)로 읽음)
+  - typed 경로: DCFInput.model_validate (검증·기본값 채움 1회) + DCFEngine.evaluate(DCFInput)
+를 비교하고, 검증만 / 평가만 시간을 따로 보여 준다. 두 경로의 결과가 같은지와
+잘못된 입력의 필드 경로 오류도 출력한다.
+
+실행:
+    python benchmarks/bench_input_models.py [건수]
+"""
+import copy
+import gc
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.valuation_engine.dcf.dcf_engine import DCFEngine
+from app.services.valuation_engine.inputs import DCFInput, InputValidationError, parse_input
+from bench_instrumentation import DCF_INPUTS
+
+REQUIRED_FIELDS = (
+    'company_id', 'company_name', 'valuation_date', 'historical_financials',
+    'assumptions', 'wacc_inputs', 'adjustments',
+)
+
+
+def validate_dict(input_data):
+    """이전 DCFService.validate_inputs (필수 키 / 과거 재무제표 3년 확인)"""
+    for field in REQUIRED_FIELDS:
+        if field not in input_data:
+            return False, f"필수 필드 누락: {field}"
+    if not isinstance(input_data['historical_financials'], list) or len(input_data['historical_financials']) < 3:
+        return False, "과거 재무제표는 최소 3년 이상 필요합니다."
+    return True, None
+
+
+def make_inputs(count):
+    """건마다 매출·성장률을 조금씩 바꾼 입력 (요청마다 새 dict가 들어오는 상황)"""
+    inputs = []
+    for i in range(count):
+        data = copy.deepcopy(DCF_INPUTS)
+        data['company_id'] = f'BENCH{i:05d}'
+        data['historical_financials'][-1]['revenue'] *= 1 + (i % 50) / 1000
+        data['assumptions']['revenue_growth'] = [g + (i % 7) / 1000 for g in data['assumptions']['revenue_growth']]
+        inputs.append(data)
+    return inputs
+
+
+def timed(fn, items):
+    gc.collect()
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    engine = DCFEngine(verbose=False)
+    raw = make_inputs(count)
+    typed = [DCFInput.model_validate(data) for data in raw]
+
+    # 결과 동일성 (created_at 제외)
+    for data, model in zip(raw[:1000], typed[:1000]):
+        expected = engine.evaluate(data).to_dict()
+        actual = engine.evaluate(model).to_dict()
+        expected.pop('created_at')
+        actual.pop('created_at')
+        assert expected == actual, data['company_id']
+
+    def dict_path(data):
+        validate_dict(data)
+        engine._evaluate(data)
+
+    def typed_path(data):
+        engine._evaluate(DCFInput.model_validate(data))
+
+    rows = [
+        ("검증: 수기 dict 검사", timed(validate_dict, raw)),
+        ("검증: DCFInput.model_validate", timed(DCFInput.model_validate, raw)),
+        ("평가: evaluate(dict)", timed(engine._evaluate, raw)),
+        ("평가: evaluate(DCFInput)", timed(engine._evaluate, typed)),
+        ("전체: dict 경로", timed(dict_path, raw)),
+        ("전체: typed 경로", timed(typed_path, raw)),
+    ]
+
+    print("=" * 72)
+    print(f"DCF 입력 검증/평가 처리량: {count:,}건 (span 제외, 1000건 결과 동일성 확인)")
+    print("=" * 72)
+    for name, seconds in rows:
+        print(f"{name:34}{seconds:>9.3f}s{count / seconds:>14,.0f} 건/s{seconds / count * 1e6:>10.1f} µs/건")
+
+    # 잘못된 입력의 필드 경로 오류
+    bad = copy.deepcopy(DCF_INPUTS)
+    bad['historical_financials'][2]['revenue'] = 'N/A'
+    del bad['wacc_inputs']['beta']
+    bad['adjustments']['shares_outstanding'] = 0
+    bad['projection_period'] = 7
+    print("\n잘못된 입력 오류 (필드 경로):")
+    try:
+        parse_input('dcf', bad)
+    except InputValidationError as e:
+        for error in e.errors:
+            print(f"  {error['loc']:34}{error['type']:18}{error['msg']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+요청 계측 오버헤드 벤치마크
+
+같은 엔드포인트(DCF 평가 1회 + SQLite 쿼리 3회)를 MetricsMiddleware 없이 / 있을 때 / 느린 요청 프로파일까지 켰을 때
+ASGI 레벨에서 직접 호출해 요청당 시간을 비교하고, span() 1회 비용을 따로 잰다.
+
+실행:
+    python benchmarks/bench_instrumentation.py [요청 수]
+"""
+import asyncio
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import sqlalchemy as sa
+from fastapi import FastAPI
+from sqlalchemy.pool import StaticPool
+
+from app.core.instrumentation import MetricsMiddleware, instrument_sqlalchemy, registry, span
+from app.services.valuation_engine.dcf.dcf_engine import DCFEngine
+
+DCF_INPUTS = {
+    'company_id': 'BENCH001',
+    'company_name': '벤치마크기업',
+    'valuation_date': '2025-01-01',
+    'historical_financials': [
+        {'year': 2022, 'revenue': 100e9, 'operating_income': 12e9, 'net_income': 8e9, 'depreciation': 3e9,
+         'capex': 4e9, 'working_capital_change': 1e9, 'tax_rate': 0.25, 'one_time_items': [5e8]},
+        {'year': 2023, 'revenue': 115e9, 'operating_income': 15e9, 'net_income': 10e9, 'depreciation': 3.5e9,
+         'capex': 5e9, 'working_capital_change': 1.5e9, 'tax_rate': 0.25},
+        {'year': 2024, 'revenue': 130e9, 'operating_income': 18e9, 'net_income': 12e9, 'depreciation': 4e9,
+         'capex': 6e9, 'working_capital_change': 1.5e9, 'tax_rate': 0.25},
+    ],
+    'assumptions': {
+        'base_year': 2024, 'revenue_growth': [0.12, 0.10, 0.08, 0.06, 0.05], 'target_operating_margin': 0.15,
+        'tax_rate': 0.25, 'depreciation_rate': 0.03, 'capex_rate': 0.05, 'wc_rate': 0.10, 'terminal_growth': 0.03,
+    },
+    'wacc_inputs': {
+        'risk_free_rate': 0.035, 'beta': 1.2, 'market_premium': 0.07, 'cost_of_debt': 0.05,
+        'debt_ratio': 0.30, 'tax_rate': 0.25,
+    },
+    'adjustments': {
+        'cash': 10e9, 'total_debt': 30e9, 'non_operating_assets': 5e9, 'shares_outstanding': 10_000_000,
+    },
+}
+
+
+def build_app(engine: sa.Engine) -> FastAPI:
+    app = FastAPI()
+    dcf = DCFEngine()
+
+    @app.get("/api/projects/{project_id}/valuation")
+    def valuation(project_id: str):
+        with engine.connect() as conn:
+            for _ in range(3):
+                conn.execute(sa.text("SELECT 1"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = dcf.run_valuation(DCF_INPUTS)
+        return {"project_id": project_id, "equity_value": result['valuation_result']['equity_value']}
+
+    return app
+
+
+async def call(asgi_app, path: str) -> int:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await asgi_app(scope, receive, send)
+    return status
+
+
+async def measure(asgi_app, requests: int) -> float:
+    for i in range(20):  # 워밍업
+        await call(asgi_app, f"/api/projects/P{i}/valuation")
+    start = time.perf_counter()
+    for i in range(requests):
+        assert await call(asgi_app, f"/api/projects/P{i}/valuation") == 200
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    engine = sa.create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    instrument_sqlalchemy(engine)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = [
+            ("no middleware", build_app(engine)),
+            ("metrics", MetricsMiddleware(build_app(engine))),
+            ("metrics + profiler (never slow)", MetricsMiddleware(build_app(engine), slow_request_seconds=60.0, profile_dir=tmp)),
+        ]
+
+        print("=" * 72)
+        print(f"요청 계측 오버헤드: {requests} 요청 (DCF 1회 + SQLite 쿼리 3회)")
+        print("=" * 72)
+        # 변형을 번갈아 3회씩 실행해 최솟값 비교 (실행 순서 영향 제거)
+        timings = {name: [] for name, _ in variants}
+        for _ in range(3):
+            for name, asgi_app in variants:
+                timings[name].append(asyncio.run(measure(asgi_app, requests)))
+
+        baseline = None
+        for name, _ in variants:
+            per_request = min(timings[name])
+            baseline = baseline or per_request
+            print(f"{name:34}{per_request * 1e6:>10.1f} µs/req{(per_request - baseline) * 1e6:>+10.1f} µs")
+
+    iterations = 200_000
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with span("bench", engine="bench"):
+            pass
+    print(f"{'span() 1회':34}{(time.perf_counter() - start) / iterations * 1e6:>10.2f} µs")
+
+    stage_metric = registry.get("valuation_stage_duration_seconds")
+    print("\nDCF 단계별 평균 (µs):")
+    for stage in ("normalize", "project", "wacc", "discount", "terminal_value", "equity"):
+        count = stage_metric.count(("dcf", stage))
+        print(f"  {stage:16}{stage_metric.sum(('dcf', stage)) / count * 1e6:>10.1f}  (n={count})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+"""
+보고서 번호 발급 동시성 스트레스 / 처리량 벤치마크
+
+1. 동시 발행: 여러 스레드가 각자 세션으로 issue_report()를 호출 (같은 멱등 키를 두 스레드가 동시에 재시도하는 요청 포함)
+   → 번호 중복 없음, 1..N 연속(누락 없음), 멱등 키당 보고서 1건인지 확인 (어긋나면 종료 코드 1)
+2. (이전) COUNT(*) LIKE 'VR-YYYY-%' + 1 방식을 같은 조건으로 실행해 번호 충돌 건수 비교
+3. 보관된 보고서 수별 번호 발급 1회 시간: COUNT 방식 vs 연도별 카운터
+
+SQLite 파일 DB 기준 (운영 PostgreSQL에서는 카운터 행 잠금으로 같은 연도 발행이 커밋까지 직렬화)
+
+실행:
+    python benchmarks/bench_report_numbering.py [--threads 16] [--issues 400]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import sqlalchemy as sa
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from models.report import Report
+from services.report_numbering import (
+    create_tables,
+    format_report_number,
+    issue_report,
+    report_number_counters_table,
+)
+
+YEAR = datetime.now().year
+PROJECTS = [f"BENCH-{i:02d}" for i in range(8)]
+
+
+def open_db(path: Path):
+    engine = sa.create_engine(f"sqlite:///{path}", connect_args={"timeout": 60, "check_same_thread": False})
+    Report.__table__.create(engine)
+    create_tables(engine)
+    return engine, sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def make_report(project_id: str, report_number: str) -> Report:
+    return Report(
+        report_id=f"RPT-{uuid.uuid4().hex[:16]}",
+        project_id=project_id,
+        report_number=report_number,
+        report_type="comprehensive",
+        delivery_format="pdf",
+        delivery_method="download",
+        issued_by="bench@valuelink.test",
+        issued_at=datetime.now(),
+    )
+
+
+def issue_by_count(db, project_id: str) -> Report:
+    """이전 방식: 연도 보고서 수 + 1"""
+    report_count = db.query(Report).filter(Report.report_number.like(f"VR-{YEAR}-%")).count()
+    report = make_report(project_id, format_report_number(YEAR, report_count + 1))
+    db.add(report)
+    db.commit()
+    return report
+
+
+def make_requests(issues: int):
+    """(project_id, 멱등 키) 목록 - 1/4은 키 없음, 나머지는 같은 키를 두 번(동시 재시도) 보냄"""
+    requests = []
+    keyless = issues // 4
+    for _ in range(keyless):
+        requests.append((random.choice(PROJECTS), None))
+    for i in range((issues - keyless) // 2):
+        request = (random.choice(PROJECTS), f"issue-{i:06d}")
+        requests.extend([request, request])
+    random.shuffle(requests)
+    return requests
+
+
+def stress_counter(session_factory, requests, threads: int):
+    replays = Counter()
+    errors = []
+    lock = threading.Lock()
+
+    def run(request):
+        project_id, key = request
+        db = session_factory()
+        try:
+            report, replayed = issue_report(db, project_id, lambda number: make_report(project_id, number), key)
+            with lock:
+                replays[replayed] += 1
+            return key, report.report_number
+        except Exception as e:
+            with lock:
+                errors.append(f"{type(e).__name__}: {e}")
+            return key, None
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(run, requests))
+    return time.perf_counter() - start, results, replays, errors
+
+
+def stress_count(session_factory, requests, threads: int):
+    collisions = 0
+    lock = threading.Lock()
+
+    def run(request):
+        nonlocal collisions
+        db = session_factory()
+        try:
+            issue_by_count(db, request[0])
+        except IntegrityError:
+            db.rollback()
+            with lock:
+                collisions += 1
+        finally:
+            db.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(run, requests))
+    return time.perf_counter() - start, collisions
+
+
+def check_counter_run(session_factory, requests, results):
+    """번호 중복·누락, 멱등 키당 보고서 1건 확인 → 문제 목록"""
+    problems = []
+    db = session_factory()
+    try:
+        numbers = [number for (number,) in db.query(Report.report_number)]
+        last_value = db.execute(
+            sa.select(report_number_counters_table.c.last_value).where(report_number_counters_table.c.year == YEAR)
+        ).scalar_one()
+    finally:
+        db.close()
+
+    expected_reports = sum(1 for _, key in requests if key is None) + len({r for r in requests if r[1]})
+    if len(numbers) != expected_reports:
+        problems.append(f"보고서 {len(numbers)}건 (기대 {expected_reports}건)")
+    duplicated = [n for n, c in Counter(numbers).items() if c > 1]
+    if duplicated:
+        problems.append(f"중복 번호 {len(duplicated)}개: {duplicated[:3]}")
+    expected_numbers = {format_report_number(YEAR, i) for i in range(1, len(numbers) + 1)}
+    if set(numbers) != expected_numbers:
+        problems.append(f"번호 누락/초과: {sorted(expected_numbers ^ set(numbers))[:3]}")
+    if last_value != len(numbers):
+        problems.append(f"카운터 {last_value} != 보고서 {len(numbers)}건")
+
+    by_key = {}
+    for key, number in results:
+        if key is not None and by_key.setdefault(key, number) != number:
+            problems.append(f"멱등 키 {key}에 서로 다른 번호: {by_key[key]}, {number}")
+    return problems
+
+
+def seed_archive(engine, count: int):
+    """이번 연도 보고서 count건 + 카운터 행"""
+    rows = [{
+        "report_id": f"RPT-SEED-{i:07d}", "project_id": PROJECTS[i % len(PROJECTS)],
+        "report_number": format_report_number(YEAR, i + 1), "report_type": "comprehensive",
+        "delivery_format": "pdf", "delivery_method": "download", "download_count": 0,
+        "created_at": datetime.now(), "updated_at": datetime.now(),
+    } for i in range(count)]
+    with engine.begin() as conn:
+        if rows:
+            conn.execute(Report.__table__.insert(), rows)
+        conn.execute(report_number_counters_table.insert(), {"year": YEAR, "last_value": count, "updated_at": datetime.now()})
+
+
+def time_issue(session_factory, issue, rounds: int) -> float:
+    db = session_factory()
+    try:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            issue(db)
+        return (time.perf_counter() - start) / rounds
+    finally:
+        db.close()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="보고서 번호 발급 동시성 / 처리량 벤치마크")
+    arg_parser.add_argument("--threads", type=int, default=16)
+    arg_parser.add_argument("--issues", type=int, default=400, help="동시 발행 요청 수 (재시도 포함)")
+    arg_parser.add_argument("--rounds", type=int, default=200, help="보관 규모별 발급 시간 측정 횟수")
+    args = arg_parser.parse_args()
+    random.seed(7)
+    requests = make_requests(args.issues)
+
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        print("=" * 80)
+        print(f"동시 발행: 요청 {len(requests)}건, 스레드 {args.threads}개 (SQLite 파일 DB)")
+        print("=" * 80)
+
+        engine, session_factory = open_db(Path(tmp) / "counter.db")
+        seconds, results, replays, errors = stress_counter(session_factory, requests, args.threads)
+        problems = check_counter_run(session_factory, requests, results) + errors[:5]
+        engine.dispose()
+        print(f"{'연도별 카운터 + 멱등 키':28}{seconds:>8.2f}s  신규 {replays[False]}건, 재요청 반환 {replays[True]}건, "
+              f"{'OK (중복/누락 없음)' if not problems else 'FAIL'}")
+        for problem in problems:
+            print(f"    - {problem}")
+        failed = bool(problems)
+
+        engine, session_factory = open_db(Path(tmp) / "count.db")
+        seconds, collisions = stress_count(session_factory, requests, args.threads)
+        engine.dispose()
+        print(f"{'(이전) COUNT + 1':28}{seconds:>8.2f}s  번호 충돌(UNIQUE 위반) {collisions}건 / {len(requests)}건")
+
+        print("\n보관 보고서 수별 번호 발급 + INSERT 1회 (µs)")
+        print(f"{'archive':>10}{'COUNT + 1':>14}{'counter':>14}")
+        for size in (0, 10_000, 100_000):
+            timings = []
+            for name, issue in (
+                ("count", lambda db: issue_by_count(db, PROJECTS[0])),
+                ("counter", lambda db: issue_report(db, PROJECTS[0], lambda n: make_report(PROJECTS[0], n))),
+            ):
+                engine, session_factory = open_db(Path(tmp) / f"{name}-{size}.db")
+                seed_archive(engine, size)
+                timings.append(time_issue(session_factory, issue, args.rounds))
+                engine.dispose()
+            print(f"{size:>10,}{timings[0] * 1e6:>14.0f}{timings[1] * 1e6:>14.0f}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
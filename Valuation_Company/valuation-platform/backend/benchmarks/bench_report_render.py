@@ -0,0 +1,93 @@
+"""
+보고서 HTML 렌더링 벤치마크
+
+5가지 평가법 종합 보고서의 HTML 렌더링 시간 측정
+- 기존 방식: 템플릿 문자열에 대해 키마다 str.replace
+- 현재 방식: 모듈 로드 시 컴파일된 Jinja2 템플릿 + 프래그먼트 캐시
+
+실행:
+    python benchmarks/bench_report_render.py [반복 횟수]
+"""
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 sys.path에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from services.report_generator import ReportGenerator, _REPORT_TEMPLATE_SOURCES
+
+
+PROJECT_DATA = {
+    'company_name_kr': '테스트기업',
+    'valuation_date': '2025-01-19',
+    'valuation_purpose': 'MA',
+    'valuation_methods': ['dcf', 'relative', 'capital_market_law', 'asset', 'inheritance_tax_law'],
+    'ceo_name': '홍길동',
+    'founded_date': '2015-03-01',
+    'industry': '소프트웨어',
+    'is_listed': False,
+}
+
+VALUATION_RESULT = {
+    'method_results': [
+        {'method': 'dcf', 'method_name': 'DCF평가법', 'equity_value': 1000000000, 'weight': 0.3, 'success': True},
+        {'method': 'relative', 'method_name': '상대가치평가법', 'equity_value': 950000000, 'weight': 0.2, 'success': True},
+        {'method': 'capital_market_law', 'method_name': '본질가치평가법', 'equity_value': 980000000, 'weight': 0.2, 'success': True},
+        {'method': 'asset', 'method_name': '자산가치평가법', 'equity_value': 900000000, 'weight': 0.15, 'success': True},
+        {'method': 'inheritance_tax_law', 'method_name': '상증세법평가법', 'equity_value': 920000000, 'weight': 0.15, 'success': True},
+    ],
+    'final_value': 960000000,
+    'value_range': {'min': 900000000, 'median': 950000000, 'max': 1000000000},
+    'weighted_average': 960000000,
+    'recommendation': '종합 평가 결과 약 9억 6천만원의 기업가치를 가진 것으로 판단됩니다.',
+}
+
+
+def legacy_render(template: str, data: dict) -> str:
+    """기존 str.replace 방식 (비교용)"""
+    html = template
+    for key, value in data.items():
+        placeholder = "{{ " + key + " }}"
+        html = html.replace(placeholder, str(value))
+    return html
+
+
+def bench(label: str, func, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    per_call_us = elapsed / iterations * 1_000_000
+    print(f"{label:<32} {per_call_us:>10.1f} µs/report  ({iterations}회, 총 {elapsed:.3f}s)")
+    return per_call_us
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    # 렌더링 경로는 Supabase를 사용하지 않으므로 더미 클라이언트 주입
+    generator = ReportGenerator("BENCH-0000000000-CP", "comprehensive", supabase=object())
+
+    def prepare():
+        return generator._prepare_report_data(
+            PROJECT_DATA, VALUATION_RESULT, 'draft', True, True, 'ko'
+        )
+
+    def legacy():
+        legacy_render(_REPORT_TEMPLATE_SOURCES['ko'], prepare())
+
+    def compiled():
+        generator._render_html(generator._get_template('ko'), prepare())
+
+    print("=" * 70)
+    print("보고서 HTML 렌더링 벤치마크 (5가지 평가법 종합 보고서)")
+    print("=" * 70)
+    legacy_us = bench("legacy str.replace", legacy, iterations)
+    compiled_us = bench("compiled Jinja2 + fragments", compiled, iterations)
+    print(f"\n속도 향상: {legacy_us / compiled_us:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+기동(import) 시간 벤치마크
+
+새 파이썬 프로세스에서 각 진입점을 import / 첫 엔진 생성까지 걸리는 시간을 여러 번 재서 중앙값을 보고,
+import 후 numpy/scipy/pandas가 로드되었는지도 표시한다. --target-ms를 넘는 항목이 있으면 종료 코드 1.
+
+실행:
+    python benchmarks/bench_startup.py [--runs 5] [--target-ms 2000]
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("numpy", "scipy", "pandas")
+
+# (이름, 측정할 코드, 목표 적용 여부)
+SCENARIOS = [
+    ("python (baseline)", "pass", False),
+    ("import app.main", "import app.main", True),
+    ("import main (root API)", "import main", True),
+    ("worker: create_engine('dcf')",
+     "from app.services.valuation_engine import create_engine; create_engine('dcf', verbose=False)", True),
+    ("worker: all 5 engines",
+     "from app.services.valuation_engine import available_methods, create_engine\n"
+     "for method in available_methods(): create_engine(method)", True),
+    ("services.DCFService()", "from services import DCFService; DCFService()", True),
+    ("(이전) sys.path 경유 기존 DCF 엔진",
+     "import sys; sys.path.insert(0, '../../기업가치평가플랫폼/valuation_engine')\n"
+     "from dcf.dcf_engine import DCFEngine; DCFEngine()", False),
+    ("(참고) numpy + scipy.optimize", "import numpy, scipy.optimize", False),
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+error = None
+try:
+    exec(compile({code!r}, "<bench>", "exec"))
+except Exception as e:
+    error = f"{{type(e).__name__}}: {{e}}"
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "error": error,
+    "heavy": [name for name in {heavy!r} if name in sys.modules],
+}}))
+"""
+
+
+def measure(code: str) -> dict:
+    """새 프로세스에서 code 실행 - 인터프리터 기동 포함 전체 시간과 code 자체 시간"""
+    import time
+
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code, heavy=HEAVY_MODULES)],
+        cwd=project_root,
+        capture_output=True,
+        text=True
+    )
+    wall = time.perf_counter() - start
+    lines = completed.stdout.strip().splitlines()
+    if completed.returncode != 0 or not lines:
+        return {"seconds": None, "wall": wall, "error": completed.stderr.strip()[-200:], "heavy": []}
+    result = json.loads(lines[-1])
+    result["wall"] = wall
+    return result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="기동(import) 시간 벤치마크")
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument("--target-ms", type=float, default=2000.0, help="진입점 import 목표 시간 (프로세스 전체)")
+    args = arg_parser.parse_args()
+
+    print("=" * 96)
+    print(f"기동 시간 (중앙값, {args.runs}회) - import: 코드 실행 시간 / process: 인터프리터 기동 포함, 목표 {args.target_ms:.0f}ms")
+    print("=" * 96)
+    print(f"{'scenario':42}{'import ms':>11}{'process ms':>12}  {'heavy modules':16}status")
+
+    over_target = []
+    for name, code, check in SCENARIOS:
+        runs = [measure(code) for _ in range(args.runs)]
+        errors = [r["error"] for r in runs if r["error"]]
+        import_ms = statistics.median(r["seconds"] for r in runs if r["seconds"] is not None) * 1000 \
+            if any(r["seconds"] is not None for r in runs) else float("nan")
+        process_ms = statistics.median(r["wall"] for r in runs) * 1000
+        heavy = ",".join(runs[-1]["heavy"]) or "-"
+
+        if errors:
+            status = f"import error: {errors[0].splitlines()[0][:60]}"
+        elif check and process_ms > args.target_ms:
+            status = "OVER TARGET"
+            over_target.append(name)
+        else:
+            status = "ok"
+        print(f"{name:42}{import_ms:>11.0f}{process_ms:>12.0f}  {heavy:16}{status}")
+
+    if over_target:
+        print(f"\n목표 초과: {', '.join(over_target)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Crawl Worker
+분할 수집 큐 워커 (여러 프로세스/서버에서 동시에 실행)
+
+CrawlerManager.crawl_all이 큐에 올린 (소스, 키워드, 페이지 구간) 샤드를 임대로 선점해 실행한다.
+수집을 시작한 프로세스와 같은 큐 DB(CRAWL_QUEUE_DATABASE_URL 또는 DATABASE_URL)를 봐야 한다.
+
+실행:
+    python crawl_worker.py [--run-id ID] [--concurrency 4] [--forever]
+    python crawl_worker.py --run-id ID --status          # 샤드별 상태
+    python crawl_worker.py --run-id ID --retry-failed    # 최종 실패한 샤드만 다시 대기열로
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import os
+from dotenv import load_dotenv
+
+# 경로 설정
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from app.services.news_crawler.article_cache import ArticleCache
+from app.services.news_crawler.crawler_manager import CrawlerManager
+from app.services.news_crawler.shard_queue import get_database_url, get_shard_queue
+
+load_dotenv(override=True)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("CrawlWorker")
+
+
+async def run_worker(run_id, concurrency, forever, poll_interval):
+    queue = get_shard_queue()
+    manager = CrawlerManager(queue=queue, article_cache=ArticleCache())
+    total = 0
+
+    while True:
+        executed = await manager.run_shard_worker(
+            queue,
+            run_id=run_id,
+            concurrency=concurrency,
+            poll_interval=poll_interval,
+            wait=run_id is not None
+        )
+        total += executed
+        if not forever:
+            break
+        await asyncio.sleep(poll_interval)
+
+    logger.info(f"Worker {queue.worker_id} executed {total} shards")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="분할 수집 큐 워커")
+    arg_parser.add_argument("--run-id", default=None, help="이 수집 실행의 샤드만 처리 (기본: 전체)")
+    arg_parser.add_argument("--concurrency", type=int, default=None, help="동시 실행 샤드 수")
+    arg_parser.add_argument("--poll-interval", type=float, default=5.0, help="대기 중 큐 조회 간격(초)")
+    arg_parser.add_argument("--forever", action="store_true", help="샤드가 없어도 종료하지 않고 대기")
+    arg_parser.add_argument("--status", action="store_true", help="--run-id 샤드별 상태 출력")
+    arg_parser.add_argument("--retry-failed", action="store_true", help="--run-id의 최종 실패 샤드를 다시 대기열로")
+    args = arg_parser.parse_args()
+
+    if not get_database_url():
+        logger.error("CRAWL_QUEUE_DATABASE_URL 또는 DATABASE_URL이 필요합니다 (수집 프로세스와 같은 큐 DB).")
+        sys.exit(1)
+
+    if (args.status or args.retry_failed) and not args.run_id:
+        arg_parser.error("--status / --retry-failed 에는 --run-id가 필요합니다.")
+
+    queue = get_shard_queue()
+
+    if args.retry_failed:
+        logger.info(f"Requeued {queue.retry_failed(args.run_id)} failed shards")
+
+    if args.status:
+        print(queue.progress(args.run_id))
+        for shard in queue.shard_stats(args.run_id):
+            print(
+                f"{shard['status']:8} {shard['source']:14} {shard['keyword'] or '-':20} "
+                f"p{shard['page_start']}-{shard['page_end']} attempt={shard['attempt']} "
+                f"articles={shard['article_count']} worker={shard['worker_id']} error={shard['error'] or ''}"
+            )
+        return
+
+    asyncio.run(run_worker(args.run_id, args.concurrency, args.forever, args.poll_interval))
+
+
+if __name__ == "__main__":
+    main()
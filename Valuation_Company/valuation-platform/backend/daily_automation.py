@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.'))
 
 from app.services.news_crawler.crawler_manager import CrawlerManager
 from app.services.news_parser import NewsParser
+from app.services.deal_amounts import parse_amount_eok
 from app.services.investment_automation.enricher import DataEnricher
 from app.services.investment_automation.reporter import DailyReporter
 from supabase import create_client
@@ -55,6 +56,7 @@ async def run_daily_automation():
     logger.info(f"Connecting to Supabase: {os.getenv('SUPABASE_URL')}") # URL 확인용 로그
     
     new_deals = [] # 리스트 초기화
+    to_enrich = [] # 정보 보강 대상 기업명
     saved_count = 0
     skipped_count = 0
     
@@ -105,11 +107,9 @@ async def run_daily_automation():
                 skipped_count += 1
                 continue
 
-            # 3️⃣ 데이터 보강 (Enrichment)
+            # 3️⃣ 데이터 보강 대상 (Enrichment) - 저장 후 일괄 조회
             if not extracted.industry or extracted.industry in ["IT", "AI"]:
-                logger.info(f"🔍 {extracted.company_name_ko} 정보 보강 중...")
-                enriched_data = await enricher.enrich_company_info(extracted.company_name_ko)
-                # 보강 로직은 추후 고도화
+                to_enrich.append(extracted.company_name_ko)
 
             # 데이터 구성
             deal_data = {
@@ -117,6 +117,7 @@ async def run_daily_automation():
                 "industry": extracted.industry,
                 "stage": extracted.investment_stage,
                 "amount": extracted.investment_amount_krw,
+                "amount_eok": parse_amount_eok(extracted.investment_amount_krw),
                 "investors": ", ".join([inv.get("name", "") for inv in extracted.investors]) if extracted.investors else extracted.lead_investor,
                 "news_title": news.title,
                 "news_url": news.source_url,
@@ -134,6 +135,14 @@ async def run_daily_automation():
 
     logger.info(f"📊 최종 결과: {len(new_deals)}건의 새로운 Deal 등록 완료")
 
+    # 3. 데이터 보강 (공유 연결 풀 / 캐시 / 호출 한도 내 동시 조회)
+    if to_enrich:
+        logger.info(f"3️⃣ {len(to_enrich)}개 기업 정보 보강 중...")
+        async with enricher:
+            enriched_data = await enricher.enrich_companies(to_enrich)
+            # 보강 로직은 추후 고도화
+
+
     # 4. 데일리 리포트 발송
     if new_deals:
         logger.info("4️⃣ 데일리 리포트 발송 단계 시작...")
@@ -0,0 +1,57 @@
+-- ================================================================
+-- deals 테이블에 재정제 상태 추가
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: reprocess_deals.py 증분 처리
+--       추출에 사용한 파서 버전을 저장해
+--       입력(제목/URL/사이트)이 바뀌었거나 파서가 갱신된 Deal만 다시 추출
+-- ================================================================
+
+ALTER TABLE deals
+ADD COLUMN IF NOT EXISTS parser_version TEXT,
+ADD COLUMN IF NOT EXISTS reprocessed_at TIMESTAMPTZ;
+
+-- 입력(제목/URL/사이트)이 바뀌면 parser_version을 비워 재정제 대상으로 되돌림
+-- → reprocess_deals.py는 "parser_version이 NULL이거나 현재 버전이 아님" 조건만 DB에 넘겨 대상을 고른다
+CREATE OR REPLACE FUNCTION reset_deal_parser_version()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.news_title IS DISTINCT FROM OLD.news_title
+       OR NEW.news_url IS DISTINCT FROM OLD.news_url
+       OR NEW.site_name IS DISTINCT FROM OLD.site_name THEN
+        NEW.parser_version := NULL;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_deals_reset_parser_version ON deals;
+CREATE TRIGGER trg_deals_reset_parser_version
+    BEFORE UPDATE OF news_title, news_url, site_name ON deals
+    FOR EACH ROW
+    EXECUTE FUNCTION reset_deal_parser_version();
+
+-- 재정제 대상 조회 (parser_version 조건 + id 키셋)
+CREATE INDEX IF NOT EXISTS ix_deals_parser_version_id
+    ON deals (parser_version, id);
+
+-- 재정제 결과 일괄 반영 (배치 한 번에 UPDATE 한 번, 갱신 행 수 반환)
+-- p_rows: [{"id", "parser_version", "reprocessed_at", 바뀐 컬럼(industry / amount / amount_eok)만}]
+-- 없는 키는 NULL로 읽히므로 COALESCE로 기존 값 유지 (재정제는 값을 NULL로 바꾸지 않음)
+CREATE OR REPLACE FUNCTION update_deals_reprocessed(p_rows JSONB)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    WITH updated AS (
+        UPDATE deals AS d
+        SET industry = COALESCE(r.industry, d.industry),
+            amount = COALESCE(r.amount, d.amount),
+            amount_eok = COALESCE(r.amount_eok, d.amount_eok),
+            parser_version = r.parser_version,
+            reprocessed_at = r.reprocessed_at
+        FROM jsonb_populate_recordset(NULL::deals, p_rows) AS r
+        WHERE d.id = r.id
+        RETURNING d.id
+    )
+    SELECT COUNT(*)::INTEGER FROM updated;
+$$;
@@ -0,0 +1,13 @@
+-- ================================================================
+-- documents 테이블에 파일 해시 추가
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: 업로드 시 계산한 SHA-256으로 동일 문서 중복 저장 방지
+--       (수정 요청 후 같은 파일을 다시 올리는 경우 등)
+-- ================================================================
+
+ALTER TABLE documents
+ADD COLUMN IF NOT EXISTS file_hash CHAR(64);
+
+CREATE INDEX IF NOT EXISTS idx_documents_project_file_hash
+    ON documents (project_id, file_hash);
@@ -0,0 +1,42 @@
+-- ================================================================
+-- 목록 API 키셋 페이지네이션 인덱스
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: 목록 조회를 OFFSET 대신 "마지막 행 다음부터" 조건으로 바꾸면서
+--       정렬 순서와 같은 복합 인덱스를 추가 (깊은 페이지도 인덱스 범위 스캔 한 번)
+--       - GET /admin/projects        : [status,] created_at DESC, project_id DESC
+--       - GET /investment-tracker/companies : [industry | latest_stage,] latest_round_date DESC NULLS LAST, id DESC
+--       - GET /investment-tracker/news      : [source | company_id,] published_date DESC NULLS LAST, id DESC
+-- ================================================================
+
+-- 1. projects (관리자 전체 프로젝트 조회)
+CREATE INDEX IF NOT EXISTS ix_projects_status_created_at_project_id
+    ON projects (status, created_at, project_id);
+
+CREATE INDEX IF NOT EXISTS ix_projects_created_at_project_id
+    ON projects (created_at, project_id);
+
+-- 2. startup_companies (기업 목록 - 최근 투자일 순)
+CREATE INDEX IF NOT EXISTS ix_startup_companies_round_date_id
+    ON startup_companies (latest_round_date DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_startup_companies_industry_round_date_id
+    ON startup_companies (industry, latest_round_date DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_startup_companies_stage_round_date_id
+    ON startup_companies (latest_stage, latest_round_date DESC NULLS LAST, id DESC);
+
+-- 3. investment_news (뉴스 목록 - 최신 발행일 순)
+CREATE INDEX IF NOT EXISTS ix_investment_news_published_date_id
+    ON investment_news (published_date DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_investment_news_source_published_date_id
+    ON investment_news (source, published_date DESC NULLS LAST, id DESC);
+
+CREATE INDEX IF NOT EXISTS ix_investment_news_company_published_date_id
+    ON investment_news (company_id, published_date DESC NULLS LAST, id DESC);
+
+-- 추정 건수(count=estimated, pg_class.reltuples) 갱신
+ANALYZE projects;
+ANALYZE startup_companies;
+ANALYZE investment_news;
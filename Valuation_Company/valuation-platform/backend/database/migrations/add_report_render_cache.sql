@@ -0,0 +1,48 @@
+-- ================================================================
+-- 보고서 PDF 렌더링 캐시 (콘텐츠 주소 기반)
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: 동일 입력으로 재생성되는 초안/최종 보고서 PDF 재사용
+--
+-- content_hash = SHA-256(프로젝트 ID, 프로젝트 데이터, 평가 결과, 모드, 옵션, 템플릿 버전)
+-- ref_count    = 이 PDF를 참조하는 현재 초안/발행 보고서 수
+--                0이 되면 Storage 객체와 함께 삭제
+-- ================================================================
+
+-- 1. 렌더링 캐시 테이블
+CREATE TABLE IF NOT EXISTS report_renders (
+    content_hash CHAR(64) PRIMARY KEY,
+    project_id TEXT NOT NULL,
+    mode TEXT NOT NULL CHECK (mode IN ('draft', 'final')),
+    file_path TEXT NOT NULL,
+    pdf_url TEXT NOT NULL,
+    size_bytes BIGINT,
+    ref_count INTEGER NOT NULL DEFAULT 0 CHECK (ref_count >= 0),
+    is_current_draft BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_report_renders_project_current_draft
+    ON report_renders (project_id)
+    WHERE mode = 'draft' AND is_current_draft;
+
+-- 2. 참조 카운트 원자적 증감 (남은 참조 수 반환)
+CREATE OR REPLACE FUNCTION adjust_report_render_ref(p_content_hash TEXT, p_delta INTEGER)
+RETURNS INTEGER
+LANGUAGE sql
+AS $$
+    UPDATE report_renders
+    SET ref_count = GREATEST(ref_count + p_delta, 0)
+    WHERE content_hash = p_content_hash
+    RETURNING ref_count;
+$$;
+
+-- 3. 발행 보고서 / 초안에 렌더링 해시 기록
+ALTER TABLE reports
+ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+
+ALTER TABLE drafts
+ADD COLUMN IF NOT EXISTS content_hash CHAR(64);
+
+CREATE INDEX IF NOT EXISTS idx_drafts_project_content_hash
+    ON drafts (project_id, content_hash);
@@ -0,0 +1,11 @@
+-- ================================================================
+-- reports 테이블: 프로젝트별 최신 보고서 조회 인덱스
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: 보고서 다운로드 시
+--       WHERE project_id = ? ORDER BY issued_at DESC LIMIT 1
+--       를 인덱스 역방향 스캔 한 번으로 처리
+-- ================================================================
+
+CREATE INDEX IF NOT EXISTS ix_reports_project_issued_at
+    ON reports (project_id, issued_at);
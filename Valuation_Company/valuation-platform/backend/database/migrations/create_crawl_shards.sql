@@ -0,0 +1,34 @@
+-- ================================================================
+-- 분할 수집 작업 큐 테이블
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: CrawlerManager.crawl_all이 (소스, 키워드, 페이지 구간) 샤드를 올리고
+--       여러 프로세스/서버의 워커(crawl_worker.py)가 임대(lease)로 선점해 실행
+--       실패한 샤드만 available_at 이후 재시도, 결과 기사는 result(JSON)에 저장
+-- ================================================================
+
+CREATE TABLE IF NOT EXISTS crawl_shards (
+    id SERIAL PRIMARY KEY,
+    run_id VARCHAR(64) NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    keyword VARCHAR(200) NOT NULL DEFAULT '',   -- ''는 키워드 없는 목록 페이지
+    page_start INTEGER NOT NULL,
+    page_end INTEGER NOT NULL,
+    status VARCHAR(20) NOT NULL,                -- pending, running, done, failed
+    attempt INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at TIMESTAMPTZ NOT NULL,
+    worker_id VARCHAR(191),
+    lease_until TIMESTAMPTZ,
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ,
+    duration_seconds DOUBLE PRECISION,
+    article_count INTEGER,
+    result TEXT,
+    error TEXT,
+    CONSTRAINT uq_crawl_shards_run_shard UNIQUE (run_id, source, keyword, page_start)
+);
+
+-- 선점 대상 조회 (run_id별 pending / 만료된 running)
+CREATE INDEX IF NOT EXISTS idx_crawl_shards_run_status
+ON crawl_shards(run_id, status, available_at);
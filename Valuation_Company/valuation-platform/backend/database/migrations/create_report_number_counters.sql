@@ -0,0 +1,37 @@
+-- ================================================================
+-- 보고서 번호 연도별 카운터 + 발행 멱등 키
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: 보고서 발행 시 COUNT(*) ... LIKE 'VR-YYYY-%' 전체 스캔 대신
+--       연도별 카운터 행을 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 으로 증가 (O(1), 동시 발행 중복 없음)
+--       (project_id, idempotency_key) UNIQUE 로 같은 발행 요청 재시도는 기존 보고서 반환
+-- ================================================================
+
+CREATE TABLE IF NOT EXISTS report_number_counters (
+    year INTEGER PRIMARY KEY,
+    last_value INTEGER NOT NULL,                -- 마지막으로 발급한 순번
+    updated_at TIMESTAMPTZ NOT NULL
+);
+
+ALTER TABLE reports ADD COLUMN IF NOT EXISTS report_number VARCHAR(20);
+ALTER TABLE reports ADD COLUMN IF NOT EXISTS idempotency_key VARCHAR(100);
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_reports_report_number
+    ON reports (report_number);
+
+-- idempotency_key가 NULL인 발행(키 없이 호출)은 서로 충돌하지 않음
+CREATE UNIQUE INDEX IF NOT EXISTS uq_reports_project_idempotency_key
+    ON reports (project_id, idempotency_key);
+
+-- 기존 보고서 번호에서 연도별 마지막 순번으로 카운터 초기화 (다시 실행해도 줄어들지 않음)
+INSERT INTO report_number_counters (year, last_value, updated_at)
+SELECT
+    CAST(SUBSTRING(report_number FROM 4 FOR 4) AS INTEGER),
+    MAX(CAST(SUBSTRING(report_number FROM 9) AS INTEGER)),
+    NOW()
+FROM reports
+WHERE report_number ~ '^VR-[0-9]{4}-[0-9]+$'
+GROUP BY 1
+ON CONFLICT (year) DO UPDATE
+    SET last_value = GREATEST(report_number_counters.last_value, EXCLUDED.last_value),
+        updated_at = EXCLUDED.updated_at;
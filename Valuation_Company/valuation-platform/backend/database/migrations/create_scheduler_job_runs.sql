@@ -0,0 +1,27 @@
+-- ================================================================
+-- 스케줄러 실행 이력 / 워커 간 실행 임대 테이블
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: app/core/scheduler.py 작업을 여러 uvicorn 워커 중 하나만 실행
+--       (job_id, scheduled_at)을 먼저 INSERT한 워커가 실행하고 lease_until을 연장,
+--       임대가 만료된 'running' 행은 다른 워커가 이어받음
+--       (작업 정의 테이블 apscheduler_jobs는 SQLAlchemyJobStore가 생성)
+-- ================================================================
+
+CREATE TABLE IF NOT EXISTS scheduler_job_runs (
+    id SERIAL PRIMARY KEY,
+    job_id VARCHAR(191) NOT NULL,
+    scheduled_at TIMESTAMPTZ NOT NULL,
+    worker_id VARCHAR(191) NOT NULL,
+    status VARCHAR(20) NOT NULL,           -- running, succeeded, failed
+    attempt INTEGER NOT NULL DEFAULT 1,
+    started_at TIMESTAMPTZ NOT NULL,
+    finished_at TIMESTAMPTZ,
+    lease_until TIMESTAMPTZ NOT NULL,
+    duration_seconds DOUBLE PRECISION,
+    error TEXT,
+    CONSTRAINT uq_scheduler_job_runs_job_scheduled UNIQUE (job_id, scheduled_at)
+);
+
+CREATE INDEX IF NOT EXISTS idx_scheduler_job_runs_job_scheduled
+ON scheduler_job_runs(job_id, scheduled_at DESC);
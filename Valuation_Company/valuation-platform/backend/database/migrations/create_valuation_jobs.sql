@@ -0,0 +1,42 @@
+-- ================================================================
+-- 통합 평가 비동기 작업 큐 테이블
+-- ================================================================
+-- 작성일: 2026-10-19
+-- 목적: 통합 평가 제출 API가 작업을 올리고 job_id를 바로 반환,
+--       워커(앱 내 워커 풀 / valuation_job_worker.py)가 임대(lease)로 선점해 실행
+--       같은 프로젝트 + 같은 입력의 진행 중 작업은 dedupe_key 부분 UNIQUE 인덱스로 1개만 유지
+-- ================================================================
+
+CREATE TABLE IF NOT EXISTS valuation_jobs (
+    job_id VARCHAR(36) PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,                  -- integrated_valuation, internal_integrated_valuation
+    project_id VARCHAR(64) NOT NULL,
+    dedupe_key VARCHAR(64) NOT NULL,            -- sha256(kind, project_id, payload)
+    status VARCHAR(20) NOT NULL,                -- queued, running, succeeded, failed, cancelled
+    stage VARCHAR(50),                          -- loading, evaluating, saving, done
+    payload TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempt INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    cancel_requested BOOLEAN NOT NULL DEFAULT FALSE,
+    worker_id VARCHAR(191),
+    lease_until TIMESTAMPTZ,
+    created_at TIMESTAMPTZ NOT NULL,
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ,
+    duration_seconds DOUBLE PRECISION
+);
+
+-- 진행 중인 작업끼리만 중복 금지 (INSERT ... ON CONFLICT (dedupe_key) WHERE ... DO NOTHING)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_valuation_jobs_active_dedupe
+ON valuation_jobs(dedupe_key)
+WHERE status IN ('queued', 'running');
+
+-- 선점 대상 조회 (오래된 queued / 만료된 running)
+CREATE INDEX IF NOT EXISTS idx_valuation_jobs_status_created
+ON valuation_jobs(status, created_at);
+
+-- 프로젝트별 작업 목록
+CREATE INDEX IF NOT EXISTS idx_valuation_jobs_project_created
+ON valuation_jobs(project_id, created_at);
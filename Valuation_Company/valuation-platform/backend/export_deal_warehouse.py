@@ -0,0 +1,69 @@
+"""
+Export Deal Warehouse
+deals / investment_news_articles Parquet 스냅샷 내보내기와 간단 조회 (app/services/deal_warehouse.py)
+
+API 서버 스케줄러(DEAL_WAREHOUSE_DIR 설정 시 매일 04:00 KST) 대신 cron 등에서 직접 돌릴 때 사용.
+스냅샷 루트는 --root → DEAL_WAREHOUSE_DIR → backend/data/warehouse 순.
+
+실행:
+    python export_deal_warehouse.py [--root DIR] [--tables deals investment_news_articles] [--keep 8]
+    python export_deal_warehouse.py --report [--since 2023-01-01]   # 최신 스냅샷으로 연도별 추이 / 투자사 순위 / 단계 전환
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import os
+from datetime import date
+from dotenv import load_dotenv
+
+# 경로 설정
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+load_dotenv(override=True)
+
+from app.services.deal_warehouse import TABLES, DealWarehouse, export_snapshots
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("ExportDealWarehouse")
+
+
+def print_report(root, since):
+    """최신 스냅샷 기준 요약 (라이브 DB 조회 없음)"""
+    with DealWarehouse(root) as warehouse:
+        print(f"스냅샷: {warehouse.snapshots}")
+        print("\n[연도별 투자 추이]")
+        print(warehouse.funding_trends("year", start=since).to_string(index=False))
+        print("\n[투자사 순위 Top 20]")
+        print(warehouse.investor_league(start=since).to_string(index=False))
+        print("\n[단계 전환]")
+        print(warehouse.stage_transitions(start=since).head(20).to_string(index=False))
+
+
+def parse_args():
+    arg_parser = argparse.ArgumentParser(description="Deal / 기사 Parquet 스냅샷 내보내기")
+    arg_parser.add_argument("--root", default=None, help="스냅샷 루트 디렉터리")
+    arg_parser.add_argument("--tables", nargs="+", choices=list(TABLES), default=list(TABLES), help="내보낼 테이블")
+    arg_parser.add_argument("--keep", type=int, default=8, help="테이블별로 남길 스냅샷 수")
+    arg_parser.add_argument("--page-size", type=int, default=1000, help="Supabase 조회 페이지 크기")
+    arg_parser.add_argument("--report", action="store_true", help="내보내지 않고 최신 스냅샷 요약만 출력")
+    arg_parser.add_argument("--since", type=date.fromisoformat, default=None, help="요약 시작일 (YYYY-MM-DD)")
+    return arg_parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.report:
+        print_report(args.root, args.since)
+    else:
+        results = asyncio.run(export_snapshots(
+            root=args.root,
+            tables=args.tables,
+            keep=args.keep,
+            page_size=args.page_size
+        ))
+        for name, info in results.items():
+            logger.info(
+                f"✅ {name}: {info['rows']}행 → {info['snapshot_id']} "
+                f"({info['files']}개 파일, {info['bytes'] / 1024 / 1024:.1f} MiB, {info['seconds']:.1f}초)"
+            )
@@ -7,7 +7,9 @@ FastAPI Main Application
 - 11단계 워크플로우 (requested → completed)
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import os
@@ -16,6 +18,14 @@ from dotenv import load_dotenv
 # 환경 변수 로드
 load_dotenv()
 
+from app.core.instrumentation import (
+    CONTENT_TYPE_LATEST,
+    MetricsMiddleware,
+    instrument_httpx,
+    instrument_sqlalchemy,
+    render_metrics,
+)
+
 # 역할별 라우터 임포트
 from routers import (
     customer_router,
@@ -23,6 +33,7 @@ from routers import (
     accountant_router,
     internal_router
 )
+from services.valuation_jobs import VALUATION_JOB_WORKERS, start_worker_pool, stop_worker_pool
 
 # 기존 라우터 (레퍼런스용 - 사용 안 함)
 # from routers import (
@@ -37,6 +48,14 @@ from routers import (
 #     master_valuation
 # )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """통합 평가 작업 워커 풀 시작/종료 (VALUATION_JOB_WORKERS=0이면 valuation_job_worker.py만 사용)"""
+    await start_worker_pool(VALUATION_JOB_WORKERS)
+    yield
+    await stop_worker_pool()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="기업가치평가 플랫폼 API",
@@ -47,7 +66,7 @@ app = FastAPI(
 - **고객**: `/api/customer/*` - 평가 신청, 문서 업로드, 수정 요청, 보고서 다운로드
 - **관리자**: `/api/admin/*` - 견적서 발송, 협의, 승인, 프로젝트 조회
 - **회계사**: `/api/accountant/*` - 판단 포인트 검토/승인, 초안 생성, 최종 확정, 보고서 발행
-- **시스템/AI**: `/api/internal/*` - 데이터 추출, 평가 계산, 통합 평가
+- **시스템/AI**: `/api/internal/*` - 데이터 추출, 평가 계산, 통합 평가 (비동기 작업: `.../integrated-valuation/jobs`)
 
 ## 5가지 평가법 (순서 고정)
 1. DCF평가법 (dcf)
@@ -62,7 +81,8 @@ app = FastAPI(
     """,
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -76,6 +96,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 계측 (가장 바깥 미들웨어) - 느린 요청 프로파일은 SLOW_REQUEST_PROFILE_SECONDS 설정 시에만
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+SLOW_REQUEST_PROFILE_SECONDS = os.getenv("SLOW_REQUEST_PROFILE_SECONDS")
+
+if METRICS_ENABLED:
+    instrument_sqlalchemy()
+    instrument_httpx()
+    app.add_middleware(
+        MetricsMiddleware,
+        slow_request_seconds=float(SLOW_REQUEST_PROFILE_SECONDS) if SLOW_REQUEST_PROFILE_SECONDS else None,
+        profile_dir=os.getenv("PROFILE_DUMP_DIR", "profiles"),
+        sample_interval_seconds=float(os.getenv("PROFILE_SAMPLE_INTERVAL_SECONDS", "0.005"))
+    )
+
 # 역할별 라우터 등록
 app.include_router(customer_router.router, prefix="/api")
 app.include_router(admin_router.router, prefix="/api")
@@ -115,6 +149,13 @@ async def health_check():
         "database": "connected"  # TODO: 실제 DB 연결 확인
     }
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus 메트릭 (라우트별 지연, 요청당 DB/HTTP 호출, 평가 단계 소요 시간)
+    """
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
 # 에러 핸들러
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
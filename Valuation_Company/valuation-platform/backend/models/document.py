@@ -35,6 +35,7 @@ class Document(Base, TimestampMixin):
     file_size = Column(Integer, nullable=False, comment="파일 크기 (bytes)")
     file_path = Column(String(1000), nullable=False, comment="저장 경로")
     file_url = Column(String(1000), nullable=True, comment="다운로드 URL")
+    file_hash = Column(String(64), nullable=True, comment="SHA-256 (동일 문서 중복 제거)")
 
     # Relationship
     project = relationship("Project", back_populates="documents")
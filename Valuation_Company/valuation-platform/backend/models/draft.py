@@ -28,6 +28,7 @@ class Draft(Base, TimestampMixin):
     draft_url = Column(String(1000), nullable=True, comment="초안 다운로드 URL")
     draft_path = Column(String(1000), nullable=True, comment="초안 저장 경로")
     page_count = Column(Integer, nullable=True, comment="페이지 수")
+    content_hash = Column(String(64), nullable=True, comment="렌더링 입력 SHA-256 (동일 입력 재사용)")
 
     # 생성 정보
     generated_at = Column(DateTime, nullable=True, comment="생성 시각")
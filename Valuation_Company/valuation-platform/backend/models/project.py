@@ -4,7 +4,7 @@ Project Model
 프로젝트 기본 정보
 """
 
-from sqlalchemy import Column, String, Date, Boolean, Integer, Text, Enum as SQLEnum
+from sqlalchemy import Column, String, Date, Boolean, Integer, Text, Index, Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
@@ -39,6 +39,11 @@ class ValuationPurpose(str, enum.Enum):
 class Project(Base, TimestampMixin):
     """프로젝트 테이블"""
     __tablename__ = "projects"
+    __table_args__ = (
+        # 관리자 전체 프로젝트 조회 키셋 페이지네이션 (상태 필터 유/무)
+        Index("ix_projects_status_created_at_project_id", "status", "created_at", "project_id"),
+        Index("ix_projects_created_at_project_id", "created_at", "project_id"),
+    )
 
     # Primary Key
     project_id = Column(String(50), primary_key=True, comment="프로젝트 ID (예: SAMSU-2501191430-CP)")
@@ -4,7 +4,7 @@ Report Model
 발행된 보고서
 """
 
-from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, DateTime
+from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from .base import Base, TimestampMixin
 
@@ -12,6 +12,13 @@ from .base import Base, TimestampMixin
 class Report(Base, TimestampMixin):
     """보고서 테이블"""
     __tablename__ = "reports"
+    __table_args__ = (
+        # 프로젝트별 최신 보고서 조회 (다운로드)
+        Index("ix_reports_project_issued_at", "project_id", "issued_at"),
+        # 보고서 번호 중복 방지 / 같은 발행 요청 재시도는 기존 보고서 반환 (services/report_numbering.py)
+        Index("uq_reports_report_number", "report_number", unique=True),
+        Index("uq_reports_project_idempotency_key", "project_id", "idempotency_key", unique=True),
+    )
 
     # Primary Key
     report_id = Column(String(100), primary_key=True, comment="보고서 ID (예: RPT-SAMSU-2501191430-CP-001)")
@@ -19,6 +26,10 @@ class Report(Base, TimestampMixin):
     # Foreign Key
     project_id = Column(String(50), ForeignKey("projects.project_id", ondelete="CASCADE"), nullable=False)
 
+    # 보고서 번호 (연도별 카운터에서 발급)
+    report_number = Column(String(20), nullable=True, comment="보고서 번호 (예: VR-2024-00123)")
+    idempotency_key = Column(String(100), nullable=True, comment="발행 요청 멱등 키 (Idempotency-Key)")
+
     # 보고서 정보
     report_type = Column(String(50), nullable=False, comment="보고서 유형 (comprehensive, single_method, executive_summary)")
     delivery_format = Column(String(20), nullable=False, comment="파일 형식 (pdf, docx, both)")
@@ -31,6 +42,7 @@ class Report(Base, TimestampMixin):
     report_path = Column(String(1000), nullable=True, comment="보고서 저장 경로")
     page_count = Column(Integer, nullable=True, comment="페이지 수")
     generation_time = Column(String(50), nullable=True, comment="생성 소요 시간")
+    content_hash = Column(String(64), nullable=True, comment="렌더링 입력 SHA-256 (동일 입력 재사용)")
 
     # 발행 정보
     issued_at = Column(DateTime, nullable=True, comment="발행 시각")
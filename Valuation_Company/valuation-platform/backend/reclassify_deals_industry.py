@@ -0,0 +1,96 @@
+"""
+Reclassify Deals Industry
+Deal 업종 일괄 재분류
+
+reparse_result.json의 기업별 업종에 보정 표(COMPANY_INDUSTRY_OVERRIDES)를 적용하고
+대분류(industry_category)를 붙여 deals 테이블에 한 번에 반영한다.
+(기존 refine_industry.py / generate_update_sql.py / update_deals_industry.py 통합)
+
+반영 방식:
+- 기본: DATABASE_URL로 접속해 임시 스테이징 테이블에 COPY 후 UPDATE 1회 (한 트랜잭션)
+- --sql FILE: UPDATE ... FROM (VALUES ...) 문 1개를 파일로 저장 (Supabase SQL Editor에서 실행)
+
+실행:
+    python reclassify_deals_industry.py [--input backend/reparse_result.json] [--sql backend/update_industry.sql] [--dry-run]
+"""
+import argparse
+import json
+import os
+import sys
+
+from dotenv import load_dotenv
+
+# 경로 설정
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+from app.services.industry_classifier import apply_updates_copy, build_update_sql, industry_classifier
+
+load_dotenv()
+
+DEFAULT_INPUT = 'backend/reparse_result.json'
+
+
+def load_companies(file_path: str):
+    if not os.path.exists(file_path):
+        print(f"Error: {file_path} not found.")
+        return None
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    if 'companies' not in data:
+        print("Error: 'companies' key not found in JSON.")
+        return None
+
+    return data['companies']
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Deal 업종 일괄 재분류")
+    arg_parser.add_argument("--input", default=DEFAULT_INPUT, help="기업별 업종 JSON (companies 목록)")
+    arg_parser.add_argument("--sql", default=None, help="DB에 반영하지 않고 UPDATE 문을 이 파일로 저장")
+    arg_parser.add_argument("--dry-run", action="store_true", help="변경분만 출력")
+    args = arg_parser.parse_args()
+
+    companies = load_companies(args.input)
+    if companies is None:
+        return
+
+    updates = industry_classifier.build_updates(companies)
+    refined = sum(
+        1 for item in companies
+        if industry_classifier.resolve_industry(item.get('company'), item.get('industry')) != item.get('industry')
+    )
+    print(f"대상 기업 {len(updates)}곳 (보정 표 적용 {refined}건)")
+
+    if args.dry_run:
+        for update in updates:
+            print(f"  {update.company_name}: {update.industry} ({update.industry_category})")
+        return
+
+    if args.sql:
+        with open(args.sql, 'w', encoding='utf-8') as f:
+            f.write(f"-- Update industry fields in deals table\n-- Generated from {os.path.basename(args.input)}\n\n")
+            f.write(build_update_sql(updates))
+        print(f"✅ SQL 파일 생성 완료: {args.sql} (기업 {len(updates)}곳, UPDATE 1개)")
+        return
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        print("Error: DATABASE_URL not found in environment variables. (--sql 로 SQL 파일 생성 가능)")
+        sys.exit(1)
+
+    import psycopg2
+
+    conn = psycopg2.connect(database_url)
+    try:
+        updated = apply_updates_copy(conn, updates)
+    finally:
+        conn.close()
+
+    print("-" * 50)
+    print(f"Update complete. Updated rows: {updated}")
+
+
+if __name__ == "__main__":
+    main()
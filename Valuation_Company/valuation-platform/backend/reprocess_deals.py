@@ -1,18 +1,36 @@
 """
 Reprocess Deals
 기존에 저장된 Deal 데이터 재정제 (품질 향상)
+
+증분 처리:
+- Deal마다 추출에 쓴 parser_version을 저장하고,
+  parser_version이 없거나(새 Deal, 제목/URL/사이트가 바뀐 Deal - DB 트리거가 비움) NewsParser.PARSER_VERSION과
+  다른 Deal만 DB 조건으로 골라 필요한 컬럼만 가져옴
+- 기사 본문은 ArticleCache를 거쳐 news_url 호스트에 맞는 크롤러로 다시 가져옴 (실패 시 제목 기반 약식 처리)
+- Gemini 추출은 동시 실행하되 분당 호출 한도(RateLimiter) 안에서 수행
+- 결과는 배치마다 update_deals_reprocessed RPC 한 번으로 바뀐 컬럼만 갱신 (버전/재정제 시각 포함)
+
+실행:
+    python reprocess_deals.py [--full] [--limit N] [--concurrency 4] [--rpm 15] [--dry-run]
 """
+import argparse
 import asyncio
 import logging
 import sys
 import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 from dotenv import load_dotenv
 
 # 경로 설정
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
 
+from app.core.rate_limit import RateLimiter
+from app.services.deal_amounts import parse_amount_eok
 from app.services.news_parser import NewsParser
-from app.services.news_crawler.base_crawler import CrawledNews
+from app.services.news_crawler.article_cache import ArticleCache
+from app.services.news_crawler.base_crawler import BaseCrawler, CrawledNews
+from app.services.news_crawler.crawler_manager import CrawlerManager
 from supabase import create_client
 
 # 설정 로드 (강제 리로드)
@@ -22,66 +40,229 @@ logger = logging.getLogger("ReprocessDeals")
 
 supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
 
-async def reprocess_deals():
+# 조회 페이지 크기 / 갱신 배치 크기
+PAGE_SIZE = 1000
+UPDATE_BATCH_SIZE = 200
+
+# 재정제에 필요한 컬럼 (추출 입력 + 변경 판단)
+DEAL_COLUMNS = "id,company_name,news_title,news_url,site_name,industry,amount"
+
+# 구체화가 필요한 포괄 업종
+GENERIC_INDUSTRIES = ["IT", "AI", "서비스"]
+
+
+def fetch_target_deals(
+    parser_version: Optional[str],
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    재정제 대상 조회 (id 키셋 페이지)
+
+    Args:
+        parser_version: 이 버전으로 추출되지 않은 Deal만 (None이면 전체)
+        limit: 최대 건수
+    """
+    deals: List[Dict[str, Any]] = []
+    last_id = None
+
+    while limit is None or len(deals) < limit:
+        page_size = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit - len(deals))
+        query = supabase.table("deals").select(DEAL_COLUMNS)
+        if parser_version is not None:
+            query = query.or_(f"parser_version.is.null,parser_version.neq.{parser_version}")
+        if last_id is not None:
+            query = query.gt("id", last_id)
+
+        response = query.order("id").limit(page_size).execute()
+        deals.extend(response.data)
+        if len(response.data) < page_size:
+            break
+        last_id = response.data[-1]["id"]
+
+    return deals
+
+
+def build_changes(deal: Dict[str, Any], extracted) -> Dict[str, Any]:
+    """추출 결과 중 반영할 변경 사항"""
+    changes = {}
+
+    # 업종 구체화 확인
+    if extracted.industry and extracted.industry not in GENERIC_INDUSTRIES:
+        if extracted.industry != deal.get("industry"):
+            changes["industry"] = extracted.industry
+
+    # 금액 검증 (기존에 0인데 새로 찾았으면 업데이트)
+    if extracted.investment_amount_krw and (not deal.get("amount") or deal["amount"] == 0):
+        changes["amount"] = extracted.investment_amount_krw
+        changes["amount_eok"] = parse_amount_eok(extracted.investment_amount_krw)
+
+    return changes
+
+
+class ArticleSource:
+    """
+    Deal 기사 본문 공급자
+
+    news_url 호스트로 크롤러를 고르고(site_name은 '네이버 뉴스' 같은 표시 이름이라 쓰지 않음),
+    소스별 크롤러를 실행 동안 하나씩만 열어 연결을 재사용하며, 본문은 ArticleCache를 거쳐 가져온다.
+    """
+
+    def __init__(self, cache: ArticleCache):
+        self.cache = cache
+        self._crawlers: Dict[str, BaseCrawler] = {}
+        self._lock = asyncio.Lock()
+
+    async def _crawler(self, url: Optional[str]) -> Optional[BaseCrawler]:
+        source = CrawlerManager.source_for_url(url)
+        crawler_class = CrawlerManager.AVAILABLE_CRAWLERS.get(source) if source else None
+        if crawler_class is None:
+            return None
+
+        async with self._lock:
+            if source not in self._crawlers:
+                self._crawlers[source] = await crawler_class().__aenter__()
+            return self._crawlers[source]
+
+    async def get(self, deal: Dict[str, Any]) -> CrawledNews:
+        """기사 본문 (가져오지 못하면 제목 기반 약식 기사)"""
+        url = deal.get("news_url")
+        crawler = await self._crawler(url)
+
+        if url and crawler is not None:
+            try:
+                article = await self.cache.get_or_fetch(url, crawler.parse_article)
+                if article is not None and article.content:
+                    return article
+            except Exception as e:
+                logger.warning(f"기사 본문 수집 실패 ({url}): {e}")
+
+        return CrawledNews(
+            source=deal.get("site_name") or "unknown",
+            source_url=url or "",
+            title=deal.get("news_title") or "",
+            content=f"{deal.get('news_title')} {deal.get('company_name')} 투자 유치"  # 본문이 없어 약식 처리
+        )
+
+    async def close(self) -> None:
+        for crawler in self._crawlers.values():
+            await crawler.__aexit__(None, None, None)
+        self._crawlers.clear()
+
+
+def update_batch(updates: List[Dict[str, Any]]) -> int:
+    """
+    배치를 RPC 한 번으로 반영 ({'id', ...변경 컬럼} 목록 → 갱신 행 수)
+
+    update_deals_reprocessed가 UPDATE ... FROM jsonb_populate_recordset으로 행마다 있는 컬럼만 바꾼다.
+    """
+    response = supabase.rpc("update_deals_reprocessed", {"p_rows": updates}).execute()
+    return int(response.data or 0)
+
+
+async def reprocess_deals(
+    full: bool = False,
+    limit: Optional[int] = None,
+    concurrency: int = 4,
+    rpm: int = 15,
+    dry_run: bool = False
+):
     logger.info("🚀 기존 Deal 데이터 재정제 시작 (IT/AI 구체화, 금액 검증)")
-    
-    # 1. 재정제 대상 가져오기 (업종이 IT, AI 이거나 금액이 없는 것)
-    # 전체를 다시 하는 것이 가장 확실함
-    response = supabase.table("deals").select("*").execute()
-    deals = response.data
-    
-    logger.info(f"총 {len(deals)}개의 Deal 데이터를 재검토합니다.")
-    
+
     parser = NewsParser()
-    updated_count = 0
-    
-    for deal in deals:
-        try:
-            # 기사 내용이 DB에 없으므로, 제목과 요약 등을 이용해 다시 파싱 시도
-            # (원래는 URL로 다시 크롤링해야 하지만, 시간상 제목+기존정보로 재추론 시도)
-            # 더 정확하게 하려면 크롤러를 다시 돌려야 함. 여기서는 크롤러를 다시 돌리는 로직으로 구현.
-            
-            logger.info(f"🔄 재처리 중: {deal['company_name']} ({deal['news_title']})")
-            
-            # 임시 뉴스 객체 생성 (재크롤링 대신 제목만으로 시도해보고, 안되면 크롤러 연동 필요)
-            # 일단 제목이 가장 중요하므로 제목 기반으로 재추출 시도
-            fake_news = CrawledNews(
-                source=deal['site_name'] or "unknown",
-                source_url=deal['news_url'] or "",
-                title=deal['news_title'] or "",
-                content=f"{deal['news_title']} {deal['company_name']} 투자 유치" # 내용이 없어서 약식 처리
-            )
-            
-            # 파서 호출 (강화된 프롬프트 적용됨)
-            # 주의: 내용(content)이 없으면 AI가 할 수 있는게 제한적임.
-            # 제대로 하려면 URL로 다시 긁어야 함.
-            
-            # 이번에는 간단히 제목만으로라도 업종을 더 구체적으로 추론해달라고 요청
-            extracted = await parser.parse_news(fake_news)
-            
-            if extracted and extracted.company_name_ko:
-                update_data = {}
-                
-                # 업종 구체화 확인
-                if extracted.industry and extracted.industry not in ["IT", "AI", "서비스"]:
-                    update_data["industry"] = extracted.industry
-                
-                # 금액 검증 (기존에 0인데 새로 찾았으면 업데이트)
-                if extracted.investment_amount_krw and (not deal['amount'] or deal['amount'] == 0):
-                    update_data["amount"] = extracted.investment_amount_krw
-                
-                # 업데이트 실행
-                if update_data:
-                    supabase.table("deals").update(update_data).eq("id", deal['id']).execute()
-                    logger.info(f"✅ 업데이트 완료: {deal['company_name']} -> {update_data}")
-                    updated_count += 1
-                else:
-                    logger.info(f"PASS: 변경 사항 없음 ({deal['company_name']})")
-            
-        except Exception as e:
-            logger.error(f"Error reprocessing deal {deal['id']}: {e}")
-
-    logger.info(f"🎉 재정제 완료: 총 {updated_count}건 업데이트됨")
+    parser_version = NewsParser.PARSER_VERSION
+
+    # 1. 재정제 대상 선택 (parser_version이 없거나 다른 Deal - 조건은 DB에서 처리)
+    targets = await asyncio.to_thread(fetch_target_deals, None if full else parser_version, limit)
+
+    logger.info(
+        f"{len(targets)}개의 Deal을 재검토합니다. "
+        f"(parser_version={parser_version}{', 전체' if full else ''}, 동시 {concurrency}개, 분당 {rpm}회)"
+    )
+
+    articles = ArticleSource(ArticleCache())
+    limiter = RateLimiter.per_minute(rpm, burst=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    reprocessed_at = datetime.now(timezone.utc).isoformat()
+
+    pending_updates: List[Dict[str, Any]] = []
+    stats = {"updated": 0, "unchanged": 0, "failed": 0, "written": 0}
+
+    async def flush():
+        if not pending_updates:
+            return
+        updates = pending_updates[:]
+        pending_updates.clear()
+        if dry_run:
+            stats["written"] += len(updates)
+        else:
+            stats["written"] += await asyncio.to_thread(update_batch, updates)
+
+    async def process(deal: Dict[str, Any]):
+        async with semaphore:
+            try:
+                news = await articles.get(deal)
+
+                # 파서 호출 (분당 호출 한도 준수)
+                await limiter.acquire()
+                extracted = await parser.parse_news(news)
+            except Exception as e:
+                logger.error(f"Error reprocessing deal {deal['id']}: {e}")
+                stats["failed"] += 1
+                return
+
+        if not extracted or not extracted.company_name_ko:
+            # parser_version을 남기지 않으므로 다음 실행에서 다시 시도
+            stats["failed"] += 1
+            return
+
+        changes = build_changes(deal, extracted)
+        if changes:
+            logger.info(f"✅ 업데이트: {deal['company_name']} -> {changes}")
+            stats["updated"] += 1
+        else:
+            stats["unchanged"] += 1
+
+        # 변경이 없어도 버전은 기록 (다음 실행에서 제외)
+        pending_updates.append({
+            "id": deal["id"],
+            **changes,
+            "parser_version": parser_version,
+            "reprocessed_at": reprocessed_at
+        })
+        if len(pending_updates) >= UPDATE_BATCH_SIZE:
+            await flush()
+
+    try:
+        await asyncio.gather(*(process(deal) for deal in targets))
+        await flush()
+    finally:
+        await articles.close()
+
+    logger.info(
+        f"🎉 재정제 완료: 업데이트 {stats['updated']}건, 변경 없음 {stats['unchanged']}건, "
+        f"실패 {stats['failed']}건, 반영 {stats['written']}행"
+        f"{' (dry-run)' if dry_run else ''} | "
+        f"기사 캐시 hit {articles.cache.hits} / miss {articles.cache.misses}"
+    )
+    return stats
+
+
+def parse_args():
+    arg_parser = argparse.ArgumentParser(description="Deal 데이터 증분 재정제")
+    arg_parser.add_argument("--full", action="store_true", help="parser_version과 관계없이 전체 재처리")
+    arg_parser.add_argument("--limit", type=int, default=None, help="최대 처리 건수")
+    arg_parser.add_argument("--concurrency", type=int, default=4, help="동시 추출 수")
+    arg_parser.add_argument("--rpm", type=int, default=15, help="분당 Gemini 호출 한도")
+    arg_parser.add_argument("--dry-run", action="store_true", help="DB에 쓰지 않고 결과만 출력")
+    return arg_parser.parse_args()
+
 
 if __name__ == "__main__":
-    asyncio.run(reprocess_deals())
+    args = parse_args()
+    asyncio.run(reprocess_deals(
+        full=args.full,
+        limit=args.limit,
+        concurrency=args.concurrency,
+        rpm=args.rpm,
+        dry_run=args.dry_run
+    ))
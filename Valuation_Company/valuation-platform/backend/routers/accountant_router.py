@@ -10,9 +10,10 @@
 6. 보고서 발행
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, status
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Optional
 
 from database import get_db
 from auth import get_accountant_user, User
@@ -36,6 +37,9 @@ from models.approval_point import ApprovalPoint
 from models.draft import Draft
 from models.report import Report
 from models.valuation_result import ValuationResult
+from services.report_cache import compute_render_key
+from services.report_generator import TEMPLATE_VERSION
+from services.report_numbering import build_issued_report, issue_report
 
 # 라우터 생성
 router = APIRouter(
@@ -432,16 +436,32 @@ async def generate_draft(
             }
         }
 
-        # 초안 저장
-        draft = Draft(
-            project_id=project_id,
-            draft_version=1,
-            content=draft_content,
-            format=request.format,
-            generated_by=current_user.email
+        # 동일 입력으로 생성된 초안이 있으면 재사용
+        content_hash = compute_render_key(
+            project_id,
+            {},
+            draft_content,
+            "draft",
+            {"format": request.format},
+            TEMPLATE_VERSION
         )
+        draft = db.query(Draft).filter(
+            Draft.project_id == project_id,
+            Draft.content_hash == content_hash
+        ).first()
 
-        db.add(draft)
+        if not draft:
+            # 초안 저장
+            draft = Draft(
+                project_id=project_id,
+                draft_version=1,
+                content=draft_content,
+                format=request.format,
+                content_hash=content_hash,
+                generated_by=current_user.email
+            )
+
+            db.add(draft)
 
         # 프로젝트 상태 업데이트
         project.status = "draft_generated"
@@ -513,7 +533,7 @@ async def finalize_project(
         # 최신 초안 확인
         latest_draft = db.query(Draft).filter(
             Draft.project_id == project_id
-        ).order_by(Draft.draft_version.desc()).first()
+        ).order_by(Draft.created_at.desc()).first()
 
         if not latest_draft:
             raise HTTPException(
@@ -548,6 +568,7 @@ async def finalize_project(
 async def generate_report(
     project_id: str,
     request: ReportGenerateRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=100),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_accountant_user)
 ):
@@ -562,6 +583,10 @@ async def generate_report(
     ## 보고서 번호 형식
     - VR-{YYYY}-{순번 5자리}
     - 예: VR-2024-00123
+    - 연도별 카운터에서 발급 (동시에 발행해도 중복 없음)
+
+    ## 멱등성
+    - `Idempotency-Key` 헤더(또는 idempotency_key 필드)가 같으면 새로 발행하지 않고 기존 보고서 반환 (replayed=true)
 
     ## 보고서 구성
     1. 표지 (Cover Page)
@@ -591,7 +616,7 @@ async def generate_report(
         # 최신 초안 확인
         latest_draft = db.query(Draft).filter(
             Draft.project_id == project_id
-        ).order_by(Draft.draft_version.desc()).first()
+        ).order_by(Draft.created_at.desc()).first()
 
         if not latest_draft:
             raise HTTPException(
@@ -599,39 +624,30 @@ async def generate_report(
                 detail="초안이 생성되지 않았습니다."
             )
 
-        # 보고서 번호 생성
-        year = datetime.now().year
-        report_count = db.query(Report).filter(
-            Report.report_number.like(f"VR-{year}-%")
-        ).count()
-        report_number = f"VR-{year}-{report_count + 1:05d}"
+        download_url = f"/api/accountant/projects/{project_id}/report/download"
 
-        # TODO: 실제 보고서 생성 (PDF)
-        report_file_path = f"./reports/{project_id}_{report_number}.pdf"
+        def build_report(report_number: str) -> Report:
+            return build_issued_report(
+                project_id, latest_draft, report_number,
+                report_format=request.format,
+                issued_by=current_user.email,
+                download_url=download_url
+            )
 
-        # 보고서 레코드 생성
-        report = Report(
-            project_id=project_id,
-            draft_id=latest_draft.draft_id,
-            report_number=report_number,
-            report_file_path=report_file_path,
-            format=request.format,
-            issued_by=current_user.email,
-            digital_signature=request.digital_signature,
-            password_protected=request.password_protected
+        # 보고서 번호 발급 (연도별 카운터) + 저장 - 같은 멱등 키로 이미 발행했으면 기존 보고서
+        report, replayed = issue_report(
+            db, project_id, build_report,
+            idempotency_key=idempotency_key or request.idempotency_key
         )
 
-        db.add(report)
-        db.commit()
-        db.refresh(report)
-
         return ReportGenerateResponse(
             project_id=project_id,
             report_id=report.report_id,
             report_number=report.report_number,
-            download_url=f"/api/accountant/projects/{project_id}/report/download",
+            download_url=download_url,
             issued_at=report.issued_at,
-            message="보고서가 발행되었습니다."
+            replayed=replayed,
+            message="이미 발행된 보고서입니다." if replayed else "보고서가 발행되었습니다."
         )
 
     except HTTPException:
@@ -8,9 +8,10 @@
 4. 전체 프로젝트 조회
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, text, tuple_
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Tuple
 from datetime import datetime
 
 from database import get_db
@@ -26,6 +27,13 @@ from schemas.project import (
 from models.project import Project
 from models.quote import Quote
 from models.negotiation import Negotiation
+from app.core.pagination import CountCache, InvalidCursorError, decode_cursor, encode_cursor
+
+# 프로젝트 목록 총건수 캐시 (상태별, 60초)
+project_count_cache = CountCache(ttl_seconds=60.0)
+
+# 전체 건수가 이 이상이면 pg_class 통계 추정치 사용 (COUNT(*) 전체 스캔 회피)
+APPROXIMATE_COUNT_THRESHOLD = 50_000
 
 # 라우터 생성
 router = APIRouter(
@@ -271,40 +279,106 @@ async def approve_project(
         )
 
 
+def count_projects(db: Session, status_filter: Optional[str]) -> Tuple[int, bool]:
+    """
+    프로젝트 총건수 (캐시)
+
+    Returns:
+        (건수, 추정치 여부) - 필터 없는 대형 테이블은 PostgreSQL 통계(reltuples) 추정치
+    """
+    return project_count_cache.get_or_compute(
+        ("projects", status_filter),
+        lambda: _count_projects(db, status_filter)
+    )
+
+
+def _count_projects(db: Session, status_filter: Optional[str]) -> Tuple[int, bool]:
+    if status_filter is None and db.bind.dialect.name == "postgresql":
+        estimate = db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'projects'::regclass")
+        ).scalar()
+        if estimate is not None and estimate >= APPROXIMATE_COUNT_THRESHOLD:
+            return int(estimate), True
+
+    query = db.query(func.count(Project.project_id))
+    if status_filter:
+        query = query.filter(Project.status == status_filter)
+    return query.scalar(), False
+
+
+def decode_project_cursor(cursor: str, status_filter: Optional[str]) -> Tuple[datetime, str]:
+    """
+    목록 커서 → (created_at, project_id)
+
+    Raises:
+        InvalidCursorError: 형식 오류, 다른 상태 필터로 발급된 커서
+    """
+    cursor_status, cursor_created_at, cursor_project_id = decode_cursor(cursor, 3)
+    if cursor_status != status_filter:
+        raise InvalidCursorError("Cursor was issued for a different status filter")
+    try:
+        return datetime.fromisoformat(cursor_created_at), str(cursor_project_id)
+    except (TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor!r}") from e
+
+
 @router.get("/projects")
 async def list_all_projects(
     skip: int = 0,
-    limit: int = 100,
-    status: str = None,
+    limit: int = Query(100, ge=1, le=500),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_admin_user)
 ):
     """
     # 4. 전체 프로젝트 조회
 
-    모든 프로젝트 목록을 조회합니다.
+    모든 프로젝트 목록을 조회합니다. (최신 신청 순)
 
     ## 권한
     - 관리자만 가능
 
     ## 필터
     - status: 상태별 필터링
-    - skip: 페이지네이션 시작
+    - cursor: 이전 응답의 next_cursor (키셋 페이지네이션, 깊은 페이지도 일정한 속도)
+    - skip: 페이지네이션 시작 (cursor가 없을 때만, 기존 호출 호환)
     - limit: 한 페이지당 개수
+
+    ## 총건수
+    - 상태별로 60초간 캐시, 필터 없는 대형 테이블은 추정치 (total_is_estimate)
     """
     try:
         query = db.query(Project)
 
-        if status:
-            query = query.filter(Project.status == status)
+        if status_filter:
+            query = query.filter(Project.status == status_filter)
 
-        total = query.count()
-        projects = query.offset(skip).limit(limit).all()
+        query = query.order_by(Project.created_at.desc(), Project.project_id.desc())
+
+        # 키셋: (status, created_at, project_id) 인덱스로 마지막 행 다음부터 조회
+        if cursor:
+            cursor_created_at, cursor_project_id = decode_project_cursor(cursor, status_filter)
+            query = query.filter(
+                tuple_(Project.created_at, Project.project_id) < (cursor_created_at, cursor_project_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+
+        projects = query.limit(limit).all()
+        total, total_is_estimate = count_projects(db, status_filter)
+
+        next_cursor = None
+        if len(projects) == limit:
+            last = projects[-1]
+            next_cursor = encode_cursor([status_filter, last.created_at, last.project_id])
 
         return {
             "total": total,
+            "total_is_estimate": total_is_estimate,
             "skip": skip,
             "limit": limit,
+            "next_cursor": next_cursor,
             "projects": [
                 {
                     "project_id": p.project_id,
@@ -318,6 +392,11 @@ async def list_all_projects(
             ]
         }
 
+    except InvalidCursorError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"잘못된 커서입니다: {str(e)}"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -3,27 +3,50 @@
 
 고객이 접근 가능한 API:
 1. 평가 신청 (프로젝트 생성)
-2. 문서 업로드
+2. 문서 업로드 (대용량 문서는 재개 가능 업로드)
 3. 수정 요청
 4. 보고서 다운로드
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Header, Request
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List
 from datetime import datetime
 from pathlib import Path
-import shutil
+import uuid
 
 from database import get_db
 from auth import get_customer_user, User
 from schemas.project import ProjectCreateRequest, ProjectCreateResponse
-from schemas.document import DocumentUploadResponse
-from schemas.revision import RevisionRequest, RevisionResponse
+from schemas.document import (
+    DocumentUploadResponse,
+    ResumableUploadCreateRequest,
+    ResumableUploadStatus,
+    UploadedFileInfo,
+    UploadProgress
+)
+from schemas.draft import RevisionRequest, RevisionResponse
 from models.project import Project
-from models.document import Document
+from models.document import Document, DocumentCategory
 from models.revision import Revision
 from models.report import Report
+from services.report_delivery import (
+    LARGE_REPORT_THRESHOLD_BYTES,
+    REPORT_MEDIA_TYPES,
+    RangedFileResponse,
+    create_signed_report_url,
+    report_storage_path,
+    stat_regular_file
+)
+from services.document_upload import (
+    ResumableUploadStore,
+    StoredUpload,
+    UploadLockedError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadTooLargeError,
+    stream_upload_to_disk
+)
 
 # 라우터 생성
 router = APIRouter(
@@ -37,6 +60,94 @@ UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")
 MAX_UPLOAD_SIZE_MB = int(os.getenv("MAX_UPLOAD_SIZE_MB", "20"))
 MAX_UPLOAD_SIZE_BYTES = MAX_UPLOAD_SIZE_MB * 1024 * 1024
 
+# 재개 가능 업로드 세션 저장소
+resumable_uploads = ResumableUploadStore(Path(UPLOAD_DIR) / ".resumable")
+
+
+def register_document(
+    db: Session,
+    project_id: str,
+    stored: StoredUpload,
+    file_name: str,
+    category: DocumentCategory
+) -> Document:
+    """
+    저장된 파일을 문서로 등록
+
+    같은 프로젝트에 동일 해시 문서가 이미 있으면 (수정 재업로드 등)
+    새 행을 만들지 않고 기존 문서를 반환한다.
+    """
+    existing = db.query(Document).filter(
+        Document.project_id == project_id,
+        Document.file_hash == stored.sha256
+    ).first()
+
+    if existing:
+        return existing
+
+    document = Document(
+        file_id=f"doc_{uuid.uuid4().hex[:12]}",
+        project_id=project_id,
+        file_name=file_name,
+        category=category,
+        file_size=stored.size,
+        file_path=str(stored.path),
+        file_hash=stored.sha256
+    )
+    db.add(document)
+    return document
+
+
+def build_upload_response(
+    db: Session,
+    project: Project,
+    documents: List[Document],
+    message: str
+) -> DocumentUploadResponse:
+    """문서 업로드 응답 (카테고리별 진행 상황은 프로젝트의 전체 문서 기준)"""
+    uploaded_categories = {
+        category for (category,) in db.query(Document.category).filter(
+            Document.project_id == project.project_id
+        ).distinct()
+    }
+
+    return DocumentUploadResponse(
+        project_id=project.project_id,
+        uploaded_files=[
+            UploadedFileInfo(
+                file_id=doc.file_id,
+                file_name=doc.file_name,
+                category=doc.category.value,
+                file_size=doc.file_size,
+                uploaded_at=doc.created_at
+            )
+            for doc in documents
+        ],
+        upload_progress=UploadProgress(**{
+            category.value: "completed" for category in uploaded_categories
+        }),
+        status=project.status.value,
+        message=message
+    )
+
+
+def get_uploadable_project(db: Session, project_id: str) -> Project:
+    """문서 업로드 가능한 프로젝트 조회 (없거나 상태가 맞지 않으면 HTTPException)"""
+    project = db.query(Project).filter(Project.project_id == project_id).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다."
+        )
+
+    if project.status not in ["approved", "documents_uploaded"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"문서 업로드는 'approved' 상태에서만 가능합니다. (현재: {project.status})"
+        )
+
+    return project
+
 
 def generate_project_id(company_code: str, valuation_methods: List[str]) -> str:
     """프로젝트 ID 생성"""
@@ -141,8 +252,7 @@ async def create_project(
 async def upload_documents(
     project_id: str,
     files: List[UploadFile] = File(...),
-    document_type: str = Form(...),
-    description: Optional[str] = Form(None),
+    category: DocumentCategory = Form(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_customer_user)
 ):
@@ -155,99 +265,215 @@ async def upload_documents(
     - 고객만 가능
     - 본인 프로젝트만 가능
 
-    ## 업로드 가능 문서
-    - 재무제표 (3~5년)
-    - 감사보고서
-    - 사업계획서
-    - 기타 참고 자료
+    ## 카테고리 (category)
+    - financial: 재무제표 (3~5년), 감사보고서
+    - business_plan: 사업계획서
+    - shareholder: 주주명부
+    - capex: 자본적지출
+    - working_capital: 운전자본
+    - others: 기타 참고 자료
+
+    ## 저장 방식
+    - 청크 단위 스트리밍 저장, SHA-256 동시 계산
+    - 최대 크기 초과 시 수신 도중 중단 (413)
+    - 동일 내용 문서는 한 번만 저장 (해시 기준 중복 제거)
+    - 최대 크기를 넘는 대용량 문서는 `/uploads` 재개 가능 업로드 사용
+    - 한 파일이라도 실패하면 이번 요청에서 새로 저장한 파일은 모두 삭제
 
     ## 상태 변경
     - approved → documents_uploaded
     """
+    promoted_paths: List[Path] = []
     try:
-        # 프로젝트 존재 및 권한 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="프로젝트를 찾을 수 없습니다."
-            )
-
+        # 프로젝트 존재 및 상태 확인
         # TODO: 본인 프로젝트 확인 (contact_email == current_user.email)
-        # if project.contact_email != current_user.email:
-        #     raise HTTPException(status_code=403, detail="권한이 없습니다.")
-
-        # 상태 확인
-        if project.status not in ["approved", "documents_uploaded"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"문서 업로드는 'approved' 상태에서만 가능합니다. (현재: {project.status})"
-            )
+        project = get_uploadable_project(db, project_id)
 
         # 파일 저장
+        project_dir = Path(UPLOAD_DIR) / project_id
         uploaded_documents = []
         for file in files:
-            # 파일 크기 체크
-            file.file.seek(0, 2)
-            file_size = file.file.tell()
-            file.file.seek(0)
-
-            if file_size > MAX_UPLOAD_SIZE_BYTES:
+            try:
+                stored = await stream_upload_to_disk(file, project_dir, MAX_UPLOAD_SIZE_BYTES)
+            except UploadTooLargeError as e:
                 raise HTTPException(
                     status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                    detail=f"파일 '{file.filename}'이 너무 큽니다. (최대 {MAX_UPLOAD_SIZE_MB}MB)"
+                    detail=str(e)
                 )
 
-            # 파일 저장
-            project_dir = Path(UPLOAD_DIR) / project_id
-            project_dir.mkdir(parents=True, exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_filename = f"{timestamp}_{file.filename}"
-            file_path = project_dir / safe_filename
-
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
-
-            # DB에 문서 정보 저장
-            document = Document(
-                project_id=project_id,
-                document_type=document_type,
-                file_name=file.filename,
-                file_path=str(file_path),
-                file_size_kb=file_size // 1024,
-                description=description
-            )
-            db.add(document)
-            uploaded_documents.append(document)
+            if not stored.deduplicated:
+                promoted_paths.append(stored.path)
+
+            # DB에 문서 정보 저장 (동일 해시 문서는 재사용)
+            document = register_document(db, project_id, stored, file.filename, category)
+            if document not in uploaded_documents:
+                uploaded_documents.append(document)
 
         # 상태 업데이트
         if project.status != "documents_uploaded":
             project.status = "documents_uploaded"
 
         db.commit()
+        promoted_paths.clear()
 
         for doc in uploaded_documents:
             db.refresh(doc)
 
-        return DocumentUploadResponse(
-            project_id=project_id,
-            uploaded_files=[
-                {
-                    "document_id": doc.document_id,
-                    "file_name": doc.file_name,
-                    "file_size_kb": doc.file_size_kb,
-                    "uploaded_at": doc.uploaded_at
-                }
-                for doc in uploaded_documents
-            ],
-            total_files=len(uploaded_documents),
-            status=project.status,
-            message=f"{len(uploaded_documents)}개 파일이 성공적으로 업로드되었습니다."
+        return build_upload_response(
+            db,
+            project,
+            uploaded_documents,
+            f"{len(uploaded_documents)}개 파일이 성공적으로 업로드되었습니다."
+        )
+
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"문서 업로드 중 오류가 발생했습니다: {str(e)}"
+        )
+    finally:
+        # 커밋되지 않은 요청에서 새로 저장한 파일은 행 없이 남지 않도록 삭제
+        for path in promoted_paths:
+            path.unlink(missing_ok=True)
+
+
+@router.post(
+    "/projects/{project_id}/uploads",
+    response_model=ResumableUploadStatus,
+    status_code=status.HTTP_201_CREATED
+)
+async def create_resumable_upload(
+    project_id: str,
+    request: ResumableUploadCreateRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_customer_user)
+):
+    """
+    # 2-1. 재개 가능 업로드 시작
+
+    감사보고서 등 대용량 문서를 여러 요청에 나눠 업로드하기 위한 세션을 만듭니다.
+
+    ## 절차
+    1. `POST /uploads` → upload_id 발급 (offset 0)
+    2. `PATCH /uploads/{upload_id}` + `Upload-Offset` 헤더로 청크 전송 (반복)
+    3. 연결이 끊기면 `GET /uploads/{upload_id}`로 offset 확인 후 이어서 전송
+    4. `POST /uploads/{upload_id}/complete` → 문서 등록
+    """
+    get_uploadable_project(db, project_id)
+
+    try:
+        session = resumable_uploads.create(
+            project_id,
+            request.file_name,
+            request.total_size,
+            request.category
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
         )
 
+    return ResumableUploadStatus(**session)
+
+
+@router.get("/projects/{project_id}/uploads/{upload_id}", response_model=ResumableUploadStatus)
+async def get_resumable_upload(
+    project_id: str,
+    upload_id: str,
+    current_user: User = Depends(get_customer_user)
+):
+    """
+    # 2-2. 재개 가능 업로드 상태 조회
+
+    서버가 수신한 바이트 수(offset)를 반환합니다. 다음 청크는 이 위치부터 전송합니다.
+    """
+    try:
+        return ResumableUploadStatus(**resumable_uploads.get(project_id, upload_id))
+    except UploadNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.patch("/projects/{project_id}/uploads/{upload_id}", response_model=ResumableUploadStatus)
+async def append_resumable_upload(
+    project_id: str,
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset"),
+    current_user: User = Depends(get_customer_user)
+):
+    """
+    # 2-3. 재개 가능 업로드 청크 전송
+
+    요청 본문(바이너리)을 스트리밍으로 세션 파일에 이어 씁니다.
+
+    ## 헤더
+    - Upload-Offset: 현재 offset (서버 값과 다르거나 같은 세션에 다른 요청이 쓰는 중이면 409)
+    """
+    try:
+        session = await resumable_uploads.append(
+            project_id, upload_id, upload_offset, request.stream()
+        )
+        return ResumableUploadStatus(**session)
+    except UploadNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (UploadOffsetMismatchError, UploadLockedError) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except UploadTooLargeError as e:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(e))
+
+
+@router.post("/projects/{project_id}/uploads/{upload_id}/complete", response_model=DocumentUploadResponse)
+async def complete_resumable_upload(
+    project_id: str,
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_customer_user)
+):
+    """
+    # 2-4. 재개 가능 업로드 완료
+
+    전체 크기를 모두 받은 세션을 해시 검증 후 문서로 등록합니다.
+
+    ## 상태 변경
+    - approved → documents_uploaded
+    """
+    try:
+        project = get_uploadable_project(db, project_id)
+        session = resumable_uploads.get(project_id, upload_id)
+        stored = await resumable_uploads.complete(
+            project_id, upload_id, Path(UPLOAD_DIR) / project_id
+        )
+
+        document = register_document(
+            db,
+            project_id,
+            stored,
+            session["file_name"],
+            DocumentCategory(session["category"])
+        )
+
+        if project.status != "documents_uploaded":
+            project.status = "documents_uploaded"
+
+        db.commit()
+        db.refresh(document)
+
+        # 등록이 커밋된 뒤에만 세션 삭제 (실패하면 같은 요청으로 다시 완료 가능)
+        resumable_uploads.discard(upload_id)
+
+        return build_upload_response(db, project, [document], "파일이 성공적으로 업로드되었습니다.")
+
     except HTTPException:
         raise
+    except UploadNotFoundError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    except (UploadOffsetMismatchError, UploadLockedError) as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except Exception as e:
         db.rollback()
         raise HTTPException(
@@ -326,9 +552,10 @@ async def request_revision(
         )
 
 
-@router.get("/projects/{project_id}/report/download")
+@router.api_route("/projects/{project_id}/report/download", methods=["GET", "HEAD"])
 async def download_report(
     project_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_customer_user)
 ):
@@ -344,8 +571,15 @@ async def download_report(
     ## 조건
     - 프로젝트 상태: completed
     - 보고서가 발행되어 있어야 함
+
+    ## 전송 방식
+    - `HEAD` 요청 지원 (본문 없이 크기 / ETag 확인)
+    - `Range` 요청 지원 (PDF 뷰어 부분 요청 → 206)
+    - `If-None-Match`가 ETag와 같으면 304 (재다운로드 시 본문 없음)
+    - 대용량 보고서 또는 서버에 로컬 파일이 없는 보고서는
+      Storage 단기 서명 URL로 리다이렉트 (307)
     """
-    from fastapi.responses import FileResponse
+    from fastapi.responses import RedirectResponse
 
     try:
         # 프로젝트 확인
@@ -356,7 +590,7 @@ async def download_report(
                 detail="프로젝트를 찾을 수 없습니다."
             )
 
-        # 보고서 조회
+        # 보고서 조회 (ix_reports_project_issued_at 인덱스 사용)
         report = db.query(Report).filter(
             Report.project_id == project_id
         ).order_by(Report.issued_at.desc()).first()
@@ -367,19 +601,39 @@ async def download_report(
                 detail="발행된 보고서가 없습니다."
             )
 
+        if not report.report_path:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="보고서 파일을 찾을 수 없습니다."
+            )
+
+        # report_path: 서버 로컬 경로이자 reports 버킷 내 경로
+        stat_result = await stat_regular_file(report.report_path)
+
+        # 대용량 또는 Storage에만 있는 보고서 → 서명 URL
+        if stat_result is None or stat_result.st_size >= LARGE_REPORT_THRESHOLD_BYTES:
+            try:
+                signed_url = await create_signed_report_url(report_storage_path(report.report_path))
+            except Exception:
+                signed_url = None
+            if signed_url:
+                return RedirectResponse(signed_url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
         # 파일 존재 확인
-        report_path = Path(report.report_file_path)
-        if not report_path.exists():
+        if stat_result is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="보고서 파일을 찾을 수 없습니다."
             )
 
-        # 파일 다운로드
-        return FileResponse(
-            path=report.report_file_path,
-            filename=f"{report.report_number}_{project.company_name_kr}_평가보고서.pdf",
-            media_type="application/pdf"
+        # 파일 다운로드 (Range / ETag 지원)
+        return RangedFileResponse(
+            path=report.report_path,
+            request_headers=request.headers,
+            stat_result=stat_result,
+            filename=f"{report.report_number}_{project.company_name_kr}_평가보고서.{report.delivery_format or 'pdf'}",
+            media_type=REPORT_MEDIA_TYPES.get(report.delivery_format, "application/pdf"),
+            method=request.method
         )
 
     except HTTPException:
@@ -4,15 +4,17 @@
 시스템 및 AI가 접근하는 내부 API:
 1. AI 데이터 추출
 2. 평가 계산
-3. 통합 평가
+3. 통합 평가 (동기 / 비동기 작업)
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 
-from database import get_db
+from database import get_db, SessionLocal
 from auth import get_system_user, User
 from schemas.ai_extraction import AIExtractionRequest, AIExtractionResponse
 from schemas.calculation import (
@@ -25,6 +27,8 @@ from models.project import Project
 from models.document import Document
 from models.approval_point import ApprovalPoint
 from models.valuation_result import ValuationResult
+from schemas.valuation_job import ValuationJobResponse
+from services.valuation_jobs import JobContext, get_job_queue, register_job_handler, submit_job
 
 # 라우터 생성
 router = APIRouter(
@@ -32,6 +36,9 @@ router = APIRouter(
     tags=["Internal - 시스템/AI"]
 )
 
+# valuation_jobs.kind
+INTEGRATED_JOB_KIND = "internal_integrated_valuation"
+
 
 @router.post("/projects/{project_id}/extract", response_model=AIExtractionResponse)
 async def extract_data(
@@ -225,6 +232,127 @@ async def calculate_valuation(
         )
 
 
+def load_project_for_integration(db: Session, project_id: str) -> Project:
+    """통합 평가 대상 프로젝트 조회 + 상태 확인 (HTTPException)"""
+    project = db.query(Project).filter(Project.project_id == project_id).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다."
+        )
+
+    # 상태 확인
+    if project.status != "evaluating":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"통합 평가는 'evaluating' 상태에서만 가능합니다. (현재: {project.status})"
+        )
+
+    return project
+
+
+def execute_integrated_valuation(
+    db: Session,
+    project_id: str,
+    weights: Dict[str, float],
+    job: Optional[JobContext] = None
+) -> IntegratedValuationResponse:
+    """
+    평가 결과 통합 + 판단 포인트 생성 (동기 엔드포인트와 비동기 작업 공용)
+
+    Args:
+        job: 비동기 작업으로 실행할 때의 JobContext (단계 기록, 커밋 직전 취소 확인)
+    """
+    if job:
+        job.stage("loading")
+    project = load_project_for_integration(db, project_id)
+
+    # 평가 결과 조회
+    valuation_results = db.query(ValuationResult).filter(
+        ValuationResult.project_id == project_id
+    ).all()
+
+    if not valuation_results:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="평가 결과가 없습니다."
+        )
+
+    if job:
+        job.stage("integrating")
+
+    # TODO: 실제 통합 로직
+    # 여기서는 단순 가중평균
+    total_value = sum(
+        r.result.get("equity_value", 0) * weights.get(r.method, 1.0)
+        for r in valuation_results
+    )
+    total_weight = sum(weights.get(r.method, 1.0) for r in valuation_results)
+    final_value = total_value / total_weight if total_weight > 0 else 0
+
+    integrated_result = {
+        "final_value": final_value,
+        "value_range": {
+            "min": final_value * 0.9,
+            "max": final_value * 1.1
+        },
+        "method_results": [
+            {
+                "method": r.method,
+                "value": r.result.get("equity_value"),
+                "weight": weights.get(r.method, 1.0)
+            }
+            for r in valuation_results
+        ]
+    }
+
+    if job:
+        job.stage("saving")
+
+    # 22개 판단 포인트 생성
+    # TODO: 실제 판단 포인트 생성 로직
+    judgment_points = []
+    for i in range(1, 23):
+        point_id = f"JP{i:03d}"
+        point = ApprovalPoint(
+            project_id=project_id,
+            point_id=point_id,
+            point_name=f"판단포인트 {i}",
+            display_name=f"판단포인트 {i}",
+            category="재무" if i <= 12 else ("시장" if i <= 16 else ("자산" if i <= 19 else "법률")),
+            importance="high" if i <= 5 else "medium",
+            valuation_method=project.valuation_methods[0] if project.valuation_methods else "dcf",
+            ai_value=1000000 * i,
+            ai_rationale=f"AI 판단 근거 {i}",
+            suggested_range={"min": 900000 * i, "max": 1100000 * i},
+            status="pending"
+        )
+        db.add(point)
+        judgment_points.append({
+            "point_id": point_id,
+            "point_name": f"판단포인트 {i}",
+            "ai_value": 1000000 * i
+        })
+
+    # 프로젝트 상태 업데이트
+    project.status = "human_approval"
+
+    if job:
+        job.check_cancelled()  # 취소 요청이면 커밋하지 않음 (세션은 핸들러가 롤백)
+    db.commit()
+
+    return IntegratedValuationResponse(
+        project_id=project_id,
+        final_value=final_value,
+        value_range=integrated_result["value_range"],
+        method_results=integrated_result["method_results"],
+        judgment_points=judgment_points,
+        status=project.status,
+        integrated_at=datetime.utcnow(),
+        message="통합 평가가 완료되었습니다. 회계사가 22개 판단 포인트를 검토합니다."
+    )
+
+
 @router.post("/projects/{project_id}/integrated-valuation", response_model=IntegratedValuationResponse)
 async def integrated_valuation(
     project_id: str,
@@ -247,105 +375,132 @@ async def integrated_valuation(
 
     ## 상태 변경
     - evaluating → human_approval
+
+    ## 대용량 입력
+    - 요청 안에서 끝까지 실행 - 오래 걸리면 `POST /internal/projects/{project_id}/integrated-valuation/jobs` 사용
     """
     try:
-        # 프로젝트 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="프로젝트를 찾을 수 없습니다."
-            )
+        return execute_integrated_valuation(db, project_id, request.weights)
 
-        # 상태 확인
-        if project.status != "evaluating":
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"통합 평가는 'evaluating' 상태에서만 가능합니다. (현재: {project.status})"
-            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"통합 평가 중 오류가 발생했습니다: {str(e)}"
+        )
 
-        # 평가 결과 조회
-        valuation_results = db.query(ValuationResult).filter(
-            ValuationResult.project_id == project_id
-        ).all()
 
-        if not valuation_results:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="평가 결과가 없습니다."
-            )
+@register_job_handler(INTEGRATED_JOB_KIND)
+def _integrated_valuation_job(job: JobContext) -> Dict[str, Any]:
+    """통합 평가 작업 핸들러 (워커 스레드, 작업마다 DB 세션 생성)"""
+    db = SessionLocal()
+    try:
+        response = execute_integrated_valuation(db, job.job.project_id, job.job.payload["weights"], job)
+        return response.model_dump(mode="json")
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        db.close()
 
-        # TODO: 실제 통합 로직
-        # 여기서는 단순 가중평균
-        total_value = sum(
-            r.result.get("equity_value", 0) * request.weights.get(r.method, 1.0)
-            for r in valuation_results
+
+def _job_response(job: Dict[str, Any], deduplicated: bool = False) -> ValuationJobResponse:
+    base = f"/api/internal/projects/{job['project_id']}/integrated-valuation/jobs/{job['job_id']}"
+    return ValuationJobResponse(
+        **job,
+        deduplicated=deduplicated,
+        status_url=base,
+        result_url=f"{base}/result"
+    )
+
+
+async def _get_job(project_id: str, job_id: str) -> Dict[str, Any]:
+    job = await asyncio.to_thread(lambda: get_job_queue().get(job_id))
+    if not job or job["kind"] != INTEGRATED_JOB_KIND or job["project_id"] != project_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="평가 작업을 찾을 수 없습니다."
         )
-        total_weight = sum(request.weights.get(r.method, 1.0) for r in valuation_results)
-        final_value = total_value / total_weight if total_weight > 0 else 0
-
-        integrated_result = {
-            "final_value": final_value,
-            "value_range": {
-                "min": final_value * 0.9,
-                "max": final_value * 1.1
-            },
-            "method_results": [
-                {
-                    "method": r.method,
-                    "value": r.result.get("equity_value"),
-                    "weight": request.weights.get(r.method, 1.0)
-                }
-                for r in valuation_results
-            ]
-        }
+    return job
 
-        # 22개 판단 포인트 생성
-        # TODO: 실제 판단 포인트 생성 로직
-        judgment_points = []
-        for i in range(1, 23):
-            point_id = f"JP{i:03d}"
-            point = ApprovalPoint(
-                project_id=project_id,
-                point_id=point_id,
-                point_name=f"판단포인트 {i}",
-                display_name=f"판단포인트 {i}",
-                category="재무" if i <= 12 else ("시장" if i <= 16 else ("자산" if i <= 19 else "법률")),
-                importance="high" if i <= 5 else "medium",
-                valuation_method=project.valuation_methods[0] if project.valuation_methods else "dcf",
-                ai_value=1000000 * i,
-                ai_rationale=f"AI 판단 근거 {i}",
-                suggested_range={"min": 900000 * i, "max": 1100000 * i},
-                status="pending"
-            )
-            db.add(point)
-            judgment_points.append({
-                "point_id": point_id,
-                "point_name": f"판단포인트 {i}",
-                "ai_value": 1000000 * i
-            })
 
-        # 프로젝트 상태 업데이트
-        project.status = "human_approval"
+@router.post(
+    "/projects/{project_id}/integrated-valuation/jobs",
+    response_model=ValuationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_integrated_valuation_job(
+    project_id: str,
+    request: IntegratedValuationRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_system_user)
+):
+    """
+    # 통합 평가 작업 제출
 
-        db.commit()
+    통합 평가를 작업 큐에 올리고 job_id를 바로 반환합니다 (202).
 
-        return IntegratedValuationResponse(
-            project_id=project_id,
-            final_value=final_value,
-            value_range=integrated_result["value_range"],
-            method_results=integrated_result["method_results"],
-            judgment_points=judgment_points,
-            status=project.status,
-            integrated_at=datetime.utcnow(),
-            message="통합 평가가 완료되었습니다. 회계사가 22개 판단 포인트를 검토합니다."
-        )
+    ## 권한
+    - 시스템 내부 API만 가능
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        db.rollback()
+    ## 동작
+    - 프로젝트/상태 확인은 제출 시점에 바로 수행 (404 / 400)
+    - 같은 프로젝트에 같은 가중치로 진행 중인 작업이 있으면 그 작업을 반환 (deduplicated=true)
+    - 상태: status_url, 결과: result_url (succeeded 이후), 취소: .../cancel
+    """
+    load_project_for_integration(db, project_id)
+
+    job, created = await submit_job(INTEGRATED_JOB_KIND, project_id, {"weights": request.weights})
+    return _job_response(job, deduplicated=not created)
+
+
+@router.get("/projects/{project_id}/integrated-valuation/jobs/{job_id}", response_model=ValuationJobResponse)
+async def get_integrated_valuation_job(
+    project_id: str,
+    job_id: str,
+    current_user: User = Depends(get_system_user)
+):
+    """통합 평가 작업 상태 (queued / running + stage / succeeded / failed / cancelled)"""
+    return _job_response(await _get_job(project_id, job_id))
+
+
+@router.get(
+    "/projects/{project_id}/integrated-valuation/jobs/{job_id}/result",
+    response_model=IntegratedValuationResponse
+)
+async def get_integrated_valuation_job_result(
+    project_id: str,
+    job_id: str,
+    current_user: User = Depends(get_system_user)
+):
+    """통합 평가 작업 결과 (완료 전이면 409, 실패면 409 + 오류)"""
+    job = await _get_job(project_id, job_id)
+    if job["status"] != "succeeded":
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"통합 평가 중 오류가 발생했습니다: {str(e)}"
+            status_code=status.HTTP_409_CONFLICT,
+            detail=job["error"] if job["status"] == "failed" else f"작업이 완료되지 않았습니다. (현재: {job['status']})"
         )
+    return await asyncio.to_thread(lambda: get_job_queue().result(job_id))
+
+
+@router.post(
+    "/projects/{project_id}/integrated-valuation/jobs/{job_id}/cancel",
+    response_model=ValuationJobResponse
+)
+async def cancel_integrated_valuation_job(
+    project_id: str,
+    job_id: str,
+    current_user: User = Depends(get_system_user)
+):
+    """
+    통합 평가 작업 취소
+
+    - 대기 중: 즉시 cancelled
+    - 실행 중: cancel_requested=true, 워커가 다음 단계(결과 저장 커밋 전)에서 중단
+    - 이미 끝난 작업: 상태 그대로 반환
+    """
+    await _get_job(project_id, job_id)
+    await asyncio.to_thread(lambda: get_job_queue().cancel(job_id))
+    return _job_response(await _get_job(project_id, job_id))
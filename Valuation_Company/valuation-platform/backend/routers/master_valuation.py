@@ -2,26 +2,37 @@
 Master Valuation Router
 
 통합 평가:
-- POST /projects/{project_id}/integrated-valuation - 5가지 평가법 통합 실행
+- POST /projects/{project_id}/integrated-valuation - 5가지 평가법 통합 실행 (요청 안에서 동기 실행)
+- POST /projects/{project_id}/integrated-valuation/jobs - 비동기 작업 제출 (job_id 즉시 반환)
+- GET  /projects/{project_id}/integrated-valuation/jobs/{job_id} - 작업 상태
+- GET  /projects/{project_id}/integrated-valuation/jobs/{job_id}/result - 작업 결과
+- POST /projects/{project_id}/integrated-valuation/jobs/{job_id}/cancel - 작업 취소
 """
 
+import asyncio
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
-from database import get_db
+from database import get_db, SessionLocal
 from schemas.master_valuation import (
     IntegratedValuationRequest,
     IntegratedValuationResponse
 )
+from schemas.valuation_job import ValuationJobResponse
+from services.valuation_jobs import JobContext, get_job_queue, register_job_handler, submit_job
 from models.project import Project
 from models.valuation_result import ValuationResult
 from models.approval_point import ApprovalPoint
 
 router = APIRouter()
 
+# valuation_jobs.kind
+JOB_KIND = "integrated_valuation"
+
 
-async def run_master_valuation_engine(
+def run_master_valuation_engine(
     project: Project,
     input_data: Dict[str, Any],
     valuation_methods: List[str],
@@ -105,6 +116,124 @@ async def run_master_valuation_engine(
     }
 
 
+def load_project_for_integrated_valuation(db: Session, project_id: str) -> Project:
+    """통합 평가 대상 프로젝트 조회 + 상태/평가 방법 확인 (HTTPException)"""
+    project = db.query(Project).filter(Project.project_id == project_id).first()
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로젝트를 찾을 수 없습니다."
+        )
+
+    # 상태 확인
+    if project.status not in ["documents_uploaded", "collecting", "evaluating"]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"통합 평가는 'documents_uploaded' 이후 상태에서만 가능합니다. (현재: {project.status})"
+        )
+
+    # 평가 방법 확인
+    if not project.valuation_methods:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="평가 방법이 지정되지 않았습니다."
+        )
+
+    return project
+
+
+def execute_integrated_valuation(
+    db: Session,
+    project_id: str,
+    input_data: Dict[str, Any],
+    job: Optional[JobContext] = None
+) -> IntegratedValuationResponse:
+    """
+    통합 평가 실행 + 결과/판단 포인트 저장 (동기 엔드포인트와 비동기 작업 공용)
+
+    Args:
+        job: 비동기 작업으로 실행할 때의 JobContext (단계 기록, 커밋 직전 취소 확인)
+    """
+    if job:
+        job.stage("loading")
+    project = load_project_for_integrated_valuation(db, project_id)
+
+    # Master Valuation Engine 실행
+    if job:
+        job.stage("evaluating")
+    engine_result = run_master_valuation_engine(
+        project,
+        input_data,
+        project.valuation_methods,
+        []  # 기존 approval points (없으면 빈 리스트)
+    )
+
+    if job:
+        job.stage("saving")
+
+    # 1. 평가 결과 저장
+    for method, result in engine_result["method_results"].items():
+        if result is None:
+            continue
+
+        existing_result = db.query(ValuationResult).filter(
+            ValuationResult.project_id == project_id,
+            ValuationResult.method == method
+        ).first()
+
+        if existing_result:
+            existing_result.result = result
+            existing_result.calculation_status = "completed"
+        else:
+            new_result = ValuationResult(
+                project_id=project_id,
+                method=method,
+                calculation_status="completed",
+                result=result
+            )
+            db.add(new_result)
+
+    # 2. 판단 포인트 생성
+    for point_data in engine_result["approval_points"]:
+        existing_point = db.query(ApprovalPoint).filter(
+            ApprovalPoint.project_id == project_id,
+            ApprovalPoint.point_id == point_data["point_id"]
+        ).first()
+
+        if not existing_point:
+            new_point = ApprovalPoint(
+                project_id=project_id,
+                point_id=point_data["point_id"],
+                point_name=f"point_{point_data['point_id']}",
+                display_name=f"판단 포인트 {point_data['point_id']}",
+                category="재무",  # TODO: 실제 카테고리
+                importance="medium",
+                valuation_method=project.valuation_methods[0],
+                ai_value=point_data["ai_value"],
+                ai_rationale=point_data["ai_rationale"],
+                suggested_range=point_data.get("suggested_range"),
+                status="pending"
+            )
+            db.add(new_point)
+
+    # 3. 프로젝트 상태 업데이트
+    project.status = "human_approval"
+
+    if job:
+        job.check_cancelled()  # 취소 요청이면 커밋하지 않음 (세션은 핸들러가 롤백)
+    db.commit()
+
+    return IntegratedValuationResponse(
+        project_id=project_id,
+        selector_recommendation=engine_result["selector_recommendation"],
+        method_results=engine_result["method_results"],
+        approval_points_count=len(engine_result["approval_points"]),
+        final_valuation=engine_result["final_valuation"],
+        status=project.status,
+        message="통합 평가가 완료되었습니다. 22개 판단 포인트를 검토하세요."
+    )
+
+
 @router.post("/projects/{project_id}/integrated-valuation", response_model=IntegratedValuationResponse)
 async def run_integrated_valuation(
     project_id: str,
@@ -171,97 +300,13 @@ async def run_integrated_valuation(
     - method_results: 5가지 평가 결과
     - approval_points: 22개 판단 포인트 (AI 제안)
     - final_valuation: 통합 최종 가치
+
+    ## 대용량 입력
+    - 요청 안에서 끝까지 실행하므로 프록시 타임아웃에 걸릴 수 있음
+    - 이 경우 `POST /projects/{project_id}/integrated-valuation/jobs`로 제출 후 상태/결과 조회
     """
     try:
-        # 프로젝트 존재 확인
-        project = db.query(Project).filter(Project.project_id == project_id).first()
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="프로젝트를 찾을 수 없습니다."
-            )
-
-        # 상태 확인
-        if project.status not in ["documents_uploaded", "collecting", "evaluating"]:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"통합 평가는 'documents_uploaded' 이후 상태에서만 가능합니다. (현재: {project.status})"
-            )
-
-        # 평가 방법 확인
-        if not project.valuation_methods:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="평가 방법이 지정되지 않았습니다."
-            )
-
-        # Master Valuation Engine 실행
-        engine_result = await run_master_valuation_engine(
-            project,
-            request.input_data,
-            project.valuation_methods,
-            []  # 기존 approval points (없으면 빈 리스트)
-        )
-
-        # 1. 평가 결과 저장
-        for method, result in engine_result["method_results"].items():
-            if result is None:
-                continue
-
-            existing_result = db.query(ValuationResult).filter(
-                ValuationResult.project_id == project_id,
-                ValuationResult.method == method
-            ).first()
-
-            if existing_result:
-                existing_result.result = result
-                existing_result.calculation_status = "completed"
-            else:
-                new_result = ValuationResult(
-                    project_id=project_id,
-                    method=method,
-                    calculation_status="completed",
-                    result=result
-                )
-                db.add(new_result)
-
-        # 2. 판단 포인트 생성
-        for point_data in engine_result["approval_points"]:
-            existing_point = db.query(ApprovalPoint).filter(
-                ApprovalPoint.project_id == project_id,
-                ApprovalPoint.point_id == point_data["point_id"]
-            ).first()
-
-            if not existing_point:
-                new_point = ApprovalPoint(
-                    project_id=project_id,
-                    point_id=point_data["point_id"],
-                    point_name=f"point_{point_data['point_id']}",
-                    display_name=f"판단 포인트 {point_data['point_id']}",
-                    category="재무",  # TODO: 실제 카테고리
-                    importance="medium",
-                    valuation_method=project.valuation_methods[0],
-                    ai_value=point_data["ai_value"],
-                    ai_rationale=point_data["ai_rationale"],
-                    suggested_range=point_data.get("suggested_range"),
-                    status="pending"
-                )
-                db.add(new_point)
-
-        # 3. 프로젝트 상태 업데이트
-        project.status = "human_approval"
-
-        db.commit()
-
-        return IntegratedValuationResponse(
-            project_id=project_id,
-            selector_recommendation=engine_result["selector_recommendation"],
-            method_results=engine_result["method_results"],
-            approval_points_count=len(engine_result["approval_points"]),
-            final_valuation=engine_result["final_valuation"],
-            status=project.status,
-            message="통합 평가가 완료되었습니다. 22개 판단 포인트를 검토하세요."
-        )
+        return execute_integrated_valuation(db, project_id, request.input_data)
 
     except HTTPException:
         raise
@@ -271,3 +316,98 @@ async def run_integrated_valuation(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"통합 평가 중 오류가 발생했습니다: {str(e)}"
         )
+
+
+@register_job_handler(JOB_KIND)
+def _integrated_valuation_job(job: JobContext) -> Dict[str, Any]:
+    """통합 평가 작업 핸들러 (워커 스레드, 작업마다 DB 세션 생성)"""
+    db = SessionLocal()
+    try:
+        response = execute_integrated_valuation(db, job.job.project_id, job.job.payload["input_data"], job)
+        return response.model_dump(mode="json")
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def _job_response(job: Dict[str, Any], deduplicated: bool = False) -> ValuationJobResponse:
+    base = f"/api/projects/{job['project_id']}/integrated-valuation/jobs/{job['job_id']}"
+    return ValuationJobResponse(
+        **job,
+        deduplicated=deduplicated,
+        status_url=base,
+        result_url=f"{base}/result"
+    )
+
+
+async def _get_job(project_id: str, job_id: str) -> Dict[str, Any]:
+    job = await asyncio.to_thread(lambda: get_job_queue().get(job_id))
+    if not job or job["kind"] != JOB_KIND or job["project_id"] != project_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="평가 작업을 찾을 수 없습니다."
+        )
+    return job
+
+
+@router.post(
+    "/projects/{project_id}/integrated-valuation/jobs",
+    response_model=ValuationJobResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def submit_integrated_valuation_job(
+    project_id: str,
+    request: IntegratedValuationRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    # 통합 평가 작업 제출
+
+    통합 평가를 작업 큐에 올리고 job_id를 바로 반환합니다 (202).
+    입력이 커서 요청 시간 안에 끝나지 않는 경우 동기 API 대신 사용합니다.
+
+    - 프로젝트/상태 확인은 제출 시점에 바로 수행 (404 / 400)
+    - 같은 프로젝트에 같은 입력으로 진행 중인 작업이 있으면 그 작업을 반환 (deduplicated=true)
+    - 상태: status_url, 결과: result_url (succeeded 이후), 취소: .../cancel
+    """
+    load_project_for_integrated_valuation(db, project_id)
+
+    job, created = await submit_job(JOB_KIND, project_id, {"input_data": request.input_data})
+    return _job_response(job, deduplicated=not created)
+
+
+@router.get("/projects/{project_id}/integrated-valuation/jobs/{job_id}", response_model=ValuationJobResponse)
+async def get_integrated_valuation_job(project_id: str, job_id: str):
+    """통합 평가 작업 상태 (queued / running + stage / succeeded / failed / cancelled)"""
+    return _job_response(await _get_job(project_id, job_id))
+
+
+@router.get(
+    "/projects/{project_id}/integrated-valuation/jobs/{job_id}/result",
+    response_model=IntegratedValuationResponse
+)
+async def get_integrated_valuation_job_result(project_id: str, job_id: str):
+    """통합 평가 작업 결과 (완료 전이면 409, 실패면 409 + 오류)"""
+    job = await _get_job(project_id, job_id)
+    if job["status"] != "succeeded":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=job["error"] if job["status"] == "failed" else f"작업이 완료되지 않았습니다. (현재: {job['status']})"
+        )
+    return await asyncio.to_thread(lambda: get_job_queue().result(job_id))
+
+
+@router.post("/projects/{project_id}/integrated-valuation/jobs/{job_id}/cancel", response_model=ValuationJobResponse)
+async def cancel_integrated_valuation_job(project_id: str, job_id: str):
+    """
+    통합 평가 작업 취소
+
+    - 대기 중: 즉시 cancelled
+    - 실행 중: cancel_requested=true, 워커가 다음 단계(결과 저장 커밋 전)에서 중단
+    - 이미 끝난 작업: 상태 그대로 반환
+    """
+    await _get_job(project_id, job_id)
+    await asyncio.to_thread(lambda: get_job_queue().cancel(job_id))
+    return _job_response(await _get_job(project_id, job_id))
@@ -7,11 +7,12 @@ Reports Router
 - GET /projects/{project_id}/report/download - 보고서 다운로드
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Header, status
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 from database import get_db
 from schemas.report import (
@@ -23,6 +24,7 @@ from schemas.report import (
 from models.project import Project
 from models.report import Report
 from models.draft import Draft
+from services.report_numbering import build_issued_report, issue_report
 
 router = APIRouter()
 
@@ -72,7 +74,7 @@ async def finalize_project(
         # 최신 초안 확인
         latest_draft = db.query(Draft).filter(
             Draft.project_id == project_id
-        ).order_by(Draft.draft_version.desc()).first()
+        ).order_by(Draft.created_at.desc()).first()
 
         if not latest_draft:
             raise HTTPException(
@@ -107,6 +109,7 @@ async def finalize_project(
 async def generate_report(
     project_id: str,
     request: ReportGenerateRequest,
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key", max_length=100),
     db: Session = Depends(get_db)
 ):
     """
@@ -123,6 +126,10 @@ async def generate_report(
     ## 보고서 번호 형식
     - VR-{YYYY}-{순번 5자리}
     - 예: VR-2024-00123
+    - 연도별 카운터에서 발급 (동시에 발행해도 중복 없음)
+
+    ## 멱등성
+    - `Idempotency-Key` 헤더(또는 idempotency_key 필드)가 같으면 새로 발행하지 않고 기존 보고서 반환 (replayed=true)
 
     ## 보고서 구성
     1. **표지 (Cover Page)**
@@ -163,7 +170,7 @@ async def generate_report(
         # 최신 초안 확인
         latest_draft = db.query(Draft).filter(
             Draft.project_id == project_id
-        ).order_by(Draft.draft_version.desc()).first()
+        ).order_by(Draft.created_at.desc()).first()
 
         if not latest_draft:
             raise HTTPException(
@@ -171,39 +178,30 @@ async def generate_report(
                 detail="초안이 생성되지 않았습니다."
             )
 
-        # 보고서 번호 생성
-        year = datetime.now().year
-        report_count = db.query(Report).filter(
-            Report.report_number.like(f"VR-{year}-%")
-        ).count()
-        report_number = f"VR-{year}-{report_count + 1:05d}"
+        download_url = f"/api/projects/{project_id}/report/download"
 
-        # TODO: 실제 보고서 생성 (PDF)
-        report_file_path = f"./reports/{project_id}_{report_number}.pdf"
+        def build_report(report_number: str) -> Report:
+            return build_issued_report(
+                project_id, latest_draft, report_number,
+                report_format=request.format,
+                issued_by=request.issued_by or "system",
+                download_url=download_url
+            )
 
-        # 보고서 레코드 생성
-        report = Report(
-            project_id=project_id,
-            draft_id=latest_draft.draft_id,
-            report_number=report_number,
-            report_file_path=report_file_path,
-            format=request.format,
-            issued_by=request.issued_by or "system",
-            digital_signature=request.digital_signature,
-            password_protected=request.password_protected
+        # 보고서 번호 발급 (연도별 카운터) + 저장 - 같은 멱등 키로 이미 발행했으면 기존 보고서
+        report, replayed = issue_report(
+            db, project_id, build_report,
+            idempotency_key=idempotency_key or request.idempotency_key
         )
 
-        db.add(report)
-        db.commit()
-        db.refresh(report)
-
         return ReportGenerateResponse(
             project_id=project_id,
             report_id=report.report_id,
             report_number=report.report_number,
-            download_url=f"/api/projects/{project_id}/report/download",
+            download_url=download_url,
             issued_at=report.issued_at,
-            message="보고서가 발행되었습니다."
+            replayed=replayed,
+            message="이미 발행된 보고서입니다." if replayed else "보고서가 발행되었습니다."
         )
 
     except HTTPException:
@@ -17,6 +17,7 @@ from .valuation import *
 from .approval import *
 from .draft import *
 from .report import *
+from .valuation_job import *
 
 __all__ = [
     # Common
@@ -38,6 +39,8 @@ __all__ = [
     # Document
     "DocumentUploadResponse",
     "UploadProgress",
+    "ResumableUploadCreateRequest",
+    "ResumableUploadStatus",
 
     # Extraction
     "ExtractionRequest",
@@ -70,4 +73,7 @@ __all__ = [
     "FinalizeResponse",
     "ReportRequest",
     "ReportResponse",
+
+    # Valuation Job
+    "ValuationJobResponse",
 ]
@@ -104,3 +104,43 @@ class DocumentUploadResponse(BaseModel):
                 "message": "필수 서류 업로드가 완료되었습니다. AI 자료 수집을 시작합니다."
             }
         }
+
+
+# ========================================
+# 5-1. 재개 가능 업로드 (POST /projects/{project_id}/uploads)
+# ========================================
+
+class ResumableUploadCreateRequest(BaseModel):
+    """재개 가능 업로드 세션 생성 요청"""
+    file_name: str = Field(..., description="파일명")
+    total_size: int = Field(..., gt=0, description="전체 파일 크기 (bytes)")
+    category: DocumentCategory = Field(..., description="카테고리")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "file_name": "감사보고서_2023.pdf",
+                "total_size": 262144000,
+                "category": "financial"
+            }
+        }
+
+
+class ResumableUploadStatus(BaseModel):
+    """재개 가능 업로드 세션 상태"""
+    upload_id: str = Field(..., description="업로드 세션 ID")
+    project_id: str
+    file_name: str = Field(..., description="파일명")
+    total_size: int = Field(..., description="전체 파일 크기 (bytes)")
+    offset: int = Field(..., description="서버가 수신한 바이트 수 (다음 청크 시작 위치)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "upload_id": "3f2b9c0e8d7a4e41b6f0c2d9a1e5b7c3",
+                "project_id": "SAMSU-2501191430-CP",
+                "file_name": "감사보고서_2023.pdf",
+                "total_size": 262144000,
+                "offset": 104857600
+            }
+        }
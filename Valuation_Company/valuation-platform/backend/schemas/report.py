@@ -140,3 +140,49 @@ class ReportResponse(BaseModel):
                 "message": "평가 보고서가 발행되었습니다."
             }
         }
+
+
+class ReportGenerateRequest(BaseModel):
+    """보고서 발행 요청 (보고서 번호 VR-{YYYY}-{순번} 발급)"""
+    format: Literal["pdf", "docx"] = Field(default="pdf", description="파일 형식")
+    digital_signature: bool = Field(default=True, description="전자 서명 포함 여부")
+    password_protected: bool = Field(default=False, description="암호화 여부")
+    issued_by: Optional[str] = Field(None, description="발행자 (미지정 시 system)")
+    idempotency_key: Optional[str] = Field(
+        None, max_length=100,
+        description="멱등 키 - 같은 키로 다시 요청하면 새로 발행하지 않고 기존 보고서 반환 (Idempotency-Key 헤더 우선)"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "format": "pdf",
+                "digital_signature": True,
+                "password_protected": False,
+                "idempotency_key": "2f1c9a7e-issue-SAMSU-2501191430-CP"
+            }
+        }
+
+
+class ReportGenerateResponse(BaseModel):
+    """보고서 발행 응답"""
+    project_id: str
+    report_id: str = Field(..., description="보고서 ID")
+    report_number: str = Field(..., description="보고서 번호")
+    download_url: str = Field(..., description="다운로드 URL")
+    issued_at: Optional[datetime] = None
+    replayed: bool = Field(default=False, description="멱등 키 재요청으로 기존 보고서를 반환했는지")
+    message: str
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "project_id": "SAMSU-2501191430-CP",
+                "report_id": "RPT-SAMSU-2501191430-CP-001",
+                "report_number": "VR-2026-00123",
+                "download_url": "/api/accountant/projects/SAMSU-2501191430-CP/report/download",
+                "issued_at": "2026-01-20T17:30:00Z",
+                "replayed": False,
+                "message": "보고서가 발행되었습니다."
+            }
+        }
@@ -4,7 +4,7 @@ Valuation calculation and results schemas
 평가 실행, 결과, 시뮬레이션 관련 스키마
 """
 
-from typing import Optional, List, Dict, Literal
+from typing import Any, Optional, List, Dict, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field
 
@@ -273,11 +273,11 @@ class SensitivityMatrix(BaseModel):
 
 class KeyAssumptions(BaseModel):
     """주요 가정"""
-    dcf: Optional[Dict[str, any]] = None
-    relative: Optional[Dict[str, any]] = None
-    asset: Optional[Dict[str, any]] = None
-    capital_market_law: Optional[Dict[str, any]] = None
-    inheritance_tax_law: Optional[Dict[str, any]] = None
+    dcf: Optional[Dict[str, Any]] = None
+    relative: Optional[Dict[str, Any]] = None
+    asset: Optional[Dict[str, Any]] = None
+    capital_market_law: Optional[Dict[str, Any]] = None
+    inheritance_tax_law: Optional[Dict[str, Any]] = None
 
 
 class PreviewResponse(BaseModel):
@@ -297,7 +297,7 @@ class PreviewResponse(BaseModel):
 class SimulationRequest(BaseModel):
     """시뮬레이션 요청"""
     method: ValuationMethodCode = Field(..., description="시뮬레이션 대상 평가법")
-    modified_assumptions: Dict[str, any] = Field(..., description="수정된 가정")
+    modified_assumptions: Dict[str, Any] = Field(..., description="수정된 가정")
 
     class Config:
         json_schema_extra = {
@@ -335,7 +335,7 @@ class SimulationResponse(BaseModel):
     method: ValuationMethodCode
     simulation_result: SimulationResult
     impact_breakdown: ImpactBreakdown
-    new_assumptions: Dict[str, any]
+    new_assumptions: Dict[str, Any]
 
     class Config:
         json_schema_extra = {
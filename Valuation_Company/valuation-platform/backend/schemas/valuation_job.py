@@ -0,0 +1,51 @@
+"""
+Valuation Job schemas
+
+통합 평가 비동기 작업 (제출 / 상태 / 취소) 스키마
+"""
+
+from typing import Optional, Literal
+from pydantic import BaseModel, Field
+
+
+JobStatus = Literal["queued", "running", "succeeded", "failed", "cancelled"]
+
+
+class ValuationJobResponse(BaseModel):
+    """작업 상태"""
+    job_id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="작업 종류")
+    project_id: str = Field(..., description="프로젝트 ID")
+    status: JobStatus = Field(..., description="작업 상태")
+    stage: Optional[str] = Field(None, description="진행 단계 (loading, evaluating, saving, done)")
+    attempt: int = Field(0, description="실행 시도 횟수")
+    cancel_requested: bool = Field(False, description="실행 중 취소 요청 여부")
+    created_at: str = Field(..., description="제출 시각")
+    started_at: Optional[str] = Field(None, description="실행 시작 시각")
+    finished_at: Optional[str] = Field(None, description="종료 시각")
+    duration_seconds: Optional[float] = Field(None, description="실행 시간(초)")
+    error: Optional[str] = Field(None, description="실패 사유")
+    deduplicated: bool = Field(False, description="진행 중인 같은 작업을 반환했는지")
+    status_url: Optional[str] = Field(None, description="상태 조회 경로")
+    result_url: Optional[str] = Field(None, description="결과 조회 경로 (succeeded 이후)")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "job_id": "3f0c8a52-6a0e-4c5e-9a57-0c6f1f3f9b11",
+                "kind": "integrated_valuation",
+                "project_id": "VAL-2026-001",
+                "status": "running",
+                "stage": "evaluating",
+                "attempt": 1,
+                "cancel_requested": False,
+                "created_at": "2026-10-19T09:00:00+00:00",
+                "started_at": "2026-10-19T09:00:01+00:00",
+                "finished_at": None,
+                "duration_seconds": None,
+                "error": None,
+                "deduplicated": False,
+                "status_url": "/api/projects/VAL-2026-001/integrated-valuation/jobs/3f0c8a52-6a0e-4c5e-9a57-0c6f1f3f9b11",
+                "result_url": "/api/projects/VAL-2026-001/integrated-valuation/jobs/3f0c8a52-6a0e-4c5e-9a57-0c6f1f3f9b11/result"
+            }
+        }
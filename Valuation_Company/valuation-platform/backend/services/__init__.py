@@ -12,12 +12,26 @@ Valuation Services
 - MasterValuationService: 5가지 평가법 통합
 """
 
-from .dcf_service import DCFService
-from .relative_service import RelativeService
-from .intrinsic_service import IntrinsicService
-from .asset_service import AssetService
-from .tax_service import TaxService
-from .master_valuation_service import MasterValuationService
+import importlib
+
+# 라우터가 services.report_delivery 등만 써도 평가 서비스까지 import하지 않도록 지연 로드
+_LAZY_EXPORTS = {
+    "DCFService": ".dcf_service",
+    "RelativeService": ".relative_service",
+    "IntrinsicService": ".intrinsic_service",
+    "AssetService": ".asset_service",
+    "TaxService": ".tax_service",
+    "MasterValuationService": ".master_valuation_service",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     "DCFService",              # 1. DCF평가법
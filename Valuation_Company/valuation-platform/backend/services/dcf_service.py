@@ -4,15 +4,9 @@
 기존 DCF 엔진을 FastAPI 서비스로 래핑
 """
 
-import sys
-import os
 from typing import Dict, Any, Optional
-from pathlib import Path
 
-# 기존 평가 엔진 경로 추가
-ENGINE_PATH = Path(__file__).parent.parent.parent.parent / "기업가치평가플랫폼" / "valuation_engine"
-if str(ENGINE_PATH) not in sys.path:
-    sys.path.insert(0, str(ENGINE_PATH))
+from app.services.valuation_engine.inputs import DCFInput, InputValidationError, validate_model
 
 
 class DCFService:
@@ -21,9 +15,9 @@ class DCFService:
     def __init__(self):
         """서비스 초기화"""
         try:
-            # 기존 DCF 엔진 import
-            from dcf.dcf_engine import DCFEngine
-            self.engine = DCFEngine()
+            # 통합 평가 엔진 패키지 (엔진 모듈은 여기서 처음 import)
+            from app.services.valuation_engine import create_engine
+            self.engine = create_engine('dcf', verbose=False)
             self.engine_available = True
         except ImportError as e:
             print(f"⚠️ DCF 엔진 import 실패: {e}")
@@ -40,26 +34,22 @@ class DCFService:
         Returns:
             (유효 여부, 에러 메시지)
         """
-        required_fields = [
-            'company_id',
-            'company_name',
-            'valuation_date',
-            'historical_financials',
-            'assumptions',
-            'wacc_inputs',
-            'adjustments'
-        ]
-
-        for field in required_fields:
-            if field not in input_data:
-                return False, f"필수 필드 누락: {field}"
-
-        # 과거 재무제표 검증
-        if not isinstance(input_data['historical_financials'], list) or len(input_data['historical_financials']) < 3:
-            return False, "과거 재무제표는 최소 3년 이상 필요합니다."
+        try:
+            self.parse_inputs(input_data)
+        except InputValidationError as e:
+            return False, e.first_message()
 
         return True, None
 
+    def parse_inputs(self, input_data: Dict[str, Any]) -> DCFInput:
+        """
+        입력 데이터 검증 + 정규화 (엔진이 바로 읽는 DCFInput)
+
+        Raises:
+            InputValidationError: 필드 경로별 오류 (e.errors)
+        """
+        return validate_model(DCFInput, input_data)
+
     def calculate(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         DCF 평가 계산 실행
@@ -90,12 +80,14 @@ class DCFService:
                     'sensitivity_analysis': Dict   # 민감도 분석
                 }
         """
-        # 입력 검증
-        is_valid, error_msg = self.validate_inputs(input_data)
-        if not is_valid:
+        # 입력 검증 (한 번 파싱한 DCFInput을 엔진에 그대로 전달)
+        try:
+            inputs = self.parse_inputs(input_data)
+        except InputValidationError as e:
             return {
                 'success': False,
-                'error': error_msg,
+                'error': e.first_message(),
+                'errors': e.errors,
                 'enterprise_value': 0,
                 'equity_value': 0
             }
@@ -107,7 +99,7 @@ class DCFService:
 
         try:
             # 기존 DCF 엔진 실행
-            result = self.engine.run_valuation(input_data)
+            result = self.engine.evaluate(inputs).to_dict()
 
             # 결과 포맷 변환 (FastAPI 응답용)
             return {
@@ -116,7 +108,7 @@ class DCFService:
                 'equity_value': result['valuation_result']['equity_value'],
                 'value_per_share': result['valuation_result']['value_per_share'],
                 'wacc': result['wacc']['wacc'],
-                'terminal_growth': input_data['assumptions']['terminal_growth'],
+                'terminal_growth': inputs.assumptions.terminal_growth,
                 'pv_fcf': result['discounted_fcf']['total_pv_fcf'],
                 'pv_terminal_value': result['terminal_value']['pv_terminal_value'],
                 'projections': result['projections'],
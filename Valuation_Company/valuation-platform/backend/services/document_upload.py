@@ -0,0 +1,357 @@
+"""
+Document Upload Service
+
+문서 업로드 스트리밍 저장 서비스
+- 청크 단위 비동기 저장 + SHA-256/크기 동시 계산
+- 용량 초과 시 업로드 도중 즉시 중단
+- 해시 기반 저장 경로로 동일 문서 중복 제거
+- 대용량 감사보고서용 재개 가능(resumable) 업로드
+"""
+
+from typing import AsyncIterator, Dict, Any, Iterator, NamedTuple
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+
+from fastapi import UploadFile
+
+
+# 청크 크기 (1MB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# 재개 가능 업로드 최대 크기 (감사보고서 등 대용량 문서)
+MAX_RESUMABLE_UPLOAD_SIZE_MB = int(os.getenv("MAX_RESUMABLE_UPLOAD_SIZE_MB", "500"))
+MAX_RESUMABLE_UPLOAD_SIZE_BYTES = MAX_RESUMABLE_UPLOAD_SIZE_MB * 1024 * 1024
+
+# 세션 잠금 파일이 이 시간(초) 동안 갱신되지 않으면 중단된 요청이 남긴 것으로 보고 회수
+UPLOAD_LOCK_STALE_SECONDS = int(os.getenv("UPLOAD_LOCK_STALE_SECONDS", "120"))
+
+
+class UploadTooLargeError(ValueError):
+    """업로드 용량 초과"""
+
+    def __init__(self, file_name: str, max_bytes: int):
+        self.file_name = file_name
+        self.max_bytes = max_bytes
+        super().__init__(f"파일 '{file_name}'이 너무 큽니다. (최대 {max_bytes // (1024 * 1024)}MB)")
+
+
+class UploadOffsetMismatchError(ValueError):
+    """재개 업로드 오프셋 불일치"""
+
+    def __init__(self, expected: int, received: int):
+        self.expected = expected
+        self.received = received
+        super().__init__(f"업로드 오프셋이 일치하지 않습니다. (서버: {expected}, 요청: {received})")
+
+
+class UploadNotFoundError(ValueError):
+    """재개 업로드 세션 없음"""
+
+
+class UploadLockedError(ValueError):
+    """같은 세션에 다른 요청이 쓰는 중"""
+
+    def __init__(self, upload_id: str):
+        self.upload_id = upload_id
+        super().__init__(f"다른 요청이 업로드 세션을 처리 중입니다: {upload_id}")
+
+
+class StoredUpload(NamedTuple):
+    """저장된 업로드 파일 정보"""
+    path: Path
+    size: int
+    sha256: str
+    deduplicated: bool
+
+
+def _content_path(dest_dir: Path, sha256: str, file_name: str) -> Path:
+    """해시 기반 저장 경로 ({dest_dir}/{sha256}{확장자})"""
+    return dest_dir / f"{sha256}{Path(file_name).suffix.lower()}"
+
+
+def _promote(part_path: Path, dest_dir: Path, sha256: str, file_name: str) -> StoredUpload:
+    """임시 파일을 해시 경로로 이동 (이미 있으면 임시 파일 삭제)"""
+    size = part_path.stat().st_size
+    final_path = _content_path(dest_dir, sha256, file_name)
+
+    if final_path.exists():
+        part_path.unlink()
+        return StoredUpload(final_path, size, sha256, True)
+
+    os.replace(part_path, final_path)
+    return StoredUpload(final_path, size, sha256, False)
+
+
+async def stream_upload_to_disk(
+    upload: UploadFile,
+    dest_dir: Path,
+    max_bytes: int,
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> StoredUpload:
+    """
+    UploadFile을 청크 단위로 저장하면서 SHA-256과 크기 계산
+
+    Args:
+        upload: FastAPI UploadFile
+        dest_dir: 저장 디렉토리
+        max_bytes: 최대 허용 크기
+        chunk_size: 청크 크기
+
+    Returns:
+        StoredUpload: 저장 경로, 크기, 해시, 중복 여부
+
+    Raises:
+        UploadTooLargeError: 크기 초과 (선언 크기 또는 수신 도중)
+    """
+    file_name = upload.filename or "upload"
+
+    # 선언된 크기로 먼저 거부
+    declared_size = getattr(upload, "size", None)
+    if declared_size is not None and declared_size > max_bytes:
+        raise UploadTooLargeError(file_name, max_bytes)
+
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    part_path = dest_dir / f".{uuid.uuid4().hex}.part"
+
+    hasher = hashlib.sha256()
+    size = 0
+
+    try:
+        with open(part_path, "wb") as buffer:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(file_name, max_bytes)
+
+                hasher.update(chunk)
+                await asyncio.to_thread(buffer.write, chunk)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+    return await asyncio.to_thread(_promote, part_path, dest_dir, hasher.hexdigest(), file_name)
+
+
+def _hash_file(path: Path, chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """파일을 청크 단위로 읽어 SHA-256 계산"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class ResumableUploadStore:
+    """
+    재개 가능 업로드 세션 저장소
+
+    세션마다 `{base_dir}/{upload_id}.json` (메타데이터)와
+    `{base_dir}/{upload_id}.part` (수신 데이터)를 유지한다.
+    현재 오프셋은 항상 .part 파일 크기이므로 서버 재시작 후에도 이어받을 수 있다.
+
+    append / complete는 `{upload_id}.lock`을 O_EXCL로 만들어 세션을 잠근다.
+    (워커 프로세스가 여러 개여도 같은 세션에 동시에 쓰지 않음)
+    complete 후에도 세션은 남아 있고, 문서 등록이 끝나면 호출자가 discard로 지운다.
+    """
+
+    def __init__(self, base_dir: Path, max_bytes: int = MAX_RESUMABLE_UPLOAD_SIZE_BYTES):
+        self.base_dir = base_dir
+        self.max_bytes = max_bytes
+
+    def _meta_path(self, upload_id: str) -> Path:
+        return self.base_dir / f"{upload_id}.json"
+
+    def _part_path(self, upload_id: str) -> Path:
+        return self.base_dir / f"{upload_id}.part"
+
+    def _lock_path(self, upload_id: str) -> Path:
+        return self.base_dir / f"{upload_id}.lock"
+
+    @contextmanager
+    def _locked(self, upload_id: str) -> Iterator[Path]:
+        """
+        세션 잠금 (잠금 파일 경로를 넘겨주므로 오래 걸리는 작업 중에는 touch로 갱신)
+
+        Raises:
+            UploadLockedError: 다른 요청이 잠금 보유 중
+        """
+        lock_path = self._lock_path(upload_id)
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                stale = datetime.now().timestamp() - lock_path.stat().st_mtime > UPLOAD_LOCK_STALE_SECONDS
+            except FileNotFoundError:
+                stale = True
+            if not stale:
+                raise UploadLockedError(upload_id)
+            # 중단된 요청이 남긴 잠금: 지우고 한 번만 다시 시도
+            lock_path.unlink(missing_ok=True)
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                raise UploadLockedError(upload_id)
+        os.close(fd)
+
+        try:
+            yield lock_path
+        finally:
+            lock_path.unlink(missing_ok=True)
+
+    def create(
+        self,
+        project_id: str,
+        file_name: str,
+        total_size: int,
+        category: str
+    ) -> Dict[str, Any]:
+        """
+        업로드 세션 생성
+
+        Raises:
+            UploadTooLargeError: total_size가 허용 크기 초과
+        """
+        if total_size > self.max_bytes:
+            raise UploadTooLargeError(file_name, self.max_bytes)
+
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        upload_id = uuid.uuid4().hex
+        meta = {
+            "upload_id": upload_id,
+            "project_id": project_id,
+            "file_name": file_name,
+            "total_size": total_size,
+            "category": category,
+            "created_at": datetime.now().isoformat()
+        }
+
+        self._meta_path(upload_id).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        self._part_path(upload_id).touch()
+
+        return {**meta, "offset": 0}
+
+    def get(self, project_id: str, upload_id: str) -> Dict[str, Any]:
+        """
+        업로드 세션 조회 (현재 오프셋 포함)
+
+        Raises:
+            UploadNotFoundError: 세션 없음 또는 다른 프로젝트의 세션
+        """
+        meta_path = self._meta_path(upload_id)
+        if not meta_path.exists():
+            raise UploadNotFoundError(f"업로드 세션을 찾을 수 없습니다: {upload_id}")
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if meta["project_id"] != project_id:
+            raise UploadNotFoundError(f"업로드 세션을 찾을 수 없습니다: {upload_id}")
+
+        if meta.get("stored"):
+            # complete 후 .part는 해시 경로로 옮겨졌음
+            return {**meta, "offset": meta["total_size"]}
+
+        return {**meta, "offset": self._part_path(upload_id).stat().st_size}
+
+    async def append(
+        self,
+        project_id: str,
+        upload_id: str,
+        offset: int,
+        chunks: AsyncIterator[bytes]
+    ) -> Dict[str, Any]:
+        """
+        청크 스트림을 세션 파일 끝에 추가
+
+        Args:
+            offset: 클라이언트가 알고 있는 현재 오프셋 (서버와 같아야 함)
+            chunks: 요청 본문 바이트 스트림
+
+        Raises:
+            UploadOffsetMismatchError: 오프셋 불일치
+            UploadTooLargeError: 선언한 전체 크기 초과
+            UploadLockedError: 같은 세션에 다른 요청이 쓰는 중
+        """
+        self.get(project_id, upload_id)
+
+        with self._locked(upload_id) as lock_path:
+            # 오프셋 확인과 쓰기는 잠금 안에서 (동시 요청이 같은 오프셋으로 덧붙이지 않도록)
+            meta = self.get(project_id, upload_id)
+
+            if offset != meta["offset"]:
+                raise UploadOffsetMismatchError(meta["offset"], offset)
+
+            if meta.get("stored"):
+                # 이미 완료된 세션: 더 보낼 데이터가 있으면 전체 크기 초과
+                async for chunk in chunks:
+                    if chunk:
+                        raise UploadTooLargeError(meta["file_name"], meta["total_size"])
+                return meta
+
+            received = meta["offset"]
+            with open(self._part_path(upload_id), "ab") as buffer:
+                async for chunk in chunks:
+                    if not chunk:
+                        continue
+
+                    received += len(chunk)
+                    if received > meta["total_size"]:
+                        # 이번 요청에서 받은 데이터는 버리고 중단
+                        await asyncio.to_thread(buffer.truncate, meta["offset"])
+                        raise UploadTooLargeError(meta["file_name"], meta["total_size"])
+
+                    await asyncio.to_thread(buffer.write, chunk)
+                    lock_path.touch()
+
+        return {**meta, "offset": received}
+
+    async def complete(self, project_id: str, upload_id: str, dest_dir: Path) -> StoredUpload:
+        """
+        업로드 완료 처리: 해시 계산 후 해시 경로로 이동
+
+        세션은 지우지 않고 저장 결과를 메타데이터에 남긴다.
+        문서 등록(DB 커밋)이 실패해도 같은 요청을 다시 보내면 같은 결과를 돌려받고,
+        등록이 끝나면 호출자가 discard로 세션을 지운다.
+
+        Raises:
+            UploadOffsetMismatchError: 아직 전체 크기를 받지 못함
+            UploadLockedError: 같은 세션에 다른 요청이 쓰는 중
+        """
+        self.get(project_id, upload_id)
+
+        with self._locked(upload_id):
+            meta = self.get(project_id, upload_id)
+
+            stored = meta.get("stored")
+            if stored:
+                # 이전 complete가 파일 이동까지 마친 세션 (문서 등록만 다시)
+                return StoredUpload(Path(stored["path"]), stored["size"], stored["sha256"], stored["deduplicated"])
+
+            if meta["offset"] != meta["total_size"]:
+                raise UploadOffsetMismatchError(meta["total_size"], meta["offset"])
+
+            part_path = self._part_path(upload_id)
+            sha256 = await asyncio.to_thread(_hash_file, part_path)
+
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            stored = await asyncio.to_thread(_promote, part_path, dest_dir, sha256, meta["file_name"])
+
+            meta.pop("offset")
+            meta["stored"] = {**stored._asdict(), "path": str(stored.path)}
+            self._meta_path(upload_id).write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+
+        return stored
+
+    def discard(self, upload_id: str) -> None:
+        """세션 파일 삭제 (문서 등록 커밋 후 호출)"""
+        self._meta_path(upload_id).unlink(missing_ok=True)
+        self._part_path(upload_id).unlink(missing_ok=True)
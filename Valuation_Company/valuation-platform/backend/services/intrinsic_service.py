@@ -4,14 +4,9 @@
 기존 본질가치평가 엔진을 FastAPI 서비스로 래핑
 """
 
-import sys
 from typing import Dict, Any, Optional
-from pathlib import Path
 
-# 기존 평가 엔진 경로 추가
-ENGINE_PATH = Path(__file__).parent.parent.parent.parent / "기업가치평가플랫폼" / "valuation_engine"
-if str(ENGINE_PATH) not in sys.path:
-    sys.path.insert(0, str(ENGINE_PATH))
+from app.services.valuation_engine.inputs import IntrinsicRequest, InputValidationError, validate_model
 
 
 class IntrinsicService:
@@ -20,9 +15,8 @@ class IntrinsicService:
     def __init__(self):
         """서비스 초기화"""
         try:
-            # 기존 본질가치평가 엔진 import (있다면)
-            # from capital_market_law.cml_engine import CMLEngine
-            # self.engine = CMLEngine()
+            # 통합 엔진: app.services.valuation_engine.create_engine('intrinsic')
+            # (엔진은 키워드 인자 입력 - 단일 input_data 어댑터 연결 전까지 더미 결과)
             self.engine = None
             self.engine_available = False
         except ImportError as e:
@@ -40,24 +34,10 @@ class IntrinsicService:
         Returns:
             (유효 여부, 에러 메시지)
         """
-        required_fields = [
-            'company_id',
-            'company_name',
-            'valuation_date',
-            'transaction_type',  # 거래 유형 (M&A, 유상증자 등)
-            'shares_outstanding',
-            'net_asset_value',
-            'earning_power_value'
-        ]
-
-        for field in required_fields:
-            if field not in input_data:
-                return False, f"필수 필드 누락: {field}"
-
-        # 거래 유형 검증
-        valid_transaction_types = ['merger', 'acquisition', 'capital_increase', 'stock_exchange']
-        if input_data['transaction_type'] not in valid_transaction_types:
-            return False, f"유효하지 않은 거래 유형: {input_data['transaction_type']}"
+        try:
+            validate_model(IntrinsicRequest, input_data)
+        except InputValidationError as e:
+            return False, e.first_message()
 
         return True, None
 
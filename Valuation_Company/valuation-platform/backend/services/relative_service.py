@@ -4,14 +4,9 @@
 기존 상대가치평가 엔진을 FastAPI 서비스로 래핑
 """
 
-import sys
 from typing import Dict, Any, Optional
-from pathlib import Path
 
-# 기존 평가 엔진 경로 추가
-ENGINE_PATH = Path(__file__).parent.parent.parent.parent / "기업가치평가플랫폼" / "valuation_engine"
-if str(ENGINE_PATH) not in sys.path:
-    sys.path.insert(0, str(ENGINE_PATH))
+from app.services.valuation_engine.inputs import RelativeRequest, InputValidationError, validate_model
 
 
 class RelativeService:
@@ -20,9 +15,8 @@ class RelativeService:
     def __init__(self):
         """서비스 초기화"""
         try:
-            # 기존 상대가치평가 엔진 import (있다면)
-            # from relative.relative_engine import RelativeEngine
-            # self.engine = RelativeEngine()
+            # 통합 엔진: app.services.valuation_engine.create_engine('relative')
+            # (엔진은 키워드 인자 입력 - 단일 input_data 어댑터 연결 전까지 더미 결과)
             self.engine = None
             self.engine_available = False
         except ImportError as e:
@@ -40,22 +34,10 @@ class RelativeService:
         Returns:
             (유효 여부, 에러 메시지)
         """
-        required_fields = [
-            'company_id',
-            'company_name',
-            'valuation_date',
-            'financial_data',
-            'comparable_companies',
-            'multiples'
-        ]
-
-        for field in required_fields:
-            if field not in input_data:
-                return False, f"필수 필드 누락: {field}"
-
-        # 비교 대상 기업 검증
-        if not isinstance(input_data['comparable_companies'], list) or len(input_data['comparable_companies']) < 3:
-            return False, "비교 대상 기업은 최소 3개 이상 필요합니다."
+        try:
+            validate_model(RelativeRequest, input_data)
+        except InputValidationError as e:
+            return False, e.first_message()
 
         return True, None
 
@@ -0,0 +1,209 @@
+"""
+Report Render Cache
+
+보고서 PDF 콘텐츠 주소 기반 캐시
+- 렌더링 키: (프로젝트 ID, 프로젝트 데이터, 평가 결과, 모드, 옵션, 템플릿 버전)의 SHA-256
+- 같은 키의 PDF가 Storage에 있으면 재렌더링/재업로드 없이 URL 반환
+- 참조 카운트로 더 이상 쓰이지 않는 초안 PDF 정리
+"""
+
+from typing import Dict, Any, Optional
+from datetime import datetime
+import hashlib
+import json
+
+from supabase import Client
+
+
+# 캐시 메타데이터 테이블 / Storage 버킷
+RENDERS_TABLE = 'report_renders'
+REPORTS_BUCKET = 'reports'
+
+
+def compute_render_key(
+    project_id: str,
+    project_data: Dict[str, Any],
+    valuation_result: Dict[str, Any],
+    mode: str,
+    options: Dict[str, Any],
+    template_version: str
+) -> str:
+    """
+    렌더링 입력의 콘텐츠 해시 계산
+
+    dict 키 순서와 무관하게 같은 입력이면 같은 키가 나오도록
+    정렬된 JSON으로 직렬화한 뒤 해시한다.
+    렌더링 필드가 같아도 프로젝트가 다르면 키가 달라 캐시 행 / Storage 객체를 공유하지 않는다.
+
+    Returns:
+        str: 64자리 SHA-256 hex 문자열
+    """
+    payload = {
+        'project_id': project_id,
+        'project': project_data,
+        'valuation_result': valuation_result,
+        'mode': mode,
+        'options': options,
+        'template_version': template_version,
+    }
+    canonical = json.dumps(
+        payload,
+        sort_keys=True,
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ReportRenderCache:
+    """
+    보고서 PDF 렌더링 캐시
+
+    `report_renders` 테이블에 해시별 Storage 경로와 참조 카운트를 저장한다.
+    참조 카운트 증감은 `adjust_report_render_ref` RPC로 원자적으로 처리한다.
+
+    참조 보유자:
+        - 프로젝트의 현재 초안 (새 초안이 생성되면 이전 초안 참조 해제)
+        - 발행된 최종 보고서 (해제하지 않음)
+    """
+
+    def __init__(self, supabase: Client, bucket: str = REPORTS_BUCKET):
+        self.supabase = supabase
+        self.bucket = bucket
+
+    @staticmethod
+    def storage_path(project_id: str, render_key: str) -> str:
+        """해시 기반 Storage 경로"""
+        return f"{project_id}/renders/{render_key}.pdf"
+
+    def lookup(self, render_key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 렌더링 조회
+
+        Returns:
+            Dict: report_renders 행 또는 None
+        """
+        try:
+            response = self.supabase.table(RENDERS_TABLE).select('*').eq(
+                'content_hash', render_key
+            ).limit(1).execute()
+
+            if response.data:
+                return response.data[0]
+
+            return None
+        except Exception as e:
+            print(f"⚠️ 렌더링 캐시 조회 실패: {e}")
+            return None
+
+    def store(
+        self,
+        project_id: str,
+        render_key: str,
+        mode: str,
+        pdf_bytes: bytes
+    ) -> str:
+        """
+        PDF를 해시 경로에 업로드하고 캐시 행 등록 (참조 카운트 0)
+
+        이미 행이 있으면 (동시 렌더링, 조회 실패 후 재렌더링 등) 그대로 두어
+        다른 보유자의 참조 카운트 / 현재 초안 표시를 덮어쓰지 않는다.
+
+        Returns:
+            str: Public URL
+        """
+        file_path = self.storage_path(project_id, render_key)
+
+        self.supabase.storage.from_(self.bucket).upload(
+            file_path,
+            pdf_bytes,
+            file_options={"content-type": "application/pdf", "upsert": "true"}
+        )
+        pdf_url = self.supabase.storage.from_(self.bucket).get_public_url(file_path)
+
+        self.supabase.table(RENDERS_TABLE).upsert({
+            'content_hash': render_key,
+            'project_id': project_id,
+            'mode': mode,
+            'file_path': file_path,
+            'pdf_url': pdf_url,
+            'size_bytes': len(pdf_bytes),
+            'ref_count': 0,
+            'is_current_draft': False,
+            'created_at': datetime.now().isoformat()
+        }, on_conflict='content_hash', ignore_duplicates=True).execute()
+
+        return pdf_url
+
+    def acquire(self, render_key: str) -> int:
+        """참조 카운트 +1 (남은 참조 수 반환)"""
+        return self._adjust_ref(render_key, 1)
+
+    def release(self, render_key: str) -> int:
+        """
+        참조 카운트 -1
+
+        참조가 0이 되면 Storage 객체와 캐시 행을 삭제한다.
+
+        Returns:
+            int: 남은 참조 수
+        """
+        remaining = self._adjust_ref(render_key, -1)
+
+        if remaining <= 0:
+            self._evict(render_key)
+
+        return remaining
+
+    def set_current_draft(self, project_id: str, render_key: str):
+        """
+        프로젝트의 현재 초안 지정
+
+        이전 현재 초안은 참조를 해제하고, 새 초안이 처음 현재 초안이 되는
+        경우에만 참조를 획득한다. 같은 초안을 다시 생성하면 변화 없음.
+        """
+        response = self.supabase.table(RENDERS_TABLE).select('content_hash').eq(
+            'project_id', project_id
+        ).eq('mode', 'draft').eq('is_current_draft', True).execute()
+
+        previous_keys = [row['content_hash'] for row in (response.data or [])]
+
+        if render_key in previous_keys:
+            return
+
+        self.supabase.table(RENDERS_TABLE).update(
+            {'is_current_draft': True}
+        ).eq('content_hash', render_key).execute()
+        self.acquire(render_key)
+
+        for previous_key in previous_keys:
+            self.supabase.table(RENDERS_TABLE).update(
+                {'is_current_draft': False}
+            ).eq('content_hash', previous_key).execute()
+            self.release(previous_key)
+
+    def _adjust_ref(self, render_key: str, delta: int) -> int:
+        response = self.supabase.rpc(
+            'adjust_report_render_ref',
+            {'p_content_hash': render_key, 'p_delta': delta}
+        ).execute()
+
+        return int(response.data or 0)
+
+    def _evict(self, render_key: str):
+        """
+        참조가 없는 렌더링 삭제
+
+        행을 먼저 ref_count = 0 조건으로 지우고, 실제로 지운 경우에만 Storage 객체를 삭제한다.
+        (그 사이 다른 요청이 참조를 획득했으면 행과 파일 모두 남음)
+        """
+        response = self.supabase.table(RENDERS_TABLE).delete().eq(
+            'content_hash', render_key
+        ).eq('ref_count', 0).execute()
+
+        for entry in response.data or []:
+            try:
+                self.supabase.storage.from_(self.bucket).remove([entry['file_path']])
+            except Exception as e:
+                print(f"⚠️ 캐시 PDF 삭제 실패: {e}")
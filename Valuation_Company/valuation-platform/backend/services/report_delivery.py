@@ -0,0 +1,283 @@
+"""
+Report Delivery Service
+
+보고서 PDF 전달 서비스
+- HTTP Range (PDF 뷰어 부분 요청) / ETag + If-None-Match (재다운로드 304)
+- 서버가 ASGI zero-copy 확장을 지원하면 sendfile로 전송
+- 대용량 보고서는 Supabase Storage 단기 서명 URL로 리다이렉트
+"""
+
+from typing import Mapping, Optional, Tuple
+from functools import lru_cache
+from email.utils import formatdate
+from urllib.parse import quote
+import hashlib
+import os
+import stat
+
+import anyio
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+
+# 서명 URL 유효 시간 (초)
+REPORT_SIGNED_URL_TTL_SECONDS = int(os.getenv("REPORT_SIGNED_URL_TTL_SECONDS", "300"))
+
+# 이 크기 이상이면 Storage 서명 URL로 전달 (bytes)
+LARGE_REPORT_THRESHOLD_MB = int(os.getenv("LARGE_REPORT_THRESHOLD_MB", "10"))
+LARGE_REPORT_THRESHOLD_BYTES = LARGE_REPORT_THRESHOLD_MB * 1024 * 1024
+
+REPORTS_BUCKET = 'reports'
+
+# reports.delivery_format → Content-Type
+REPORT_MEDIA_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+
+class RangeNotSatisfiableError(ValueError):
+    """요청한 Range가 파일 범위를 벗어남"""
+
+
+def make_etag(stat_result: os.stat_result) -> str:
+    """파일 mtime/크기 기반 strong ETag"""
+    base = f"{stat_result.st_mtime_ns}-{stat_result.st_size}"
+    return '"' + hashlib.md5(base.encode(), usedforsecurity=False).hexdigest() + '"'
+
+
+def etag_matches(header_value: Optional[str], etag: str) -> bool:
+    """If-None-Match / If-Range 헤더와 ETag 비교 (약한 비교)"""
+    if not header_value:
+        return False
+
+    if header_value.strip() == "*":
+        return True
+
+    candidates = [tag.strip() for tag in header_value.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def parse_range_header(header_value: Optional[str], file_size: int) -> Optional[Tuple[int, int]]:
+    """
+    단일 bytes Range 헤더 파싱
+
+    Args:
+        header_value: Range 헤더 값 (예: "bytes=0-1023", "bytes=1024-", "bytes=-500")
+        file_size: 파일 크기
+
+    Returns:
+        (start, end) 포함 범위, 또는 전체 응답해야 하면 None
+        (헤더 없음, 형식 오류, 다중 범위는 전체 응답)
+
+    Raises:
+        RangeNotSatisfiableError: 범위가 파일을 벗어남
+    """
+    if not header_value or not header_value.startswith("bytes="):
+        return None
+
+    spec = header_value[len("bytes="):].strip()
+    if "," in spec or "-" not in spec:
+        return None
+
+    start_text, end_text = (part.strip() for part in spec.split("-", 1))
+
+    try:
+        start = int(start_text) if start_text else None
+        end = int(end_text) if end_text else None
+    except ValueError:
+        return None
+
+    if start is None:
+        # 마지막 N 바이트
+        if not end:
+            raise RangeNotSatisfiableError(header_value)
+        start = max(file_size - end, 0)
+        end = file_size - 1
+    else:
+        end = file_size - 1 if end is None else min(end, file_size - 1)
+
+    if start >= file_size or start > end:
+        raise RangeNotSatisfiableError(header_value)
+
+    return start, end
+
+
+class RangedFileResponse(Response):
+    """
+    Range / 조건부 요청을 지원하는 파일 응답
+
+    - If-None-Match가 ETag와 같으면 304
+    - Range가 있으면 206 + Content-Range (If-Range 불일치 시 전체)
+    - 범위 밖 Range는 416
+    - 서버가 `http.response.zerocopy` 확장을 제공하면 파일 디스크립터를 넘겨
+      커널 sendfile로 전송, 아니면 청크 단위 읽기
+    """
+
+    chunk_size = 256 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        request_headers: Mapping[str, str],
+        stat_result: os.stat_result,
+        filename: Optional[str] = None,
+        media_type: str = "application/pdf",
+        method: str = "GET"
+    ):
+        self.path = path
+        self.media_type = media_type
+        self.background = None
+        self.send_header_only = method.upper() == "HEAD"
+
+        file_size = stat_result.st_size
+        etag = make_etag(stat_result)
+
+        headers = {
+            "accept-ranges": "bytes",
+            "etag": etag,
+            "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+            "cache-control": "private, max-age=0, must-revalidate",
+        }
+        if filename is not None:
+            headers["content-disposition"] = f"attachment; filename*=utf-8''{quote(filename)}"
+
+        self.start = 0
+        self.end = file_size - 1
+
+        if etag_matches(request_headers.get("if-none-match"), etag):
+            self.status_code = 304
+            self.send_header_only = True
+            self.init_headers(headers)
+            return
+
+        range_header = request_headers.get("range")
+        if_range = request_headers.get("if-range")
+        if if_range is not None and not etag_matches(if_range, etag):
+            range_header = None
+
+        try:
+            byte_range = parse_range_header(range_header, file_size)
+        except RangeNotSatisfiableError:
+            self.status_code = 416
+            self.send_header_only = True
+            headers["content-range"] = f"bytes */{file_size}"
+            headers["content-length"] = "0"
+            self.init_headers(headers)
+            return
+
+        if byte_range is None:
+            self.status_code = 200
+        else:
+            self.status_code = 206
+            self.start, self.end = byte_range
+            headers["content-range"] = f"bytes {self.start}-{self.end}/{file_size}"
+
+        headers["content-length"] = str(self.end - self.start + 1)
+        self.init_headers(headers)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+
+        count = self.end - self.start + 1
+
+        if self.send_header_only or count <= 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        if "http.response.zerocopy" in scope.get("extensions", {}):
+            # 서버가 sendfile로 직접 전송 (사용자 공간 복사 없음)
+            with open(self.path, "rb") as file:
+                await send({
+                    "type": "http.response.zerocopy",
+                    "file": file.fileno(),
+                    "offset": self.start,
+                    "count": count,
+                    "more_body": False,
+                })
+            return
+
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.start)
+            remaining = count
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+
+async def stat_regular_file(path: str) -> Optional[os.stat_result]:
+    """일반 파일이면 stat 결과, 없거나 파일이 아니면 None"""
+    try:
+        stat_result = await anyio.to_thread.run_sync(os.stat, path)
+    except (FileNotFoundError, TypeError):
+        return None
+
+    if not stat.S_ISREG(stat_result.st_mode):
+        return None
+
+    return stat_result
+
+
+def report_storage_path(report_path: str) -> str:
+    """
+    reports.report_path → reports 버킷 내 경로
+
+    로컬 경로('./reports/X.pdf')와 버킷 경로('X.pdf' / 'reports/X.pdf')를 같은 키로 맞춘다.
+    """
+    path = report_path.replace("\\", "/")
+    while path.startswith("./"):
+        path = path[2:]
+    path = path.lstrip("/")
+    if path.startswith(f"{REPORTS_BUCKET}/"):
+        path = path[len(REPORTS_BUCKET) + 1:]
+    return path
+
+
+@lru_cache(maxsize=1)
+def _get_storage_client():
+    """Supabase 클라이언트 (프로세스당 1회 생성)"""
+    from supabase import create_client
+
+    supabase_url = os.getenv("SUPABASE_URL")
+    supabase_key = os.getenv("SUPABASE_KEY")
+
+    if not supabase_url or not supabase_key:
+        raise ValueError("Supabase URL과 KEY가 설정되지 않았습니다.")
+
+    return create_client(supabase_url, supabase_key)
+
+
+async def create_signed_report_url(
+    storage_path: str,
+    expires_in: int = REPORT_SIGNED_URL_TTL_SECONDS
+) -> str:
+    """
+    Storage 보고서 단기 서명 URL 생성
+
+    Args:
+        storage_path: reports 버킷 내 경로
+        expires_in: 유효 시간 (초)
+
+    Returns:
+        str: 서명 URL
+    """
+    def _sign() -> str:
+        bucket = _get_storage_client().storage.from_(REPORTS_BUCKET)
+        signed = bucket.create_signed_url(storage_path, expires_in)
+        return signed.get("signedURL") or signed.get("signedUrl")
+
+    return await anyio.to_thread.run_sync(_sign)
@@ -6,158 +6,36 @@ Report Generator Service
 
 from typing import Dict, Any, Optional
 from datetime import datetime
+from functools import lru_cache
 import os
+from jinja2 import Environment, Template
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
+from .report_cache import ReportRenderCache, compute_render_key
+
 # 환경 변수 로드
 load_dotenv()
 
 
-class ReportGenerator:
-    """
-    평가 보고서 PDF 생성기
-
-    Purpose: 평가 결과를 기반으로 전문적인 PDF 보고서 생성
-
-    Report Structure (9 sections):
-        1. 요약 (Executive Summary)
-        2. 평가 개요 (Evaluation Overview)
-        3. 회사 개요 및 산업 분석 (Company & Industry Analysis)
-        4. 재무 분석 (Financial Analysis)
-        5. 평가 방법론 및 가정 (Methodology & Assumptions)
-        6. 평가 결과 (Valuation Results)
-        7. 민감도 분석 (Sensitivity Analysis)
-        8. 결론 (Conclusion)
-        9. 부록 (Appendix)
-    """
-
-    def __init__(self, project_id: str, method: str):
-        """
-        초기화
-
-        Args:
-            project_id: 프로젝트 ID
-            method: 평가법 ('dcf', 'relative', 'capital_market_law', 'asset', 'inheritance_tax_law', 'comprehensive')
-        """
-        self.project_id = project_id
-        self.method = method
-
-        # Supabase 클라이언트 초기화
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_KEY")
-
-        if not supabase_url or not supabase_key:
-            raise ValueError("Supabase URL과 KEY가 설정되지 않았습니다.")
-
-        self.supabase: Client = create_client(supabase_url, supabase_key)
-
-    async def generate_report(
-        self,
-        valuation_result: Dict[str, Any],
-        mode: str = 'draft',
-        options: Optional[Dict[str, Any]] = None
-    ) -> str:
-        """
-        PDF 보고서 생성
-
-        Args:
-            valuation_result: 평가 엔진 출력 결과
-                {
-                    'method_results': List[Dict],   # 개별 평가법 결과
-                    'final_value': float,           # 최종 기업가치
-                    'value_range': Dict,            # 평가 범위
-                    'weighted_average': float,      # 가중평균 가치
-                    'recommendation': str           # 최종 의견
-                }
-            mode: 'draft' (초안) 또는 'final' (최종본)
-            options: 추가 옵션
-                {
-                    'include_appendix': bool,      # 부록 포함 여부 (default: True)
-                    'watermark': bool,             # 워터마크 포함 (default: False)
-                    'language': str                # 언어 ('ko', 'en')
-                }
-
-        Returns:
-            str: Supabase Storage에 업로드된 PDF URL
-        """
-        # 기본 옵션 설정
-        if options is None:
-            options = {}
-
-        include_appendix = options.get('include_appendix', True)
-        watermark = options.get('watermark', False)
-        language = options.get('language', 'ko')
-
-        # 1. 프로젝트 데이터 로드
-        project_data = await self._load_project_data()
-
-        if not project_data:
-            raise ValueError(f"프로젝트를 찾을 수 없습니다: {self.project_id}")
-
-        # 2. 템플릿 선택
-        template = self._get_template(language)
-
-        # 3. 보고서 데이터 준비
-        report_data = self._prepare_report_data(
-            project_data,
-            valuation_result,
-            mode,
-            include_appendix,
-            watermark
-        )
-
-        # 4. HTML 렌더링
-        html_content = self._render_html(template, report_data)
-
-        # 5. PDF 변환
-        pdf_bytes = await self._convert_to_pdf(html_content, watermark)
-
-        # 6. Supabase Storage에 업로드
-        filename = self._generate_filename(mode)
-        pdf_url = await self._upload_to_storage(pdf_bytes, filename)
-
-        # 7. 보고서 메타데이터 DB 저장
-        await self._save_report_metadata(
-            pdf_url,
-            filename,
-            mode,
-            options
-        )
-
-        return pdf_url
-
-    async def _load_project_data(self) -> Optional[Dict[str, Any]]:
-        """
-        프로젝트 정보 로드
-
-        Returns:
-            Dict: 프로젝트 데이터 또는 None
-        """
-        try:
-            response = self.supabase.table('projects').select('*').eq('project_id', self.project_id).execute()
-
-            if response.data and len(response.data) > 0:
-                return response.data[0]
-
-            return None
-        except Exception as e:
-            print(f"❌ 프로젝트 로드 실패: {e}")
-            return None
-
-    def _get_template(self, language: str = 'ko') -> str:
-        """
-        평가법별 HTML 템플릿 반환
-
-        Args:
-            language: 언어 ('ko' 또는 'en')
-
-        Returns:
-            str: HTML 템플릿
-        """
-        # 기본 템플릿 구조 (9개 섹션)
-        if language == 'ko':
-            template = """
+# 템플릿 버전 (템플릿/프래그먼트가 바뀌면 올려서 렌더링 캐시 무효화)
+TEMPLATE_VERSION = "1"
+
+# 템플릿에 렌더링되는 프로젝트 필드 (이 필드만 조회하고 렌더링 키에 넣는다)
+RENDERED_PROJECT_FIELDS = (
+    'company_name_kr',
+    'valuation_date',
+    'valuation_purpose',
+    'valuation_methods',
+    'ceo_name',
+    'founded_date',
+    'industry',
+    'is_listed',
+)
+
+# 보고서 본문 템플릿 (9개 섹션)
+_REPORT_TEMPLATE_SOURCES: Dict[str, str] = {
+    'ko': """
 <!DOCTYPE html>
 <html lang="ko">
 <head>
@@ -299,12 +177,260 @@ class ReportGenerator:
     </div>
 </body>
 </html>
-            """
+""",
+    # 영문 템플릿 (TODO: 추후 구현)
+    'en': "<!-- English template not yet implemented -->",
+}
+
+# 섹션 콘텐츠는 이미 HTML로 생성되므로 autoescape는 끈다
+_jinja_env = Environment(autoescape=False)
+
+# 애플리케이션 시작 시 1회 컴파일
+_COMPILED_TEMPLATES: Dict[str, Template] = {
+    language: _jinja_env.from_string(source)
+    for language, source in _REPORT_TEMPLATE_SOURCES.items()
+}
+
+# 평가법 설명 (5. 평가 방법론)
+_METHOD_DESCRIPTIONS: Dict[str, Dict[str, str]] = {
+    'ko': {
+        'dcf': 'DCF(Discounted Cash Flow) 평가법: 미래 현금흐름의 현재가치를 계산',
+        'relative': '상대가치평가법: 유사 기업의 배수(Multiple)를 적용',
+        'capital_market_law': '본질가치평가법: 자본시장법상 기업인수목적회사(SPAC) 평가',
+        'asset': '자산가치평가법: 순자산가치(NAV) 기준 평가',
+        'inheritance_tax_law': '상증세법평가법: 상속세 및 증여세법상 평가'
+    },
+}
+
+_METHODOLOGY_FRAGMENT = _jinja_env.from_string("<p>{{ description }}</p>")
+
+_APPENDIX_FRAGMENT = _jinja_env.from_string(
+    """
+        <h3>9.1 재무제표</h3>
+        <p>(업로드된 재무제표 원본 데이터 첨부 예정)</p>
+
+        <h3>9.2 평가법 상세 설명</h3>
+        <p>(5가지 평가법의 이론적 배경 및 수식 설명 예정)</p>
+
+        <h3>9.3 참고 자료</h3>
+        <ul>
+            <li>자본시장법</li>
+            <li>상속세 및 증여세법</li>
+            <li>한국공인회계사회 평가 실무 지침</li>
+        </ul>
+        """
+)
+
+
+@lru_cache(maxsize=None)
+def _render_methodology_fragment(method: str, language: str) -> str:
+    """평가법 설명 프래그먼트 (평가법 + 언어 기준 캐시)"""
+    descriptions = _METHOD_DESCRIPTIONS.get(language, _METHOD_DESCRIPTIONS['ko'])
+    return _METHODOLOGY_FRAGMENT.render(description=descriptions.get(method, ''))
+
+
+@lru_cache(maxsize=None)
+def _render_appendix_fragment(method: str, language: str) -> str:
+    """부록 프래그먼트 (평가법 + 언어 기준 캐시)"""
+    return _APPENDIX_FRAGMENT.render(method=method, language=language)
+
+
+class ReportGenerator:
+    """
+    평가 보고서 PDF 생성기
+
+    Purpose: 평가 결과를 기반으로 전문적인 PDF 보고서 생성
+
+    Report Structure (9 sections):
+        1. 요약 (Executive Summary)
+        2. 평가 개요 (Evaluation Overview)
+        3. 회사 개요 및 산업 분석 (Company & Industry Analysis)
+        4. 재무 분석 (Financial Analysis)
+        5. 평가 방법론 및 가정 (Methodology & Assumptions)
+        6. 평가 결과 (Valuation Results)
+        7. 민감도 분석 (Sensitivity Analysis)
+        8. 결론 (Conclusion)
+        9. 부록 (Appendix)
+    """
+
+    def __init__(self, project_id: str, method: str, supabase: Optional[Client] = None):
+        """
+        초기화
+
+        Args:
+            project_id: 프로젝트 ID
+            method: 평가법 ('dcf', 'relative', 'capital_market_law', 'asset', 'inheritance_tax_law', 'comprehensive')
+            supabase: 이미 생성된 Supabase 클라이언트 (None이면 환경 변수로 생성)
+        """
+        self.project_id = project_id
+        self.method = method
+
+        if supabase is None:
+            # Supabase 클라이언트 초기화
+            supabase_url = os.getenv("SUPABASE_URL")
+            supabase_key = os.getenv("SUPABASE_KEY")
+
+            if not supabase_url or not supabase_key:
+                raise ValueError("Supabase URL과 KEY가 설정되지 않았습니다.")
+
+            supabase = create_client(supabase_url, supabase_key)
+
+        self.supabase: Client = supabase
+
+        # 콘텐츠 해시 기반 PDF 캐시
+        self.render_cache = ReportRenderCache(self.supabase)
+
+    async def generate_report(
+        self,
+        valuation_result: Dict[str, Any],
+        mode: str = 'draft',
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        PDF 보고서 생성
+
+        Args:
+            valuation_result: 평가 엔진 출력 결과
+                {
+                    'method_results': List[Dict],   # 개별 평가법 결과
+                    'final_value': float,           # 최종 기업가치
+                    'value_range': Dict,            # 평가 범위
+                    'weighted_average': float,      # 가중평균 가치
+                    'recommendation': str           # 최종 의견
+                }
+            mode: 'draft' (초안) 또는 'final' (최종본)
+            options: 추가 옵션
+                {
+                    'include_appendix': bool,      # 부록 포함 여부 (default: True)
+                    'watermark': bool,             # 워터마크 포함 (default: False)
+                    'language': str                # 언어 ('ko', 'en')
+                }
+
+        Returns:
+            str: Supabase Storage에 업로드된 PDF URL
+
+        Note:
+            (렌더링되는 프로젝트 필드, 평가 결과, 모드, 옵션, 템플릿 버전)이 같은 PDF가
+            이미 있으면 재렌더링/재업로드 없이 기존 URL을 사용한다.
+            참조 등록(초안 교체 / 최종본 보유)과 메타데이터 저장은 캐시 적중 시에도 한다.
+        """
+        # 기본 옵션 설정 (렌더링에 쓰는 옵션만 남김)
+        options = options or {}
+        include_appendix = options.get('include_appendix', True)
+        watermark = options.get('watermark', False)
+        language = options.get('language', 'ko')
+        options = {
+            'include_appendix': include_appendix,
+            'watermark': watermark,
+            'language': language
+        }
+
+        # 1. 프로젝트 데이터 로드
+        project_data = await self._load_project_data()
+
+        if not project_data:
+            raise ValueError(f"프로젝트를 찾을 수 없습니다: {self.project_id}")
+
+        # 2. 렌더링 캐시 확인
+        render_key = compute_render_key(
+            self.project_id,
+            project_data,
+            valuation_result,
+            mode,
+            options,
+            TEMPLATE_VERSION
+        )
+        cached = self.render_cache.lookup(render_key)
+
+        if cached:
+            pdf_url = cached['pdf_url']
+            storage_path = cached['file_path']
+            uploaded = True
         else:
-            # 영문 템플릿 (TODO: 추후 구현)
-            template = "<!-- English template not yet implemented -->"
+            storage_path = ReportRenderCache.storage_path(self.project_id, render_key)
+
+            # 3. 템플릿 선택
+            template = self._get_template(language)
+
+            # 4. 보고서 데이터 준비
+            report_data = self._prepare_report_data(
+                project_data,
+                valuation_result,
+                mode,
+                include_appendix,
+                watermark,
+                language
+            )
+
+            # 5. HTML 렌더링
+            html_content = self._render_html(template, report_data)
+
+            # 6. PDF 변환
+            pdf_bytes = await self._convert_to_pdf(html_content, watermark)
+
+            # 7. Supabase Storage에 업로드 (해시 경로)
+            pdf_url = await self._upload_to_storage(pdf_bytes, render_key, mode)
+            uploaded = pdf_url is not None
+            if not uploaded:
+                # Mock URL 반환 (개발용)
+                pdf_url = f"https://mock-storage.supabase.co/{storage_path}"
+
+        # 8. 참조 등록: 초안은 현재 초안 교체, 최종본은 영구 보유
+        #    (업로드 실패 시에는 없는 PDF를 현재 초안으로 바꾸지 않음)
+        if uploaded:
+            try:
+                if mode == 'draft':
+                    self.render_cache.set_current_draft(self.project_id, render_key)
+                else:
+                    self.render_cache.acquire(render_key)
+            except Exception as e:
+                print(f"⚠️ 렌더링 참조 등록 실패: {e}")
+
+        # 9. 보고서 메타데이터 DB 저장
+        await self._save_report_metadata(
+            pdf_url,
+            storage_path,
+            render_key,
+            mode,
+            options
+        )
+
+        return pdf_url
+
+    async def _load_project_data(self) -> Optional[Dict[str, Any]]:
+        """
+        프로젝트 정보 로드 (템플릿에 렌더링되는 필드만)
+
+        Returns:
+            Dict: 프로젝트 데이터 또는 None
+        """
+        try:
+            response = self.supabase.table('projects').select(
+                ','.join(RENDERED_PROJECT_FIELDS)
+            ).eq('project_id', self.project_id).execute()
+
+            if response.data and len(response.data) > 0:
+                return response.data[0]
+
+            return None
+        except Exception as e:
+            print(f"❌ 프로젝트 로드 실패: {e}")
+            return None
+
+    def _get_template(self, language: str = 'ko') -> Template:
+        """
+        평가법별 HTML 템플릿 반환
 
-        return template
+        템플릿은 모듈 로드 시 한 번만 컴파일되며, 이 메서드는 캐시된
+        Template 객체를 돌려준다.
+
+        Args:
+            language: 언어 ('ko' 또는 'en')
+
+        Returns:
+            Template: 컴파일된 Jinja2 템플릿
+        """
+        return _COMPILED_TEMPLATES.get(language, _COMPILED_TEMPLATES['en'])
 
     def _prepare_report_data(
         self,
@@ -312,7 +438,8 @@ class ReportGenerator:
         valuation_result: Dict[str, Any],
         mode: str,
         include_appendix: bool,
-        watermark: bool
+        watermark: bool,
+        language: str = 'ko'
     ) -> Dict[str, Any]:
         """
         보고서 렌더링에 필요한 데이터 준비
@@ -332,11 +459,11 @@ class ReportGenerator:
             'evaluation_overview': self._generate_evaluation_overview(project_data),
             'company_analysis': self._generate_company_analysis(project_data),
             'financial_analysis': self._generate_financial_analysis(project_data),
-            'methodology': self._generate_methodology(valuation_result),
+            'methodology': self._generate_methodology(valuation_result, language),
             'valuation_results': self._generate_valuation_results(valuation_result),
             'sensitivity_analysis': self._generate_sensitivity_analysis(valuation_result),
             'conclusion': self._generate_conclusion(valuation_result),
-            'appendix': self._generate_appendix(project_data) if include_appendix else '',
+            'appendix': self._generate_appendix(project_data, language) if include_appendix else '',
 
             # 옵션
             'include_appendix': include_appendix,
@@ -409,27 +536,20 @@ class ReportGenerator:
         <p>(수익성, 안정성, 성장성 지표는 재무 데이터 기반으로 자동 계산 예정)</p>
         """
 
-    def _generate_methodology(self, valuation_result: Dict) -> str:
+    def _generate_methodology(self, valuation_result: Dict, language: str = 'ko') -> str:
         """5. 평가 방법론 및 가정"""
         method_results = valuation_result.get('method_results', [])
 
-        method_descriptions = {
-            'dcf': 'DCF(Discounted Cash Flow) 평가법: 미래 현금흐름의 현재가치를 계산',
-            'relative': '상대가치평가법: 유사 기업의 배수(Multiple)를 적용',
-            'capital_market_law': '본질가치평가법: 자본시장법상 기업인수목적회사(SPAC) 평가',
-            'asset': '자산가치평가법: 순자산가치(NAV) 기준 평가',
-            'inheritance_tax_law': '상증세법평가법: 상속세 및 증여세법상 평가'
-        }
-
         methods_html = ""
         for i, method_result in enumerate(method_results, 1):
             method = method_result.get('method', '')
             method_name = method_result.get('method_name', '')
-            description = method_descriptions.get(method, '')
+            # 평가법 설명은 평가법/언어별로 캐시된 프래그먼트 사용
+            description_html = _render_methodology_fragment(method, language)
 
             methods_html += f"""
             <h3>5.{i} {method_name}</h3>
-            <p>{description}</p>
+            {description_html}
             <p><strong>적용 가중치:</strong> {method_result.get('weight', 0):.1%}</p>
             """
 
@@ -514,42 +634,22 @@ class ReportGenerator:
         </ul>
         """
 
-    def _generate_appendix(self, project_data: Dict) -> str:
+    def _generate_appendix(self, project_data: Dict, language: str = 'ko') -> str:
         """9. 부록"""
-        return """
-        <h3>9.1 재무제표</h3>
-        <p>(업로드된 재무제표 원본 데이터 첨부 예정)</p>
-
-        <h3>9.2 평가법 상세 설명</h3>
-        <p>(5가지 평가법의 이론적 배경 및 수식 설명 예정)</p>
-
-        <h3>9.3 참고 자료</h3>
-        <ul>
-            <li>자본시장법</li>
-            <li>상속세 및 증여세법</li>
-            <li>한국공인회계사회 평가 실무 지침</li>
-        </ul>
-        """
+        return _render_appendix_fragment(self.method, language)
 
-    def _render_html(self, template: str, data: Dict[str, Any]) -> str:
+    def _render_html(self, template: Template, data: Dict[str, Any]) -> str:
         """
         Jinja2를 사용하여 HTML 렌더링
 
         Args:
-            template: HTML 템플릿
+            template: 컴파일된 HTML 템플릿
             data: 템플릿 변수
 
         Returns:
             str: 렌더링된 HTML
         """
-        # 현재는 간단한 문자열 치환 사용
-        # 실제 구현 시 Jinja2 사용 권장
-        html = template
-        for key, value in data.items():
-            placeholder = "{{ " + key + " }}"
-            html = html.replace(placeholder, str(value))
-
-        return html
+        return template.render(**data)
 
     async def _convert_to_pdf(self, html: str, watermark: bool = False) -> bytes:
         """
@@ -604,45 +704,30 @@ class ReportGenerator:
             print(f"❌ PDF 변환 실패: {e}")
             raise
 
-    async def _upload_to_storage(self, pdf_bytes: bytes, filename: str) -> str:
+    async def _upload_to_storage(self, pdf_bytes: bytes, render_key: str, mode: str) -> Optional[str]:
         """
         Supabase Storage에 PDF 업로드
 
         Args:
             pdf_bytes: PDF 바이트
-            filename: 파일명
+            render_key: 렌더링 콘텐츠 해시 (Storage 경로로 사용)
+            mode: 'draft' 또는 'final'
 
         Returns:
-            str: Public URL
+            str: Public URL (업로드 실패 시 None)
         """
         try:
-            # Supabase Storage 버킷 이름
-            bucket_name = 'reports'
-
-            # 파일 경로
-            file_path = f"{self.project_id}/{filename}"
-
-            # 업로드
-            self.supabase.storage.from_(bucket_name).upload(
-                file_path,
-                pdf_bytes,
-                file_options={"content-type": "application/pdf"}
-            )
-
-            # Public URL 생성
-            public_url = self.supabase.storage.from_(bucket_name).get_public_url(file_path)
-
-            return public_url
+            return self.render_cache.store(self.project_id, render_key, mode, pdf_bytes)
 
         except Exception as e:
             print(f"❌ Storage 업로드 실패: {e}")
-            # Mock URL 반환 (개발용)
-            return f"https://mock-storage.supabase.co/reports/{self.project_id}/{filename}"
+            return None
 
     async def _save_report_metadata(
         self,
         pdf_url: str,
-        filename: str,
+        report_path: str,
+        render_key: str,
         mode: str,
         options: Dict[str, Any]
     ):
@@ -651,7 +736,8 @@ class ReportGenerator:
 
         Args:
             pdf_url: PDF URL
-            filename: 파일명
+            report_path: Storage 경로
+            render_key: 렌더링 콘텐츠 해시
             mode: 'draft' 또는 'final'
             options: 추가 옵션
         """
@@ -667,7 +753,8 @@ class ReportGenerator:
                 'include_appendix': options.get('include_appendix', True),
                 'watermark': options.get('watermark', False),
                 'report_url': pdf_url,
-                'report_path': f"{self.project_id}/{filename}",
+                'report_path': report_path,
+                'content_hash': render_key,
                 'issued_at': datetime.now().isoformat(),
                 'issued_by': None  # TODO: 현재 로그인 사용자 정보
             }
@@ -679,21 +766,6 @@ class ReportGenerator:
         except Exception as e:
             print(f"❌ 메타데이터 저장 실패: {e}")
 
-    def _generate_filename(self, mode: str) -> str:
-        """
-        파일명 생성
-
-        Args:
-            mode: 'draft' 또는 'final'
-
-        Returns:
-            str: 파일명
-        """
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        mode_suffix = 'DRAFT' if mode == 'draft' else 'FINAL'
-
-        return f"Valuation_Report_{self.project_id}_{mode_suffix}_{timestamp}.pdf"
-
 
 # 사용 예시
 if __name__ == "__main__":
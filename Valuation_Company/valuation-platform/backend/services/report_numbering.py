@@ -0,0 +1,143 @@
+"""
+Report Numbering
+
+보고서 번호(VR-{YYYY}-{순번 5자리}) 발급과 멱등 발행
+- 연도별 카운터 행(report_number_counters)을 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 문장으로 증가
+  → 보고서 수와 무관하게 O(1), 동시에 발행해도 같은 번호가 나오지 않음
+- 카운터 증가와 보고서 INSERT가 같은 트랜잭션이라 발행이 실패(롤백)하면 번호도 되돌아감 (번호 누락 없음)
+  같은 연도 발행끼리는 카운터 행 잠금으로 커밋까지 직렬화된다
+- 멱등 키: (project_id, idempotency_key) UNIQUE - 같은 키로 다시 요청하면 기존 보고서 반환,
+  동시에 들어온 같은 키 요청은 UNIQUE 위반 후 기존 보고서를 돌려줌
+- PostgreSQL / SQLite(3.35+) 공통 SQL
+"""
+
+from datetime import datetime
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, bindparam, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models.report import Report
+
+REPORT_NUMBER_PREFIX = "VR"
+
+metadata = MetaData()
+
+report_number_counters_table = Table(
+    "report_number_counters",
+    metadata,
+    Column("year", Integer, primary_key=True),
+    Column("last_value", Integer, nullable=False),
+    Column("updated_at", DateTime(timezone=True), nullable=False),
+)
+
+ALLOCATE_SQL = text("""
+    INSERT INTO report_number_counters (year, last_value, updated_at)
+    VALUES (:year, 1, :now)
+    ON CONFLICT (year) DO UPDATE
+        SET last_value = report_number_counters.last_value + 1,
+            updated_at = excluded.updated_at
+    RETURNING last_value
+""").bindparams(bindparam("now", type_=DateTime(timezone=True)))
+
+
+def create_tables(engine: Engine) -> None:
+    """카운터 테이블 생성 (운영 DB는 database/migrations/create_report_number_counters.sql)"""
+    metadata.create_all(engine, tables=[report_number_counters_table], checkfirst=True)
+
+
+def format_report_number(year: int, value: int) -> str:
+    """(2024, 123) → 'VR-2024-00123'"""
+    return f"{REPORT_NUMBER_PREFIX}-{year}-{value:05d}"
+
+
+def allocate_report_number(db: Session, year: Optional[int] = None) -> str:
+    """
+    연도별 다음 보고서 번호 발급
+
+    호출한 세션의 트랜잭션 안에서 카운터를 증가시킨다.
+    커밋 전까지 같은 연도의 다른 발행은 카운터 행에서 대기하고, 롤백하면 번호도 반납된다.
+    """
+    year = year or datetime.now().year
+    value = db.execute(ALLOCATE_SQL, {"year": year, "now": datetime.now()}).scalar_one()
+    return format_report_number(year, value)
+
+
+def build_issued_report(
+    project_id: str,
+    draft,
+    report_number: str,
+    report_format: str,
+    issued_by: str,
+    download_url: str
+) -> Report:
+    """
+    최신 초안으로 발행 보고서 레코드 생성 (reports 테이블 실제 컬럼만 사용)
+
+    보고서 유형 / 부록 / 페이지 수 / 입력 해시는 초안을 따르고,
+    전달 방식은 다운로드(report/download 엔드포인트)로 고정한다.
+    """
+    return Report(
+        report_id=f"RPT-{project_id}-{report_number}",
+        project_id=project_id,
+        report_number=report_number,
+        report_type=draft.report_type,
+        delivery_format=report_format,
+        delivery_method="download",
+        include_appendix=draft.include_appendix,
+        # TODO: 실제 보고서 생성 (PDF / DOCX)
+        report_path=f"./reports/{project_id}_{report_number}.{report_format}",
+        report_url=download_url,
+        page_count=draft.page_count,
+        content_hash=draft.content_hash,
+        issued_at=datetime.now(),
+        issued_by=issued_by
+    )
+
+
+def find_report_by_idempotency_key(db: Session, project_id: str, idempotency_key: str) -> Optional[Report]:
+    return db.query(Report).filter(
+        Report.project_id == project_id,
+        Report.idempotency_key == idempotency_key
+    ).first()
+
+
+def issue_report(
+    db: Session,
+    project_id: str,
+    build_report: Callable[[str], Report],
+    idempotency_key: Optional[str] = None
+) -> Tuple[Report, bool]:
+    """
+    보고서 번호 발급 + 보고서 레코드 저장 (한 트랜잭션)
+
+    Args:
+        build_report: 발급된 보고서 번호를 받아 저장할 Report를 만드는 함수
+        idempotency_key: 같은 키로 이미 발행했으면 새로 발행하지 않음
+
+    Returns:
+        (보고서, 기존 보고서 반환 여부)
+    """
+    if idempotency_key:
+        existing = find_report_by_idempotency_key(db, project_id, idempotency_key)
+        if existing is not None:
+            return existing, True
+
+    report = build_report(allocate_report_number(db))
+    report.idempotency_key = idempotency_key
+    db.add(report)
+    try:
+        db.commit()
+    except IntegrityError:
+        # 같은 키의 동시 요청이 먼저 커밋됨 → 카운터 증가도 함께 롤백
+        db.rollback()
+        if idempotency_key:
+            existing = find_report_by_idempotency_key(db, project_id, idempotency_key)
+            if existing is not None:
+                return existing, True
+        raise
+
+    db.refresh(report)
+    return report, False
@@ -4,14 +4,9 @@
 기존 상증세법평가 엔진을 FastAPI 서비스로 래핑
 """
 
-import sys
 from typing import Dict, Any, Optional
-from pathlib import Path
 
-# 기존 평가 엔진 경로 추가
-ENGINE_PATH = Path(__file__).parent.parent.parent.parent / "기업가치평가플랫폼" / "valuation_engine"
-if str(ENGINE_PATH) not in sys.path:
-    sys.path.insert(0, str(ENGINE_PATH))
+from app.services.valuation_engine.inputs import TaxRequest, InputValidationError, validate_model
 
 
 class TaxService:
@@ -20,9 +15,8 @@ class TaxService:
     def __init__(self):
         """서비스 초기화"""
         try:
-            # 기존 상증세법평가 엔진 import (있다면)
-            # from inheritance_tax_law.itl_engine import ITLEngine
-            # self.engine = ITLEngine()
+            # 통합 엔진: app.services.valuation_engine.create_engine('inheritance_tax')
+            # (엔진은 키워드 인자 입력 - 단일 input_data 어댑터 연결 전까지 더미 결과)
             self.engine = None
             self.engine_available = False
         except ImportError as e:
@@ -40,27 +34,10 @@ class TaxService:
         Returns:
             (유효 여부, 에러 메시지)
         """
-        required_fields = [
-            'company_id',
-            'company_name',
-            'valuation_date',
-            'company_type',  # 상장/비상장
-            'net_asset_value',
-            'earnings',  # 최근 3년 순손익
-            'weighted_average_per'  # 가중평균 PER
-        ]
-
-        for field in required_fields:
-            if field not in input_data:
-                return False, f"필수 필드 누락: {field}"
-
-        # 회사 유형 검증
-        if input_data['company_type'] not in ['listed', 'unlisted']:
-            return False, "회사 유형은 'listed' 또는 'unlisted'여야 합니다."
-
-        # 순손익 데이터 검증
-        if not isinstance(input_data['earnings'], list) or len(input_data['earnings']) < 3:
-            return False, "최근 3년 순손익 데이터가 필요합니다."
+        try:
+            validate_model(TaxRequest, input_data)
+        except InputValidationError as e:
+            return False, e.first_message()
 
         return True, None
 
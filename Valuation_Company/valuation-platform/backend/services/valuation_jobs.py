@@ -0,0 +1,638 @@
+"""
+Valuation Job Queue
+
+오래 걸리는 통합 평가를 HTTP 요청 밖에서 실행하는 작업 큐
+- 제출 API는 작업을 valuation_jobs 테이블에 올리고 job_id를 바로 반환
+- 워커 풀(앱 프로세스 내 asyncio 워커 + valuation_job_worker.py 별도 프로세스)이 임대(lease)로 선점해 실행
+- 같은 프로젝트에 같은 내용으로 다시 제출하면 진행 중(queued / running)인 기존 작업을 반환
+  (dedupe_key 부분 UNIQUE 인덱스로 원자적 판정)
+- 취소: 대기 중이면 즉시 cancelled, 실행 중이면 cancel_requested → 핸들러가 단계 사이에서 확인 후 중단
+- 워커가 죽으면 임대 만료 후 다른 워커가 이어받음 (max_attempts까지)
+- PostgreSQL / SQLite 공통 SQL만 사용 (app/core/job_runs.py, news_crawler/shard_queue.py와 같은 방식)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    Text,
+    and_,
+    bindparam,
+    create_engine,
+    false,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.engine import Engine
+
+from app.core.job_runs import default_worker_id
+
+logger = logging.getLogger(__name__)
+
+# 설정 (루트 API는 환경 변수 사용)
+VALUATION_JOB_DATABASE_URL = os.getenv("VALUATION_JOB_DATABASE_URL")
+VALUATION_JOB_WORKERS = int(os.getenv("VALUATION_JOB_WORKERS", "2"))
+VALUATION_JOB_LEASE_SECONDS = float(os.getenv("VALUATION_JOB_LEASE_SECONDS", "120"))
+VALUATION_JOB_MAX_ATTEMPTS = int(os.getenv("VALUATION_JOB_MAX_ATTEMPTS", "2"))
+VALUATION_JOB_POLL_SECONDS = float(os.getenv("VALUATION_JOB_POLL_SECONDS", "2"))
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+metadata = MetaData()
+
+valuation_jobs_table = Table(
+    "valuation_jobs",
+    metadata,
+    Column("job_id", String(36), primary_key=True),
+    Column("kind", String(50), nullable=False),
+    Column("project_id", String(64), nullable=False),
+    Column("dedupe_key", String(64), nullable=False),
+    Column("status", String(20), nullable=False),  # queued, running, succeeded, failed, cancelled
+    Column("stage", String(50)),
+    Column("payload", Text, nullable=False),
+    Column("result", Text),
+    Column("error", Text),
+    Column("attempt", Integer, nullable=False, server_default="0"),
+    Column("max_attempts", Integer, nullable=False),
+    Column("cancel_requested", Boolean, nullable=False, server_default=false()),
+    Column("worker_id", String(191)),
+    Column("lease_until", DateTime(timezone=True)),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("started_at", DateTime(timezone=True)),
+    Column("finished_at", DateTime(timezone=True)),
+    Column("duration_seconds", Float),
+    # 진행 중인 작업끼리만 중복 금지 (끝난 작업과 같은 내용은 다시 제출 가능)
+    Index(
+        "uq_valuation_jobs_active_dedupe", "dedupe_key", unique=True,
+        postgresql_where=text("status IN ('queued', 'running')"),
+        sqlite_where=text("status IN ('queued', 'running')"),
+    ),
+    Index("idx_valuation_jobs_status_created", "status", "created_at"),
+    Index("idx_valuation_jobs_project_created", "project_id", "created_at"),
+)
+
+SUBMIT_SQL = text("""
+    INSERT INTO valuation_jobs
+        (job_id, kind, project_id, dedupe_key, status, payload, attempt, max_attempts, cancel_requested, created_at)
+    VALUES
+        (:job_id, :kind, :project_id, :dedupe_key, 'queued', :payload, 0, :max_attempts, :cancel_requested, :now)
+    ON CONFLICT (dedupe_key) WHERE status IN ('queued', 'running') DO NOTHING
+""").bindparams(
+    bindparam("cancel_requested", type_=Boolean),
+    bindparam("now", type_=DateTime(timezone=True)),
+)
+
+
+class JobCancelled(Exception):
+    """취소 요청을 받았거나 임대를 잃어 작업을 중단"""
+
+
+@dataclass(frozen=True)
+class ValuationJob:
+    """선점한 작업"""
+    job_id: str
+    kind: str
+    project_id: str
+    payload: Dict[str, Any]
+    attempt: int
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+    if value.tzinfo is None:  # SQLite는 타임존을 저장하지 않음 (UTC로 기록)
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def make_dedupe_key(kind: str, project_id: str, payload: Dict[str, Any]) -> str:
+    """(작업 종류, 프로젝트, 요청 내용) → 중복 판정 키 (dict 키 순서 무관)"""
+    canonical = json.dumps([kind, project_id, payload], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ValuationJobQueue:
+    """
+    valuation_jobs 테이블 접근 (동기 - 호출부에서 asyncio.to_thread 사용)
+    """
+
+    # 선점 경합 시 한 번에 살펴볼 후보 수
+    CLAIM_CANDIDATES = 8
+
+    def __init__(
+        self,
+        engine: Engine,
+        lease_seconds: float = 120.0,
+        max_attempts: int = 2,
+        worker_id: Optional[str] = None
+    ):
+        self.engine = engine
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = worker_id or default_worker_id()
+        # SQLite는 연결을 스레드 간 공유할 수 있으므로 트랜잭션을 직렬화
+        self._lock = threading.Lock() if engine.dialect.name == "sqlite" else None
+
+    @contextmanager
+    def _begin(self) -> Iterator[Any]:
+        if self._lock is None:
+            with self.engine.begin() as conn:
+                yield conn
+        else:
+            with self._lock, self.engine.begin() as conn:
+                yield conn
+
+    def create_tables(self) -> None:
+        metadata.create_all(self.engine, tables=[valuation_jobs_table], checkfirst=True)
+
+    # ============================================================
+    # 제출 / 조회 / 취소 (API 쪽)
+    # ============================================================
+
+    def submit(self, kind: str, project_id: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        작업 제출
+
+        Returns:
+            (작업 상태, 새로 만들었는지 - False면 진행 중인 같은 작업을 반환)
+        """
+        c = valuation_jobs_table.c
+        dedupe_key = make_dedupe_key(kind, project_id, payload)
+        encoded = json.dumps(payload, ensure_ascii=False, default=str)
+
+        # 기존 작업이 조회 직전에 끝나면 다시 INSERT (몇 번이면 충분)
+        for _ in range(5):
+            job_id = str(uuid.uuid4())
+            with self._begin() as conn:
+                inserted = conn.execute(SUBMIT_SQL, {
+                    "job_id": job_id,
+                    "kind": kind,
+                    "project_id": project_id,
+                    "dedupe_key": dedupe_key,
+                    "payload": encoded,
+                    "max_attempts": self.max_attempts,
+                    "cancel_requested": False,
+                    "now": _utcnow(),
+                }).rowcount == 1
+                if not inserted:
+                    existing = conn.execute(
+                        select(c.job_id)
+                        .where(c.dedupe_key == dedupe_key)
+                        .where(c.status.in_(ACTIVE_STATUSES))
+                    ).scalar()
+                    if existing is None:
+                        continue
+                    job_id = existing
+            return self.get(job_id), inserted
+
+        raise RuntimeError(f"작업 제출 실패 (dedupe_key={dedupe_key})")
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 (결과 본문 제외)"""
+        c = valuation_jobs_table.c
+        with self._begin() as conn:
+            row = conn.execute(
+                select(
+                    c.job_id, c.kind, c.project_id, c.status, c.stage, c.attempt, c.cancel_requested,
+                    c.worker_id, c.created_at, c.started_at, c.finished_at, c.duration_seconds, c.error
+                ).where(c.job_id == job_id)
+            ).mappings().first()
+        if row is None:
+            return None
+
+        job = dict(row)
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        for key in ("created_at", "started_at", "finished_at"):
+            job[key] = _isoformat(job[key])
+        return job
+
+    def result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """완료된 작업의 결과 (없거나 미완료면 None)"""
+        c = valuation_jobs_table.c
+        with self._begin() as conn:
+            payload = conn.execute(
+                select(c.result).where(c.job_id == job_id).where(c.status == "succeeded")
+            ).scalar()
+        return json.loads(payload) if payload else None
+
+    def list_for_project(self, project_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """프로젝트의 최근 작업 (최신순)"""
+        c = valuation_jobs_table.c
+        with self._begin() as conn:
+            job_ids = conn.execute(
+                select(c.job_id)
+                .where(c.project_id == project_id)
+                .order_by(c.created_at.desc())
+                .limit(limit)
+            ).scalars().all()
+        return [job for job in (self.get(job_id) for job_id in job_ids) if job]
+
+    def cancel(self, job_id: str) -> Optional[str]:
+        """
+        작업 취소
+
+        Returns:
+            cancelled (대기 중이던 작업), cancelling (실행 중 - 워커가 다음 단계에서 중단),
+            이미 끝난 작업은 그 상태, 없는 작업은 None
+        """
+        c = valuation_jobs_table.c
+        now = _utcnow()
+        with self._begin() as conn:
+            if conn.execute(
+                valuation_jobs_table.update()
+                .where(c.job_id == job_id)
+                .where(c.status == "queued")
+                .values(status="cancelled", cancel_requested=True, finished_at=now)
+            ).rowcount == 1:
+                return "cancelled"
+
+            if conn.execute(
+                valuation_jobs_table.update()
+                .where(c.job_id == job_id)
+                .where(c.status == "running")
+                .values(cancel_requested=True)
+            ).rowcount == 1:
+                return "cancelling"
+
+            return conn.execute(select(c.status).where(c.job_id == job_id)).scalar()
+
+    # ============================================================
+    # 선점 / 진행 / 완료 (워커 쪽)
+    # ============================================================
+
+    def claim(self, kinds: Optional[Sequence[str]] = None) -> Optional[ValuationJob]:
+        """
+        실행 가능한 작업 1개 선점 (오래된 순)
+
+        Args:
+            kinds: 이 워커가 처리할 작업 종류 (None이면 전체)
+        """
+        c = valuation_jobs_table.c
+
+        while True:
+            now = _utcnow()
+            claimable = or_(
+                c.status == "queued",
+                and_(c.status == "running", c.lease_until < now, c.attempt < c.max_attempts),
+            )
+            query = select(c.job_id).where(claimable).where(c.cancel_requested == false())
+            if kinds:
+                query = query.where(c.kind.in_(list(kinds)))
+
+            with self._begin() as conn:
+                candidates = list(conn.execute(query.order_by(c.created_at).limit(self.CLAIM_CANDIDATES)).scalars())
+            if not candidates:
+                return None
+
+            # 워커끼리 같은 행을 두고 경합하지 않도록 후보 중 무작위 선택
+            random.shuffle(candidates)
+            for job_id in candidates:
+                with self._begin() as conn:
+                    result = conn.execute(
+                        valuation_jobs_table.update()
+                        .where(c.job_id == job_id)
+                        .where(claimable)
+                        .where(c.cancel_requested == false())
+                        .values(
+                            status="running",
+                            stage=None,
+                            worker_id=self.worker_id,
+                            attempt=c.attempt + 1,
+                            started_at=now,
+                            lease_until=now + timedelta(seconds=self.lease_seconds),
+                            error=None
+                        )
+                    )
+                    if result.rowcount != 1:
+                        continue
+                    row = conn.execute(
+                        select(c.job_id, c.kind, c.project_id, c.payload, c.attempt).where(c.job_id == job_id)
+                    ).mappings().one()
+
+                return ValuationJob(
+                    job_id=row["job_id"],
+                    kind=row["kind"],
+                    project_id=row["project_id"],
+                    payload=json.loads(row["payload"]),
+                    attempt=row["attempt"]
+                )
+            # 후보를 모두 다른 워커가 가져감 → 다시 조회
+
+    def heartbeat(self, job_id: str, stage: Optional[str] = None) -> Optional[bool]:
+        """
+        임대 연장 (+ 진행 단계 기록)
+
+        Returns:
+            취소 요청 여부 (임대를 잃었으면 None)
+        """
+        c = valuation_jobs_table.c
+        values: Dict[str, Any] = {"lease_until": _utcnow() + timedelta(seconds=self.lease_seconds)}
+        if stage is not None:
+            values["stage"] = stage
+
+        with self._begin() as conn:
+            result = conn.execute(
+                valuation_jobs_table.update()
+                .where(c.job_id == job_id)
+                .where(c.worker_id == self.worker_id)
+                .where(c.status == "running")
+                .values(**values)
+            )
+            if result.rowcount != 1:
+                return None
+            return bool(conn.execute(select(c.cancel_requested).where(c.job_id == job_id)).scalar())
+
+    def _finish(self, job_id: str, status: str, duration_seconds: float, **values: Any) -> bool:
+        c = valuation_jobs_table.c
+        with self._begin() as conn:
+            result = conn.execute(
+                valuation_jobs_table.update()
+                .where(c.job_id == job_id)
+                .where(c.worker_id == self.worker_id)
+                .where(c.status == "running")
+                .values(status=status, finished_at=_utcnow(), duration_seconds=duration_seconds, **values)
+            )
+        return result.rowcount == 1
+
+    def complete(self, job_id: str, result: Dict[str, Any], duration_seconds: float) -> bool:
+        """완료 및 결과 저장 (임대를 잃었으면 False)"""
+        return self._finish(
+            job_id, "succeeded", duration_seconds,
+            stage="done", result=json.dumps(result, ensure_ascii=False, default=str)
+        )
+
+    def fail(self, job_id: str, error: str, duration_seconds: float) -> bool:
+        """실패 기록 - 평가 오류는 같은 입력으로 다시 실행해도 같으므로 재시도하지 않음"""
+        return self._finish(job_id, "failed", duration_seconds, error=error[:2000])
+
+    def mark_cancelled(self, job_id: str, duration_seconds: float) -> bool:
+        return self._finish(job_id, "cancelled", duration_seconds)
+
+    def expire_abandoned(self) -> int:
+        """재시도 횟수를 다 쓴 채 임대가 만료된 작업을 failed로 정리"""
+        c = valuation_jobs_table.c
+        now = _utcnow()
+        with self._begin() as conn:
+            return conn.execute(
+                valuation_jobs_table.update()
+                .where(c.status == "running")
+                .where(c.lease_until < now)
+                .where(c.attempt >= c.max_attempts)
+                .values(status="failed", finished_at=now, error="lease expired")
+            ).rowcount
+
+
+# ============================================================
+# 작업 핸들러
+# ============================================================
+
+class JobContext:
+    """핸들러에 전달 - 진행 단계 기록 / 취소 확인"""
+
+    def __init__(self, queue: ValuationJobQueue, job: ValuationJob):
+        self.queue = queue
+        self.job = job
+
+    def stage(self, name: str) -> None:
+        """진행 단계 기록 (취소 요청을 받았거나 임대를 잃었으면 JobCancelled)"""
+        cancel_requested = self.queue.heartbeat(self.job.job_id, stage=name)
+        if cancel_requested is None:
+            raise JobCancelled("lease lost")
+        if cancel_requested:
+            raise JobCancelled("cancel requested")
+
+    def check_cancelled(self) -> None:
+        """DB 커밋 등 되돌리기 어려운 단계 직전에 호출"""
+        cancel_requested = self.queue.heartbeat(self.job.job_id)
+        if cancel_requested is None:
+            raise JobCancelled("lease lost")
+        if cancel_requested:
+            raise JobCancelled("cancel requested")
+
+
+JobHandler = Callable[[JobContext], Dict[str, Any]]
+
+# 작업 종류 → 핸들러 (라우터 모듈이 import될 때 등록)
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """
+    작업 핸들러 등록 데코레이터
+
+    핸들러는 워커 스레드에서 동기로 실행되고, JSON으로 저장할 결과 dict를 반환한다.
+    """
+    def decorator(handler: JobHandler) -> JobHandler:
+        JOB_HANDLERS[kind] = handler
+        return handler
+    return decorator
+
+
+def execute_job(queue: ValuationJobQueue, job: ValuationJob) -> str:
+    """
+    선점한 작업 1개 실행 (동기)
+
+    Returns:
+        최종 상태 (succeeded / failed / cancelled)
+    """
+    start = time.perf_counter()
+    handler = JOB_HANDLERS.get(job.kind)
+    if handler is None:
+        queue.fail(job.job_id, f"Unknown job kind: {job.kind}", 0.0)
+        return "failed"
+
+    try:
+        result = handler(JobContext(queue, job))
+    except JobCancelled:
+        queue.mark_cancelled(job.job_id, time.perf_counter() - start)
+        return "cancelled"
+    except Exception as e:
+        # HTTPException(상태 확인 실패 등)은 detail이 메시지
+        error = getattr(e, "detail", None) or f"{type(e).__name__}: {e}"
+        logger.warning(f"Valuation job {job.job_id} ({job.kind}) failed: {error}")
+        queue.fail(job.job_id, str(error), time.perf_counter() - start)
+        return "failed"
+
+    queue.complete(job.job_id, result, time.perf_counter() - start)
+    return "succeeded"
+
+
+# ============================================================
+# 워커 풀
+# ============================================================
+
+class ValuationJobWorkerPool:
+    """
+    asyncio 워커 N개 - 각 워커가 작업을 선점해 스레드에서 실행하고, 실행 중에는 임대를 연장
+
+    앱 프로세스 안에서는 lifespan에서 start/stop, 별도 프로세스는 valuation_job_worker.py 사용
+    """
+
+    def __init__(
+        self,
+        queue: ValuationJobQueue,
+        concurrency: int = 2,
+        poll_interval: float = 2.0,
+        kinds: Optional[Sequence[str]] = None
+    ):
+        self.queue = queue
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.kinds = kinds
+        self.executed = 0
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"valuation-job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        logger.info(f"Valuation job workers started ({self.concurrency}, worker_id={self.queue.worker_id})")
+
+    async def stop(self) -> None:
+        """새 작업 선점을 멈추고 종료 (실행 중인 작업은 임대 만료 후 다른 워커가 이어받음)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """새 작업 제출 알림 - 폴링 간격을 기다리지 않고 바로 선점 (다른 스레드에서 호출 가능)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def run_until_empty(self) -> int:
+        """대기 중인 작업이 없을 때까지 실행 (CLI / 테스트용)"""
+        await asyncio.gather(*(self._worker(stop_when_idle=True) for _ in range(self.concurrency)))
+        return self.executed
+
+    async def _worker(self, stop_when_idle: bool = False) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self.queue.claim, self.kinds)
+            except Exception as e:
+                logger.error(f"Valuation job claim failed: {e}")
+                job = None
+
+            if job is None:
+                if stop_when_idle:
+                    return
+                await asyncio.to_thread(self.queue.expire_abandoned)
+                await self._sleep()
+                continue
+
+            await self._run(job)
+            self.executed += 1
+
+    async def _run(self, job: ValuationJob) -> None:
+        # 스레드에서 실행하면서 임대의 1/3 간격으로 연장
+        future = asyncio.ensure_future(asyncio.to_thread(execute_job, self.queue, job))
+        while True:
+            done, _ = await asyncio.wait({future}, timeout=self.queue.lease_seconds / 3)
+            if done:
+                break
+            await asyncio.to_thread(self.queue.heartbeat, job.job_id)
+
+        status = future.result()
+        logger.info(f"Valuation job {job.job_id} ({job.kind}, project={job.project_id}) {status}")
+
+    async def _sleep(self) -> None:
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wakeup.clear()
+
+
+# 전역 큐 / 워커 풀 (지연 생성)
+job_queue: Optional[ValuationJobQueue] = None
+worker_pool: Optional[ValuationJobWorkerPool] = None
+
+
+def create_job_queue(database_url: Optional[str] = None, **kwargs) -> ValuationJobQueue:
+    """
+    큐 생성 (테이블이 없으면 생성)
+
+    database_url이 없으면 API와 같은 DB(database.engine)를 사용
+    """
+    if database_url:
+        connect_args = {"timeout": 30} if database_url.startswith("sqlite") else {}
+        engine = create_engine(database_url, pool_pre_ping=True, connect_args=connect_args)
+    else:
+        from database import engine
+
+    kwargs.setdefault("lease_seconds", VALUATION_JOB_LEASE_SECONDS)
+    kwargs.setdefault("max_attempts", VALUATION_JOB_MAX_ATTEMPTS)
+
+    queue = ValuationJobQueue(engine, **kwargs)
+    queue.create_tables()
+    return queue
+
+
+def get_job_queue() -> ValuationJobQueue:
+    """전역 큐 반환 (VALUATION_JOB_DATABASE_URL → API DB)"""
+    global job_queue
+
+    if job_queue is None:
+        job_queue = create_job_queue(VALUATION_JOB_DATABASE_URL)
+
+    return job_queue
+
+
+async def start_worker_pool(concurrency: int = VALUATION_JOB_WORKERS) -> Optional[ValuationJobWorkerPool]:
+    """앱 프로세스 내 워커 풀 시작 (concurrency 0이면 별도 워커 프로세스만 사용)"""
+    global worker_pool
+
+    if concurrency <= 0 or worker_pool is not None:
+        return worker_pool
+
+    queue = await asyncio.to_thread(get_job_queue)
+    worker_pool = ValuationJobWorkerPool(queue, concurrency=concurrency, poll_interval=VALUATION_JOB_POLL_SECONDS)
+    worker_pool.start()
+    return worker_pool
+
+
+async def stop_worker_pool() -> None:
+    global worker_pool
+
+    if worker_pool is not None:
+        await worker_pool.stop()
+        worker_pool = None
+
+
+async def submit_job(kind: str, project_id: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+    """작업 제출 후 프로세스 내 워커 깨우기 (라우터용)"""
+    job, created = await asyncio.to_thread(lambda: get_job_queue().submit(kind, project_id, payload))
+    if created and worker_pool is not None:
+        worker_pool.notify()
+    return job, created
@@ -0,0 +1,189 @@
+"""
+문서 업로드 엔드포인트 테스트 (POST /api/customer/projects/{project_id}/documents, /uploads)
+
+SQLite 메모리 DB에 projects / documents만 만들어
+- 업로드한 파일이 documents 실제 컬럼(file_id, category, file_size, file_hash)으로 등록되는지
+- 같은 내용 재업로드 시 기존 문서 재사용
+- 한 파일이 용량 초과면 같은 요청에서 먼저 저장한 파일도 남지 않는지
+- 재개 가능 업로드 완료 후 문서 등록 / 세션 삭제
+를 확인한다.
+
+실행:
+    python -m pytest -q test_document_upload.py
+"""
+import hashlib
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import ARRAY, create_engine, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from auth import User, get_customer_user
+from database import get_db
+from models.base import Base
+from models.document import Document, DocumentCategory
+from models.project import Project, ProjectStatus, ValuationPurpose
+from routers import customer_router
+from services.document_upload import ResumableUploadStore
+
+PROJECT_ID = "SAMSU-2501191430-CP"
+
+
+# PostgreSQL 전용 타입을 SQLite에서 만들 수 있게 (테스트 한정)
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _compile_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine, tables=[Project.__table__, Document.__table__])
+    SessionLocal = sessionmaker(bind=engine)
+
+    with SessionLocal() as db:
+        # ARRAY 컬럼은 SQLite 바인딩이 없어 projects 행은 SQL로 직접 넣는다
+        db.execute(text("""
+            INSERT INTO projects (
+                project_id, status, company_name_kr, company_name_en, business_number, ceo_name,
+                industry, founded_date, contact_name, contact_email, contact_phone,
+                valuation_methods, valuation_purpose, valuation_date, created_at, updated_at
+            ) VALUES (
+                :project_id, :status, '삼성테스트', 'Samsung Test', '123-45-67890', '홍길동',
+                '반도체', '2010-01-01', '김담당', 'contact@example.com', '010-0000-0000',
+                '["dcf"]', :purpose, '2024-12-31', :now, :now
+            )
+        """), {
+            "project_id": PROJECT_ID,
+            "status": ProjectStatus.APPROVED.name,
+            "purpose": ValuationPurpose.MA.name,
+            "now": datetime.now()
+        })
+        db.commit()
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    upload_dir = tmp_path / "uploads"
+    monkeypatch.setattr(customer_router, "UPLOAD_DIR", str(upload_dir))
+    monkeypatch.setattr(customer_router, "resumable_uploads", ResumableUploadStore(upload_dir / ".resumable"))
+
+    app = FastAPI()
+    app.include_router(customer_router.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_customer_user] = lambda: User(
+        user_id="customer-1", email="contact@example.com", role="customer"
+    )
+    with TestClient(app) as test_client:
+        test_client.SessionLocal = SessionLocal
+        test_client.project_dir = upload_dir / PROJECT_ID
+        yield test_client
+    engine.dispose()
+
+
+def stored_files(client):
+    return sorted(p.name for p in client.project_dir.iterdir()) if client.project_dir.exists() else []
+
+
+def test_upload_documents_registers_real_columns(client):
+    content = b"%PDF-1.4 financial statements"
+    response = client.post(
+        f"/api/customer/projects/{PROJECT_ID}/documents",
+        files=[("files", ("재무제표_2023.pdf", content, "application/pdf"))],
+        data={"category": "financial"}
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == "documents_uploaded"
+    assert body["upload_progress"]["financial"] == "completed"
+    assert body["upload_progress"]["business_plan"] == "pending"
+
+    uploaded = body["uploaded_files"]
+    assert len(uploaded) == 1
+    assert uploaded[0]["category"] == "financial"
+    assert uploaded[0]["file_size"] == len(content)
+
+    sha256 = hashlib.sha256(content).hexdigest()
+    with client.SessionLocal() as db:
+        document = db.query(Document).one()
+        assert document.file_id == uploaded[0]["file_id"]
+        assert document.category == DocumentCategory.FINANCIAL
+        assert document.file_size == len(content)
+        assert document.file_hash == sha256
+    assert stored_files(client) == [f"{sha256}.pdf"]
+
+    # 같은 내용 재업로드: 행 / 파일 재사용
+    again = client.post(
+        f"/api/customer/projects/{PROJECT_ID}/documents",
+        files=[("files", ("재무제표_2023_v2.pdf", content, "application/pdf"))],
+        data={"category": "financial"}
+    )
+    assert again.status_code == 200, again.text
+    assert again.json()["uploaded_files"][0]["file_id"] == uploaded[0]["file_id"]
+    with client.SessionLocal() as db:
+        assert db.query(Document).count() == 1
+
+
+def test_upload_documents_too_large_removes_earlier_files(client, monkeypatch):
+    monkeypatch.setattr(customer_router, "MAX_UPLOAD_SIZE_BYTES", 16)
+    response = client.post(
+        f"/api/customer/projects/{PROJECT_ID}/documents",
+        files=[
+            ("files", ("small.pdf", b"0123456789", "application/pdf")),
+            ("files", ("large.pdf", b"x" * 64, "application/pdf")),
+        ],
+        data={"category": "others"}
+    )
+    assert response.status_code == 413
+    assert stored_files(client) == []
+    with client.SessionLocal() as db:
+        assert db.query(Document).count() == 0
+
+
+def test_resumable_upload_complete_registers_document(client):
+    content = b"audit report " * 100
+    created = client.post(
+        f"/api/customer/projects/{PROJECT_ID}/uploads",
+        json={"file_name": "감사보고서_2023.pdf", "total_size": len(content), "category": "financial"}
+    )
+    assert created.status_code == 201, created.text
+    upload_id = created.json()["upload_id"]
+
+    for offset in range(0, len(content), 512):
+        patched = client.patch(
+            f"/api/customer/projects/{PROJECT_ID}/uploads/{upload_id}",
+            content=content[offset:offset + 512],
+            headers={"Upload-Offset": str(offset)}
+        )
+        assert patched.status_code == 200, patched.text
+
+    stale = client.patch(
+        f"/api/customer/projects/{PROJECT_ID}/uploads/{upload_id}",
+        content=b"x",
+        headers={"Upload-Offset": "0"}
+    )
+    assert stale.status_code == 409
+
+    completed = client.post(f"/api/customer/projects/{PROJECT_ID}/uploads/{upload_id}/complete")
+    assert completed.status_code == 200, completed.text
+    body = completed.json()
+    assert body["uploaded_files"][0]["file_size"] == len(content)
+    assert body["upload_progress"]["financial"] == "completed"
+
+    with client.SessionLocal() as db:
+        assert db.query(Document).one().file_hash == hashlib.sha256(content).hexdigest()
+    assert client.get(f"/api/customer/projects/{PROJECT_ID}/uploads/{upload_id}").status_code == 404
@@ -0,0 +1,135 @@
+"""
+보고서 발행 엔드포인트 테스트 (POST /api/projects/{project_id}/report)
+
+SQLite 메모리 DB에 projects / drafts / reports / report_number_counters만 만들어
+- reports 테이블 실제 컬럼으로 레코드가 저장되는지
+- 보고서 번호(VR-{YYYY}-{순번}) 연속 발급
+- 같은 Idempotency-Key 재요청 시 기존 보고서 반환
+을 확인한다.
+
+실행:
+    python -m pytest -q test_report_issue.py
+"""
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import ARRAY, create_engine, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import get_db
+from models.base import Base
+from models.draft import Draft
+from models.project import Project, ProjectStatus, ValuationPurpose
+from models.report import Report
+from routers import reports
+from services.report_numbering import create_tables
+
+
+# PostgreSQL 전용 타입을 SQLite에서 만들 수 있게 (테스트 한정)
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _compile_json(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def client():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine, tables=[Project.__table__, Draft.__table__, Report.__table__])
+    create_tables(engine)
+    SessionLocal = sessionmaker(bind=engine)
+
+    with SessionLocal() as db:
+        # ARRAY 컬럼은 SQLite 바인딩이 없어 projects 행은 SQL로 직접 넣는다
+        db.execute(text("""
+            INSERT INTO projects (
+                project_id, status, company_name_kr, company_name_en, business_number, ceo_name,
+                industry, founded_date, contact_name, contact_email, contact_phone,
+                valuation_methods, valuation_purpose, valuation_date, created_at, updated_at
+            ) VALUES (
+                'SAMSU-2501191430-CP', :status, '삼성테스트', 'Samsung Test', '123-45-67890', '홍길동',
+                '반도체', '2010-01-01', '김담당', 'contact@example.com', '010-0000-0000',
+                '["dcf"]', :purpose, '2024-12-31', :now, :now
+            )
+        """), {"status": ProjectStatus.COMPLETED.name, "purpose": ValuationPurpose.MA.name, "now": datetime.now()})
+        db.add(Draft(
+            draft_id="DRAFT-SAMSU-001",
+            project_id="SAMSU-2501191430-CP",
+            report_type="comprehensive",
+            include_appendix=True,
+            page_count=42,
+            content_hash="a" * 64,
+            generated_at=datetime.now()
+        ))
+        db.commit()
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(reports.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    with TestClient(app) as test_client:
+        test_client.SessionLocal = SessionLocal
+        yield test_client
+    engine.dispose()
+
+
+def test_issue_report_stores_real_columns(client):
+    response = client.post(
+        "/api/projects/SAMSU-2501191430-CP/report",
+        json={"format": "pdf", "issued_by": "cpa@example.com"}
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    year = datetime.now().year
+    assert body["report_number"] == f"VR-{year}-00001"
+    assert body["report_id"] == f"RPT-SAMSU-2501191430-CP-VR-{year}-00001"
+    assert body["download_url"] == "/api/projects/SAMSU-2501191430-CP/report/download"
+    assert body["replayed"] is False
+
+    with client.SessionLocal() as db:
+        report = db.query(Report).filter(Report.report_id == body["report_id"]).one()
+        assert report.report_type == "comprehensive"
+        assert report.delivery_format == "pdf"
+        assert report.delivery_method == "download"
+        assert report.report_path == f"./reports/SAMSU-2501191430-CP_VR-{year}-00001.pdf"
+        assert report.report_url == body["download_url"]
+        assert report.page_count == 42
+        assert report.issued_by == "cpa@example.com"
+        assert report.issued_at is not None
+
+    second = client.post("/api/projects/SAMSU-2501191430-CP/report", json={"format": "docx"})
+    assert second.status_code == 200, second.text
+    assert second.json()["report_number"] == f"VR-{year}-00002"
+
+
+def test_issue_report_idempotency_key_replays(client):
+    headers = {"Idempotency-Key": "issue-1"}
+    first = client.post("/api/projects/SAMSU-2501191430-CP/report", json={}, headers=headers)
+    again = client.post("/api/projects/SAMSU-2501191430-CP/report", json={}, headers=headers)
+    assert first.status_code == 200, first.text
+    assert again.status_code == 200, again.text
+    assert again.json()["replayed"] is True
+    assert again.json()["report_number"] == first.json()["report_number"]
+
+    with client.SessionLocal() as db:
+        assert db.query(Report).count() == 1
+
+
+def test_issue_report_missing_project(client):
+    response = client.post("/api/projects/NOPE/report", json={})
+    assert response.status_code == 404
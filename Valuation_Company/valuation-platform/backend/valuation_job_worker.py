@@ -0,0 +1,85 @@
+"""
+Valuation Job Worker
+통합 평가 작업 큐 워커 (API 서버와 별도 프로세스/서버에서 실행)
+
+API가 valuation_jobs 테이블에 올린 통합 평가 작업을 임대로 선점해 실행한다.
+API와 같은 DB(VALUATION_JOB_DATABASE_URL 또는 DATABASE_URL)를 봐야 한다.
+API 프로세스 안의 워커 풀만 쓰려면 실행할 필요 없음 (VALUATION_JOB_WORKERS).
+
+실행:
+    python valuation_job_worker.py [--concurrency 2] [--forever]
+    python valuation_job_worker.py --status JOB_ID     # 작업 상태
+    python valuation_job_worker.py --cancel JOB_ID     # 작업 취소
+"""
+import argparse
+import asyncio
+import logging
+import sys
+import os
+from dotenv import load_dotenv
+
+# 경로 설정
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
+
+load_dotenv(override=True)
+
+from services.valuation_jobs import (
+    JOB_HANDLERS,
+    VALUATION_JOB_POLL_SECONDS,
+    VALUATION_JOB_WORKERS,
+    ValuationJobWorkerPool,
+    get_job_queue,
+)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logger = logging.getLogger("ValuationJobWorker")
+
+
+def register_handlers():
+    """작업 핸들러는 라우터 모듈 import 시 등록됨"""
+    import routers.internal_router  # noqa: F401  internal_integrated_valuation
+    import routers.master_valuation  # noqa: F401  integrated_valuation
+
+
+async def run_worker(concurrency, forever, poll_interval):
+    queue = get_job_queue()
+    pool = ValuationJobWorkerPool(queue, concurrency=concurrency, poll_interval=poll_interval)
+
+    if forever:
+        pool.start()
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await pool.stop()
+    else:
+        await pool.run_until_empty()
+
+    logger.info(f"Worker {queue.worker_id} executed {pool.executed} jobs")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="통합 평가 작업 큐 워커")
+    arg_parser.add_argument("--concurrency", type=int, default=max(VALUATION_JOB_WORKERS, 1), help="동시 실행 작업 수")
+    arg_parser.add_argument("--poll-interval", type=float, default=VALUATION_JOB_POLL_SECONDS, help="대기 중 큐 조회 간격(초)")
+    arg_parser.add_argument("--forever", action="store_true", help="작업이 없어도 종료하지 않고 대기")
+    arg_parser.add_argument("--status", metavar="JOB_ID", help="작업 상태 출력")
+    arg_parser.add_argument("--cancel", metavar="JOB_ID", help="작업 취소")
+    args = arg_parser.parse_args()
+
+    queue = get_job_queue()
+
+    if args.cancel:
+        print(f"{args.cancel}: {queue.cancel(args.cancel)}")
+        return
+
+    if args.status:
+        print(queue.get(args.status))
+        return
+
+    register_handlers()
+    logger.info(f"Handlers: {', '.join(sorted(JOB_HANDLERS))}")
+    asyncio.run(run_worker(args.concurrency, args.forever, args.poll_interval))
+
+
+if __name__ == "__main__":
+    main()
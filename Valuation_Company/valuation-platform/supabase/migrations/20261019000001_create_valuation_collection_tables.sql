@@ -0,0 +1,55 @@
+-- 평가 Step 5 데이터 수집 테이블 (app/services/data_collection/collectors.py의 Supabase 수집기)
+-- VALUATION_COLLECTOR_SOURCE=supabase로 바꾸기 전에 적용하고 데이터를 채워야 함
+-- (재무제표가 없는 프로젝트는 필수 수집 실패로 평가가 'failed' 처리됨)
+-- 프로젝트별: financial_statements, market_data, company_assets (project_id)
+-- 업종별: comparable_companies, industry_benchmarks (industry = 최신 재무제표의 industry)
+
+CREATE TABLE IF NOT EXISTS financial_statements (
+    id BIGSERIAL PRIMARY KEY,
+    project_id VARCHAR(20) NOT NULL REFERENCES projects(project_id) ON DELETE CASCADE,
+    fiscal_year INTEGER NOT NULL,
+    industry VARCHAR(100),
+    data JSONB NOT NULL DEFAULT '{}'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    UNIQUE (project_id, fiscal_year)
+);
+
+CREATE TABLE IF NOT EXISTS market_data (
+    id BIGSERIAL PRIMARY KEY,
+    project_id VARCHAR(20) NOT NULL REFERENCES projects(project_id) ON DELETE CASCADE,
+    as_of DATE,
+    data JSONB NOT NULL DEFAULT '{}'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS company_assets (
+    id BIGSERIAL PRIMARY KEY,
+    project_id VARCHAR(20) NOT NULL REFERENCES projects(project_id) ON DELETE CASCADE,
+    asset_type VARCHAR(50),
+    data JSONB NOT NULL DEFAULT '{}'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS comparable_companies (
+    id BIGSERIAL PRIMARY KEY,
+    industry VARCHAR(100) NOT NULL,
+    company_name VARCHAR(100) NOT NULL,
+    data JSONB NOT NULL DEFAULT '{}'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS industry_benchmarks (
+    id BIGSERIAL PRIMARY KEY,
+    industry VARCHAR(100) NOT NULL,
+    metric VARCHAR(50) NOT NULL,
+    value NUMERIC,
+    data JSONB NOT NULL DEFAULT '{}'::jsonb,
+    created_at TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- 수집기 조회 조건
+CREATE INDEX IF NOT EXISTS idx_financial_statements_project ON financial_statements(project_id, fiscal_year);
+CREATE INDEX IF NOT EXISTS idx_market_data_project ON market_data(project_id);
+CREATE INDEX IF NOT EXISTS idx_company_assets_project ON company_assets(project_id);
+CREATE INDEX IF NOT EXISTS idx_comparable_companies_industry ON comparable_companies(industry);
+CREATE INDEX IF NOT EXISTS idx_industry_benchmarks_industry ON industry_benchmarks(industry);